@@ -0,0 +1,103 @@
+"""create_shop_review_rollups_table
+
+Revision ID: c004_review_rollups
+Revises: c003_style_tags
+Create Date: 2026-01-12
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c004_review_rollups"
+down_revision: str | Sequence[str] | None = "c003_style_tags"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COUNTER_COLUMNS = (
+    "review_count",
+    "pending_count",
+    "replied_count",
+    "ignored_count",
+    "rating_sum",
+    "rating_1_count",
+    "rating_2_count",
+    "rating_3_count",
+    "rating_4_count",
+    "rating_5_count",
+)
+
+
+def upgrade() -> None:
+    """Create shop_review_rollups table and backfill it from reviews."""
+    op.create_table(
+        "shop_review_rollups",
+        sa.Column("shop_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("platform", sa.String(20), nullable=False),
+        # 상태별 개수 / 평점 합계 / 평점 히스토그램
+        *[
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0")
+            for column in COUNTER_COLUMNS
+        ],
+        # 타임스탬프
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["shop_id"], ["shops.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("shop_id", "platform"),
+    )
+
+    # 기존 리뷰로부터 집계 백필
+    op.execute("""
+        INSERT INTO shop_review_rollups (
+            shop_id, platform, review_count, pending_count, replied_count,
+            ignored_count, rating_sum, rating_1_count, rating_2_count,
+            rating_3_count, rating_4_count, rating_5_count
+        )
+        SELECT
+            shop_id,
+            CASE WHEN google_review_id IS NOT NULL THEN 'google' ELSE 'naver' END,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE status = 'pending'),
+            COUNT(*) FILTER (WHERE status = 'replied'),
+            COUNT(*) FILTER (WHERE status = 'ignored'),
+            COALESCE(SUM(rating), 0),
+            COUNT(*) FILTER (WHERE rating = 1),
+            COUNT(*) FILTER (WHERE rating = 2),
+            COUNT(*) FILTER (WHERE rating = 3),
+            COUNT(*) FILTER (WHERE rating = 4),
+            COUNT(*) FILTER (WHERE rating = 5)
+        FROM reviews
+        GROUP BY 1, 2
+    """)
+
+    # updated_at 트리거 생성
+    op.execute("""
+        CREATE TRIGGER set_shop_review_rollups_updated_at
+            BEFORE UPDATE ON shop_review_rollups
+            FOR EACH ROW
+            EXECUTE FUNCTION update_updated_at_column();
+    """)
+
+
+def downgrade() -> None:
+    """Drop shop_review_rollups table."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS set_shop_review_rollups_updated_at "
+        "ON shop_review_rollups"
+    )
+    op.drop_table("shop_review_rollups")
@@ -0,0 +1,100 @@
+"""create_review_daily_stats_table
+
+Revision ID: c005_review_daily_stats
+Revises: c004_review_rollups
+Create Date: 2026-01-13
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c005_review_daily_stats"
+down_revision: str | Sequence[str] | None = "c004_review_rollups"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COUNTER_COLUMNS = (
+    "review_count",
+    "replied_count",
+    "rating_sum",
+    "rating_1_count",
+    "rating_2_count",
+    "rating_3_count",
+    "rating_4_count",
+    "rating_5_count",
+)
+
+
+def upgrade() -> None:
+    """Create review_daily_stats table and backfill it from reviews."""
+    op.create_table(
+        "review_daily_stats",
+        sa.Column("shop_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("platform", sa.String(20), nullable=False),
+        # 리뷰 수 / 답변 수 / 평점 합계 / 평점 히스토그램
+        *[
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0")
+            for column in COUNTER_COLUMNS
+        ],
+        # 타임스탬프
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["shop_id"], ["shops.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("shop_id", "day", "platform"),
+    )
+
+    # 기존 리뷰로부터 일별 통계 백필 (UTC 기준 일자)
+    op.execute("""
+        INSERT INTO review_daily_stats (
+            shop_id, day, platform, review_count, replied_count, rating_sum,
+            rating_1_count, rating_2_count, rating_3_count, rating_4_count,
+            rating_5_count
+        )
+        SELECT
+            shop_id,
+            (review_date AT TIME ZONE 'UTC')::date,
+            CASE WHEN google_review_id IS NOT NULL THEN 'google' ELSE 'naver' END,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE status = 'replied'),
+            COALESCE(SUM(rating), 0),
+            COUNT(*) FILTER (WHERE rating = 1),
+            COUNT(*) FILTER (WHERE rating = 2),
+            COUNT(*) FILTER (WHERE rating = 3),
+            COUNT(*) FILTER (WHERE rating = 4),
+            COUNT(*) FILTER (WHERE rating = 5)
+        FROM reviews
+        GROUP BY 1, 2, 3
+    """)
+
+    # updated_at 트리거 생성
+    op.execute("""
+        CREATE TRIGGER set_review_daily_stats_updated_at
+            BEFORE UPDATE ON review_daily_stats
+            FOR EACH ROW
+            EXECUTE FUNCTION update_updated_at_column();
+    """)
+
+
+def downgrade() -> None:
+    """Drop review_daily_stats table."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS set_review_daily_stats_updated_at ON review_daily_stats"
+    )
+    op.drop_table("review_daily_stats")
@@ -0,0 +1,40 @@
+"""add_post_display_at
+
+Revision ID: c006_post_display_at
+Revises: c005_review_daily_stats
+Create Date: 2026-01-14
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c006_post_display_at"
+down_revision: str | Sequence[str] | None = "c005_review_daily_stats"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add generated display_at column and calendar index to posts table."""
+    op.add_column(
+        "posts",
+        sa.Column(
+            "display_at",
+            sa.DateTime(timezone=True),
+            sa.Computed("coalesce(scheduled_at, published_at)", persisted=True),
+        ),
+    )
+
+    # Composite index for calendar range queries
+    op.create_index("idx_posts_shop_display_at", "posts", ["shop_id", "display_at"])
+
+
+def downgrade() -> None:
+    """Remove display_at column and calendar index from posts table."""
+    op.drop_index("idx_posts_shop_display_at", table_name="posts")
+    op.drop_column("posts", "display_at")
@@ -0,0 +1,54 @@
+"""add_post_engagement_score
+
+Revision ID: c007_post_engagement
+Revises: c006_post_display_at
+Create Date: 2026-01-15
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c007_post_engagement"
+down_revision: str | Sequence[str] | None = "c006_post_display_at"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add generated engagement_score column and top posts index."""
+    op.add_column(
+        "posts",
+        sa.Column(
+            "engagement_score",
+            sa.Integer(),
+            sa.Computed(
+                "likes_count + comments_count * 2 + reach_count / 10", persisted=True
+            ),
+        ),
+    )
+
+    # Partial covering index for top published posts per shop
+    op.create_index(
+        "idx_posts_shop_engagement_published",
+        "posts",
+        ["shop_id", sa.text("engagement_score DESC")],
+        postgresql_where=sa.text("status = 'published'"),
+        postgresql_include=[
+            "id",
+            "image_url",
+            "likes_count",
+            "comments_count",
+            "reach_count",
+        ],
+    )
+
+
+def downgrade() -> None:
+    """Remove engagement_score column and top posts index."""
+    op.drop_index("idx_posts_shop_engagement_published", table_name="posts")
+    op.drop_column("posts", "engagement_score")
@@ -0,0 +1,47 @@
+"""add_review_keyset_indexes
+
+Revision ID: c008_review_keyset_idx
+Revises: c007_post_engagement
+Create Date: 2026-01-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c008_review_keyset_idx"
+down_revision: str | Sequence[str] | None = "c007_post_engagement"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace review dashboard indexes with keyset pagination indexes.
+
+    The new indexes match the listing sort order (review_date DESC, id DESC)
+    and cover the old (shop_id, status) and (shop_id, review_date) prefixes.
+    """
+    op.create_index(
+        "idx_reviews_shop_date_id",
+        "reviews",
+        ["shop_id", sa.text("review_date DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "idx_reviews_shop_status_date_id",
+        "reviews",
+        ["shop_id", "status", sa.text("review_date DESC"), sa.text("id DESC")],
+    )
+    op.drop_index("idx_reviews_shop_date", table_name="reviews")
+    op.drop_index("idx_reviews_shop_status", table_name="reviews")
+
+
+def downgrade() -> None:
+    """Restore the original review dashboard indexes."""
+    op.create_index("idx_reviews_shop_status", "reviews", ["shop_id", "status"])
+    op.create_index("idx_reviews_shop_date", "reviews", ["shop_id", "review_date"])
+    op.drop_index("idx_reviews_shop_status_date_id", table_name="reviews")
+    op.drop_index("idx_reviews_shop_date_id", table_name="reviews")
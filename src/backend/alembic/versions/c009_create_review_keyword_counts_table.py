@@ -0,0 +1,69 @@
+"""create_review_keyword_counts_table
+
+Revision ID: c009_review_keyword_counts
+Revises: c008_review_keyset_idx
+Create Date: 2026-01-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c009_review_keyword_counts"
+down_revision: str | Sequence[str] | None = "c008_review_keyset_idx"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create review_keyword_counts table.
+
+    Keyword extraction is dictionary based application code, so the table is
+    not backfilled here; that would tie this revision to whatever models and
+    vocabulary exist when it runs. After upgrading, backfill it with
+    ``python scripts/rebuild_review_rollups.py --keywords``.
+    """
+    op.create_table(
+        "review_keyword_counts",
+        sa.Column("shop_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("keyword", sa.String(50), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        # 타임스탬프
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["shop_id"], ["shops.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("shop_id", "day", "keyword"),
+    )
+
+    # updated_at 트리거 생성
+    op.execute("""
+        CREATE TRIGGER set_review_keyword_counts_updated_at
+            BEFORE UPDATE ON review_keyword_counts
+            FOR EACH ROW
+            EXECUTE FUNCTION update_updated_at_column();
+    """)
+
+
+def downgrade() -> None:
+    """Drop review_keyword_counts table."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS set_review_keyword_counts_updated_at "
+        "ON review_keyword_counts"
+    )
+    op.drop_table("review_keyword_counts")
@@ -0,0 +1,47 @@
+"""add_review_search_indexes
+
+Revision ID: c010_review_search_idx
+Revises: c009_review_keyword_counts
+Create Date: 2026-01-18
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c010_review_search_idx"
+down_revision: str | Sequence[str] | None = "c009_review_keyword_counts"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and add trigram GIN indexes for review search.
+
+    Trigrams are character based, so they work for Korean text without a
+    language-specific tsvector parser, and serve both substring (ILIKE)
+    matches and word_similarity (<%) fuzzy matches.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "idx_reviews_content_trgm",
+        "reviews",
+        ["content"],
+        postgresql_using="gin",
+        postgresql_ops={"content": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_reviews_reviewer_name_trgm",
+        "reviews",
+        ["reviewer_name"],
+        postgresql_using="gin",
+        postgresql_ops={"reviewer_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Drop review search indexes (the pg_trgm extension is left installed)."""
+    op.drop_index("idx_reviews_reviewer_name_trgm", table_name="reviews")
+    op.drop_index("idx_reviews_content_trgm", table_name="reviews")
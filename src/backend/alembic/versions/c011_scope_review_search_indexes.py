@@ -0,0 +1,65 @@
+"""scope_review_search_indexes
+
+Revision ID: c011_review_search_shop_idx
+Revises: c010_review_search_idx
+Create Date: 2026-01-19
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c011_review_search_shop_idx"
+down_revision: str | Sequence[str] | None = "c010_review_search_idx"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace the global trigram indexes with (shop_id, column) GIN indexes.
+
+    Search always filters by shop, so btree_gin lets the same GIN index
+    restrict both the shop and the trigrams instead of intersecting every
+    shop's matches. Queries shorter than three characters yield no trigrams;
+    those skip the trigram operators and scan the shop's reviews through the
+    shop_id btree indexes (see review_search_filter).
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.create_index(
+        "idx_reviews_shop_content_trgm",
+        "reviews",
+        ["shop_id", "content"],
+        postgresql_using="gin",
+        postgresql_ops={"content": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_reviews_shop_reviewer_name_trgm",
+        "reviews",
+        ["shop_id", "reviewer_name"],
+        postgresql_using="gin",
+        postgresql_ops={"reviewer_name": "gin_trgm_ops"},
+    )
+    op.drop_index("idx_reviews_reviewer_name_trgm", table_name="reviews")
+    op.drop_index("idx_reviews_content_trgm", table_name="reviews")
+
+
+def downgrade() -> None:
+    """Restore the global trigram indexes (btree_gin is left installed)."""
+    op.create_index(
+        "idx_reviews_content_trgm",
+        "reviews",
+        ["content"],
+        postgresql_using="gin",
+        postgresql_ops={"content": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "idx_reviews_reviewer_name_trgm",
+        "reviews",
+        ["reviewer_name"],
+        postgresql_using="gin",
+        postgresql_ops={"reviewer_name": "gin_trgm_ops"},
+    )
+    op.drop_index("idx_reviews_shop_reviewer_name_trgm", table_name="reviews")
+    op.drop_index("idx_reviews_shop_content_trgm", table_name="reviews")
@@ -0,0 +1,32 @@
+"""add_style_tag_analysis_job_id
+
+Revision ID: c012_style_tag_analysis_job
+Revises: c011_review_search_shop_idx
+Create Date: 2026-01-20
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c012_style_tag_analysis_job"
+down_revision: str | Sequence[str] | None = "c011_review_search_shop_idx"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Record which background job owns a style tag's analysis."""
+    op.add_column(
+        "style_tags",
+        sa.Column("analysis_job_id", sa.String(length=36), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove analysis_job_id column."""
+    op.drop_column("style_tags", "analysis_job_id")
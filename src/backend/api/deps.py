@@ -3,13 +3,18 @@ API 의존성
 인증, 데이터베이스 세션 등 공통 의존성 정의
 """
 
+from datetime import UTC, datetime
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.database import get_db
+from infrastructure.cache.shop_cache import ShopCache
+from models.shop import Shop
 from models.user import User
 from services.auth_service import AuthException, AuthService
 
@@ -34,3 +39,44 @@ async def get_current_user(
 
 # 현재 사용자 의존성
 CurrentUser = Annotated[User, Depends(get_current_user)]
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 약한 비교로 확인합니다."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+async def apply_shop_etag(
+    request: Request,
+    response: Response,
+    shop_id: UUID,
+    shop_cache: ShopCache,
+) -> None:
+    """매장 데이터 버전 기반 weak ETag를 적용합니다.
+
+    If-None-Match가 현재 ETag와 같으면 핸들러 실행 전에 304를 반환합니다.
+    트렌드처럼 오늘 날짜에 따라 달라지는 응답이 있으므로 날짜도 포함합니다.
+    Redis를 사용할 수 없으면 ETag 없이 그대로 진행합니다.
+    """
+    version = await shop_cache.get_version(shop_id)
+    if version is None:
+        return
+
+    etag = f'W/"{version}-{datetime.now(UTC):%Y%m%d}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+
+
+async def is_shop_owner(db: AsyncSession, shop_id: UUID, user: User) -> bool:
+    """사용자가 매장 소유자인지 확인합니다."""
+    result = await db.execute(
+        select(Shop.id).where(Shop.id == shop_id).where(Shop.user_id == user.id)
+    )
+    return result.scalar_one_or_none() is not None
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.database import get_db
 from config.settings import get_settings
+from infrastructure.external.http_clients import HTTPClientRegistry, get_http_clients
 from schemas.auth import (
     AccessTokenResponse,
     AuthResponse,
@@ -30,9 +31,12 @@ def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
     return AuthService(db)
 
 
-def get_oauth_service(db: AsyncSession = Depends(get_db)) -> OAuthService:
+def get_oauth_service(
+    db: AsyncSession = Depends(get_db),
+    http_clients: HTTPClientRegistry = Depends(get_http_clients),
+) -> OAuthService:
     """OAuth 서비스 의존성"""
-    return OAuthService(db)
+    return OAuthService(db, http_clients)
 
 
 @router.post(
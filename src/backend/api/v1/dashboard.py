@@ -6,15 +6,18 @@ from datetime import date
 from uuid import UUID
 
 import sentry_sdk
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from config.database import get_db
+from api.deps import apply_shop_etag
+from config.database import get_db, get_session_factory
+from infrastructure.cache.shop_cache import ShopCache, get_shop_cache
 from models.shop import Shop
 from models.user import User
 from schemas.dashboard import (
     CalendarResponse,
+    DashboardOverviewResponse,
     EngagementResponse,
     GeneratedResponseResult,
     PendingReviewsResponse,
@@ -24,7 +27,7 @@ from schemas.dashboard import (
     TrendResponse,
 )
 from services.auth_service import AuthException, AuthService
-from services.dashboard_service import DashboardService
+from services.dashboard_service import DashboardOverviewService, DashboardService
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 security = HTTPBearer()
@@ -42,9 +45,12 @@ async def get_current_user(
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
 
 
-async def get_dashboard_service(db: AsyncSession = Depends(get_db)) -> DashboardService:
+async def get_dashboard_service(
+    db: AsyncSession = Depends(get_db),
+    shop_cache: ShopCache = Depends(get_shop_cache),
+) -> DashboardService:
     """Dependency to get DashboardService instance"""
-    return DashboardService(db)
+    return DashboardService(db, shop_cache)
 
 
 async def verify_shop_access(
@@ -82,10 +88,66 @@ async def verify_shop_access(
     return shop
 
 
+async def conditional_get(
+    request: Request,
+    response: Response,
+    shop: Shop = Depends(verify_shop_access),
+    shop_cache: ShopCache = Depends(get_shop_cache),
+) -> None:
+    """Answer If-None-Match with 304 while the shop's data is unchanged"""
+    await apply_shop_etag(request, response, shop.id, shop_cache)
+
+
+# ============== Dashboard Overview ==============
+
+
+@router.get(
+    "/{shop_id}/overview",
+    response_model=DashboardOverviewResponse,
+    dependencies=[Depends(conditional_get)],
+)
+async def get_dashboard_overview(
+    shop_id: UUID,
+    response: Response,
+    start_date: date | None = Query(
+        None, description="Calendar start date (defaults to start of this month)"
+    ),
+    end_date: date | None = Query(
+        None, description="Calendar end date (defaults to end of start month)"
+    ),
+    period: str = Query(
+        "month", pattern="^(week|month|year)$", description="Trend period"
+    ),
+    limit: int = Query(10, ge=1, le=50, description="Maximum pending reviews"),
+    _shop: Shop = Depends(verify_shop_access),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+    shop_cache: ShopCache = Depends(get_shop_cache),
+) -> DashboardOverviewResponse:
+    """
+    Get every dashboard section in one request.
+
+    Authorizes once, then computes stats, calendar, engagement, trends and
+    pending reviews concurrently. Per-section timings are reported in the
+    Server-Timing header.
+    """
+    service = DashboardOverviewService(session_factory, shop_cache)
+    overview, timings = await service.get_overview(
+        shop_id, start_date, end_date, period, limit
+    )
+    response.headers["Server-Timing"] = ", ".join(
+        f"{section};dur={duration:.2f}" for section, duration in timings.items()
+    )
+    return overview
+
+
 # ============== User Story 1: Review Stats ==============
 
 
-@router.get("/{shop_id}/stats", response_model=ReviewStatsResponse)
+@router.get(
+    "/{shop_id}/stats",
+    response_model=ReviewStatsResponse,
+    dependencies=[Depends(conditional_get)],
+)
 async def get_dashboard_stats(
     shop_id: UUID,
     _shop: Shop = Depends(verify_shop_access),
@@ -102,7 +164,11 @@ async def get_dashboard_stats(
 # ============== User Story 2: Posting Calendar ==============
 
 
-@router.get("/{shop_id}/calendar", response_model=CalendarResponse)
+@router.get(
+    "/{shop_id}/calendar",
+    response_model=CalendarResponse,
+    dependencies=[Depends(conditional_get)],
+)
 async def get_posting_calendar(
     shop_id: UUID,
     start_date: date = Query(..., description="Start date for calendar range"),
@@ -124,7 +190,11 @@ async def get_posting_calendar(
 # ============== User Story 3: Engagement Metrics ==============
 
 
-@router.get("/{shop_id}/engagement", response_model=EngagementResponse)
+@router.get(
+    "/{shop_id}/engagement",
+    response_model=EngagementResponse,
+    dependencies=[Depends(conditional_get)],
+)
 async def get_engagement_metrics(
     shop_id: UUID,
     _shop: Shop = Depends(verify_shop_access),
@@ -141,7 +211,11 @@ async def get_engagement_metrics(
 # ============== User Story 4: Trend Data ==============
 
 
-@router.get("/{shop_id}/trends", response_model=TrendResponse)
+@router.get(
+    "/{shop_id}/trends",
+    response_model=TrendResponse,
+    dependencies=[Depends(conditional_get)],
+)
 async def get_trend_data(
     shop_id: UUID,
     period: str = Query(..., pattern="^(week|month|year)$", description="Time period"),
@@ -159,7 +233,11 @@ async def get_trend_data(
 # ============== User Story 5: Pending Reviews & Quick Actions ==============
 
 
-@router.get("/{shop_id}/pending-reviews", response_model=PendingReviewsResponse)
+@router.get(
+    "/{shop_id}/pending-reviews",
+    response_model=PendingReviewsResponse,
+    dependencies=[Depends(conditional_get)],
+)
 async def get_pending_reviews(
     shop_id: UUID,
     limit: int = Query(10, ge=1, le=50, description="Maximum reviews to return"),
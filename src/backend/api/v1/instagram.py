@@ -6,6 +6,7 @@ Instagram Business 계정 OAuth 및 연결 관리
 from typing import Annotated
 from uuid import UUID
 
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import RedirectResponse
 from pydantic import BaseModel
@@ -13,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.deps import get_current_user, get_db
 from config.settings import get_settings
+from infrastructure.external.http_clients import get_graph_http_client
 from models.user import User
 from services.instagram_service import InstagramAPIError, InstagramService
 
@@ -43,6 +45,14 @@ class InstagramOAuthCallback(BaseModel):
     message: str
 
 
+def get_instagram_service(
+    db: AsyncSession = Depends(get_db),
+    client: httpx.AsyncClient = Depends(get_graph_http_client),
+) -> InstagramService:
+    """InstagramService 의존성 (공용 Graph API HTTP 클라이언트 사용)"""
+    return InstagramService(db, client)
+
+
 # ============== OAuth 흐름 ==============
 
 
@@ -75,15 +85,13 @@ async def start_instagram_oauth(
 async def instagram_oauth_callback(
     code: str = Query(..., description="Facebook OAuth authorization code"),
     state: str = Query(..., description="State parameter with user info"),
-    db: AsyncSession = Depends(get_db),
+    instagram_service: InstagramService = Depends(get_instagram_service),
 ) -> RedirectResponse:
     """Instagram OAuth 콜백 처리
 
     Facebook에서 리다이렉트된 요청을 처리하고,
     access token을 교환하여 Instagram 계정을 연결합니다.
     """
-    instagram_service = InstagramService(db)
-
     try:
         # state에서 user_id와 redirect_uri 추출
         parts = state.split("|", 1)
@@ -140,9 +148,6 @@ async def instagram_oauth_callback(
         error_redirect = f"{frontend_redirect}?error=unknown_error"
         return RedirectResponse(url=error_redirect)
 
-    finally:
-        await instagram_service.close()
-
 
 # ============== 연결 상태 관리 ==============
 
@@ -151,6 +156,7 @@ async def instagram_oauth_callback(
 async def get_instagram_connection_status(
     current_user: Annotated[User, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db),
+    instagram_service: InstagramService = Depends(get_instagram_service),
 ) -> InstagramConnectionStatus:
     """현재 사용자의 Instagram 연결 상태 조회"""
     from sqlalchemy import select
@@ -169,7 +175,6 @@ async def get_instagram_connection_status(
         return InstagramConnectionStatus(connected=False)
 
     # Instagram 계정 정보 조회
-    instagram_service = InstagramService(db)
     try:
         ig_account = await instagram_service.get_instagram_business_account(
             social_account.access_token
@@ -188,8 +193,6 @@ async def get_instagram_connection_status(
     except InstagramAPIError:
         # 토큰이 유효하지 않으면 연결 해제 상태로 표시
         return InstagramConnectionStatus(connected=False)
-    finally:
-        await instagram_service.close()
 
 
 @router.delete("/disconnect")
@@ -220,11 +223,9 @@ async def disconnect_instagram(
 async def get_shop_instagram_status(
     shop_id: UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: AsyncSession = Depends(get_db),
+    instagram_service: InstagramService = Depends(get_instagram_service),
 ) -> InstagramConnectionStatus:
     """특정 Shop의 Instagram 연결 상태 조회"""
-    instagram_service = InstagramService(db)
-
     try:
         ig_connection = await instagram_service.get_shop_instagram_account(shop_id)
 
@@ -254,6 +255,3 @@ async def get_shop_instagram_status(
 
     except InstagramAPIError:
         return InstagramConnectionStatus(connected=False)
-
-    finally:
-        await instagram_service.close()
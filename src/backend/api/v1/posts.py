@@ -6,11 +6,23 @@ Instagram 포스트 CRUD 및 발행 API
 from datetime import UTC, datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+import httpx
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.deps import apply_shop_etag, is_shop_owner
 from config.database import get_db
+from infrastructure.cache.shop_cache import ShopCache, get_shop_cache
+from infrastructure.external.http_clients import get_graph_http_client
 from models.post import Post
 from models.user import User
 from schemas.post import (
@@ -43,9 +55,26 @@ async def get_current_user(
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
 
 
-def get_post_service(db: AsyncSession = Depends(get_db)) -> PostService:
+async def conditional_get(
+    request: Request,
+    response: Response,
+    shop_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    shop_cache: ShopCache = Depends(get_shop_cache),
+) -> None:
+    """매장 데이터가 변경되지 않았으면 If-None-Match에 304로 응답합니다."""
+    if await is_shop_owner(db, shop_id, current_user):
+        await apply_shop_etag(request, response, shop_id, shop_cache)
+
+
+def get_post_service(
+    db: AsyncSession = Depends(get_db),
+    shop_cache: ShopCache = Depends(get_shop_cache),
+    graph_client: httpx.AsyncClient = Depends(get_graph_http_client),
+) -> PostService:
     """포스트 서비스 의존성"""
-    return PostService(db)
+    return PostService(db, shop_cache, graph_client)
 
 
 def _post_to_response(post: Post) -> PostResponse:
@@ -93,6 +122,7 @@ async def create_post(
 
 @router.get(
     "",
+    dependencies=[Depends(conditional_get)],
     response_model=PostListResponse,
     summary="포스트 목록 조회",
 )
@@ -119,6 +149,7 @@ async def get_posts(
 
 @router.get(
     "/stats",
+    dependencies=[Depends(conditional_get)],
     response_model=PostStatsResponse,
     summary="포스트 통계 조회",
 )
@@ -163,6 +194,7 @@ async def get_optimal_times(
 
 @router.get(
     "/{post_id}",
+    dependencies=[Depends(conditional_get)],
     response_model=PostResponse,
     summary="포스트 상세 조회",
 )
@@ -3,39 +3,85 @@
 리뷰 CRUD 및 통계 API
 """
 
-from datetime import datetime
-from typing import Literal
+import json
+from collections import Counter
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from typing import Any, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from config.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from api.deps import apply_shop_etag, is_shop_owner
+from config.database import get_db, get_session_factory
+from core.export_formats import iter_csv, iter_json_array, iter_ndjson, iter_xlsx
+from core.sse import SSE_HEADERS, format_sse
+from infrastructure.cache.job_store import JobStore, get_job_store
+from infrastructure.cache.reply_cache import ReplyCache, get_reply_cache
+from infrastructure.cache.shop_cache import ShopCache, get_shop_cache
+from infrastructure.external.llm_client import LLMProvider, get_llm_provider
 from models.user import User
-from schemas.ai_response import AIResponseRequest, AIResponseResult
+from schemas.ai_response import (
+    AIReplyCacheStats,
+    AIResponseBatchRequest,
+    AIResponseJob,
+    AIResponseRequest,
+    AIResponseResult,
+)
 from schemas.review import (
+    ExportFormat,
     KeywordFrequency,
     MetricComparison,
     PlatformDistribution,
     RatingDistribution,
     ReviewAnalyticsResponse,
+    ReviewBulkItemResult,
+    ReviewBulkResponse,
+    ReviewBulkStatusItemResult,
+    ReviewBulkStatusResponse,
+    ReviewBulkStatusUpdate,
     ReviewCreate,
     ReviewExportItem,
     ReviewListResponse,
     ReviewResponse,
+    ReviewSearchHit,
+    ReviewSearchResponse,
     ReviewStatsResponse,
     ReviewUpdate,
     SentimentAnalysis,
     TrendDataPoint,
 )
-from services.ai_response_service import AIResponseException, AIResponseService
+from services.ai_response_service import (
+    AIResponseException,
+    AIResponseService,
+    ReplyOptions,
+)
 from services.auth_service import AuthException, AuthService
-from services.review_service import ReviewException, ReviewService
+from services.review_service import EXPORT_COLUMNS, ReviewException, ReviewService
+from worker.queue import JobQueue, get_job_queue
+from worker.tasks.ai_replies import JOB_KIND, generate_ai_replies
 
 router = APIRouter()
 security = HTTPBearer()
 
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -49,14 +95,74 @@ async def get_current_user(
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
 
 
-def get_review_service(db: AsyncSession = Depends(get_db)) -> ReviewService:
+async def conditional_get(
+    request: Request,
+    response: Response,
+    shop_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    shop_cache: ShopCache = Depends(get_shop_cache),
+) -> None:
+    """매장 데이터가 변경되지 않았으면 If-None-Match에 304로 응답합니다."""
+    if await is_shop_owner(db, shop_id, current_user):
+        await apply_shop_etag(request, response, shop_id, shop_cache)
+
+
+async def _iter_ndjson_items(request: Request) -> AsyncIterator[Any]:
+    """NDJSON 요청 본문을 읽는 대로 한 줄씩 파싱합니다.
+
+    JSON으로 파싱할 수 없는 줄은 원문 그대로 넘겨 항목 검증 단계에서
+    오류로 보고되게 합니다.
+    """
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _parse_ndjson_line(line)
+    if buffer.strip():
+        yield _parse_ndjson_line(buffer)
+
+
+def _parse_ndjson_line(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return line.decode(errors="replace")
+
+
+async def _iter_items(items: list[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+async def _export_items(
+    rows: AsyncIterator[dict[str, Any]],
+) -> AsyncIterator[dict[str, Any]]:
+    """내보내기 행을 ReviewExportItem의 camelCase 형태로 변환합니다."""
+    async for row in rows:
+        yield ReviewExportItem.model_validate(row).model_dump(by_alias=True)
+
+
+def get_review_service(
+    db: AsyncSession = Depends(get_db),
+    shop_cache: ShopCache = Depends(get_shop_cache),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> ReviewService:
     """리뷰 서비스 의존성"""
-    return ReviewService(db)
+    return ReviewService(db, shop_cache, session_factory)
 
 
-def get_ai_response_service(db: AsyncSession = Depends(get_db)) -> AIResponseService:
+def get_ai_response_service(
+    db: AsyncSession = Depends(get_db),
+    shop_cache: ShopCache = Depends(get_shop_cache),
+    llm: LLMProvider | None = Depends(get_llm_provider),
+    reply_cache: ReplyCache = Depends(get_reply_cache),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> AIResponseService:
     """AI 응답 서비스 의존성"""
-    return AIResponseService(db)
+    return AIResponseService(db, shop_cache, llm, reply_cache, session_factory)
 
 
 @router.post(
@@ -102,6 +208,7 @@ async def create_review(
 
 @router.get(
     "",
+    dependencies=[Depends(conditional_get)],
     response_model=ReviewListResponse,
     summary="리뷰 목록 조회",
 )
@@ -110,6 +217,8 @@ async def get_reviews(
     status_filter: str | None = Query(default=None, alias="status"),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=True, alias="includeTotal"),
     current_user: User = Depends(get_current_user),
     review_service: ReviewService = Depends(get_review_service),
 ) -> ReviewListResponse:
@@ -117,11 +226,19 @@ async def get_reviews(
 
     - **status**: 필터링할 상태 (pending, replied, ignored)
     - **limit**: 조회할 개수 (기본 20, 최대 100)
-    - **offset**: 시작 위치
+    - **offset**: 시작 위치 (하위 호환용, cursor 사용 권장)
+    - **cursor**: 이전 응답의 nextCursor (지정 시 offset 무시)
+    - **includeTotal**: 총 개수 포함 여부 (기본 true)
     """
     try:
-        reviews, total = await review_service.get_reviews(
-            current_user, shop_id, status_filter, limit, offset
+        reviews, total, next_cursor = await review_service.get_reviews(
+            current_user,
+            shop_id,
+            status_filter,
+            limit,
+            offset,
+            cursor=cursor,
+            include_total=include_total,
         )
         return ReviewListResponse(
             reviews=[
@@ -144,6 +261,160 @@ async def get_reviews(
                 for r in reviews
             ],
             total=total,
+            nextCursor=next_cursor,
+        )
+    except ReviewException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message) from e
+
+
+@router.post(
+    "/bulk",
+    response_model=ReviewBulkResponse,
+    summary="리뷰 일괄 등록",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/ReviewCreate"},
+                    }
+                },
+                "application/x-ndjson": {
+                    "schema": {"$ref": "#/components/schemas/ReviewCreate"}
+                },
+            },
+        }
+    },
+)
+async def bulk_import_reviews(
+    shop_id: UUID,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    review_service: ReviewService = Depends(get_review_service),
+) -> ReviewBulkResponse:
+    """리뷰를 일괄 등록합니다.
+
+    JSON 배열 또는 NDJSON(application/x-ndjson) 본문을 받습니다.
+    googleReviewId가 이미 등록된 리뷰는 원본 정보만 갱신되며,
+    항목별 결과(created, updated, error)를 요청 순서대로 반환합니다.
+    """
+    items: AsyncIterator[Any]
+    if "ndjson" in request.headers.get("content-type", ""):
+        items = _iter_ndjson_items(request)
+    else:
+        try:
+            body = json.loads(await request.body())
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400, detail="올바른 JSON 본문이 아닙니다."
+            ) from e
+        if not isinstance(body, list):
+            raise HTTPException(status_code=400, detail="리뷰 배열이 필요합니다.")
+        items = _iter_items(body)
+
+    try:
+        results = await review_service.bulk_upsert_reviews(current_user, shop_id, items)
+    except ReviewException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message) from e
+
+    counts = Counter(result["status"] for result in results)
+    return ReviewBulkResponse(
+        created=counts["created"],
+        updated=counts["updated"],
+        failed=counts["error"],
+        results=[
+            ReviewBulkItemResult(
+                index=result["index"],
+                status=result["status"],
+                id=result["id"],
+                googleReviewId=result["google_review_id"],
+                error=result["error"],
+            )
+            for result in results
+        ],
+    )
+
+
+@router.patch(
+    "/bulk",
+    response_model=ReviewBulkStatusResponse,
+    summary="리뷰 상태 일괄 변경",
+)
+async def bulk_update_review_status(
+    shop_id: UUID,
+    update_data: ReviewBulkStatusUpdate,
+    current_user: User = Depends(get_current_user),
+    review_service: ReviewService = Depends(get_review_service),
+) -> ReviewBulkStatusResponse:
+    """여러 리뷰의 상태를 한 번에 변경합니다.
+
+    - **status**: 변경할 상태 (pending, replied, ignored)
+    - **reviewIds**: 대상 리뷰 ID 목록 (최대 1000개)
+    - **filter**: 대상 조건 (status, rating, reviewDateBefore 중 하나 이상,
+      조건에 맞는 리뷰가 1000개를 넘으면 400)
+
+    reviewIds와 filter 중 하나만 지정해야 하며,
+    항목별 결과(updated, unchanged, not_found)를 반환합니다.
+    """
+    try:
+        results = await review_service.bulk_update_status(
+            current_user,
+            shop_id,
+            update_data.status,
+            review_ids=update_data.review_ids,
+            filters=update_data.filter,
+        )
+    except ReviewException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message) from e
+
+    counts = Counter(result["result"] for result in results)
+    return ReviewBulkStatusResponse(
+        updated=counts["updated"],
+        unchanged=counts["unchanged"],
+        notFound=counts["not_found"],
+        results=[
+            ReviewBulkStatusItemResult(id=result["id"], result=result["result"])
+            for result in results
+        ],
+    )
+
+
+@router.get(
+    "/search",
+    dependencies=[Depends(conditional_get)],
+    response_model=ReviewSearchResponse,
+    summary="리뷰 검색",
+)
+async def search_reviews(
+    shop_id: UUID,
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None),
+    current_user: User = Depends(get_current_user),
+    review_service: ReviewService = Depends(get_review_service),
+) -> ReviewSearchResponse:
+    """리뷰 본문과 작성자 이름으로 검색합니다.
+
+    - **q**: 검색어 (오타가 섞여도 유사한 리뷰를 찾음)
+    - **limit**: 조회할 개수 (기본 20, 최대 100)
+    - **cursor**: 이전 응답의 nextCursor
+
+    결과는 관련도가 높은 순, 같으면 최신순으로 정렬됩니다.
+    """
+    try:
+        hits, next_cursor = await review_service.search_reviews(
+            current_user, shop_id, q, limit, cursor=cursor
+        )
+        return ReviewSearchResponse(
+            reviews=[
+                ReviewSearchHit(
+                    **ReviewResponse.model_validate(review).model_dump(), rank=rank
+                )
+                for review, rank in hits
+            ],
+            nextCursor=next_cursor,
         )
     except ReviewException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
@@ -151,6 +422,7 @@ async def get_reviews(
 
 @router.get(
     "/stats",
+    dependencies=[Depends(conditional_get)],
     response_model=ReviewStatsResponse,
     summary="리뷰 통계 조회",
 )
@@ -173,8 +445,148 @@ async def get_review_stats(
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
 
 
+@router.get(
+    "/analytics",
+    dependencies=[Depends(conditional_get)],
+    response_model=ReviewAnalyticsResponse,
+    summary="리뷰 분석 조회",
+)
+async def get_review_analytics(
+    shop_id: UUID,
+    period: Literal["week", "month", "year"] = Query(default="month"),
+    current_user: User = Depends(get_current_user),
+    review_service: ReviewService = Depends(get_review_service),
+) -> ReviewAnalyticsResponse:
+    """매장의 리뷰 분석 데이터를 조회합니다.
+
+    - **period**: 분석 기간 (week, month, year)
+    """
+    try:
+        analytics = await review_service.get_analytics(current_user, shop_id, period)
+        return ReviewAnalyticsResponse(
+            totalReviews=MetricComparison(
+                current=analytics["total_reviews"]["current"],
+                previous=analytics["total_reviews"]["previous"],
+                changePercent=analytics["total_reviews"]["change_percent"],
+            ),
+            averageRating=MetricComparison(
+                current=analytics["average_rating"]["current"],
+                previous=analytics["average_rating"]["previous"],
+                changePercent=analytics["average_rating"]["change_percent"],
+            ),
+            responseRate=MetricComparison(
+                current=analytics["response_rate"]["current"],
+                previous=analytics["response_rate"]["previous"],
+                changePercent=analytics["response_rate"]["change_percent"],
+            ),
+            ratingDistribution=[
+                RatingDistribution(
+                    rating=item["rating"],
+                    count=item["count"],
+                    percent=item["percent"],
+                )
+                for item in analytics["rating_distribution"]
+            ],
+            platformDistribution=[
+                PlatformDistribution(
+                    platform=item["platform"],
+                    count=item["count"],
+                    percent=item["percent"],
+                )
+                for item in analytics["platform_distribution"]
+            ],
+            trendData=[
+                TrendDataPoint(
+                    date=item["date"],
+                    reviewCount=item["review_count"],
+                    averageRating=item["average_rating"],
+                )
+                for item in analytics["trend_data"]
+            ],
+            keywords=[
+                KeywordFrequency(keyword=item["keyword"], count=item["count"])
+                for item in analytics["keywords"]
+            ],
+            sentiment=SentimentAnalysis(
+                positive=analytics["sentiment"]["positive"],
+                neutral=analytics["sentiment"]["neutral"],
+                negative=analytics["sentiment"]["negative"],
+                positivePercent=analytics["sentiment"]["positive_percent"],
+                neutralPercent=analytics["sentiment"]["neutral_percent"],
+                negativePercent=analytics["sentiment"]["negative_percent"],
+            ),
+        )
+    except ReviewException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message) from e
+
+
+@router.get(
+    "/export",
+    dependencies=[Depends(conditional_get)],
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "format에 따른 리뷰 내보내기 파일",
+            "content": {
+                EXPORT_MEDIA_TYPES["json"]: {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/ReviewExportItem"},
+                    }
+                },
+                EXPORT_MEDIA_TYPES["ndjson"]: {},
+                EXPORT_MEDIA_TYPES["csv"]: {},
+                EXPORT_MEDIA_TYPES["xlsx"]: {},
+            },
+        }
+    },
+    summary="리뷰 내보내기",
+)
+async def export_reviews(
+    shop_id: UUID,
+    status_filter: str | None = Query(default=None, alias="status"),
+    date_from: datetime | None = Query(default=None, alias="dateFrom"),
+    date_to: datetime | None = Query(default=None, alias="dateTo"),
+    export_format: ExportFormat = Query(default="json", alias="format"),
+    current_user: User = Depends(get_current_user),
+    review_service: ReviewService = Depends(get_review_service),
+) -> StreamingResponse:
+    """리뷰 데이터를 스트리밍으로 내보냅니다.
+
+    - **status**: 상태 필터 (pending, replied, ignored)
+    - **dateFrom**: 시작일
+    - **dateTo**: 종료일
+    - **format**: 출력 형식 (json, ndjson, csv, xlsx)
+    """
+    try:
+        rows = await review_service.export_reviews(
+            current_user, shop_id, status_filter, date_from, date_to
+        )
+    except ReviewException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message) from e
+
+    body: AsyncIterator[bytes]
+    if export_format == "csv":
+        body = iter_csv(EXPORT_COLUMNS, rows)
+    elif export_format == "xlsx":
+        body = iter_xlsx(EXPORT_COLUMNS, rows)
+    elif export_format == "ndjson":
+        body = iter_ndjson(_export_items(rows))
+    else:
+        body = iter_json_array(_export_items(rows))
+
+    headers = {}
+    if export_format != "json":
+        filename = f"reviews_{datetime.now(UTC):%Y%m%d}.{export_format}"
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return StreamingResponse(
+        body, media_type=EXPORT_MEDIA_TYPES[export_format], headers=headers
+    )
+
+
 @router.get(
     "/{review_id}",
+    dependencies=[Depends(conditional_get)],
     response_model=ReviewResponse,
     summary="리뷰 상세 조회",
 )
@@ -303,116 +715,153 @@ async def generate_ai_response(
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
 
 
-@router.get(
-    "/analytics",
-    response_model=ReviewAnalyticsResponse,
-    summary="리뷰 분석 조회",
+@router.post(
+    "/{review_id}/ai-response/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "token, done, error 이벤트 스트림",
+            "content": {"text/event-stream": {}},
+        }
+    },
+    summary="AI 답변 스트리밍 생성",
 )
-async def get_review_analytics(
+async def stream_ai_response(
     shop_id: UUID,
-    period: Literal["week", "month", "year"] = Query(default="month"),
+    review_id: UUID,
+    request: AIResponseRequest | None = None,
     current_user: User = Depends(get_current_user),
-    review_service: ReviewService = Depends(get_review_service),
-) -> ReviewAnalyticsResponse:
-    """매장의 리뷰 분석 데이터를 조회합니다.
+    ai_service: AIResponseService = Depends(get_ai_response_service),
+) -> StreamingResponse:
+    """리뷰에 대한 AI 답변을 생성되는 대로 Server-Sent Events로 전송합니다.
 
-    - **period**: 분석 기간 (week, month, year)
+    - **token**: 생성된 텍스트 조각 ({"text"})
+    - **done**: 저장된 최종 답변 ({"aiResponse", "generatedAt"})
+    - **error**: 생성 실패 ({"message"}), 이 경우 답변은 저장되지 않음
     """
+    request_data = request or AIResponseRequest()
     try:
-        analytics = await review_service.get_analytics(current_user, shop_id, period)
-        return ReviewAnalyticsResponse(
-            totalReviews=MetricComparison(
-                current=analytics["total_reviews"]["current"],
-                previous=analytics["total_reviews"]["previous"],
-                changePercent=analytics["total_reviews"]["change_percent"],
-            ),
-            averageRating=MetricComparison(
-                current=analytics["average_rating"]["current"],
-                previous=analytics["average_rating"]["previous"],
-                changePercent=analytics["average_rating"]["change_percent"],
-            ),
-            responseRate=MetricComparison(
-                current=analytics["response_rate"]["current"],
-                previous=analytics["response_rate"]["previous"],
-                changePercent=analytics["response_rate"]["change_percent"],
-            ),
-            ratingDistribution=[
-                RatingDistribution(
-                    rating=item["rating"],
-                    count=item["count"],
-                    percent=item["percent"],
-                )
-                for item in analytics["rating_distribution"]
-            ],
-            platformDistribution=[
-                PlatformDistribution(
-                    platform=item["platform"],
-                    count=item["count"],
-                    percent=item["percent"],
-                )
-                for item in analytics["platform_distribution"]
-            ],
-            trendData=[
-                TrendDataPoint(
-                    date=item["date"],
-                    reviewCount=item["review_count"],
-                    averageRating=item["average_rating"],
-                )
-                for item in analytics["trend_data"]
-            ],
-            keywords=[
-                KeywordFrequency(keyword=item["keyword"], count=item["count"])
-                for item in analytics["keywords"]
-            ],
-            sentiment=SentimentAnalysis(
-                positive=analytics["sentiment"]["positive"],
-                neutral=analytics["sentiment"]["neutral"],
-                negative=analytics["sentiment"]["negative"],
-                positivePercent=analytics["sentiment"]["positive_percent"],
-                neutralPercent=analytics["sentiment"]["neutral_percent"],
-                negativePercent=analytics["sentiment"]["negative_percent"],
+        events = await ai_service.stream_response(
+            current_user,
+            shop_id,
+            review_id,
+            ReplyOptions(
+                tone=request_data.tone or "friendly",
+                include_shop_name=request_data.include_shop_name,
+                max_length=request_data.max_length,
             ),
         )
-    except ReviewException as e:
+    except AIResponseException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
 
+    async def body() -> AsyncIterator[bytes]:
+        async for event, data in events:
+            if event == "done":
+                data = AIResponseResult(
+                    aiResponse=data["ai_response"], generatedAt=data["generated_at"]
+                ).model_dump(mode="json", by_alias=True)
+            yield format_sse(event, data)
 
-@router.get(
-    "/export",
-    response_model=list[ReviewExportItem],
-    summary="리뷰 내보내기",
+    return StreamingResponse(
+        body(), media_type="text/event-stream", headers=SSE_HEADERS
+    )
+
+
+@router.post(
+    "/ai-responses",
+    response_model=AIResponseJob,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="AI 답변 일괄 생성",
 )
-async def export_reviews(
+async def generate_ai_responses(
     shop_id: UUID,
-    status_filter: str | None = Query(default=None, alias="status"),
-    date_from: datetime | None = Query(default=None, alias="dateFrom"),
-    date_to: datetime | None = Query(default=None, alias="dateTo"),
+    request: AIResponseBatchRequest | None = None,
     current_user: User = Depends(get_current_user),
-    review_service: ReviewService = Depends(get_review_service),
-) -> list[ReviewExportItem]:
-    """리뷰 데이터를 내보냅니다.
-
-    - **status**: 상태 필터 (pending, replied, ignored)
-    - **dateFrom**: 시작일
-    - **dateTo**: 종료일
+    ai_service: AIResponseService = Depends(get_ai_response_service),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+    shop_cache: ShopCache = Depends(get_shop_cache),
+    reply_cache: ReplyCache = Depends(get_reply_cache),
+    job_store: JobStore = Depends(get_job_store),
+    job_queue: JobQueue = Depends(get_job_queue),
+) -> AIResponseJob:
+    """여러 리뷰의 AI 답변 생성을 백그라운드 작업으로 등록합니다.
+
+    - **reviewIds**: 대상 리뷰 ID 목록 (생략 시 답변이 없는 대기 리뷰 전체)
+    - **tone**, **includeShopName**, **maxLength**: 단건 생성과 동일
+
+    진행 상황은 반환된 작업 ID로 작업 상태 조회 API에서 확인합니다.
     """
+    request_data = request or AIResponseBatchRequest()
     try:
-        reviews = await review_service.export_reviews(
-            current_user, shop_id, status_filter, date_from, date_to
+        review_ids = await ai_service.get_batch_targets(
+            current_user, shop_id, request_data.review_ids
         )
-        return [
-            ReviewExportItem(
-                id=item["id"],
-                reviewerName=item["reviewer_name"],
-                rating=item["rating"],
-                content=item["content"],
-                reviewDate=item["review_date"],
-                status=item["status"],
-                platform=item["platform"],
-                response=item["response"],
-                respondedAt=item["responded_at"],
-            )
-            for item in reviews
-        ]
-    except ReviewException as e:
+    except AIResponseException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
+
+    job = await job_store.create(JOB_KIND, shop_id, len(review_ids))
+    if review_ids:
+        job_queue.submit(
+            generate_ai_replies(
+                session_factory,
+                job_store,
+                shop_cache,
+                reply_cache,
+                job["id"],
+                shop_id,
+                review_ids,
+                ReplyOptions(
+                    tone=request_data.tone or "friendly",
+                    include_shop_name=request_data.include_shop_name,
+                    max_length=request_data.max_length,
+                ),
+            ),
+            job_id=job["id"],
+        )
+    return AIResponseJob.model_validate(job)
+
+
+@router.get(
+    "/ai-responses/jobs/{job_id}",
+    response_model=AIResponseJob,
+    summary="AI 답변 일괄 생성 작업 조회",
+)
+async def get_ai_response_job(
+    shop_id: UUID,
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    job_store: JobStore = Depends(get_job_store),
+) -> AIResponseJob:
+    """AI 답변 일괄 생성 작업의 진행 상황을 조회합니다."""
+    if not await is_shop_owner(db, shop_id, current_user):
+        raise HTTPException(status_code=404, detail="매장을 찾을 수 없습니다.")
+
+    job = await job_store.get(job_id)
+    if job is None or job["kind"] != JOB_KIND or job["shop_id"] != str(shop_id):
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return AIResponseJob.model_validate(job)
+
+
+@router.get(
+    "/ai-responses/cache",
+    response_model=AIReplyCacheStats,
+    summary="AI 답변 캐시 적중 통계",
+)
+async def get_ai_reply_cache_stats(
+    shop_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    reply_cache: ReplyCache = Depends(get_reply_cache),
+) -> AIReplyCacheStats:
+    """비슷한 리뷰의 답변을 재사용한 횟수(적중)와 새로 생성한 횟수(미스)를 조회합니다."""
+    if not await is_shop_owner(db, shop_id, current_user):
+        raise HTTPException(status_code=404, detail="매장을 찾을 수 없습니다.")
+
+    hits, misses = await reply_cache.stats(shop_id)
+    lookups = hits + misses
+    return AIReplyCacheStats(
+        hits=hits,
+        misses=misses,
+        hitRate=round(hits / lookups, 4) if lookups else 0.0,
+    )
@@ -6,14 +6,26 @@ Vision AI 기반 시술 사진 분석 및 스타일 관리
 from typing import Annotated
 from uuid import UUID
 
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, ConfigDict, Field
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from api.deps import get_current_user, get_db
+from api.deps import get_current_user, get_db, is_shop_owner
+from config.database import get_session_factory
+from infrastructure.cache.job_store import JobStore, get_job_store
+from infrastructure.cache.shop_cache import ShopCache, get_shop_cache
+from infrastructure.external.http_clients import get_openai_http_client
 from models.style_tag import StyleTag
 from models.user import User
+from schemas.common import JobResponse
 from services.vision_service import VisionService, VisionServiceError
+from worker.queue import JobQueue, get_job_queue
+from worker.tasks.style_analysis import (
+    JOB_KIND,
+    analyze_style_image,
+    analyze_style_images,
+)
 
 router = APIRouter()
 
@@ -65,6 +77,21 @@ class AnalyzeImageRequest(BaseModel):
     thumbnail_url: str | None = Field(None, description="썸네일 URL (선택)")
 
 
+class AnalyzeBatchRequest(BaseModel):
+    """이미지 일괄 분석 요청 (스타일북 가져오기)"""
+
+    images: list[AnalyzeImageRequest] = Field(
+        ..., min_length=1, max_length=500, description="분석할 이미지 목록"
+    )
+
+
+class AnalyzeBatchResponse(BaseModel):
+    """이미지 일괄 분석 요청 응답"""
+
+    job: JobResponse
+    style_tag_ids: list[str]
+
+
 class AnalyzeBase64Request(BaseModel):
     """Base64 이미지 분석 요청"""
 
@@ -90,6 +117,15 @@ class ContentSuggestionResponse(BaseModel):
 # ============== Helper ==============
 
 
+def get_vision_service(
+    db: AsyncSession = Depends(get_db),
+    shop_cache: ShopCache = Depends(get_shop_cache),
+    client: httpx.AsyncClient = Depends(get_openai_http_client),
+) -> VisionService:
+    """VisionService 의존성 (공용 OpenAI HTTP 클라이언트 사용)"""
+    return VisionService(db, shop_cache, client)
+
+
 def style_tag_to_response(style_tag: StyleTag) -> StyleTagResponse:
     """StyleTag 모델을 응답 스키마로 변환"""
     return StyleTagResponse(
@@ -116,33 +152,102 @@ def style_tag_to_response(style_tag: StyleTag) -> StyleTagResponse:
 # ============== Endpoints ==============
 
 
-@router.post("", response_model=StyleTagResponse, status_code=status.HTTP_201_CREATED)
+@router.post("", response_model=StyleTagResponse, status_code=status.HTTP_202_ACCEPTED)
 async def analyze_image(
     shop_id: UUID,
     request: AnalyzeImageRequest,
     current_user: Annotated[User, Depends(get_current_user)],
     db: AsyncSession = Depends(get_db),
+    vision_service: VisionService = Depends(get_vision_service),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+    shop_cache: ShopCache = Depends(get_shop_cache),
+    job_queue: JobQueue = Depends(get_job_queue),
 ) -> StyleTagResponse:
-    """이미지 분석 및 스타일 태그 생성
+    """이미지 분석 요청 및 스타일 태그 생성
 
-    Vision AI를 사용하여 시술 사진을 분석하고
-    스타일 태그를 자동으로 생성합니다.
+    스타일 태그를 분석 대기(pending) 상태로 만들고 Vision AI 분석은
+    백그라운드 작업으로 실행합니다. 분석 진행 상황은 스타일 태그 조회 API의
+    analysis_status(pending → analyzing → completed/failed)로 확인합니다.
     """
-    vision_service = VisionService(db)
+    if not await is_shop_owner(db, shop_id, current_user):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="매장을 찾을 수 없습니다."
+        )
 
-    try:
-        style_tag = await vision_service.analyze_image(
-            shop_id=shop_id,
-            image_url=request.image_url,
-            thumbnail_url=request.thumbnail_url,
+    style_tag = await vision_service.create_style_tag(
+        shop_id=shop_id,
+        image_url=request.image_url,
+        thumbnail_url=request.thumbnail_url,
+    )
+    job_queue.submit(analyze_style_image(session_factory, shop_cache, style_tag.id))
+    return style_tag_to_response(style_tag)
+
+
+@router.post(
+    "/batch",
+    response_model=AnalyzeBatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def analyze_images(
+    shop_id: UUID,
+    request: AnalyzeBatchRequest,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_db),
+    vision_service: VisionService = Depends(get_vision_service),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+    shop_cache: ShopCache = Depends(get_shop_cache),
+    job_store: JobStore = Depends(get_job_store),
+    job_queue: JobQueue = Depends(get_job_queue),
+) -> AnalyzeBatchResponse:
+    """이미지 일괄 분석 요청 (스타일북 가져오기)
+
+    모든 이미지의 스타일 태그를 분석 대기(pending) 상태로 한 번에 만들고
+    Vision AI 분석은 백그라운드 작업으로 실행합니다. 진행 상황은 반환된
+    작업 ID로 작업 상태 조회 API에서 확인합니다.
+    """
+    if not await is_shop_owner(db, shop_id, current_user):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="매장을 찾을 수 없습니다."
         )
-        return style_tag_to_response(style_tag)
 
-    except VisionServiceError as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message) from e
+    job = await job_store.create(JOB_KIND, shop_id, len(request.images))
+    style_tag_ids = await vision_service.create_style_tags(
+        shop_id,
+        [(image.image_url, image.thumbnail_url) for image in request.images],
+        job["id"],
+    )
+    job_queue.submit(
+        analyze_style_images(
+            session_factory, job_store, shop_cache, job["id"], shop_id, style_tag_ids
+        ),
+        job_id=job["id"],
+    )
+    return AnalyzeBatchResponse(
+        job=JobResponse.model_validate(job),
+        style_tag_ids=[str(style_tag_id) for style_tag_id in style_tag_ids],
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_analysis_job(
+    shop_id: UUID,
+    job_id: str,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: AsyncSession = Depends(get_db),
+    job_store: JobStore = Depends(get_job_store),
+) -> JobResponse:
+    """이미지 일괄 분석 작업의 진행 상황을 조회합니다."""
+    if not await is_shop_owner(db, shop_id, current_user):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="매장을 찾을 수 없습니다."
+        )
 
-    finally:
-        await vision_service.close()
+    job = await job_store.get(job_id)
+    if job is None or job["kind"] != JOB_KIND or job["shop_id"] != str(shop_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="작업을 찾을 수 없습니다."
+        )
+    return JobResponse.model_validate(job)
 
 
 @router.post(
@@ -154,14 +259,12 @@ async def analyze_base64_image(
     shop_id: UUID,
     request: AnalyzeBase64Request,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: AsyncSession = Depends(get_db),
+    vision_service: VisionService = Depends(get_vision_service),
 ) -> StyleTagResponse:
     """Base64 이미지 분석
 
     Base64 인코딩된 이미지를 직접 분석합니다.
     """
-    vision_service = VisionService(db)
-
     try:
         style_tag = await vision_service.analyze_image_from_base64(
             shop_id=shop_id,
@@ -173,9 +276,6 @@ async def analyze_base64_image(
     except VisionServiceError as e:
         raise HTTPException(status_code=e.status_code, detail=e.message) from e
 
-    finally:
-        await vision_service.close()
-
 
 @router.get("", response_model=StyleTagListResponse)
 async def get_style_tags(
@@ -185,52 +285,40 @@ async def get_style_tags(
     style_category: str | None = Query(None, description="스타일 카테고리 필터"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    vision_service: VisionService = Depends(get_vision_service),
 ) -> StyleTagListResponse:
     """스타일 태그 목록 조회
 
     매장의 분석된 스타일 태그 목록을 조회합니다.
     """
-    vision_service = VisionService(db)
-
-    try:
-        style_tags, total = await vision_service.get_style_tags(
-            shop_id=shop_id,
-            service_type=service_type,
-            style_category=style_category,
-            limit=limit,
-            offset=offset,
-        )
-
-        return StyleTagListResponse(
-            style_tags=[style_tag_to_response(st) for st in style_tags],
-            total=total,
-            limit=limit,
-            offset=offset,
-        )
+    style_tags, total = await vision_service.get_style_tags(
+        shop_id=shop_id,
+        service_type=service_type,
+        style_category=style_category,
+        limit=limit,
+        offset=offset,
+    )
 
-    finally:
-        await vision_service.close()
+    return StyleTagListResponse(
+        style_tags=[style_tag_to_response(st) for st in style_tags],
+        total=total,
+        limit=limit,
+        offset=offset,
+    )
 
 
 @router.get("/statistics", response_model=StyleStatisticsResponse)
 async def get_style_statistics(
     shop_id: UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: AsyncSession = Depends(get_db),
+    vision_service: VisionService = Depends(get_vision_service),
 ) -> StyleStatisticsResponse:
     """스타일 통계 조회
 
     매장의 스타일 분석 통계를 조회합니다.
     """
-    vision_service = VisionService(db)
-
-    try:
-        stats = await vision_service.get_style_statistics(shop_id)
-        return StyleStatisticsResponse(**stats)
-
-    finally:
-        await vision_service.close()
+    stats = await vision_service.get_style_statistics(shop_id)
+    return StyleStatisticsResponse(**stats)
 
 
 @router.get("/{style_tag_id}", response_model=StyleTagResponse)
@@ -238,24 +326,18 @@ async def get_style_tag(
     shop_id: UUID,
     style_tag_id: UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: AsyncSession = Depends(get_db),
+    vision_service: VisionService = Depends(get_vision_service),
 ) -> StyleTagResponse:
     """특정 스타일 태그 조회"""
-    vision_service = VisionService(db)
-
-    try:
-        style_tag = await vision_service.get_style_tag_by_id(shop_id, style_tag_id)
-
-        if not style_tag:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="스타일 태그를 찾을 수 없습니다.",
-            )
+    style_tag = await vision_service.get_style_tag_by_id(shop_id, style_tag_id)
 
-        return style_tag_to_response(style_tag)
+    if not style_tag:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="스타일 태그를 찾을 수 없습니다.",
+        )
 
-    finally:
-        await vision_service.close()
+    return style_tag_to_response(style_tag)
 
 
 @router.get("/{style_tag_id}/suggest", response_model=ContentSuggestionResponse)
@@ -263,29 +345,23 @@ async def get_content_suggestion(
     shop_id: UUID,
     style_tag_id: UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: AsyncSession = Depends(get_db),
+    vision_service: VisionService = Depends(get_vision_service),
 ) -> ContentSuggestionResponse:
     """스타일 기반 콘텐츠 제안
 
     스타일 태그를 기반으로 인스타그램 포스팅용
     캡션과 해시태그를 제안합니다.
     """
-    vision_service = VisionService(db)
+    style_tag = await vision_service.get_style_tag_by_id(shop_id, style_tag_id)
 
-    try:
-        style_tag = await vision_service.get_style_tag_by_id(shop_id, style_tag_id)
-
-        if not style_tag:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="스타일 태그를 찾을 수 없습니다.",
-            )
-
-        suggestion = await vision_service.suggest_content_for_style(style_tag)
-        return ContentSuggestionResponse(**suggestion)
+    if not style_tag:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="스타일 태그를 찾을 수 없습니다.",
+        )
 
-    finally:
-        await vision_service.close()
+    suggestion = await vision_service.suggest_content_for_style(style_tag)
+    return ContentSuggestionResponse(**suggestion)
 
 
 @router.delete("/{style_tag_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -293,19 +369,13 @@ async def delete_style_tag(
     shop_id: UUID,
     style_tag_id: UUID,
     current_user: Annotated[User, Depends(get_current_user)],
-    db: AsyncSession = Depends(get_db),
+    vision_service: VisionService = Depends(get_vision_service),
 ) -> None:
     """스타일 태그 삭제"""
-    vision_service = VisionService(db)
+    deleted = await vision_service.delete_style_tag(shop_id, style_tag_id)
 
-    try:
-        deleted = await vision_service.delete_style_tag(shop_id, style_tag_id)
-
-        if not deleted:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="스타일 태그를 찾을 수 없습니다.",
-            )
-
-    finally:
-        await vision_service.close()
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="스타일 태그를 찾을 수 없습니다.",
+        )
@@ -48,3 +48,12 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             yield session
         finally:
             await session.close()
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """세션 팩토리 의존성
+
+    한 요청 안에서 여러 쿼리를 동시에 실행할 때 쿼리마다 별도의 세션을
+    풀에서 받아 쓰기 위해 사용합니다.
+    """
+    return async_session_factory
@@ -0,0 +1,85 @@
+"""
+리뷰 키워드 사전
+매장 유형별로 리뷰 분석에서 집계할 키워드를 정의합니다.
+
+- keywords: 대표 키워드 -> 같은 키워드로 집계할 표현 목록
+- negatives: 긍정 키워드와 겹치면 해당 매칭을 무효화하는 부정 표현
+  (예: "불친절"은 "친절"로 집계하지 않음)
+
+리뷰 본문은 어절 끝의 조사를 제거한 뒤 매칭하므로 표현은 조사 없이
+어간 형태로 적습니다 (예: "추천 안"은 "추천을 안 해요"에도 매칭).
+"""
+
+from typing import NamedTuple
+
+
+class KeywordVocabulary(NamedTuple):
+    """키워드 사전"""
+
+    keywords: dict[str, tuple[str, ...]]
+    negatives: tuple[str, ...] = ()
+
+
+COMMON_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "친절": ("친절", "상냥"),
+    "만족": ("만족",),
+    "좋": ("좋",),
+    "최고": ("최고",),
+    "추천": ("추천",),
+    "감사": ("감사",),
+    "편안": ("편안", "편했"),
+    "깔끔": ("깔끔", "청결"),
+    "스타일": ("스타일",),
+    "서비스": ("서비스",),
+    "분위기": ("분위기",),
+    "재방문": ("재방문", "또 올"),
+    "가격": ("가격", "가성비"),
+    "실력": ("실력", "솜씨"),
+    "전문": ("전문",),
+}
+
+COMMON_NEGATIVES: tuple[str, ...] = (
+    "불친절",
+    "불만족",
+    "비추천",
+    "추천 안",
+    "안 좋",
+    "좋지 않",
+    "재방문 안",
+    "재방문 의사 없",
+)
+
+SHOP_TYPE_KEYWORDS: dict[str, dict[str, tuple[str, ...]]] = {
+    "hair": {
+        "커트": ("커트", "컷"),
+        "펌": ("펌", "파마"),
+        "염색": ("염색", "컬러"),
+        "두피": ("두피",),
+    },
+    "nail": {
+        "젤네일": ("젤네일", "젤"),
+        "네일아트": ("네일아트", "아트"),
+        "지속력": ("지속력", "오래가"),
+        "케어": ("케어",),
+    },
+    "skin": {
+        "피부": ("피부",),
+        "관리": ("관리",),
+        "진정": ("진정",),
+        "트러블": ("트러블",),
+    },
+    "lash": {
+        "속눈썹": ("속눈썹",),
+        "연장": ("연장",),
+        "컬": ("컬",),
+        "유지력": ("유지력", "오래가"),
+    },
+}
+
+
+def get_vocabulary(shop_type: str | None) -> KeywordVocabulary:
+    """매장 유형의 키워드 사전을 반환합니다 (공통 키워드 포함)."""
+    return KeywordVocabulary(
+        keywords={**COMMON_KEYWORDS, **SHOP_TYPE_KEYWORDS.get(shop_type or "", {})},
+        negatives=COMMON_NEGATIVES,
+    )
@@ -0,0 +1,72 @@
+"""
+리뷰 답변 템플릿
+LLM을 쓸 수 없을 때 사용하는 기본 답변을 (감정, 톤, 매장 유형)별로 정의합니다.
+
+- 키의 "*"는 모든 톤 또는 모든 매장 유형에 적용되는 기본값입니다.
+  조회 시 (감정, 톤, 매장 유형) → (감정, 톤, *) → (감정, *, 매장 유형)
+  → (감정, *, *) 순서로 가장 구체적인 템플릿을 사용합니다.
+- 템플릿에는 {reviewer_name}, {shop_name}, {shop_type} 필드만 쓸 수 있습니다.
+
+매장별로 Shop.settings["reply_templates"]에 같은 형식의 재정의를 둘 수 있습니다.
+감정 → 템플릿 문자열(모든 톤) 또는 감정 → {톤 또는 "*": 템플릿 문자열}
+(예: {"positive": {"casual": "{reviewer_name}님 최고예요!"}}).
+"""
+
+# 리뷰 평점 구간 (4점 이상 긍정, 3점 중립, 그 이하 부정)
+SENTIMENTS = ("positive", "neutral", "negative")
+
+REPLY_TONES = ("friendly", "formal", "casual")
+
+# 매장 유형 -> 답변에 쓰는 한글 이름
+SHOP_TYPE_NAMES: dict[str, str] = {
+    "nail": "네일",
+    "hair": "헤어",
+    "skin": "피부 관리",
+    "lash": "속눈썹",
+}
+
+# 알 수 없는 매장 유형의 한글 이름
+DEFAULT_SHOP_TYPE_NAME = "뷰티"
+
+REPLY_TEMPLATE_FIELDS = frozenset({"reviewer_name", "shop_name", "shop_type"})
+
+REPLY_TEMPLATES: dict[tuple[str, str, str], str] = {
+    ("positive", "friendly", "*"): (
+        "{reviewer_name}님, 안녕하세요!\n\n"
+        "{shop_name}에 방문해 주시고 좋은 리뷰까지 남겨 주셔서 정말 감사합니다. "
+        "고객님께서 만족하셨다니 저희도 너무 기쁩니다!\n\n"
+        "앞으로도 더 좋은 {shop_type} 서비스로 보답하겠습니다. "
+        "다음에 또 뵙겠습니다! 감사합니다. 😊"
+    ),
+    ("positive", "formal", "*"): (
+        "{reviewer_name} 고객님, 안녕하세요.\n\n"
+        "{shop_name}을 이용해 주시고 좋은 리뷰를 남겨 주셔서 진심으로 감사드립니다. "
+        "고객님의 소중한 후기가 저희에게 큰 힘이 됩니다.\n\n"
+        "앞으로도 최상의 {shop_type} 서비스로 보답하겠습니다. "
+        "다음 방문 시에도 만족스러운 경험을 드릴 수 있도록 최선을 다하겠습니다.\n\n"
+        "감사합니다."
+    ),
+    ("positive", "casual", "*"): (
+        "{reviewer_name}님, 리뷰 감사해요! 🙏\n\n"
+        "좋게 봐주셔서 정말 기쁘네요~ "
+        "다음에 또 오시면 더 예쁘게 해드릴게요! ✨\n\n"
+        "또 뵙겠습니다! 💕"
+    ),
+    ("neutral", "*", "*"): (
+        "{reviewer_name}님, 안녕하세요.\n\n"
+        "{shop_name}을 이용해 주셔서 감사합니다. "
+        "소중한 피드백을 주셔서 감사드립니다.\n\n"
+        "고객님의 의견을 반영하여 더 나은 서비스를 제공할 수 있도록 노력하겠습니다. "
+        "다음 방문 시에는 더욱 만족스러운 경험을 드릴 수 있도록 최선을 다하겠습니다.\n\n"
+        "감사합니다."
+    ),
+    ("negative", "*", "*"): (
+        "{reviewer_name}님, 안녕하세요.\n\n"
+        "먼저 {shop_name}을 이용해 주셔서 감사드리며, "
+        "불편을 드려 진심으로 죄송합니다.\n\n"
+        "고객님께서 말씀해 주신 부분에 대해 깊이 반성하고, "
+        "즉시 개선할 수 있도록 노력하겠습니다. "
+        "다음에 다시 방문해 주신다면 더 나은 서비스로 보답하겠습니다.\n\n"
+        "다시 한번 불편을 드린 점 사과드립니다. 감사합니다."
+    ),
+}
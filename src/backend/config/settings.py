@@ -23,6 +23,8 @@ class Settings(BaseSettings):
     app_version: str = "0.1.0"
     debug: bool = False
     environment: Literal["development", "staging", "production"] = "development"
+    # 매장 설정에 timezone이 없을 때 일자 경계 계산에 사용
+    default_timezone: str = "UTC"
 
     # API 설정
     api_v1_prefix: str = "/v1"
@@ -40,6 +42,8 @@ class Settings(BaseSettings):
 
     # Redis 설정
     redis_url: str = "redis://localhost:6379/0"
+    # 대시보드 조회 캐시 TTL (초), 쓰기 시에는 매장 버전으로 즉시 무효화
+    dashboard_cache_ttl_seconds: int = 30
 
     # CORS 설정
     cors_origins: list[str] = [
@@ -52,6 +56,33 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     openai_model: str = "gpt-4o"
     openai_fallback_model: str = "gpt-4o-mini"
+    openai_base_url: str = "https://api.openai.com/v1"
+    # 요청 1회의 최대 대기 시간 (초), 초과 시 대체 모델로 전환
+    openai_timeout_seconds: float = 15.0
+    # 응답이 이 시간(초) 안에 오지 않으면 같은 요청을 한 번 더 보냄
+    openai_hedge_delay_seconds: float = 3.0
+    openai_max_connections: int = 20
+    # 이미지 분석(Vision) 요청은 응답이 길어 별도 타임아웃 사용
+    openai_vision_timeout_seconds: float = 60.0
+    # 일괄 답변 생성 시 동시에 생성할 리뷰 수
+    ai_batch_concurrency: int = 5
+    # 유사 리뷰 답변 캐시: 매장당 최대 항목 수와 TTL (초)
+    ai_reply_cache_max_entries: int = 500
+    ai_reply_cache_ttl_seconds: int = 7 * 24 * 60 * 60
+
+    # 스타일 이미지 일괄 분석: 동시 요청 수와 분당 최대 Vision 요청 수
+    vision_batch_concurrency: int = 4
+    vision_requests_per_minute: int = 60
+    # 429 응답 시 재시도 대기 시간 (초, 재시도마다 두 배)
+    vision_retry_backoff_seconds: float = 2.0
+
+    # 백그라운드 작업 설정
+    # 프로세스당 동시에 실행할 백그라운드 작업 수
+    background_job_concurrency: int = 4
+    # 이 시간(초) 넘게 pending/analyzing인 스타일 태그는 분석이 끊긴 것으로 보고
+    # 주기적으로 다시 분석 작업에 넣음
+    style_analysis_stale_seconds: int = 10 * 60
+    style_analysis_sweep_interval_seconds: int = 5 * 60
 
     # 외부 API 설정
     google_client_id: str = ""
@@ -61,6 +92,14 @@ class Settings(BaseSettings):
     instagram_app_id: str = ""
     instagram_app_secret: str = ""
 
+    # 외부 API HTTP 클라이언트 (업스트림별로 연결을 재사용)
+    graph_api_timeout_seconds: float = 30.0
+    graph_api_max_connections: int = 10
+    oauth_timeout_seconds: float = 10.0
+    oauth_max_connections: int = 10
+    # 유휴 keep-alive 연결을 유지하는 시간 (초)
+    http_keepalive_expiry_seconds: float = 30.0
+
     # OAuth Redirect URIs
     oauth_redirect_base_url: str = "http://localhost:3000/auth/callback"
 
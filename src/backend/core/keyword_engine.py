@@ -0,0 +1,189 @@
+"""
+리뷰 키워드 추출 엔진
+Aho-Corasick 오토마톤으로 사전의 모든 표현을 문서당 한 번의 순회로 매칭합니다.
+"""
+
+import re
+import unicodedata
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import Protocol
+
+from config.keywords import KeywordVocabulary, get_vocabulary
+
+# 어절 끝에서 제거할 조사 (긴 것부터 검사)
+PARTICLES = (
+    "에서",
+    "으로",
+    "이랑",
+    "까지",
+    "부터",
+    "처럼",
+    "보다",
+    "은",
+    "는",
+    "이",
+    "가",
+    "을",
+    "를",
+    "에",
+    "도",
+    "만",
+    "의",
+    "로",
+    "와",
+    "과",
+    "랑",
+)
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def strip_particle(token: str, keep: tuple[str, ...] = ()) -> str:
+    """어절 끝의 조사를 제거합니다 (어간이 두 글자 이상 남을 때만).
+
+    keep에 있는 표현으로 끝나는 어절은 끝 글자가 조사처럼 보여도
+    (예: "오래가"의 "가") 그대로 둡니다.
+    """
+    if keep and token.endswith(keep):
+        return token
+    for particle in PARTICLES:
+        if token.endswith(particle) and len(token) - len(particle) >= 2:
+            return token[: -len(particle)]
+    return token
+
+
+def normalize_text(text: str, keep: tuple[str, ...] = ()) -> str:
+    """리뷰 본문을 매칭용으로 정규화합니다.
+
+    유니코드 NFC 정규화와 소문자 변환 후 문장부호를 제거하고,
+    어절마다 끝의 조사를 떼어 공백 하나로 이어 붙입니다.
+    keep은 조사를 떼지 않을 어절 끝 표현입니다 (strip_particle 참고).
+    """
+    text = unicodedata.normalize("NFC", text).lower()
+    return " ".join(
+        strip_particle(token, keep) for token in _WORD_PATTERN.findall(text)
+    )
+
+
+def normalize_pattern(pattern: str) -> str:
+    """사전 표현을 정규화합니다 (조사는 제거하지 않음)."""
+    text = unicodedata.normalize("NFC", pattern).lower()
+    return " ".join(_WORD_PATTERN.findall(text))
+
+
+class AhoCorasick:
+    """다중 패턴 문자열 매칭 오토마톤
+
+    패턴 수와 관계없이 텍스트를 한 번 순회하며 모든 출현 위치를 찾습니다.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[str]] = [[]]
+
+        for pattern in patterns:
+            if pattern:
+                self._add(pattern)
+        self._build_failure_links()
+
+    def _add(self, pattern: str) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+        if pattern not in self._output[state]:
+            self._output[state].append(pattern)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # 접미사 상태의 출력도 함께 보고
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, str]]:
+        """(시작, 끝, 패턴) 튜플을 끝 위치 순서로 반환합니다."""
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for pattern in self._output[state]:
+                yield index + 1 - len(pattern), index + 1, pattern
+
+
+class KeywordExtractor(Protocol):
+    """리뷰 본문에서 키워드 출현 횟수를 세는 엔진"""
+
+    def count(self, text: str) -> Counter[str]: ...
+
+
+class KeywordEngine:
+    """사전 기반 키워드 추출 엔진
+
+    대표 키워드의 모든 표현과 부정 표현을 하나의 오토마톤에 넣고,
+    부정 표현과 겹치는 매칭은 집계에서 제외합니다. 같은 키워드의
+    표현끼리 겹치면(예: "젤"과 "젤네일") 한 번만 셉니다.
+    """
+
+    def __init__(self, vocabulary: KeywordVocabulary):
+        self._canonical: dict[str, str] = {}
+        for keyword, aliases in vocabulary.keywords.items():
+            for alias in (keyword, *aliases):
+                self._canonical[normalize_pattern(alias)] = keyword
+        self._negatives = {normalize_pattern(n) for n in vocabulary.negatives}
+        self._automaton = AhoCorasick([*self._canonical, *self._negatives])
+        # 조사로 끝나는 표현(예: "오래가")은 조사 제거로 깨지지 않도록 보존
+        self._keep = tuple(
+            sorted(
+                {
+                    pattern.rsplit(" ", 1)[-1]
+                    for pattern in (*self._canonical, *self._negatives)
+                    if pattern.endswith(PARTICLES)
+                }
+            )
+        )
+
+    def count(self, text: str) -> Counter[str]:
+        """본문 하나의 키워드별 출현 횟수를 셉니다."""
+        matches = list(self._automaton.iter_matches(normalize_text(text, self._keep)))
+        blocked = [
+            (start, end)
+            for start, end, pattern in matches
+            if pattern in self._negatives
+        ]
+
+        counts: Counter[str] = Counter()
+        last_end: dict[str, int] = {}
+        for start, end, pattern in matches:
+            keyword = self._canonical.get(pattern)
+            if keyword is None:
+                continue
+            if any(b_start < end and start < b_end for b_start, b_end in blocked):
+                continue
+            if start < last_end.get(keyword, 0):
+                continue
+            counts[keyword] += 1
+            last_end[keyword] = end
+        return counts
+
+
+@lru_cache
+def get_keyword_engine(shop_type: str | None = None) -> KeywordExtractor:
+    """매장 유형별 키워드 엔진을 반환합니다 (오토마톤은 유형마다 한 번만 생성)."""
+    return KeywordEngine(get_vocabulary(shop_type))
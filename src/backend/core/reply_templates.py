@@ -0,0 +1,216 @@
+"""
+리뷰 답변 템플릿 엔진
+템플릿을 미리 컴파일해 (감정, 톤, 매장 유형)마다 한 번의 조회로 렌더링합니다.
+"""
+
+import json
+import logging
+import string
+import unicodedata
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
+
+from config.reply_templates import (
+    REPLY_TEMPLATE_FIELDS,
+    REPLY_TEMPLATES,
+    REPLY_TONES,
+    SENTIMENTS,
+    SHOP_TYPE_NAMES,
+)
+
+logger = logging.getLogger(__name__)
+
+TemplateKey = tuple[str, str, str]
+
+_FORMATTER = string.Formatter()
+
+# 앞 글자와 하나의 문자소(grapheme)를 이루는 글자
+_ZWJ = "\u200d"
+_EXTEND_CATEGORIES = frozenset({"Mn", "Me", "Mc"})
+
+
+def _is_extending(char: str) -> bool:
+    code = ord(char)
+    return (
+        char == _ZWJ
+        or 0xFE00 <= code <= 0xFE0F  # 이모지 표현 선택자
+        or 0x1F3FB <= code <= 0x1F3FF  # 피부색 수정자
+        or 0xE0020 <= code <= 0xE007F  # 태그 문자 (지역 깃발)
+        or 0x1160 <= code <= 0x11FF  # 한글 조합형 중성·종성
+        or unicodedata.category(char) in _EXTEND_CATEGORIES
+    )
+
+
+def _is_regional_indicator(char: str) -> bool:
+    return 0x1F1E6 <= ord(char) <= 0x1F1FF
+
+
+def truncate_graphemes(text: str, max_length: int) -> str:
+    """문자소 경계에서 잘라 max_length 글자 이내로 맞춥니다.
+
+    결합 문자, 이모지 ZWJ 시퀀스와 수정자, 국기(지역 표시 문자 쌍),
+    한글 조합형 자모가 중간에서 잘리지 않도록 경계를 앞으로 옮깁니다.
+    """
+    if len(text) <= max_length:
+        return text
+    end = max(max_length, 0)
+    while end > 0 and (_is_extending(text[end]) or text[end - 1] == _ZWJ):
+        end -= 1
+    if end > 0 and _is_regional_indicator(text[end]):
+        start = end
+        while start > 0 and _is_regional_indicator(text[start - 1]):
+            start -= 1
+        # 국기는 두 글자씩 짝을 이루므로 홀수 번째에서 끊기면 한 글자 더 뺌
+        end -= (end - start) % 2
+    return text[:end].rstrip()
+
+
+class ReplyTemplate:
+    """컴파일된 답변 템플릿
+
+    컴파일 시 형식과 필드 이름을 검증하므로 렌더링은 실패하지 않습니다.
+    """
+
+    __slots__ = ("render_fields", "source")
+
+    def __init__(self, source: str):
+        fields = {
+            field for _, field, _, _ in _FORMATTER.parse(source) if field is not None
+        }
+        unknown = fields - REPLY_TEMPLATE_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown template fields: {', '.join(sorted(unknown))}")
+        try:
+            # 형식 지정자 안의 중첩 필드 등 parse로 드러나지 않는 오류 확인
+            source.format_map(dict.fromkeys(REPLY_TEMPLATE_FIELDS, ""))
+        except (KeyError, IndexError, AttributeError) as e:
+            raise ValueError(f"Invalid template: {e}") from e
+        self.source = source
+        self.render_fields = source.format_map
+
+    def render(self, values: Mapping[str, str], max_length: int | None = None) -> str:
+        """필드를 채운 답변을 반환합니다 (max_length가 있으면 문자소 경계에서 자름)."""
+        text = self.render_fields(values)
+        return text if max_length is None else truncate_graphemes(text, max_length)
+
+
+def _compile(templates: Mapping[TemplateKey, str]) -> dict[TemplateKey, ReplyTemplate]:
+    return {key: ReplyTemplate(source) for key, source in templates.items()}
+
+
+def _parse_overrides(overrides: Mapping[str, Any]) -> dict[TemplateKey, ReplyTemplate]:
+    """Shop.settings의 재정의를 컴파일합니다 (잘못된 항목은 건너뜀)."""
+    compiled: dict[TemplateKey, ReplyTemplate] = {}
+    for sentiment, by_tone in overrides.items():
+        if sentiment not in SENTIMENTS:
+            continue
+        entries = by_tone if isinstance(by_tone, dict) else {"*": by_tone}
+        for tone, source in entries.items():
+            if not isinstance(source, str):
+                continue
+            try:
+                compiled[(sentiment, tone, "*")] = ReplyTemplate(source)
+            except ValueError:
+                logger.warning(
+                    "Invalid reply template override",
+                    extra={"sentiment": sentiment, "tone": tone},
+                    exc_info=True,
+                )
+    return compiled
+
+
+class ReplyTemplateRegistry:
+    """(감정, 톤, 매장 유형)으로 색인된 답변 템플릿 모음
+
+    생성 시 모든 조합의 템플릿을 미리 결정해 두므로 조회는 딕셔너리 한 번입니다.
+    재정의(overrides)에 맞는 템플릿이 있으면 기본 템플릿보다 우선합니다.
+    """
+
+    def __init__(
+        self,
+        templates: Mapping[TemplateKey, str] = REPLY_TEMPLATES,
+        overrides: Mapping[TemplateKey, ReplyTemplate] | None = None,
+    ):
+        layers = [overrides or {}, _compile(templates)]
+        self._templates: dict[TemplateKey, ReplyTemplate] = {}
+        for sentiment in SENTIMENTS:
+            for tone in REPLY_TONES:
+                for shop_type in (*SHOP_TYPE_NAMES, "*"):
+                    self._templates[(sentiment, tone, shop_type)] = self._resolve(
+                        layers, sentiment, tone, shop_type
+                    )
+
+    @staticmethod
+    def _resolve(
+        layers: list[Mapping[TemplateKey, ReplyTemplate]],
+        sentiment: str,
+        tone: str,
+        shop_type: str,
+    ) -> ReplyTemplate:
+        candidates = dict.fromkeys(
+            [
+                (sentiment, tone, shop_type),
+                (sentiment, tone, "*"),
+                (sentiment, "*", shop_type),
+                (sentiment, "*", "*"),
+            ]
+        )
+        for layer in layers:
+            for key in candidates:
+                if key in layer:
+                    return layer[key]
+        raise KeyError(f"No reply template for {sentiment}")
+
+    def get(self, sentiment: str, tone: str, shop_type: str) -> ReplyTemplate:
+        """가장 구체적인 템플릿을 반환합니다.
+
+        모르는 톤은 friendly, 모르는 매장 유형은 공통 템플릿으로 대체합니다.
+        """
+        template = self._templates.get((sentiment, tone, shop_type))
+        if template is None:
+            template = self._templates[
+                (
+                    sentiment,
+                    tone if tone in REPLY_TONES else "friendly",
+                    shop_type if shop_type in SHOP_TYPE_NAMES else "*",
+                )
+            ]
+        return template
+
+    def render(
+        self,
+        sentiment: str,
+        tone: str,
+        shop_type: str,
+        values: Mapping[str, str],
+        max_length: int | None = None,
+    ) -> str:
+        """템플릿을 찾아 렌더링합니다."""
+        return self.get(sentiment, tone, shop_type).render(values, max_length)
+
+
+@lru_cache
+def get_reply_template_registry() -> ReplyTemplateRegistry:
+    """기본 템플릿 레지스트리를 반환합니다 (프로세스당 한 번 컴파일)."""
+    return ReplyTemplateRegistry()
+
+
+@lru_cache(maxsize=256)
+def _registry_with_overrides(overrides_json: str) -> ReplyTemplateRegistry:
+    return ReplyTemplateRegistry(overrides=_parse_overrides(json.loads(overrides_json)))
+
+
+def get_shop_reply_templates(
+    shop_settings: Mapping[str, Any] | None,
+) -> ReplyTemplateRegistry:
+    """매장 재정의(settings["reply_templates"])를 반영한 레지스트리를 반환합니다.
+
+    재정의 내용별로 컴파일 결과를 재사용하며, 재정의가 없으면 기본 레지스트리입니다.
+    """
+    overrides = (shop_settings or {}).get("reply_templates")
+    if not overrides or not isinstance(overrides, dict):
+        return get_reply_template_registry()
+    return _registry_with_overrides(
+        json.dumps(overrides, sort_keys=True, ensure_ascii=False)
+    )
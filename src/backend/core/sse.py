@@ -0,0 +1,18 @@
+"""
+Server-Sent Events 인코더
+"""
+
+import json
+from typing import Any
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # 프록시(nginx)가 응답을 버퍼링하지 않도록 함
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_sse(event: str, data: Any) -> bytes:
+    """이벤트 하나를 SSE 메시지로 인코딩합니다 (data는 한 줄 JSON)."""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n".encode()
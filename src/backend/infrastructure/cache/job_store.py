@@ -0,0 +1,159 @@
+"""Background job status records stored in Redis."""
+
+from datetime import UTC, datetime
+from typing import Any, Literal
+from uuid import UUID, uuid4
+
+from infrastructure.cache.redis_cache import RedisCache, get_cache
+
+JobStatus = Literal["queued", "running", "completed", "failed"]
+
+# Finished jobs stay queryable for a day
+JOB_TTL_SECONDS = 24 * 60 * 60
+
+# Unfinished jobs without progress or heartbeat for this long are treated as
+# interrupted
+JOB_STALE_SECONDS = 30 * 60
+
+# How often the process holding a job refreshes its heartbeat
+JOB_HEARTBEAT_SECONDS = 60
+
+# Error reported for jobs cancelled on shutdown or lost with their process
+JOB_INTERRUPTED_ERROR = "작업이 중단되었습니다. 다시 요청해 주세요."
+
+
+class JobStore:
+    """Progress records of background jobs.
+
+    Each job is a JSON document under ``job:{id}`` holding its status and
+    processed/succeeded/failed counters. Only the task running the job
+    writes to its record, so read-modify-write updates do not race.
+
+    Jobs run in the API process, so a crash or deploy can drop a job without
+    finishing its record. Every write stamps ``updated_at`` and the process
+    holding a queued or running job refreshes ``job:{id}:heartbeat`` (see
+    ``worker.queue.heartbeat_jobs``). An unfinished job with neither for
+    ``stale_after`` seconds is marked failed as interrupted when read; later
+    updates from a task that was still alive after all are ignored so the
+    reported failure stays final. The heartbeat lives under its own key so
+    it never overwrites the counters written by the task.
+    """
+
+    def __init__(
+        self,
+        cache: RedisCache,
+        ttl: int = JOB_TTL_SECONDS,
+        stale_after: int = JOB_STALE_SECONDS,
+    ) -> None:
+        self.cache = cache
+        self.ttl = ttl
+        self.stale_after = stale_after
+
+    @staticmethod
+    def job_key(job_id: str) -> str:
+        """Redis key holding the job record."""
+        return f"job:{job_id}"
+
+    @staticmethod
+    def heartbeat_key(job_id: str) -> str:
+        """Redis key refreshed while the job is queued or running."""
+        return f"job:{job_id}:heartbeat"
+
+    async def create(self, kind: str, shop_id: UUID, total: int) -> dict[str, Any]:
+        """Register a new job; jobs without items are completed immediately."""
+        now = datetime.now(UTC).isoformat()
+        job: dict[str, Any] = {
+            "id": str(uuid4()),
+            "kind": kind,
+            "shop_id": str(shop_id),
+            "status": "queued" if total else "completed",
+            "total": total,
+            "processed": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+            "finished_at": None if total else now,
+        }
+        await self.cache.set(self.job_key(job["id"]), job, ttl=self.ttl)
+        return job
+
+    async def get(self, job_id: str) -> dict[str, Any] | None:
+        """Return the job record, or None if it is unknown or expired."""
+        job = await self.cache.get(self.job_key(job_id))
+        if not isinstance(job, dict):
+            return None
+        if await self._is_stale(job):
+            job.update(
+                status="failed",
+                error=JOB_INTERRUPTED_ERROR,
+                finished_at=datetime.now(UTC).isoformat(),
+            )
+            await self._save(job)
+        return job
+
+    async def is_active(self, job_id: str) -> bool:
+        """Whether the job is still queued or running (interrupted jobs are not)."""
+        job = await self.get(job_id)
+        return job is not None and job["status"] in ("queued", "running")
+
+    async def touch(self, job_id: str) -> None:
+        """Refresh the heartbeat of a job that is still queued or running."""
+        await self.cache.set(
+            self.heartbeat_key(job_id),
+            datetime.now(UTC).isoformat(),
+            ttl=self.stale_after,
+        )
+
+    async def _is_stale(self, job: dict[str, Any]) -> bool:
+        if job["status"] not in ("queued", "running"):
+            return False
+        updated_at = datetime.fromisoformat(job.get("updated_at") or job["created_at"])
+        if (datetime.now(UTC) - updated_at).total_seconds() <= self.stale_after:
+            return False
+        return await self.cache.get(self.heartbeat_key(job["id"])) is None
+
+    @staticmethod
+    def _is_interrupted(job: dict[str, Any]) -> bool:
+        return job["status"] == "failed" and job["error"] == JOB_INTERRUPTED_ERROR
+
+    async def _save(self, job: dict[str, Any]) -> None:
+        job["updated_at"] = datetime.now(UTC).isoformat()
+        await self.cache.set(self.job_key(job["id"]), job, ttl=self.ttl)
+
+    async def update(self, job_id: str, **fields: Any) -> dict[str, Any] | None:
+        """Overwrite fields of the job record (ignored once interrupted)."""
+        job = await self.get(job_id)
+        if job is None or self._is_interrupted(job):
+            return job
+        job.update(fields)
+        await self._save(job)
+        return job
+
+    async def advance(
+        self, job_id: str, succeeded: int = 0, failed: int = 0
+    ) -> dict[str, Any] | None:
+        """Add processed items to the job counters (ignored once interrupted)."""
+        job = await self.get(job_id)
+        if job is None or self._is_interrupted(job):
+            return job
+        job["succeeded"] += succeeded
+        job["failed"] += failed
+        job["processed"] = job["succeeded"] + job["failed"]
+        await self._save(job)
+        return job
+
+    async def finish(self, job_id: str, error: str | None = None) -> None:
+        """Mark the job completed, or failed when an error message is given."""
+        await self.update(
+            job_id,
+            status="failed" if error else "completed",
+            error=error,
+            finished_at=datetime.now(UTC).isoformat(),
+        )
+
+
+async def get_job_store() -> JobStore:
+    """Dependency providing the job store backed by the shared Redis client."""
+    return JobStore(await get_cache())
@@ -55,11 +55,15 @@ class RedisCache:
         key: str,
         value: Any,
         ttl: int | None = None,
+        nx: bool = False,
     ) -> bool:
-        """Set value in cache with optional TTL (seconds)."""
+        """Set value in cache with optional TTL (seconds).
+
+        With nx=True the value is only set if the key does not exist yet.
+        """
         if isinstance(value, (dict, list)):
             value = json.dumps(value)
-        result = await self.client.set(key, value, ex=ttl)
+        result = await self.client.set(key, value, ex=ttl, nx=nx)
         return bool(result)
 
     async def delete(self, key: str) -> int:
@@ -78,6 +82,23 @@ class RedisCache:
         """Set expiration on key."""
         return await self.client.expire(key, ttl)
 
+    async def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        """Add members to a sorted set or update their scores."""
+        return int(await self.client.zadd(key, mapping) or 0)
+
+    async def zcard(self, key: str) -> int:
+        """Count members of a sorted set."""
+        return await self.client.zcard(key)
+
+    async def zpopmin(self, key: str, count: int = 1) -> list[str]:
+        """Remove and return the lowest-scored members of a sorted set."""
+        popped = await self.client.zpopmin(key, count)
+        return [str(entry[0]) for entry in popped]
+
+    async def zrem(self, key: str, *members: str) -> int:
+        """Remove members from a sorted set."""
+        return await self.client.zrem(key, *members)
+
     async def ping(self) -> bool:
         """Check Redis connection."""
         try:
@@ -0,0 +1,106 @@
+"""Per-shop LRU cache of generated review replies stored in Redis."""
+
+import logging
+import time
+from typing import NamedTuple
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from config.settings import get_settings
+from infrastructure.cache.redis_cache import RedisCache, get_cache
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class ReplyCacheStats(NamedTuple):
+    """Hit and miss counters of a shop's reply cache."""
+
+    hits: int
+    misses: int
+
+
+class ReplyCache:
+    """Generated replies keyed by a fingerprint of the review and options.
+
+    Each entry lives under ``reply:{shop_id}:{fingerprint}`` with a TTL,
+    and a sorted set per shop records when every entry was last used.
+    Storing an entry beyond ``max_entries`` evicts the least recently used
+    ones. Redis failures are logged and treated as cache misses.
+    """
+
+    def __init__(
+        self,
+        cache: RedisCache,
+        max_entries: int | None = None,
+        ttl: int | None = None,
+    ) -> None:
+        self.cache = cache
+        self.max_entries = max_entries or settings.ai_reply_cache_max_entries
+        self.ttl = ttl or settings.ai_reply_cache_ttl_seconds
+
+    @staticmethod
+    def entry_key(shop_id: UUID, fingerprint: str) -> str:
+        """Redis key holding a cached reply."""
+        return f"reply:{shop_id}:{fingerprint}"
+
+    @staticmethod
+    def lru_key(shop_id: UUID) -> str:
+        """Redis sorted set ordering the shop's entries by last use."""
+        return f"reply:{shop_id}:lru"
+
+    @staticmethod
+    def counter_key(shop_id: UUID, outcome: str) -> str:
+        """Redis key counting the shop's cache hits or misses."""
+        return f"reply:{shop_id}:{outcome}"
+
+    async def get(self, shop_id: UUID, fingerprint: str) -> str | None:
+        """Return the cached reply and mark it as recently used."""
+        try:
+            entry = await self.cache.get(self.entry_key(shop_id, fingerprint))
+            if not isinstance(entry, dict):
+                await self.cache.incr(self.counter_key(shop_id, "misses"))
+                return None
+            await self.cache.zadd(self.lru_key(shop_id), {fingerprint: time.time()})
+            await self.cache.expire(self.entry_key(shop_id, fingerprint), self.ttl)
+            await self.cache.incr(self.counter_key(shop_id, "hits"))
+        except RedisError:
+            logger.warning("Reply cache read failed", exc_info=True)
+            return None
+        return str(entry["reply"])
+
+    async def set(self, shop_id: UUID, fingerprint: str, reply: str) -> None:
+        """Store a reply, evicting the shop's least recently used entries."""
+        lru_key = self.lru_key(shop_id)
+        try:
+            await self.cache.set(
+                self.entry_key(shop_id, fingerprint), {"reply": reply}, ttl=self.ttl
+            )
+            await self.cache.zadd(lru_key, {fingerprint: time.time()})
+            await self.cache.expire(lru_key, self.ttl)
+            overflow = await self.cache.zcard(lru_key) - self.max_entries
+            if overflow > 0:
+                for evicted in await self.cache.zpopmin(lru_key, overflow):
+                    await self.cache.delete(self.entry_key(shop_id, evicted))
+        except RedisError:
+            logger.warning(
+                "Reply cache write failed",
+                extra={"shop_id": str(shop_id)},
+                exc_info=True,
+            )
+
+    async def stats(self, shop_id: UUID) -> ReplyCacheStats:
+        """Hit and miss counters of the shop (zero if Redis is unavailable)."""
+        try:
+            hits = await self.cache.get(self.counter_key(shop_id, "hits"))
+            misses = await self.cache.get(self.counter_key(shop_id, "misses"))
+        except RedisError:
+            logger.warning("Reply cache stats lookup failed", exc_info=True)
+            return ReplyCacheStats(0, 0)
+        return ReplyCacheStats(int(hits or 0), int(misses or 0))
+
+
+async def get_reply_cache() -> ReplyCache:
+    """Dependency providing the reply cache backed by the shared Redis client."""
+    return ReplyCache(await get_cache())
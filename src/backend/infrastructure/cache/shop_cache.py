@@ -0,0 +1,160 @@
+"""Shop-scoped cache versioning and read-through helpers."""
+
+import inspect
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from functools import wraps
+from typing import Any, Concatenate, ParamSpec, Protocol, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from config.settings import get_settings
+from infrastructure.cache.redis_cache import RedisCache, get_cache
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+S = TypeVar("S", bound="SupportsShopCache")
+P = ParamSpec("P")
+
+
+class SupportsShopCache(Protocol):
+    """Service exposing an optional shop cache."""
+
+    shop_cache: "ShopCache | None"
+
+
+class ShopCache:
+    """Per-shop data version and versioned read-through cache.
+
+    Each shop has a version counter that is embedded in every cache key,
+    so bumping the counter invalidates all of the shop's entries at once
+    and stale entries simply expire via their TTL. The same version backs
+    the ETag of shop-scoped GET responses. Redis failures are logged and
+    treated as cache misses so reads fall back to the database.
+
+    Counters are seeded from the current time in milliseconds, so a
+    version is never reused after Redis loses its data.
+    """
+
+    def __init__(self, cache: RedisCache, ttl: int | None = None) -> None:
+        self.cache = cache
+        self.ttl = ttl or settings.dashboard_cache_ttl_seconds
+
+    @staticmethod
+    def version_key(shop_id: UUID) -> str:
+        """Redis key holding the shop's data version."""
+        return f"shop:{shop_id}:version"
+
+    async def _seed_version(self, key: str) -> None:
+        await self.cache.set(key, time.time_ns() // 1_000_000, nx=True)
+
+    async def get_version(self, shop_id: UUID) -> int | None:
+        """Current data version of the shop (None if Redis is unavailable)."""
+        key = self.version_key(shop_id)
+        try:
+            value = await self.cache.get(key)
+            if value is None:
+                await self._seed_version(key)
+                value = await self.cache.get(key)
+        except RedisError:
+            logger.warning("Shop version lookup failed", exc_info=True)
+            return None
+        return int(value or 0)
+
+    async def bump(self, shop_id: UUID) -> None:
+        """Invalidate every cached entry of the shop."""
+        key = self.version_key(shop_id)
+        try:
+            await self._seed_version(key)
+            await self.cache.incr(key)
+        except RedisError:
+            logger.warning(
+                "Shop version bump failed",
+                extra={"shop_id": str(shop_id)},
+                exc_info=True,
+            )
+
+    async def get_or_load(
+        self,
+        shop_id: UUID,
+        key: str,
+        model: type[M],
+        loader: Callable[[], Awaitable[M]],
+    ) -> M:
+        """Return the cached value for key, loading and storing it on a miss."""
+        version = await self.get_version(shop_id)
+        if version is None:
+            return await loader()
+
+        cache_key = f"shop:{shop_id}:v{version}:{key}"
+        try:
+            cached = await self.cache.get(cache_key)
+        except RedisError:
+            logger.warning("Cache read failed", exc_info=True)
+            cached = None
+        if cached is not None:
+            return model.model_validate(cached)
+
+        value = await loader()
+        try:
+            await self.cache.set(cache_key, value.model_dump(mode="json"), ttl=self.ttl)
+        except RedisError:
+            logger.warning("Cache write failed", exc_info=True)
+        return value
+
+    @staticmethod
+    def cached(
+        namespace: str, model: type[M]
+    ) -> Callable[
+        [Callable[Concatenate[S, UUID, P], Awaitable[M]]],
+        Callable[Concatenate[S, UUID, P], Awaitable[M]],
+    ]:
+        """Cache a service read method keyed by shop and call arguments.
+
+        The decorated method must take shop_id as its first argument and the
+        service must expose a ``shop_cache`` attribute (None disables caching).
+        """
+
+        def decorator(
+            func: Callable[Concatenate[S, UUID, P], Awaitable[M]],
+        ) -> Callable[Concatenate[S, UUID, P], Awaitable[M]]:
+            signature = inspect.signature(func)
+
+            @wraps(func)
+            async def wrapper(
+                self: S, shop_id: UUID, /, *args: P.args, **kwargs: P.kwargs
+            ) -> M:
+                if self.shop_cache is None:
+                    return await func(self, shop_id, *args, **kwargs)
+
+                bound = signature.bind(self, shop_id, *args, **kwargs)
+                bound.apply_defaults()
+                params: dict[str, Any] = dict(bound.arguments)
+                params.pop("self")
+                params.pop("shop_id")
+                key = ":".join(
+                    [namespace, *(f"{name}={value}" for name, value in params.items())]
+                )
+                return await self.shop_cache.get_or_load(
+                    shop_id, key, model, lambda: func(self, shop_id, *args, **kwargs)
+                )
+
+            return wrapper
+
+        return decorator
+
+
+async def bump_shop_version(shop_cache: ShopCache | None, shop_id: UUID) -> None:
+    """Invalidate the shop's cached reads when a cache is configured."""
+    if shop_cache is not None:
+        await shop_cache.bump(shop_id)
+
+
+async def get_shop_cache() -> ShopCache:
+    """Dependency providing the shop cache backed by the shared Redis client."""
+    return ShopCache(await get_cache())
@@ -0,0 +1,113 @@
+"""Shared outbound HTTP clients, one pooled client per upstream API."""
+
+from importlib.util import find_spec
+from typing import Literal, NamedTuple
+
+import httpx
+
+from config.settings import get_settings
+
+settings = get_settings()
+
+Upstream = Literal["openai", "graph", "google", "kakao"]
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); without it clients
+# stay on HTTP/1.1 keep-alive.
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+class UpstreamConfig(NamedTuple):
+    """Connection settings of one upstream API."""
+
+    timeout: float
+    max_connections: int
+    http2: bool = True
+
+
+def default_upstream_configs() -> dict[Upstream, UpstreamConfig]:
+    """Per-upstream timeouts and pool sizes from settings."""
+    return {
+        "openai": UpstreamConfig(
+            settings.openai_timeout_seconds, settings.openai_max_connections
+        ),
+        "graph": UpstreamConfig(
+            settings.graph_api_timeout_seconds, settings.graph_api_max_connections
+        ),
+        "google": UpstreamConfig(
+            settings.oauth_timeout_seconds, settings.oauth_max_connections
+        ),
+        "kakao": UpstreamConfig(
+            settings.oauth_timeout_seconds, settings.oauth_max_connections
+        ),
+    }
+
+
+class HTTPClientRegistry:
+    """Process-wide ``httpx.AsyncClient`` per upstream.
+
+    Reusing one client per upstream keeps TCP/TLS connections alive across
+    requests, so warm calls skip the handshake. Clients are created on first
+    use and closed together on shutdown.
+    """
+
+    def __init__(self, configs: dict[Upstream, UpstreamConfig] | None = None) -> None:
+        self.configs = configs or default_upstream_configs()
+        self._clients: dict[Upstream, httpx.AsyncClient] = {}
+
+    def get(self, upstream: Upstream) -> httpx.AsyncClient:
+        """Get the shared client of the upstream."""
+        client = self._clients.get(upstream)
+        if client is None:
+            config = self.configs[upstream]
+            client = httpx.AsyncClient(
+                timeout=config.timeout,
+                limits=httpx.Limits(
+                    max_connections=config.max_connections,
+                    max_keepalive_connections=config.max_connections,
+                    keepalive_expiry=settings.http_keepalive_expiry_seconds,
+                ),
+                http2=config.http2 and HTTP2_AVAILABLE,
+            )
+            self._clients[upstream] = client
+        return client
+
+    def warm_up(self) -> None:
+        """Create every configured client up front."""
+        for upstream in self.configs:
+            self.get(upstream)
+
+    async def aclose(self) -> None:
+        """Close every client and drop its pooled connections."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+
+# Singleton instance
+_registry: HTTPClientRegistry | None = None
+
+
+def get_http_clients() -> HTTPClientRegistry:
+    """Get the shared HTTP client registry."""
+    global _registry
+    if _registry is None:
+        _registry = HTTPClientRegistry()
+    return _registry
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP client registry."""
+    global _registry
+    if _registry:
+        await _registry.aclose()
+        _registry = None
+
+
+def get_openai_http_client() -> httpx.AsyncClient:
+    """Dependency providing the shared OpenAI client."""
+    return get_http_clients().get("openai")
+
+
+def get_graph_http_client() -> httpx.AsyncClient:
+    """Dependency providing the shared Facebook Graph API client."""
+    return get_http_clients().get("graph")
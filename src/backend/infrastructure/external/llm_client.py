@@ -0,0 +1,255 @@
+"""LLM chat completion providers backed by the shared OpenAI HTTP client."""
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import aclosing
+from typing import Any, Protocol
+
+import httpx
+
+from config.settings import get_settings
+from infrastructure.external.http_clients import get_http_clients
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+ChatMessages = Sequence[dict[str, str]]
+
+
+class LLMProviderError(Exception):
+    """Chat completion failure.
+
+    Retryable errors (timeouts, connection errors, 429 and 5xx responses)
+    make the provider hedge, retry or fall back to the next model.
+    """
+
+    def __init__(self, message: str, retryable: bool = False):
+        self.message = message
+        self.retryable = retryable
+        super().__init__(self.message)
+
+
+class LLMProvider(Protocol):
+    """Backend generating chat completions."""
+
+    async def complete(
+        self, messages: ChatMessages, max_tokens: int, temperature: float = 0.7
+    ) -> str: ...
+
+    def stream(
+        self, messages: ChatMessages, max_tokens: int, temperature: float = 0.7
+    ) -> AsyncGenerator[str, None]: ...
+
+
+class OpenAIChatProvider:
+    """OpenAI-compatible ``/chat/completions`` client.
+
+    Each attempt is bounded by ``timeout``. If an attempt has not answered
+    within ``hedge_delay`` (or fails with a retryable error) a duplicate
+    request is started, up to ``max_attempts`` in flight per model, and the
+    first successful answer wins. When every attempt on a model fails with a
+    retryable error the next model in ``models`` is tried.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        api_key: str,
+        models: Sequence[str],
+        base_url: str | None = None,
+        timeout: float | None = None,
+        hedge_delay: float | None = None,
+        max_attempts: int = 2,
+    ) -> None:
+        self.client = client
+        self.api_key = api_key
+        self.models = list(dict.fromkeys(models))
+        self.base_url = (base_url or settings.openai_base_url).rstrip("/")
+        self.timeout = timeout or settings.openai_timeout_seconds
+        self.hedge_delay = hedge_delay or settings.openai_hedge_delay_seconds
+        self.max_attempts = max_attempts
+
+    async def complete(
+        self, messages: ChatMessages, max_tokens: int, temperature: float = 0.7
+    ) -> str:
+        """Return the completion text, falling back across models."""
+        payload = {
+            "messages": list(messages),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        last_error = LLMProviderError("No model configured")
+        for model in self.models:
+            try:
+                return await self._hedged(model, payload)
+            except LLMProviderError as e:
+                if not e.retryable:
+                    raise
+                logger.warning(
+                    "LLM model failed, trying fallback",
+                    extra={"model": model, "error": e.message},
+                )
+                last_error = e
+        raise last_error
+
+    async def stream(
+        self, messages: ChatMessages, max_tokens: int, temperature: float = 0.7
+    ) -> AsyncGenerator[str, None]:
+        """Yield completion tokens as the model produces them.
+
+        Falls back to the next model only while no token has been yielded;
+        ``timeout`` bounds the wait for the response and for each chunk.
+        """
+        payload = {
+            "messages": list(messages),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True,
+        }
+        last_error = LLMProviderError("No model configured")
+        for model in self.models:
+            started = False
+            try:
+                async with aclosing(self._stream_model(model, payload)) as tokens:
+                    async for token in tokens:
+                        started = True
+                        yield token
+                return
+            except LLMProviderError as e:
+                if started or not e.retryable:
+                    raise
+                logger.warning(
+                    "LLM model failed, trying fallback",
+                    extra={"model": model, "error": e.message},
+                )
+                last_error = e
+        raise last_error
+
+    async def _stream_model(
+        self, model: str, payload: dict[str, Any]
+    ) -> AsyncGenerator[str, None]:
+        request = self.client.build_request(
+            "POST",
+            f"{self.base_url}/chat/completions",
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            json={**payload, "model": model},
+            timeout=self.timeout,
+        )
+        try:
+            async with asyncio.timeout(self.timeout):
+                response = await self.client.send(request, stream=True)
+        except (TimeoutError, httpx.TimeoutException) as e:
+            raise LLMProviderError(f"{model} timed out", retryable=True) from e
+        except httpx.TransportError as e:
+            raise LLMProviderError(f"{model} connection failed", retryable=True) from e
+
+        try:
+            if response.status_code == 429 or response.status_code >= 500:
+                raise LLMProviderError(
+                    f"{model} returned {response.status_code}", retryable=True
+                )
+            if response.is_error:
+                raise LLMProviderError(f"{model} returned {response.status_code}")
+
+            lines = response.aiter_lines()
+            while True:
+                try:
+                    async with asyncio.timeout(self.timeout):
+                        line = await anext(lines, None)
+                except (TimeoutError, httpx.TimeoutException) as e:
+                    raise LLMProviderError(f"{model} timed out", retryable=True) from e
+                except httpx.TransportError as e:
+                    raise LLMProviderError(
+                        f"{model} connection failed", retryable=True
+                    ) from e
+                if line is None:
+                    return
+                data = line.removeprefix("data:").strip()
+                if not line.startswith("data:") or not data:
+                    continue
+                if data == "[DONE]":
+                    return
+                try:
+                    token = json.loads(data)["choices"][0]["delta"].get("content")
+                except (
+                    ValueError,
+                    KeyError,
+                    IndexError,
+                    TypeError,
+                    AttributeError,
+                ) as e:
+                    raise LLMProviderError(
+                        f"{model} returned a malformed chunk", retryable=True
+                    ) from e
+                if token:
+                    yield token
+        finally:
+            await response.aclose()
+
+    async def _hedged(self, model: str, payload: dict[str, Any]) -> str:
+        pending = {asyncio.create_task(self._request(model, payload))}
+        launched = 1
+        last_error = LLMProviderError(f"{model} did not respond", retryable=True)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self.hedge_delay if launched < self.max_attempts else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    try:
+                        return task.result()
+                    except LLMProviderError as e:
+                        if not e.retryable:
+                            raise
+                        last_error = e
+                if launched < self.max_attempts:
+                    pending.add(asyncio.create_task(self._request(model, payload)))
+                    launched += 1
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        raise last_error
+
+    async def _request(self, model: str, payload: dict[str, Any]) -> str:
+        try:
+            async with asyncio.timeout(self.timeout):
+                response = await self.client.post(
+                    f"{self.base_url}/chat/completions",
+                    headers={"Authorization": f"Bearer {self.api_key}"},
+                    json={**payload, "model": model},
+                    timeout=self.timeout,
+                )
+        except (TimeoutError, httpx.TimeoutException) as e:
+            raise LLMProviderError(f"{model} timed out", retryable=True) from e
+        except httpx.TransportError as e:
+            raise LLMProviderError(f"{model} connection failed", retryable=True) from e
+
+        if response.status_code == 429 or response.status_code >= 500:
+            raise LLMProviderError(
+                f"{model} returned {response.status_code}", retryable=True
+            )
+        if response.is_error:
+            raise LLMProviderError(f"{model} returned {response.status_code}")
+        try:
+            content = response.json()["choices"][0]["message"]["content"]
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise LLMProviderError(
+                f"{model} returned a malformed response", retryable=True
+            ) from e
+        return str(content).strip()
+
+
+def get_llm_provider() -> LLMProvider | None:
+    """Dependency providing the configured LLM provider (None without API key)."""
+    if not settings.openai_api_key:
+        return None
+    return OpenAIChatProvider(
+        get_http_clients().get("openai"),
+        settings.openai_api_key,
+        [settings.openai_model, settings.openai_fallback_model],
+    )
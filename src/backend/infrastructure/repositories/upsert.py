@@ -0,0 +1,20 @@
+"""Dialect-aware INSERT ... ON CONFLICT helpers."""
+
+from typing import Any
+
+from sqlalchemy import Table
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Dialect
+
+
+def dialect_insert(dialect: Dialect, table: Table) -> Any:
+    """Return an INSERT construct supporting ``on_conflict_do_update``.
+
+    PostgreSQL is used in production and SQLite in tests; both expose the
+    same ``ON CONFLICT`` API through their dialect-specific ``insert()``.
+    """
+    if dialect.name == "postgresql":
+        return postgresql.insert(table)
+    if dialect.name == "sqlite":
+        return sqlite.insert(table)
+    raise NotImplementedError(f"Upsert is not supported for dialect {dialect.name}")
@@ -3,6 +3,7 @@ SalonMate API 서버 진입점
 FastAPI 애플리케이션 설정 및 라우터 등록
 """
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -14,8 +15,16 @@ from sentry_sdk.integrations.fastapi import FastApiIntegration
 from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 
 from api.v1 import router as api_v1_router
+from config.database import get_session_factory
 from config.settings import get_settings
+from core.reply_templates import get_reply_template_registry
+from infrastructure.cache.job_store import get_job_store
+from infrastructure.cache.redis_cache import close_cache
+from infrastructure.cache.shop_cache import get_shop_cache
+from infrastructure.external.http_clients import close_http_clients, get_http_clients
 from middleware.timing import TimingMiddleware
+from worker.queue import get_job_queue, heartbeat_jobs
+from worker.tasks.style_analysis import sweep_stale_style_tags
 
 settings = get_settings()
 
@@ -39,8 +48,24 @@ if settings.sentry_dsn:
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """애플리케이션 수명 주기 관리"""
     # 시작 시 실행
+    get_reply_template_registry()
+    get_http_clients().warm_up()
+    # 큐에서 대기 중이거나 실행 중인 작업이 중단으로 처리되지 않도록 생존 신호 갱신
+    job_store = await get_job_store()
+    heartbeat = asyncio.create_task(heartbeat_jobs(get_job_queue(), job_store))
+    # 재시작 등으로 끊긴 스타일 이미지 분석을 주기적으로 다시 실행
+    sweeper = asyncio.create_task(
+        sweep_stale_style_tags(
+            get_session_factory(), job_store, await get_shop_cache(), get_job_queue()
+        )
+    )
     yield
     # 종료 시 실행
+    sweeper.cancel()
+    heartbeat.cancel()
+    await get_job_queue().shutdown()
+    await close_cache()
+    await close_http_clients()
 
 
 def create_app() -> FastAPI:
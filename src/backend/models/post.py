@@ -6,7 +6,17 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from models.base import GUID, BaseModel
@@ -28,6 +38,27 @@ class Post(BaseModel):
     """Instagram 포스트 엔티티"""
 
     __tablename__ = "posts"
+    __table_args__ = (
+        # 캘린더 조회: 매장별 표시 시각 범위 스캔
+        Index("idx_posts_shop_display_at", "shop_id", "display_at"),
+        # 인기 포스트 조회: 게시된 포스트만 점수순 인덱스 스캔 (index-only)
+        Index(
+            "idx_posts_shop_engagement_published",
+            "shop_id",
+            text("engagement_score DESC"),
+            postgresql_where=text("status = 'published'"),
+            postgresql_include=[
+                "id",
+                "image_url",
+                "likes_count",
+                "comments_count",
+                "reach_count",
+            ],
+            sqlite_where=text("status = 'published'"),
+        ),
+    )
+    # display_at, engagement_score 등 DB가 계산하는 컬럼을 flush 시 RETURNING으로 함께 로드
+    __mapper_args__ = {"eager_defaults": True}
 
     shop_id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
@@ -61,11 +92,21 @@ class Post(BaseModel):
     published_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # 캘린더 표시 시각 (예약 시각 우선, 없으면 게시 시각)
+    display_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        Computed("coalesce(scheduled_at, published_at)", persisted=True),
+    )
 
     # 인게이지먼트 메트릭
     likes_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     comments_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     reach_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # 인게이지먼트 점수: likes + comments*2 + reach/10 (정수 나눗셈)
+    engagement_score: Mapped[int] = mapped_column(
+        Integer,
+        Computed("likes_count + comments_count * 2 + reach_count / 10", persisted=True),
+    )
     engagement_synced_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
@@ -76,11 +117,6 @@ class Post(BaseModel):
     # 관계
     shop: Mapped["Shop"] = relationship("Shop", back_populates="posts")
 
-    @property
-    def engagement_score(self) -> int:
-        """Calculate engagement score: likes + comments*2 + reach/10"""
-        return self.likes_count + (self.comments_count * 2) + (self.reach_count // 10)
-
     @property
     def caption_snippet(self) -> str:
         """First 50 characters of caption"""
@@ -7,7 +7,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from models.base import GUID, BaseModel
@@ -20,6 +20,38 @@ class Review(BaseModel):
     """리뷰 엔티티"""
 
     __tablename__ = "reviews"
+    __table_args__ = (
+        # 리뷰 목록 키셋 페이지네이션: (review_date, id) 내림차순 인덱스 스캔
+        Index(
+            "idx_reviews_shop_date_id",
+            "shop_id",
+            text("review_date DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "idx_reviews_shop_status_date_id",
+            "shop_id",
+            "status",
+            text("review_date DESC"),
+            text("id DESC"),
+        ),
+        # 리뷰 검색: 매장별 pg_trgm trigram 인덱스 (btree_gin으로 shop_id 포함,
+        # 3글자 이상 검색어의 ILIKE 및 word_similarity 연산자)
+        Index(
+            "idx_reviews_shop_content_trgm",
+            "shop_id",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_reviews_shop_reviewer_name_trgm",
+            "shop_id",
+            "reviewer_name",
+            postgresql_using="gin",
+            postgresql_ops={"reviewer_name": "gin_trgm_ops"},
+        ),
+    )
 
     shop_id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
@@ -0,0 +1,53 @@
+"""
+일별 리뷰 통계 모델
+매장/일자/플랫폼별 리뷰 시계열을 미리 집계하여 저장합니다.
+"""
+
+import uuid
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from models.base import GUID, Base, TimestampMixin
+from models.review_rollup import RATING_COLUMNS
+
+
+class ReviewDailyStat(Base, TimestampMixin):
+    """일별 리뷰 통계 엔티티
+
+    트렌드 차트와 리뷰 분석은 1년치 원본 리뷰 대신
+    하루 한 행(플랫폼별)의 작은 집계 행만 읽습니다.
+    """
+
+    __tablename__ = "review_daily_stats"
+
+    shop_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        ForeignKey("shops.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    platform: Mapped[str] = mapped_column(String(20), primary_key=True)
+
+    review_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    replied_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # 평점 합계 및 히스토그램
+    rating_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_1_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_2_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_3_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_4_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_5_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    @property
+    def rating_histogram(self) -> dict[int, int]:
+        """평점별 리뷰 수 (1-5)"""
+        return {
+            rating: getattr(self, column) or 0
+            for rating, column in enumerate(RATING_COLUMNS, start=1)
+        }
+
+    def __repr__(self) -> str:
+        return f"<ReviewDailyStat {self.shop_id}:{self.day}:{self.platform}>"
@@ -0,0 +1,35 @@
+"""
+리뷰 키워드 집계 모델
+매장/일자별 키워드 출현 횟수를 미리 집계하여 저장합니다.
+"""
+
+import uuid
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from models.base import GUID, Base, TimestampMixin
+
+
+class ReviewKeywordCount(Base, TimestampMixin):
+    """리뷰 키워드 집계 엔티티
+
+    리뷰 분석의 키워드 클라우드는 리뷰 본문 대신 기간 내
+    일자별 키워드 행만 합산합니다.
+    """
+
+    __tablename__ = "review_keyword_counts"
+
+    shop_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        ForeignKey("shops.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    keyword: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<ReviewKeywordCount {self.shop_id}:{self.day}:{self.keyword}>"
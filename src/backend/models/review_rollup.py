@@ -0,0 +1,69 @@
+"""
+매장 리뷰 집계 모델
+매장/플랫폼별 리뷰 통계를 미리 집계하여 저장합니다.
+"""
+
+import uuid
+
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from models.base import GUID, Base, TimestampMixin
+
+RATING_COLUMNS = (
+    "rating_1_count",
+    "rating_2_count",
+    "rating_3_count",
+    "rating_4_count",
+    "rating_5_count",
+)
+
+
+class ShopReviewRollup(Base, TimestampMixin):
+    """매장 리뷰 집계 엔티티
+
+    매장과 플랫폼(google, naver) 조합마다 한 행을 유지합니다.
+    리뷰가 추가/수정/삭제될 때 같은 트랜잭션 안에서 증분 갱신되므로
+    리뷰 수와 관계없이 통계를 O(1)로 조회할 수 있습니다.
+    """
+
+    __tablename__ = "shop_review_rollups"
+
+    shop_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        ForeignKey("shops.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    platform: Mapped[str] = mapped_column(String(20), primary_key=True)
+
+    # 상태별 개수
+    review_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    pending_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    replied_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    ignored_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # 평점 합계 및 히스토그램
+    rating_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_1_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_2_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_3_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_4_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rating_5_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    @property
+    def rating_histogram(self) -> dict[int, int]:
+        """평점별 리뷰 수 (1-5)"""
+        return {
+            rating: getattr(self, column) or 0
+            for rating, column in enumerate(RATING_COLUMNS, start=1)
+        }
+
+    @property
+    def average_rating(self) -> float:
+        """평균 평점"""
+        if not self.review_count:
+            return 0.0
+        return self.rating_sum / self.review_count
+
+    def __repr__(self) -> str:
+        return f"<ShopReviewRollup {self.shop_id}:{self.platform}>"
@@ -46,6 +46,8 @@ class StyleTag(BaseModel):
     analyzed_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # 분석을 맡은 백그라운드 작업 ID (JobStore, 단건 분석은 없음)
+    analysis_job_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
 
     # 서비스 유형 (네일, 헤어, 메이크업, 속눈썹 등)
     service_type: Mapped[str | None] = mapped_column(
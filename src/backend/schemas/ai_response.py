@@ -4,9 +4,12 @@ AI 응답 관련 스키마
 
 from datetime import datetime
 from typing import Literal
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from schemas.common import JobResponse
+
 
 class AIResponseRequest(BaseModel):
     """AI 답변 생성 요청"""
@@ -25,3 +28,25 @@ class AIResponseResult(BaseModel):
     generated_at: datetime = Field(alias="generatedAt")
 
     model_config = {"populate_by_name": True}
+
+
+class AIResponseBatchRequest(AIResponseRequest):
+    """AI 답변 일괄 생성 요청 (reviewIds가 없으면 답변 없는 대기 리뷰 전체)"""
+
+    review_ids: list[UUID] | None = Field(
+        default=None, alias="reviewIds", min_length=1, max_length=1000
+    )
+
+
+class AIResponseJob(JobResponse):
+    """AI 답변 일괄 생성 작업 상태"""
+
+
+class AIReplyCacheStats(BaseModel):
+    """AI 답변 캐시 적중 통계"""
+
+    hits: int
+    misses: int
+    hit_rate: float = Field(alias="hitRate")
+
+    model_config = {"populate_by_name": True}
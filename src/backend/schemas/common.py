@@ -3,7 +3,7 @@
 """
 
 from datetime import datetime
-from typing import Generic, TypeVar
+from typing import Generic, Literal, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -56,3 +56,19 @@ class PaginatedResponse(BaseModel, Generic[T]):
     data: list[T]
     meta: ApiMeta
     pagination: PaginationMeta
+
+
+class JobResponse(BaseModel):
+    """백그라운드 작업 상태"""
+
+    id: str
+    status: Literal["queued", "running", "completed", "failed"]
+    total: int
+    processed: int
+    succeeded: int
+    failed: int
+    error: str | None = None
+    created_at: datetime = Field(alias="createdAt")
+    finished_at: datetime | None = Field(default=None, alias="finishedAt")
+
+    model_config = {"populate_by_name": True}
@@ -177,3 +177,16 @@ class ShopsListResponse(BaseModel):
     """Response schema for user's shops list"""
 
     shops: list[ShopSummary]
+
+
+# ============== Dashboard Overview ==============
+
+
+class DashboardOverviewResponse(BaseModel):
+    """Combined payload for the dashboard first paint"""
+
+    stats: ReviewStatsResponse
+    calendar: CalendarResponse
+    engagement: EngagementResponse
+    trends: TrendResponse
+    pending_reviews: PendingReviewsResponse
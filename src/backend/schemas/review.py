@@ -3,12 +3,13 @@
 """
 
 from datetime import datetime
-from typing import Literal
+from typing import Literal, Self
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 ReviewStatus = Literal["pending", "replied", "ignored"]
+ExportFormat = Literal["json", "ndjson", "csv", "xlsx"]
 
 
 class ReviewCreate(BaseModel):
@@ -24,6 +25,75 @@ class ReviewCreate(BaseModel):
     model_config = {"populate_by_name": True}
 
 
+class ReviewBulkItemResult(BaseModel):
+    """리뷰 일괄 등록 항목 결과"""
+
+    index: int
+    status: Literal["created", "updated", "error"]
+    id: UUID | None = None
+    google_review_id: str | None = Field(default=None, alias="googleReviewId")
+    error: str | None = None
+
+    model_config = {"populate_by_name": True}
+
+
+class ReviewBulkResponse(BaseModel):
+    """리뷰 일괄 등록 응답"""
+
+    created: int
+    updated: int
+    failed: int
+    results: list[ReviewBulkItemResult]
+
+
+class ReviewStatusFilter(BaseModel):
+    """리뷰 상태 일괄 변경 대상 조건 (하나 이상 지정)"""
+
+    status: ReviewStatus | None = None
+    rating: int | None = Field(default=None, ge=1, le=5)
+    review_date_before: datetime | None = Field(default=None, alias="reviewDateBefore")
+
+    model_config = {"populate_by_name": True}
+
+    @model_validator(mode="after")
+    def require_criterion(self) -> Self:
+        """빈 조건으로 매장의 모든 리뷰를 바꾸지 않도록 조건을 요구합니다."""
+        criteria = (self.status, self.rating, self.review_date_before)
+        if all(criterion is None for criterion in criteria):
+            raise ValueError("filter에는 조건을 하나 이상 지정해야 합니다.")
+        return self
+
+
+class ReviewBulkStatusUpdate(BaseModel):
+    """리뷰 상태 일괄 변경 요청 (reviewIds와 filter 중 하나만 지정)"""
+
+    status: ReviewStatus
+    review_ids: list[UUID] | None = Field(
+        default=None, alias="reviewIds", min_length=1, max_length=1000
+    )
+    filter: ReviewStatusFilter | None = None
+
+    model_config = {"populate_by_name": True}
+
+
+class ReviewBulkStatusItemResult(BaseModel):
+    """리뷰 상태 일괄 변경 항목 결과"""
+
+    id: UUID
+    result: Literal["updated", "unchanged", "not_found"]
+
+
+class ReviewBulkStatusResponse(BaseModel):
+    """리뷰 상태 일괄 변경 응답"""
+
+    updated: int
+    unchanged: int
+    not_found: int = Field(alias="notFound")
+    results: list[ReviewBulkStatusItemResult]
+
+    model_config = {"populate_by_name": True}
+
+
 class ReviewUpdate(BaseModel):
     """리뷰 수정 요청"""
 
@@ -60,7 +130,25 @@ class ReviewListResponse(BaseModel):
     """리뷰 목록 응답"""
 
     reviews: list[ReviewResponse]
-    total: int
+    total: int | None = None
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
+
+    model_config = {"populate_by_name": True}
+
+
+class ReviewSearchHit(ReviewResponse):
+    """리뷰 검색 결과 항목"""
+
+    rank: float
+
+
+class ReviewSearchResponse(BaseModel):
+    """리뷰 검색 응답"""
+
+    reviews: list[ReviewSearchHit]
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
+
+    model_config = {"populate_by_name": True}
 
 
 class ReviewStatsResponse(BaseModel):
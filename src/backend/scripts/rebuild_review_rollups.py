@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Review rollup backfill/repair script.
+
+Rebuilds shop_review_rollups, review_daily_stats and review_keyword_counts
+from the raw reviews table, either for every shop or for the shops given on
+the command line.
+
+With --keywords only review_keyword_counts is rebuilt. Run it once after
+upgrading past the c009_review_keyword_counts migration (which only creates
+the table) and after changing the keyword vocabulary in config/keywords.py.
+
+Usage:
+    python scripts/rebuild_review_rollups.py [--keywords] [SHOP_ID ...]
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from uuid import UUID
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.database import async_session_factory, engine
+from infrastructure.cache.redis_cache import close_cache
+from infrastructure.cache.shop_cache import get_shop_cache
+from models.post import Post  # noqa: F401
+from models.shop import Shop  # noqa: F401
+from models.social_account import SocialAccount  # noqa: F401
+from models.style_tag import StyleTag  # noqa: F401
+from models.user import User  # noqa: F401
+from services.review_rollup_service import ReviewRollupService
+
+
+async def rebuild(shop_ids: list[UUID], keywords_only: bool = False) -> None:
+    """Rebuild rollups for the given shops (all shops when empty)."""
+    async with async_session_factory() as session:
+        # 재구축한 매장의 캐시된 통계와 ETag를 무효화
+        service = ReviewRollupService(session, await get_shop_cache())
+        run = service.rebuild_keywords if keywords_only else service.rebuild
+        target = "review keyword counts" if keywords_only else "review rollups"
+        if not shop_ids:
+            print(f"Rebuilding {target} for all shops...")
+            await run()
+        for shop_id in shop_ids:
+            print(f"Rebuilding {target} for shop {shop_id}...")
+            await run(shop_id)
+
+
+async def main() -> None:
+    """Run the rollup rebuild."""
+    print("=" * 60)
+    print("SalonMate Review Rollup Rebuild")
+    print("=" * 60)
+
+    args = sys.argv[1:]
+    keywords_only = "--keywords" in args
+    try:
+        shop_ids = [UUID(arg) for arg in args if arg != "--keywords"]
+    except ValueError as e:
+        print(f"Invalid shop id: {e}")
+        sys.exit(2)
+
+    try:
+        await rebuild(shop_ids, keywords_only)
+    except Exception as e:
+        print("=" * 60)
+        print("Rebuild failed!")
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        await engine.dispose()
+        await close_cache()
+
+    print("=" * 60)
+    print("Rebuild complete!")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,20 +1,80 @@
 """
 AI 리뷰 답변 생성 서비스
-OpenAI API 연동 전 Mock 버전
+LLM 제공자가 설정되어 있으면 LLM으로, 아니면 템플릿으로 답변을 생성합니다.
 """
 
+import asyncio
+import hashlib
+import logging
+import re
+import unicodedata
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
+from contextlib import aclosing, nullcontext
 from datetime import UTC, datetime
+from typing import Any, NamedTuple
 from uuid import UUID
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from config.reply_templates import DEFAULT_SHOP_TYPE_NAME, SHOP_TYPE_NAMES
 from config.settings import get_settings
+from core.reply_templates import get_shop_reply_templates, truncate_graphemes
+from infrastructure.cache.reply_cache import ReplyCache
+from infrastructure.cache.shop_cache import ShopCache, bump_shop_version
+from infrastructure.external.llm_client import (
+    ChatMessages,
+    LLMProvider,
+    LLMProviderError,
+)
 from models.review import Review
 from models.shop import Shop
 from models.user import User
 from services.review_service import ReviewService
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# 답변 톤별 LLM 지시문
+TONE_INSTRUCTIONS = {
+    "friendly": "친근하고 따뜻한 존댓말로 작성하세요.",
+    "formal": "격식 있고 정중한 존댓말로 작성하세요.",
+    "casual": "가볍고 발랄한 말투로 작성하고 이모지를 한두 개 사용해도 좋습니다.",
+}
+
+REPLY_SYSTEM_PROMPT = """당신은 {shop_type} 매장 사장님을 대신해 고객 리뷰에 답글을 작성합니다.
+- 리뷰 작성자를 "{{이름}}님"으로 부르며 시작하세요.
+- 평점이 낮거나 불만이 있으면 사과하고 개선 의지를 밝히세요.
+- 리뷰에 언급된 구체적인 내용을 한 가지 이상 반영하세요.
+- {tone}
+- {shop_name}
+- 공백 포함 {max_length}자 이내로, 답글 본문만 출력하세요."""
+
+# 템플릿 답변을 스트리밍할 때 어절 단위로 나누는 패턴 (공백 포함)
+_TEMPLATE_TOKEN = re.compile(r"\S+\s*|\s+")
+
+# 답변 캐시 대상 리뷰의 정규화된 본문 최대 길이 (짧은 칭찬·불만 리뷰만 재사용)
+REPLY_CACHE_MAX_CONTENT_LENGTH = 100
+
+# 캐시된 답변에서 리뷰마다 바꿔 넣는 자리표시자
+REVIEWER_PLACEHOLDER = "{{reviewer_name}}"
+GREETING_PLACEHOLDER = "{{greeting}}"
+
+# 캐시된 답변을 재사용할 때 리뷰별로 번갈아 쓰는 인사말
+GREETING_VARIANTS = {
+    "friendly": ("안녕하세요", "반갑습니다", "안녕하세요, 반가워요"),
+    "formal": ("안녕하세요", "반갑습니다"),
+    "casual": ("안녕하세요", "반가워요"),
+}
+
+_NON_WORD = re.compile(r"[\W_]+")
+_REPEATED_CHAR = re.compile(r"(.)\1{2,}")
+
+# 일괄 생성 시 한 번의 UPDATE와 커밋으로 저장할 리뷰 수
+AI_BATCH_CHUNK_SIZE = 50
+
+# 일괄 생성 진행 콜백: (성공 수, 실패 수)
+ProgressCallback = Callable[[int, int], Awaitable[None]]
 
 
 class AIResponseException(Exception):
@@ -26,12 +86,92 @@ class AIResponseException(Exception):
         super().__init__(self.message)
 
 
+class ReplyOptions(NamedTuple):
+    """답변 생성 옵션"""
+
+    tone: str = "friendly"
+    include_shop_name: bool = False
+    max_length: int = 500
+
+
+class ReviewSnapshot(NamedTuple):
+    """답변 생성에 필요한 리뷰 값 (세션과 무관한 복사본)"""
+
+    id: UUID
+    shop_id: UUID
+    rating: int
+    content: str | None
+    reviewer_name: str
+
+
+# 답변 생성 대상: ORM 리뷰 또는 그 값 복사본
+ReplySubject = Review | ReviewSnapshot
+
+
+def rating_band(rating: int) -> str:
+    """평점을 답변 템플릿과 같은 긍정/중립/부정 구간으로 나눕니다."""
+    if rating >= 4:
+        return "positive"
+    return "neutral" if rating >= 3 else "negative"
+
+
+def normalize_review_content(content: str | None) -> str:
+    """리뷰 본문을 비교용으로 정규화합니다.
+
+    유니코드 호환 문자를 통일하고 소문자로 바꾼 뒤 문장부호·이모지를 지우고,
+    세 번 이상 반복된 글자("ㅎㅎㅎㅎ", "~~~")는 두 번으로 줄입니다.
+    """
+    text = unicodedata.normalize("NFKC", content or "").lower()
+    text = _NON_WORD.sub(" ", text)
+    return " ".join(_REPEATED_CHAR.sub(r"\1\1", text).split())
+
+
+def reply_fingerprint(
+    review: ReplySubject, shop: Shop | None, options: ReplyOptions
+) -> str | None:
+    """답변 캐시 키로 쓸 리뷰 지문을 만듭니다.
+
+    매장, 평점 구간, 답변 옵션과 정규화된 본문이 같으면 같은 지문이 됩니다.
+    본문이 길어 재사용 가치가 낮은 리뷰는 None을 반환합니다.
+    """
+    content = normalize_review_content(review.content)
+    if len(content) > REPLY_CACHE_MAX_CONTENT_LENGTH:
+        return None
+    parts = [
+        str(review.shop_id),
+        rating_band(review.rating),
+        options.tone,
+        # 매장 이름을 넣는 답변은 이름이 바뀌면 다시 생성
+        shop.name if shop and options.include_shop_name else "",
+        shop.type if shop else "",
+        str(options.max_length),
+        content,
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()[:32]
+
+
 class AIResponseService:
-    """AI 리뷰 답변 생성 서비스 (Mock)"""
+    """AI 리뷰 답변 생성 서비스
 
-    def __init__(self, db: AsyncSession):
+    llm이 없거나 LLM 호출이 모두 실패하면 템플릿 답변을 사용합니다.
+    reply_cache가 있으면 비슷한 리뷰에 생성했던 LLM 답변을 재사용합니다.
+    session_factory가 있으면 스트리밍 답변은 요청 세션 대신 별도 세션에 저장합니다.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        shop_cache: ShopCache | None = None,
+        llm: LLMProvider | None = None,
+        reply_cache: ReplyCache | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ):
         self.db = db
-        self.review_service = ReviewService(db)
+        self.shop_cache = shop_cache
+        self.llm = llm
+        self.reply_cache = reply_cache
+        self.session_factory = session_factory
+        self.review_service = ReviewService(db, shop_cache)
 
     async def generate_response(
         self,
@@ -54,12 +194,8 @@ class AIResponseService:
         # 매장 정보 조회
         shop = await self._get_shop(shop_id)
 
-        # Mock 답변 생성
-        ai_response = self._generate_mock_response(
-            review=review,
-            shop=shop,
-            tone=tone,
-            include_shop_name=include_shop_name,
+        ai_response = await self.compose_reply(
+            review, shop, ReplyOptions(tone, include_shop_name, max_length)
         )
 
         # 리뷰에 AI 답변 저장
@@ -67,133 +203,311 @@ class AIResponseService:
         review.ai_response = ai_response
         review.ai_response_generated_at = generated_at
         await self.db.commit()
+        await bump_shop_version(self.shop_cache, shop_id)
 
         return ai_response, generated_at
 
-    async def _get_shop(self, shop_id: UUID) -> Shop | None:
-        """매장 정보를 조회합니다."""
-        from sqlalchemy import select
+    async def stream_response(
+        self, user: User, shop_id: UUID, review_id: UUID, options: ReplyOptions
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """리뷰에 대한 AI 답변을 생성되는 대로 스트리밍합니다.
 
-        result = await self.db.execute(select(Shop).where(Shop.id == shop_id))
-        return result.scalar_one_or_none()
+        리뷰 확인은 스트림 시작 전에 수행하며, 반환된 이터레이터는
+        ("token", {"text"}) 이벤트를 차례로 내보낸 뒤 답변을 저장하고
+        ("done", {"ai_response", "generated_at"}) 이벤트로 끝납니다.
+        생성 도중 실패하면 저장하지 않고 ("error", {"message"})로 끝납니다.
 
-    def _generate_mock_response(
-        self,
-        review: Review,
-        shop: Shop | None,
-        tone: str,
-        include_shop_name: bool,
-    ) -> str:
-        """Mock 답변을 생성합니다.
-
-        실제 OpenAI API 연동 전까지 사용할 Mock 답변입니다.
+        스트림은 응답을 보내는 동안 실행되므로 리뷰 값을 복사한 뒤 요청 세션의
+        트랜잭션을 끝내고, 답변은 _save_reply로 저장합니다.
         """
-        shop_name = shop.name if shop and include_shop_name else "저희 매장"
-        shop_type = self._get_shop_type_korean(shop.type if shop else "nail")
-
-        # 평점에 따른 답변 템플릿
-        if review.rating >= 4:
-            return self._generate_positive_response(
-                reviewer_name=review.reviewer_name,
-                shop_name=shop_name,
-                shop_type=shop_type,
-                content=review.content,
-                tone=tone,
+        review = await self.review_service.get_review_by_id(user, shop_id, review_id)
+        if not review:
+            raise AIResponseException("리뷰를 찾을 수 없습니다.", status_code=404)
+        shop = await self._get_shop(shop_id)
+        snapshot = ReviewSnapshot(
+            review.id,
+            review.shop_id,
+            review.rating,
+            review.content,
+            review.reviewer_name,
+        )
+        await self.db.commit()
+        return self._stream_reply(snapshot, shop, options)
+
+    async def _stream_reply(
+        self, review: ReviewSnapshot, shop: Shop | None, options: ReplyOptions
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        parts: list[str] = []
+        length = 0
+        try:
+            async with aclosing(self._stream_tokens(review, shop, options)) as tokens:
+                async for token in tokens:
+                    text = truncate_graphemes(token, options.max_length - length)
+                    if text:
+                        parts.append(text)
+                        length += len(text)
+                        yield "token", {"text": text}
+                    if length >= options.max_length:
+                        break
+        except LLMProviderError as e:
+            logger.warning(
+                "LLM reply stream failed",
+                extra={"review_id": str(review.id), "error": e.message},
             )
-        elif review.rating >= 3:
-            return self._generate_neutral_response(
-                reviewer_name=review.reviewer_name,
-                shop_name=shop_name,
-                shop_type=shop_type,
-                content=review.content,
-                tone=tone,
+            yield "error", {"message": "답변 생성 중 오류가 발생했습니다."}
+            return
+
+        generated_at = datetime.now(UTC)
+        ai_response = "".join(parts).strip()
+        await self._save_reply(review, ai_response, generated_at)
+        yield "done", {"ai_response": ai_response, "generated_at": generated_at}
+
+    async def _save_reply(
+        self, review: ReviewSnapshot, ai_response: str, generated_at: datetime
+    ) -> None:
+        """스트리밍한 답변을 저장합니다 (세션 팩토리가 있으면 별도 세션 사용)."""
+        async with (
+            self.session_factory() if self.session_factory else nullcontext(self.db)
+        ) as session:
+            await session.execute(
+                update(Review)
+                .where(Review.id == review.id)
+                .values(ai_response=ai_response, ai_response_generated_at=generated_at)
+                .execution_options(synchronize_session=False)
             )
-        else:
-            return self._generate_negative_response(
-                reviewer_name=review.reviewer_name,
-                shop_name=shop_name,
-                shop_type=shop_type,
-                content=review.content,
-                tone=tone,
+            await session.commit()
+        await bump_shop_version(self.shop_cache, review.shop_id)
+
+    async def _stream_tokens(
+        self, review: ReplySubject, shop: Shop | None, options: ReplyOptions
+    ) -> AsyncGenerator[str, None]:
+        """LLM 토큰을 내보내고, 첫 토큰 전에 실패하면 템플릿 답변으로 대체합니다."""
+        if self.llm is not None:
+            fingerprint = reply_fingerprint(review, shop, options)
+            cached = await self._get_cached_reply(review, fingerprint, options)
+            if cached is not None:
+                for token in _TEMPLATE_TOKEN.findall(cached):
+                    yield token
+                return
+
+            parts: list[str] = []
+            stream = self.llm.stream(
+                self._build_messages(review, shop, options),
+                max_tokens=options.max_length * 2,
             )
+            try:
+                async with aclosing(stream) as tokens:
+                    async for token in tokens:
+                        parts.append(token)
+                        yield token
+                if parts:
+                    # 끝까지 받은 답변만 캐시 (max_length로 중간에 끊기면 여기 오지 않음)
+                    reply = "".join(parts).strip()
+                    await self._cache_reply(review, fingerprint, reply)
+                    return
+            except LLMProviderError as e:
+                if parts:
+                    raise
+                logger.warning(
+                    "LLM reply stream failed, using template",
+                    extra={"review_id": str(review.id), "error": e.message},
+                )
+        template = self._render_template_reply(review, shop, options)
+        for token in _TEMPLATE_TOKEN.findall(template):
+            yield token
+
+    async def get_batch_targets(
+        self, user: User, shop_id: UUID, review_ids: list[UUID] | None = None
+    ) -> list[UUID]:
+        """일괄 답변 생성 대상 리뷰 ID를 조회합니다.
+
+        review_ids가 없으면 아직 AI 답변이 없는 대기(pending) 리뷰 전체를,
+        있으면 그중 매장에 속한 리뷰를 대상으로 합니다 (기존 답변은 다시 생성).
+        """
+        shop = await self.review_service._get_user_shop(user, shop_id)
+        if not shop:
+            raise AIResponseException("매장을 찾을 수 없습니다.", status_code=404)
+
+        query = select(Review.id).where(Review.shop_id == shop_id)
+        if review_ids is None:
+            query = query.where(
+                Review.status == "pending", Review.ai_response.is_(None)
+            ).order_by(Review.review_date.desc(), Review.id.desc())
+        else:
+            query = query.where(Review.id.in_(review_ids))
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
 
-    def _get_shop_type_korean(self, shop_type: str) -> str:
-        """매장 유형을 한글로 변환합니다."""
-        type_map = {
-            "nail": "네일",
-            "hair": "헤어",
-            "skin": "피부 관리",
-            "lash": "속눈썹",
-        }
-        return type_map.get(shop_type, "뷰티")
-
-    def _generate_positive_response(
+    async def generate_batch(
         self,
-        reviewer_name: str,
-        shop_name: str,
-        shop_type: str,
-        content: str | None,
-        tone: str,
-    ) -> str:
-        """긍정 리뷰에 대한 답변을 생성합니다."""
-        if tone == "formal":
-            return (
-                f"{reviewer_name} 고객님, 안녕하세요.\n\n"
-                f"{shop_name}을 이용해 주시고 좋은 리뷰를 남겨 주셔서 진심으로 감사드립니다. "
-                f"고객님의 소중한 후기가 저희에게 큰 힘이 됩니다.\n\n"
-                f"앞으로도 최상의 {shop_type} 서비스로 보답하겠습니다. "
-                f"다음 방문 시에도 만족스러운 경험을 드릴 수 있도록 최선을 다하겠습니다.\n\n"
-                f"감사합니다."
-            )
-        elif tone == "casual":
-            return (
-                f"{reviewer_name}님, 리뷰 감사해요! 🙏\n\n"
-                f"좋게 봐주셔서 정말 기쁘네요~ "
-                f"다음에 또 오시면 더 예쁘게 해드릴게요! ✨\n\n"
-                f"또 뵙겠습니다! 💕"
+        shop_id: UUID,
+        review_ids: list[UUID],
+        options: ReplyOptions,
+        on_progress: ProgressCallback | None = None,
+    ) -> tuple[int, int]:
+        """여러 리뷰의 AI 답변을 생성해 저장합니다.
+
+        AI_BATCH_CHUNK_SIZE개씩 동시에 최대 settings.ai_batch_concurrency개를
+        생성하고, 청크마다 한 번의 일괄 UPDATE와 커밋으로 저장합니다.
+        LLM 호출 중에는 트랜잭션을 열어 두지 않도록 리뷰 값을 복사한 뒤 커밋하고
+        생성합니다. 생성에 실패한 리뷰는 건너뛰며 (성공 수, 실패 수)를 반환합니다.
+        """
+        shop = await self._get_shop(shop_id)
+        slots = asyncio.Semaphore(settings.ai_batch_concurrency)
+
+        async def compose(review: ReviewSnapshot) -> str:
+            async with slots:
+                return await self.compose_reply(review, shop, options)
+
+        succeeded = failed = 0
+        for start in range(0, len(review_ids), AI_BATCH_CHUNK_SIZE):
+            chunk = review_ids[start : start + AI_BATCH_CHUNK_SIZE]
+            result = await self.db.execute(
+                select(
+                    Review.id,
+                    Review.shop_id,
+                    Review.rating,
+                    Review.content,
+                    Review.reviewer_name,
+                ).where(Review.shop_id == shop_id, Review.id.in_(chunk))
             )
-        else:  # friendly (default)
-            return (
-                f"{reviewer_name}님, 안녕하세요!\n\n"
-                f"{shop_name}에 방문해 주시고 좋은 리뷰까지 남겨 주셔서 정말 감사합니다. "
-                f"고객님께서 만족하셨다니 저희도 너무 기쁩니다!\n\n"
-                f"앞으로도 더 좋은 {shop_type} 서비스로 보답하겠습니다. "
-                f"다음에 또 뵙겠습니다! 감사합니다. 😊"
+            reviews = [ReviewSnapshot(*row) for row in result.all()]
+            # LLM 응답을 기다리는 동안 DB 연결을 잡지 않도록 먼저 트랜잭션 종료
+            await self.db.commit()
+            replies = await asyncio.gather(
+                *(compose(review) for review in reviews), return_exceptions=True
             )
 
-    def _generate_neutral_response(
-        self,
-        reviewer_name: str,
-        shop_name: str,
-        shop_type: str,
-        content: str | None,
-        tone: str,
+            generated_at = datetime.now(UTC)
+            rows = [
+                {
+                    "id": review.id,
+                    "ai_response": reply,
+                    "ai_response_generated_at": generated_at,
+                }
+                for review, reply in zip(reviews, replies, strict=True)
+                if isinstance(reply, str)
+            ]
+            if rows:
+                await self.db.execute(update(Review), rows)
+                await self.db.commit()
+                await bump_shop_version(self.shop_cache, shop_id)
+
+            chunk_failed = len(chunk) - len(rows)
+            succeeded += len(rows)
+            failed += chunk_failed
+            if on_progress is not None:
+                await on_progress(len(rows), chunk_failed)
+        return succeeded, failed
+
+    async def compose_reply(
+        self, review: ReplySubject, shop: Shop | None, options: ReplyOptions
     ) -> str:
-        """중립 리뷰에 대한 답변을 생성합니다."""
-        return (
-            f"{reviewer_name}님, 안녕하세요.\n\n"
-            f"{shop_name}을 이용해 주셔서 감사합니다. "
-            f"소중한 피드백을 주셔서 감사드립니다.\n\n"
-            f"고객님의 의견을 반영하여 더 나은 서비스를 제공할 수 있도록 노력하겠습니다. "
-            f"다음 방문 시에는 더욱 만족스러운 경험을 드릴 수 있도록 최선을 다하겠습니다.\n\n"
-            f"감사합니다."
+        """리뷰 하나의 답변을 생성합니다 (저장하지 않음)."""
+        if self.llm is not None:
+            fingerprint = reply_fingerprint(review, shop, options)
+            cached = await self._get_cached_reply(review, fingerprint, options)
+            if cached is not None:
+                return cached
+            try:
+                reply = await self.llm.complete(
+                    self._build_messages(review, shop, options),
+                    # 한글은 글자당 1~2 토큰이므로 여유를 둠
+                    max_tokens=options.max_length * 2,
+                )
+                if reply:
+                    reply = truncate_graphemes(reply, options.max_length)
+                    await self._cache_reply(review, fingerprint, reply)
+                    return reply
+            except LLMProviderError as e:
+                logger.warning(
+                    "LLM reply generation failed, using template",
+                    extra={"review_id": str(review.id), "error": e.message},
+                )
+        return self._render_template_reply(review, shop, options)
+
+    async def _get_cached_reply(
+        self, review: ReplySubject, fingerprint: str | None, options: ReplyOptions
+    ) -> str | None:
+        """캐시된 답변에 리뷰 작성자 이름과 인사말을 채워 반환합니다."""
+        if self.reply_cache is None or fingerprint is None:
+            return None
+        template = await self.reply_cache.get(review.shop_id, fingerprint)
+        if template is None:
+            return None
+        greetings = GREETING_VARIANTS.get(options.tone, GREETING_VARIANTS["friendly"])
+        reply = template.replace(REVIEWER_PLACEHOLDER, review.reviewer_name).replace(
+            GREETING_PLACEHOLDER, greetings[review.id.int % len(greetings)]
         )
+        return truncate_graphemes(reply, options.max_length)
 
-    def _generate_negative_response(
-        self,
-        reviewer_name: str,
-        shop_name: str,
-        shop_type: str,
-        content: str | None,
-        tone: str,
+    async def _cache_reply(
+        self, review: ReplySubject, fingerprint: str | None, reply: str
+    ) -> None:
+        """생성한 답변의 작성자 이름과 첫 인사말을 자리표시자로 바꿔 캐시합니다."""
+        if self.reply_cache is None or fingerprint is None:
+            return
+        name = review.reviewer_name.strip()
+        if len(name) < 2:
+            # 한 글자 이름은 답변 본문의 다른 글자와 구분할 수 없음
+            return
+        template = reply.replace(name, REVIEWER_PLACEHOLDER).replace(
+            "안녕하세요", GREETING_PLACEHOLDER, 1
+        )
+        await self.reply_cache.set(review.shop_id, fingerprint, template)
+
+    def _build_messages(
+        self, review: ReplySubject, shop: Shop | None, options: ReplyOptions
+    ) -> ChatMessages:
+        """LLM에 보낼 대화 메시지를 구성합니다."""
+        shop_name = (
+            f'매장 이름 "{shop.name}"을 자연스럽게 한 번 언급하세요.'
+            if shop and options.include_shop_name
+            else "매장 이름은 언급하지 말고 '저희 매장'이라고 부르세요."
+        )
+        system = REPLY_SYSTEM_PROMPT.format(
+            shop_type=SHOP_TYPE_NAMES.get(
+                shop.type if shop else "nail", DEFAULT_SHOP_TYPE_NAME
+            ),
+            tone=TONE_INSTRUCTIONS.get(options.tone, TONE_INSTRUCTIONS["friendly"]),
+            shop_name=shop_name,
+            max_length=options.max_length,
+        )
+        user = (
+            f"작성자: {review.reviewer_name}\n"
+            f"평점: {review.rating}/5\n"
+            f"리뷰: {review.content or '(내용 없음)'}"
+        )
+        return [
+            {"role": "system", "content": system},
+            {"role": "user", "content": user},
+        ]
+
+    async def _get_shop(self, shop_id: UUID) -> Shop | None:
+        """매장 정보를 조회합니다."""
+        result = await self.db.execute(select(Shop).where(Shop.id == shop_id))
+        return result.scalar_one_or_none()
+
+    def _render_template_reply(
+        self, review: ReplySubject, shop: Shop | None, options: ReplyOptions
     ) -> str:
-        """부정 리뷰에 대한 답변을 생성합니다."""
-        return (
-            f"{reviewer_name}님, 안녕하세요.\n\n"
-            f"먼저 {shop_name}을 이용해 주셔서 감사드리며, "
-            f"불편을 드려 진심으로 죄송합니다.\n\n"
-            f"고객님께서 말씀해 주신 부분에 대해 깊이 반성하고, "
-            f"즉시 개선할 수 있도록 노력하겠습니다. "
-            f"다음에 다시 방문해 주신다면 더 나은 서비스로 보답하겠습니다.\n\n"
-            f"다시 한번 불편을 드린 점 사과드립니다. 감사합니다."
+        """템플릿 답변을 생성합니다.
+
+        LLM이 없거나 실패했을 때 쓰는 답변으로, 매장의 템플릿 재정의를 반영하고
+        max_length를 문자소 경계에서 적용합니다.
+        """
+        shop_type = shop.type if shop else "nail"
+        templates = get_shop_reply_templates(shop.settings if shop else None)
+        return templates.render(
+            rating_band(review.rating),
+            options.tone,
+            shop_type,
+            {
+                "reviewer_name": review.reviewer_name,
+                "shop_name": (
+                    shop.name if shop and options.include_shop_name else "저희 매장"
+                ),
+                "shop_type": SHOP_TYPE_NAMES.get(shop_type, DEFAULT_SHOP_TYPE_NAME),
+            },
+            options.max_length,
         )
@@ -2,19 +2,28 @@
 Dashboard Service - Business logic for marketing dashboard
 """
 
+import asyncio
+import calendar
 import logging
-from datetime import UTC, date, datetime, timedelta
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime, time, timedelta
+from time import perf_counter
+from typing import TypeVar
 from uuid import UUID
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from sqlalchemy import and_, case, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from config.settings import get_settings
+from infrastructure.cache.shop_cache import ShopCache, bump_shop_version
 from models.post import Post
 from models.review import Review
 from models.shop import Shop
 from schemas.dashboard import (
     CalendarEntry,
     CalendarResponse,
+    DashboardOverviewResponse,
     EngagementResponse,
     GeneratedResponseResult,
     PendingReview,
@@ -29,15 +38,26 @@ from schemas.dashboard import (
     TrendDataPoint,
     TrendResponse,
 )
+from services.review_rollup_service import ReviewRollupService
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _local_date(value: datetime, tz: ZoneInfo) -> date:
+    """Date of a stored timestamp in the given timezone (naive means UTC)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(tz).date()
+
 
 class DashboardService:
     """Service for dashboard-related operations"""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, shop_cache: ShopCache | None = None):
         self.db = db
+        self.shop_cache = shop_cache
 
     async def verify_shop_ownership(self, shop_id: UUID, user_id: UUID) -> Shop | None:
         """Verify that the user owns the shop"""
@@ -58,90 +78,43 @@ class DashboardService:
 
     # ============== User Story 1: Review Stats ==============
 
+    @ShopCache.cached("stats", ReviewStatsResponse)
     async def get_review_stats(self, shop_id: UUID) -> ReviewStatsResponse:
         """
         Get review statistics for a shop.
         Implements FR-001, FR-002, FR-003, FR-004.
         """
         logger.info("Fetching review stats", extra={"shop_id": str(shop_id)})
-        # Get all reviews for the shop
-        result = await self.db.execute(
-            select(
-                func.count(Review.id).label("total_reviews"),
-                func.coalesce(func.avg(Review.rating), 0).label("average_rating"),
-                func.sum(case((Review.status == "replied", 1), else_=0)).label(
-                    "replied_count"
-                ),
-                func.sum(case((Review.status == "pending", 1), else_=0)).label(
-                    "pending_count"
-                ),
-            ).where(Review.shop_id == shop_id)
-        )
-        row = result.one()
-
-        total_reviews = row.total_reviews or 0
-        average_rating = float(row.average_rating or 0)
-        replied_count = int(row.replied_count or 0)
-        pending_count = int(row.pending_count or 0)
+        # Per-platform rollups are maintained incrementally on review writes,
+        # so this reads at most one row per platform regardless of review count
+        rollups = await ReviewRollupService(self.db).get_shop_rollups(shop_id)
+
+        total_reviews = 0
+        rating_sum = 0
+        replied_count = 0
+        pending_count = 0
+        by_platform: dict[str, PlatformStats] = {}
 
-        # Calculate response rate
-        response_rate = 0.0
-        if total_reviews > 0:
-            response_rate = (replied_count / total_reviews) * 100
+        for rollup in rollups:
+            if rollup.review_count <= 0:
+                continue
 
-        # Get platform breakdown (google vs naver)
-        # Reviews with google_review_id are from Google, otherwise assume Naver
-        by_platform: dict[str, PlatformStats] = {}
+            total_reviews += rollup.review_count
+            rating_sum += rollup.rating_sum
+            replied_count += rollup.replied_count
+            pending_count += rollup.pending_count
 
-        # Google reviews (have google_review_id)
-        google_result = await self.db.execute(
-            select(
-                func.count(Review.id).label("total"),
-                func.coalesce(func.avg(Review.rating), 0).label("avg_rating"),
-                func.sum(case((Review.status == "replied", 1), else_=0)).label(
-                    "replied"
-                ),
-            ).where(
-                and_(
-                    Review.shop_id == shop_id,
-                    Review.google_review_id.isnot(None),
-                )
-            )
-        )
-        google_row = google_result.one()
-        if google_row.total and google_row.total > 0:
-            google_response_rate = (
-                int(google_row.replied or 0) / google_row.total
-            ) * 100
-            by_platform["google"] = PlatformStats(
-                total_reviews=google_row.total,
-                average_rating=float(google_row.avg_rating or 0),
-                response_rate=google_response_rate,
+            by_platform[rollup.platform] = PlatformStats(
+                total_reviews=rollup.review_count,
+                average_rating=rollup.average_rating,
+                response_rate=(rollup.replied_count / rollup.review_count) * 100,
             )
 
-        # Naver reviews (no google_review_id)
-        naver_result = await self.db.execute(
-            select(
-                func.count(Review.id).label("total"),
-                func.coalesce(func.avg(Review.rating), 0).label("avg_rating"),
-                func.sum(case((Review.status == "replied", 1), else_=0)).label(
-                    "replied"
-                ),
-            ).where(
-                and_(
-                    Review.shop_id == shop_id,
-                    Review.google_review_id.is_(None),
-                )
-            )
-        )
-        naver_row = naver_result.one()
-        if naver_row.total and naver_row.total > 0:
-            naver_response_rate = (int(naver_row.replied or 0) / naver_row.total) * 100
-            by_platform["naver"] = PlatformStats(
-                total_reviews=naver_row.total,
-                average_rating=float(naver_row.avg_rating or 0),
-                response_rate=naver_response_rate,
-            )
+        average_rating = 0.0
+        response_rate = 0.0
+        if total_reviews > 0:
+            average_rating = rating_sum / total_reviews
+            response_rate = (replied_count / total_reviews) * 100
 
         return ReviewStatsResponse(
             total_reviews=total_reviews,
@@ -154,6 +127,7 @@ class DashboardService:
 
     # ============== User Story 2: Posting Calendar ==============
 
+    @ShopCache.cached("calendar", CalendarResponse)
     async def get_posting_calendar(
         self,
         shop_id: UUID,
@@ -172,35 +146,27 @@ class DashboardService:
                 "end_date": str(end_date),
             },
         )
-        from sqlalchemy import or_
+        shop_tz = await self._get_shop_timezone(shop_id)
+
+        # Half-open [start, end) range on the indexed display_at column,
+        # with day boundaries taken in the shop's timezone
+        range_start = datetime.combine(start_date, time.min, tzinfo=shop_tz)
+        range_end = datetime.combine(
+            end_date + timedelta(days=1), time.min, tzinfo=shop_tz
+        )
 
-        # Query posts that fall within the date range
-        # Posts are grouped by their display date (scheduled_at or published_at)
         # Exclude draft posts (they have no scheduled_at)
         result = await self.db.execute(
             select(Post)
             .where(
                 and_(
                     Post.shop_id == shop_id,
-                    Post.status != "draft",  # Exclude drafts
-                    or_(
-                        # Check scheduled_at is within range
-                        and_(
-                            Post.scheduled_at.isnot(None),
-                            func.date(Post.scheduled_at) >= start_date,
-                            func.date(Post.scheduled_at) <= end_date,
-                        ),
-                        # Check published_at is within range (for published posts without scheduled_at)
-                        and_(
-                            Post.scheduled_at.is_(None),
-                            Post.published_at.isnot(None),
-                            func.date(Post.published_at) >= start_date,
-                            func.date(Post.published_at) <= end_date,
-                        ),
-                    ),
+                    Post.display_at >= range_start.astimezone(UTC),
+                    Post.display_at < range_end.astimezone(UTC),
+                    Post.status != "draft",
                 )
             )
-            .order_by(Post.scheduled_at, Post.published_at)
+            .order_by(Post.display_at)
         )
         posts = result.scalars().all()
 
@@ -213,7 +179,7 @@ class DashboardService:
             if display_datetime is None:
                 continue
 
-            display_date = display_datetime.date()
+            display_date = _local_date(display_datetime, shop_tz)
 
             if display_date not in posts_by_date:
                 posts_by_date[display_date] = []
@@ -248,8 +214,23 @@ class DashboardService:
             last_synced_at=datetime.now(UTC),
         )
 
+    async def _get_shop_timezone(self, shop_id: UUID) -> ZoneInfo:
+        """Get the shop's timezone, falling back to the configured default."""
+        result = await self.db.execute(select(Shop.settings).where(Shop.id == shop_id))
+        shop_settings = result.scalar_one_or_none() or {}
+        name = shop_settings.get("timezone") or get_settings().default_timezone
+        try:
+            return ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.warning(
+                "Unknown shop timezone, using default",
+                extra={"shop_id": str(shop_id), "timezone": name},
+            )
+            return ZoneInfo(get_settings().default_timezone)
+
     # ============== User Story 3: Engagement Metrics ==============
 
+    @ShopCache.cached("engagement", EngagementResponse)
     async def get_engagement_metrics(self, shop_id: UUID) -> EngagementResponse:
         """
         Get engagement metrics summary.
@@ -275,38 +256,38 @@ class DashboardService:
         total_comments = int(row.total_comments)
         total_reach = int(row.total_reach)
 
-        # Get top 5 posts by engagement score
-        # Engagement score = likes + comments*2 + reach/10
+        # Get top 5 posts by the persisted engagement score
+        # (likes + comments*2 + reach/10), served by the partial
+        # (shop_id, engagement_score DESC) index on published posts
         posts_result = await self.db.execute(
-            select(Post)
+            select(
+                Post.id,
+                Post.image_url,
+                Post.likes_count,
+                Post.comments_count,
+                Post.reach_count,
+                Post.engagement_score,
+            )
             .where(
                 and_(
                     Post.shop_id == shop_id,
                     Post.status == "published",
                 )
             )
-            .order_by(
-                # Order by engagement score descending
-                (
-                    Post.likes_count + Post.comments_count * 2 + Post.reach_count / 10
-                ).desc()
-            )
+            .order_by(Post.engagement_score.desc())
             .limit(5)
         )
-        top_posts_models = posts_result.scalars().all()
 
         top_posts = [
             TopPost(
-                id=post.id,
-                image_url=post.image_url,
-                likes_count=post.likes_count,
-                comments_count=post.comments_count,
-                reach_count=post.reach_count,
-                engagement_score=post.likes_count
-                + (post.comments_count * 2)
-                + (post.reach_count // 10),
+                id=row.id,
+                image_url=row.image_url,
+                likes_count=row.likes_count,
+                comments_count=row.comments_count,
+                reach_count=row.reach_count,
+                engagement_score=row.engagement_score,
             )
-            for post in top_posts_models
+            for row in posts_result.all()
         ]
 
         return EngagementResponse(
@@ -319,6 +300,7 @@ class DashboardService:
 
     # ============== User Story 4: Trend Data ==============
 
+    @ShopCache.cached("trends", TrendResponse)
     async def get_trend_data(
         self,
         shop_id: UUID,
@@ -343,41 +325,22 @@ class DashboardService:
 
         end_date = now.date()
 
-        # Query reviews grouped by date
-        result = await self.db.execute(
-            select(
-                func.date(Review.review_date).label("date"),
-                func.count(Review.id).label("review_count"),
-                func.coalesce(func.avg(Review.rating), 0).label("average_rating"),
-                func.sum(case((Review.status == "replied", 1), else_=0)).label(
-                    "replied_count"
-                ),
-            )
-            .where(
-                and_(
-                    Review.shop_id == shop_id,
-                    func.date(Review.review_date) >= start_date,
-                    func.date(Review.review_date) <= end_date,
-                )
-            )
-            .group_by(func.date(Review.review_date))
-            .order_by(func.date(Review.review_date))
+        # 일별 통계 테이블에서 기간 내 최대 365행만 조회
+        rows = await ReviewRollupService(self.db).get_daily_stats(
+            shop_id, start_date, end_date
         )
-        rows = result.all()
 
         data_points = []
         for row in rows:
-            review_count = row.review_count or 0
-            average_rating = float(row.average_rating or 0)
+            review_count = int(row.review_count or 0)
             replied_count = int(row.replied_count or 0)
+            average_rating = float(row.rating_sum or 0) / review_count
 
-            response_rate = 0.0
-            if review_count > 0:
-                response_rate = (replied_count / review_count) * 100
+            response_rate = (replied_count / review_count) * 100
 
             data_points.append(
                 TrendDataPoint(
-                    date=row.date,
+                    date=row.day,
                     review_count=review_count,
                     average_rating=round(average_rating, 2),
                     response_rate=round(response_rate, 2),
@@ -391,6 +354,7 @@ class DashboardService:
 
     # ============== User Story 5: Pending Reviews & Quick Actions ==============
 
+    @ShopCache.cached("pending_reviews", PendingReviewsResponse)
     async def get_pending_reviews(
         self,
         shop_id: UUID,
@@ -417,16 +381,9 @@ class DashboardService:
         )
         reviews = result.scalars().all()
 
-        # Get total pending count
-        count_result = await self.db.execute(
-            select(func.count(Review.id)).where(
-                and_(
-                    Review.shop_id == shop_id,
-                    Review.status == "pending",
-                )
-            )
-        )
-        total_pending = count_result.scalar() or 0
+        # Get total pending count from the per-platform rollups
+        rollups = await ReviewRollupService(self.db).get_shop_rollups(shop_id)
+        total_pending = sum(rollup.pending_count for rollup in rollups)
 
         pending_reviews = [
             PendingReview(
@@ -481,6 +438,7 @@ class DashboardService:
         # Store the generated response
         review.ai_response = ai_response
         await self.db.commit()
+        await bump_shop_version(self.shop_cache, shop_id)
 
         return GeneratedResponseResult(
             review_id=review_id,
@@ -531,6 +489,7 @@ class DashboardService:
         review.replied_at = datetime.now(UTC)
 
         await self.db.commit()
+        await bump_shop_version(self.shop_cache, shop_id)
 
         return PublishResponseResult(
             review_id=review_id,
@@ -546,31 +505,109 @@ class DashboardService:
         Implements FR-016.
         """
         logger.info("Fetching user shops", extra={"user_id": str(user_id)})
-        result = await self.db.execute(select(Shop).where(Shop.user_id == user_id))
-        shops = result.scalars().all()
-
-        shop_summaries = []
-        for shop in shops:
-            # Check if shop has reviews
-            review_count = await self.db.execute(
-                select(func.count(Review.id)).where(Review.shop_id == shop.id)
-            )
-            has_reviews = (review_count.scalar() or 0) > 0
+        # Correlated EXISTS stops at the first matching row per shop
+        has_reviews = (
+            select(Review.id)
+            .where(Review.shop_id == Shop.id)
+            .exists()
+            .label("has_reviews")
+        )
+        has_posts = (
+            select(Post.id).where(Post.shop_id == Shop.id).exists().label("has_posts")
+        )
 
-            # Check if shop has posts
-            post_count = await self.db.execute(
-                select(func.count(Post.id)).where(Post.shop_id == shop.id)
-            )
-            has_posts = (post_count.scalar() or 0) > 0
-
-            shop_summaries.append(
-                ShopSummary(
-                    id=shop.id,
-                    name=shop.name,
-                    type=shop.type,
-                    has_reviews=has_reviews,
-                    has_posts=has_posts,
-                )
+        result = await self.db.execute(
+            select(Shop.id, Shop.name, Shop.type, has_reviews, has_posts)
+            .where(Shop.user_id == user_id)
+            .order_by(Shop.created_at)
+        )
+
+        shop_summaries = [
+            ShopSummary(
+                id=row.id,
+                name=row.name,
+                type=row.type,
+                has_reviews=bool(row.has_reviews),
+                has_posts=bool(row.has_posts),
             )
+            for row in result.all()
+        ]
 
         return ShopsListResponse(shops=shop_summaries)
+
+
+class DashboardOverviewService:
+    """Service composing every dashboard section into a single payload"""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        shop_cache: ShopCache | None = None,
+    ):
+        self.session_factory = session_factory
+        self.shop_cache = shop_cache
+
+    async def _timed(
+        self,
+        section: str,
+        query: Callable[[DashboardService], Awaitable[T]],
+        timings: dict[str, float],
+    ) -> T:
+        """Run one section on its own pooled session and record its duration."""
+        start = perf_counter()
+        async with self.session_factory() as session:
+            result = await query(DashboardService(session, self.shop_cache))
+        timings[section] = (perf_counter() - start) * 1000
+        return result
+
+    async def get_overview(
+        self,
+        shop_id: UUID,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        period: str = "month",
+        pending_limit: int = 10,
+    ) -> tuple[DashboardOverviewResponse, dict[str, float]]:
+        """
+        Get stats, calendar, engagement, trends and pending reviews at once.
+
+        Sections run concurrently, each on a separate session, since one
+        AsyncSession cannot run queries in parallel. The calendar defaults to
+        the current month. Returns the payload and per-section durations (ms).
+        Shop access must be verified by the caller.
+        """
+        logger.info("Fetching dashboard overview", extra={"shop_id": str(shop_id)})
+        today = datetime.now(UTC).date()
+        if start_date is None:
+            start_date = today.replace(day=1)
+        if end_date is None:
+            last_day = calendar.monthrange(start_date.year, start_date.month)[1]
+            end_date = start_date.replace(day=last_day)
+
+        timings: dict[str, float] = {}
+        stats, posting_calendar, engagement, trends, pending = await asyncio.gather(
+            self._timed("stats", lambda s: s.get_review_stats(shop_id), timings),
+            self._timed(
+                "calendar",
+                lambda s: s.get_posting_calendar(shop_id, start_date, end_date),
+                timings,
+            ),
+            self._timed(
+                "engagement", lambda s: s.get_engagement_metrics(shop_id), timings
+            ),
+            self._timed("trends", lambda s: s.get_trend_data(shop_id, period), timings),
+            self._timed(
+                "pending_reviews",
+                lambda s: s.get_pending_reviews(shop_id, pending_limit),
+                timings,
+            ),
+        )
+
+        overview = DashboardOverviewResponse(
+            stats=stats,
+            calendar=posting_calendar,
+            engagement=engagement,
+            trends=trends,
+            pending_reviews=pending,
+        )
+        return overview, timings
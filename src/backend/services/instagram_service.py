@@ -12,6 +12,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.settings import get_settings
+from infrastructure.external.http_clients import get_graph_http_client
 from models.shop import Shop
 from models.social_account import SocialAccount
 
@@ -41,18 +42,16 @@ class InstagramService:
     3. 미디어 컨테이너 생성 (이미지 URL + 캡션)
     4. 컨테이너 발행
 
+    HTTP 클라이언트는 프로세스 공용 클라이언트를 주입받아 사용하며 닫지 않습니다.
+
     참고: https://developers.facebook.com/docs/instagram-api/guides/content-publishing
     """
 
     BASE_URL = "https://graph.facebook.com/v21.0"
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, client: httpx.AsyncClient | None = None):
         self.db = db
-        self.client = httpx.AsyncClient(timeout=30.0)
-
-    async def close(self) -> None:
-        """HTTP 클라이언트 종료"""
-        await self.client.aclose()
+        self.client = client or get_graph_http_client()
 
     # ============== OAuth 관련 ==============
 
@@ -7,12 +7,12 @@ import secrets
 from typing import Literal
 from urllib.parse import urlencode
 
-import httpx
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.settings import get_settings
 from core.security import create_tokens
+from infrastructure.external.http_clients import HTTPClientRegistry, get_http_clients
 from models.social_account import SocialAccount
 from models.user import User
 from schemas.auth import AuthResponse, UserResponse
@@ -34,10 +34,16 @@ class OAuthException(Exception):
 
 
 class OAuthService:
-    """OAuth 서비스"""
+    """OAuth 서비스
 
-    def __init__(self, db: AsyncSession):
+    Google/Kakao 요청은 프로바이더별 공용 HTTP 클라이언트로 보냅니다.
+    """
+
+    def __init__(
+        self, db: AsyncSession, http_clients: HTTPClientRegistry | None = None
+    ):
         self.db = db
+        self.http_clients = http_clients or get_http_clients()
 
     def get_oauth_url(self, provider: OAuthProvider, redirect_uri: str) -> str:
         """OAuth 인증 URL을 생성합니다."""
@@ -78,82 +84,82 @@ class OAuthService:
     ) -> dict[str, str]:
         """Google에서 사용자 정보를 가져옵니다."""
         # 토큰 교환
-        async with httpx.AsyncClient() as client:
-            token_response = await client.post(
-                "https://oauth2.googleapis.com/token",
-                data={
-                    "code": code,
-                    "client_id": settings.google_client_id,
-                    "client_secret": settings.google_client_secret,
-                    "redirect_uri": redirect_uri,
-                    "grant_type": "authorization_code",
-                },
-            )
-
-            if token_response.status_code != 200:
-                raise OAuthException("Google 인증 코드가 유효하지 않습니다.", 400)
-
-            token_data = token_response.json()
-            access_token = token_data.get("access_token")
-
-            # 사용자 정보 조회
-            user_response = await client.get(
-                "https://www.googleapis.com/oauth2/v2/userinfo",
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-
-            if user_response.status_code != 200:
-                raise OAuthException("Google 사용자 정보를 가져올 수 없습니다.", 400)
-
-            user_data = user_response.json()
-            return {
-                "id": user_data["id"],
-                "email": user_data["email"],
-                "name": user_data.get("name", user_data["email"].split("@")[0]),
-                "picture": user_data.get("picture"),
-            }
+        client = self.http_clients.get("google")
+        token_response = await client.post(
+            "https://oauth2.googleapis.com/token",
+            data={
+                "code": code,
+                "client_id": settings.google_client_id,
+                "client_secret": settings.google_client_secret,
+                "redirect_uri": redirect_uri,
+                "grant_type": "authorization_code",
+            },
+        )
+
+        if token_response.status_code != 200:
+            raise OAuthException("Google 인증 코드가 유효하지 않습니다.", 400)
+
+        token_data = token_response.json()
+        access_token = token_data.get("access_token")
+
+        # 사용자 정보 조회
+        user_response = await client.get(
+            "https://www.googleapis.com/oauth2/v2/userinfo",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+
+        if user_response.status_code != 200:
+            raise OAuthException("Google 사용자 정보를 가져올 수 없습니다.", 400)
+
+        user_data = user_response.json()
+        return {
+            "id": user_data["id"],
+            "email": user_data["email"],
+            "name": user_data.get("name", user_data["email"].split("@")[0]),
+            "picture": user_data.get("picture"),
+        }
 
     async def get_kakao_user_info(self, code: str, redirect_uri: str) -> dict[str, str]:
         """Kakao에서 사용자 정보를 가져옵니다."""
-        async with httpx.AsyncClient() as client:
-            # 토큰 교환
-            token_response = await client.post(
-                "https://kauth.kakao.com/oauth/token",
-                data={
-                    "grant_type": "authorization_code",
-                    "client_id": settings.kakao_client_id,
-                    "client_secret": settings.kakao_client_secret,
-                    "redirect_uri": redirect_uri,
-                    "code": code,
-                },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-
-            if token_response.status_code != 200:
-                raise OAuthException("Kakao 인증 코드가 유효하지 않습니다.", 400)
-
-            token_data = token_response.json()
-            access_token = token_data.get("access_token")
-
-            # 사용자 정보 조회
-            user_response = await client.get(
-                "https://kapi.kakao.com/v2/user/me",
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-
-            if user_response.status_code != 200:
-                raise OAuthException("Kakao 사용자 정보를 가져올 수 없습니다.", 400)
-
-            user_data = user_response.json()
-            kakao_account = user_data.get("kakao_account", {})
-            profile = kakao_account.get("profile", {})
-
-            return {
-                "id": str(user_data["id"]),
-                "email": kakao_account.get("email", f"{user_data['id']}@kakao.user"),
-                "name": profile.get("nickname", f"User{user_data['id']}"),
-                "picture": profile.get("profile_image_url"),
-            }
+        client = self.http_clients.get("kakao")
+        # 토큰 교환
+        token_response = await client.post(
+            "https://kauth.kakao.com/oauth/token",
+            data={
+                "grant_type": "authorization_code",
+                "client_id": settings.kakao_client_id,
+                "client_secret": settings.kakao_client_secret,
+                "redirect_uri": redirect_uri,
+                "code": code,
+            },
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+
+        if token_response.status_code != 200:
+            raise OAuthException("Kakao 인증 코드가 유효하지 않습니다.", 400)
+
+        token_data = token_response.json()
+        access_token = token_data.get("access_token")
+
+        # 사용자 정보 조회
+        user_response = await client.get(
+            "https://kapi.kakao.com/v2/user/me",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+
+        if user_response.status_code != 200:
+            raise OAuthException("Kakao 사용자 정보를 가져올 수 없습니다.", 400)
+
+        user_data = user_response.json()
+        kakao_account = user_data.get("kakao_account", {})
+        profile = kakao_account.get("profile", {})
+
+        return {
+            "id": str(user_data["id"]),
+            "email": kakao_account.get("email", f"{user_data['id']}@kakao.user"),
+            "name": profile.get("nickname", f"User{user_data['id']}"),
+            "picture": profile.get("profile_image_url"),
+        }
 
     async def handle_oauth_callback(
         self, provider: OAuthProvider, user_info: dict[str, str]
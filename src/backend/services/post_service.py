@@ -7,9 +7,11 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
+import httpx
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from infrastructure.cache.shop_cache import ShopCache, bump_shop_version
 from models.post import Post
 from models.shop import Shop
 from models.user import User
@@ -29,8 +31,15 @@ class PostException(Exception):
 class PostService:
     """포스트 서비스"""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        shop_cache: ShopCache | None = None,
+        graph_client: httpx.AsyncClient | None = None,
+    ):
         self.db = db
+        self.shop_cache = shop_cache
+        self.graph_client = graph_client
 
     async def _get_user_shop(self, user: User, shop_id: UUID) -> Shop | None:
         """사용자의 매장을 조회합니다."""
@@ -60,6 +69,7 @@ class PostService:
 
         self.db.add(post)
         await self.db.commit()
+        await bump_shop_version(self.shop_cache, shop_id)
         await self.db.refresh(post)
         return post
 
@@ -128,6 +138,7 @@ class PostService:
             post.status = "scheduled"
 
         await self.db.commit()
+        await bump_shop_version(self.shop_cache, shop_id)
         await self.db.refresh(post)
         return post
 
@@ -142,6 +153,7 @@ class PostService:
 
         await self.db.delete(post)
         await self.db.commit()
+        await bump_shop_version(self.shop_cache, shop_id)
 
     async def publish_post(self, user: User, shop_id: UUID, post_id: UUID) -> Post:
         """포스트를 Instagram에 즉시 발행합니다.
@@ -162,7 +174,7 @@ class PostService:
             )
 
         # Instagram 서비스 초기화
-        instagram_service = InstagramService(self.db)
+        instagram_service = InstagramService(self.db, self.graph_client)
 
         try:
             # Shop에 연결된 Instagram 계정 조회
@@ -196,6 +208,7 @@ class PostService:
             post.instagram_post_id = instagram_post_id
 
             await self.db.commit()
+            await bump_shop_version(self.shop_cache, shop_id)
             await self.db.refresh(post)
 
             return post
@@ -204,15 +217,13 @@ class PostService:
             # Instagram API 오류 시 상태를 failed로 변경
             post.status = "failed"
             await self.db.commit()
+            await bump_shop_version(self.shop_cache, shop_id)
 
             raise PostException(
                 f"Instagram 발행 실패: {e.message}",
                 status_code=e.status_code,
             ) from e
 
-        finally:
-            await instagram_service.close()
-
     async def get_post_stats(self, user: User, shop_id: UUID) -> dict[str, Any]:
         """포스트 통계를 조회합니다."""
         shop = await self._get_user_shop(user, shop_id)
@@ -257,5 +268,6 @@ class PostService:
 
         self.db.add(new_post)
         await self.db.commit()
+        await bump_shop_version(self.shop_cache, shop_id)
         await self.db.refresh(new_post)
         return new_post
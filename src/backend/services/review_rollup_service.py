@@ -0,0 +1,608 @@
+"""
+리뷰 집계 서비스
+shop_review_rollups / review_daily_stats / review_keyword_counts 테이블의
+증분 갱신 및 재구축 로직
+
+리뷰가 flush될 때마다 변경 전/후 스냅샷의 차이를 같은 트랜잭션 안에서
+집계 테이블에 반영합니다. 서비스 계층, 테스트 fixture, 관리 스크립트 등
+어떤 경로로 리뷰가 변경되더라도 집계가 어긋나지 않도록 Session 이벤트에
+연결되어 있습니다.
+"""
+
+import logging
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import UTC, date, datetime
+from typing import Any, NamedTuple, cast
+from uuid import UUID
+
+from sqlalchemy import Table, case, delete, event, func, insert, inspect, select
+from sqlalchemy.engine import Connection, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, UOWTransaction
+
+from core.keyword_engine import get_keyword_engine
+from infrastructure.cache.shop_cache import ShopCache, bump_shop_version
+from infrastructure.repositories.upsert import dialect_insert
+from models.review import Review
+from models.review_daily_stat import ReviewDailyStat
+from models.review_keyword_count import ReviewKeywordCount
+from models.review_rollup import RATING_COLUMNS, ShopReviewRollup
+from models.shop import Shop
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_COUNTERS = (
+    "review_count",
+    "pending_count",
+    "replied_count",
+    "ignored_count",
+    "rating_sum",
+    *RATING_COLUMNS,
+)
+
+DAILY_COUNTERS = (
+    "review_count",
+    "replied_count",
+    "rating_sum",
+    *RATING_COLUMNS,
+)
+
+KEYWORD_COUNTERS = ("count",)
+
+# 키워드 재구축 시 한 번에 가져올 리뷰 본문 수
+KEYWORD_REBUILD_CHUNK_SIZE = 500
+
+STATUS_COUNTERS = {
+    "pending": "pending_count",
+    "replied": "replied_count",
+    "ignored": "ignored_count",
+}
+
+# 집계에 영향을 주는 리뷰 필드
+SNAPSHOT_FIELDS = (
+    "shop_id",
+    "google_review_id",
+    "rating",
+    "status",
+    "review_date",
+    "content",
+)
+
+ReviewChange = tuple[int, "ReviewSnapshot"]
+
+
+def review_platform(google_review_id: str | None) -> str:
+    """리뷰 플랫폼을 판별합니다.
+
+    google_review_id가 있으면 Google, 없으면 Naver 리뷰로 간주합니다.
+    """
+    return "google" if google_review_id else "naver"
+
+
+def platform_expression() -> Any:
+    """review_platform()과 동일한 판별을 수행하는 SQL 표현식"""
+    return case((Review.google_review_id.isnot(None), "google"), else_="naver")
+
+
+def review_day(review_date: datetime) -> date:
+    """리뷰가 집계되는 UTC 기준 일자를 반환합니다.
+
+    SQLite는 timezone 정보 없이 UTC 값을 돌려주므로 naive 값은 UTC로 간주합니다.
+    """
+    if review_date.tzinfo is not None:
+        review_date = review_date.astimezone(UTC)
+    return review_date.date()
+
+
+class ReviewSnapshot(NamedTuple):
+    """집계에 반영되는 리뷰 필드 스냅샷"""
+
+    shop_id: UUID
+    platform: str
+    rating: int
+    status: str
+    day: date
+    content: str | None
+
+
+def snapshot_review(review: Review) -> ReviewSnapshot:
+    """리뷰의 현재 값으로 스냅샷을 만듭니다."""
+    return ReviewSnapshot(
+        shop_id=review.shop_id,
+        platform=review_platform(review.google_review_id),
+        rating=review.rating,
+        status=review.status or "pending",
+        day=review_day(review.review_date),
+        content=review.content,
+    )
+
+
+def snapshot_values(values: Mapping[str, Any]) -> ReviewSnapshot:
+    """SNAPSHOT_FIELDS 값으로 스냅샷을 만듭니다 (Core 일괄 처리 경로용)."""
+    return ReviewSnapshot(
+        shop_id=values["shop_id"],
+        platform=review_platform(values["google_review_id"]),
+        rating=values["rating"],
+        status=values["status"] or "pending",
+        day=review_day(values["review_date"]),
+        content=values["content"],
+    )
+
+
+def committed_snapshot(review: Review) -> ReviewSnapshot | None:
+    """flush 이전(DB에 반영된) 값으로 스냅샷을 만듭니다.
+
+    변경 전 값이 로드되지 않은 속성이 있으면 None을 반환합니다.
+    """
+    state = inspect(review)
+    values: dict[str, Any] = {}
+    for field in SNAPSHOT_FIELDS:
+        history = state.attrs[field].history
+        if history.deleted:
+            values[field] = history.deleted[0]
+        elif history.unchanged:
+            values[field] = history.unchanged[0]
+        elif history.added or field in state.expired_attributes:
+            return None
+        else:
+            # 한 번도 설정되지 않은 속성은 NULL로 저장되어 있음
+            values[field] = None
+
+    return snapshot_values(values)
+
+
+def _count_review(delta: Counter[str], sign: int, snapshot: ReviewSnapshot) -> None:
+    """스냅샷 하나를 카운터 증감에 반영합니다."""
+    delta["review_count"] += sign
+    delta["rating_sum"] += sign * snapshot.rating
+    if 1 <= snapshot.rating <= len(RATING_COLUMNS):
+        delta[RATING_COLUMNS[snapshot.rating - 1]] += sign
+    status_counter = STATUS_COUNTERS.get(snapshot.status)
+    if status_counter:
+        delta[status_counter] += sign
+
+
+def _nonzero(
+    deltas: dict[Any, Counter[str]], counters: Sequence[str]
+) -> dict[Any, Counter[str]]:
+    return {
+        key: delta
+        for key, delta in deltas.items()
+        if any(delta[counter] for counter in counters)
+    }
+
+
+def rollup_deltas(
+    changes: Iterable[ReviewChange],
+) -> dict[tuple[UUID, str], Counter[str]]:
+    """리뷰 변경 목록을 (매장, 플랫폼)별 카운터 증감으로 변환합니다."""
+    deltas: dict[tuple[UUID, str], Counter[str]] = {}
+    for sign, snapshot in changes:
+        key = (snapshot.shop_id, snapshot.platform)
+        _count_review(deltas.setdefault(key, Counter()), sign, snapshot)
+    return _nonzero(deltas, ROLLUP_COUNTERS)
+
+
+def daily_deltas(
+    changes: Iterable[ReviewChange],
+) -> dict[tuple[UUID, date, str], Counter[str]]:
+    """리뷰 변경 목록을 (매장, 일자, 플랫폼)별 카운터 증감으로 변환합니다."""
+    deltas: dict[tuple[UUID, date, str], Counter[str]] = {}
+    for sign, snapshot in changes:
+        key = (snapshot.shop_id, snapshot.day, snapshot.platform)
+        _count_review(deltas.setdefault(key, Counter()), sign, snapshot)
+    return _nonzero(deltas, DAILY_COUNTERS)
+
+
+def keyword_deltas(
+    changes: Iterable[ReviewChange], shop_types: dict[UUID, str]
+) -> dict[tuple[UUID, date, str], Counter[str]]:
+    """리뷰 변경 목록을 (매장, 일자, 키워드)별 출현 횟수 증감으로 변환합니다.
+
+    본문은 매장 유형별 키워드 사전으로 분석하며, 수정 전/후 본문이 같으면
+    한 번만 분석합니다.
+    """
+    deltas: dict[tuple[UUID, date, str], Counter[str]] = {}
+    analyzed: dict[tuple[str | None, str], Counter[str]] = {}
+    for sign, snapshot in changes:
+        if not snapshot.content:
+            continue
+        shop_type = shop_types.get(snapshot.shop_id)
+        counts = analyzed.get((shop_type, snapshot.content))
+        if counts is None:
+            counts = get_keyword_engine(shop_type).count(snapshot.content)
+            analyzed[(shop_type, snapshot.content)] = counts
+        for keyword, count in counts.items():
+            key = (snapshot.shop_id, snapshot.day, keyword)
+            deltas.setdefault(key, Counter())["count"] += sign * count
+    return _nonzero(deltas, KEYWORD_COUNTERS)
+
+
+def _shop_types(connection: Connection, shop_ids: set[UUID]) -> dict[UUID, str]:
+    if not shop_ids:
+        return {}
+    result = connection.execute(select(Shop.id, Shop.type).where(Shop.id.in_(shop_ids)))
+    return {row.id: row.type for row in result}
+
+
+def _upsert_deltas(
+    connection: Connection,
+    table: Table,
+    key_columns: Sequence[str],
+    deltas: dict[Any, Counter[str]],
+    counters: Sequence[str],
+) -> None:
+    """키별 카운터 증감을 INSERT ... ON CONFLICT DO UPDATE로 반영합니다."""
+    for key, delta in deltas.items():
+        stmt = dialect_insert(connection.dialect, table).values(
+            **dict(zip(key_columns, key, strict=True)),
+            **{counter: delta[counter] for counter in counters},
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c[column] for column in key_columns],
+            set_={
+                **{
+                    counter: table.c[counter] + stmt.excluded[counter]
+                    for counter in counters
+                },
+                "updated_at": func.now(),
+            },
+        )
+        connection.execute(stmt)
+
+
+def apply_review_changes(connection: Connection, changes: list[ReviewChange]) -> None:
+    """리뷰 변경분을 집계 테이블에 증분 반영합니다.
+
+    키별로 INSERT ... ON CONFLICT DO UPDATE 한 번씩 실행하므로
+    동시에 실행되는 트랜잭션 사이에서도 증감이 유실되지 않습니다.
+    """
+    _upsert_deltas(
+        connection,
+        cast(Table, ShopReviewRollup.__table__),
+        ("shop_id", "platform"),
+        rollup_deltas(changes),
+        ROLLUP_COUNTERS,
+    )
+    _upsert_deltas(
+        connection,
+        cast(Table, ReviewDailyStat.__table__),
+        ("shop_id", "day", "platform"),
+        daily_deltas(changes),
+        DAILY_COUNTERS,
+    )
+    shop_types = _shop_types(
+        connection, {snapshot.shop_id for _, snapshot in changes if snapshot.content}
+    )
+    _upsert_deltas(
+        connection,
+        cast(Table, ReviewKeywordCount.__table__),
+        ("shop_id", "day", "keyword"),
+        keyword_deltas(changes, shop_types),
+        KEYWORD_COUNTERS,
+    )
+
+
+def _rating_count_columns() -> list[Any]:
+    return [
+        func.sum(case((Review.rating == rating, 1), else_=0))
+        for rating in range(1, len(RATING_COLUMNS) + 1)
+    ]
+
+
+def rebuild_rollups(connection: Connection, shop_id: UUID | None = None) -> None:
+    """원본 리뷰로부터 매장별 집계 테이블을 다시 계산합니다.
+
+    shop_id가 없으면 전체 매장을 재구축합니다.
+    """
+    table = cast(Table, ShopReviewRollup.__table__)
+    platform = platform_expression().label("platform")
+
+    source = select(
+        Review.shop_id,
+        platform,
+        func.count(Review.id),
+        *[
+            func.sum(case((Review.status == status, 1), else_=0))
+            for status in STATUS_COUNTERS
+        ],
+        func.sum(Review.rating),
+        *_rating_count_columns(),
+    ).group_by(Review.shop_id, platform)
+
+    clear = delete(table)
+    if shop_id is not None:
+        source = source.where(Review.shop_id == shop_id)
+        clear = clear.where(table.c.shop_id == shop_id)
+
+    connection.execute(clear)
+    connection.execute(
+        insert(table).from_select(
+            [
+                "shop_id",
+                "platform",
+                "review_count",
+                *STATUS_COUNTERS.values(),
+                "rating_sum",
+                *RATING_COLUMNS,
+            ],
+            source,
+        )
+    )
+
+
+def rebuild_daily_stats(connection: Connection, shop_id: UUID | None = None) -> None:
+    """원본 리뷰로부터 일별 통계 테이블을 다시 계산합니다.
+
+    shop_id가 없으면 전체 매장을 재구축합니다.
+    """
+    table = cast(Table, ReviewDailyStat.__table__)
+    review_date: Any = Review.review_date
+    if connection.dialect.name == "postgresql":
+        # 세션 timezone과 무관하게 review_day()와 같은 UTC 일자로 묶음
+        review_date = func.timezone("UTC", review_date)
+    day = func.date(review_date).label("day")
+    platform = platform_expression().label("platform")
+
+    source = select(
+        Review.shop_id,
+        day,
+        platform,
+        func.count(Review.id),
+        func.sum(case((Review.status == "replied", 1), else_=0)),
+        func.sum(Review.rating),
+        *_rating_count_columns(),
+    ).group_by(Review.shop_id, day, platform)
+
+    clear = delete(table)
+    if shop_id is not None:
+        source = source.where(Review.shop_id == shop_id)
+        clear = clear.where(table.c.shop_id == shop_id)
+
+    connection.execute(clear)
+    connection.execute(
+        insert(table).from_select(
+            [
+                "shop_id",
+                "day",
+                "platform",
+                "review_count",
+                "replied_count",
+                "rating_sum",
+                *RATING_COLUMNS,
+            ],
+            source,
+        )
+    )
+
+
+def _insert_keyword_counts(
+    connection: Connection, table: Table, counts: Counter[tuple[UUID, date, str]]
+) -> None:
+    if counts:
+        connection.execute(
+            insert(table),
+            [
+                {"shop_id": shop_id, "day": day, "keyword": keyword, "count": count}
+                for (shop_id, day, keyword), count in counts.items()
+            ],
+        )
+
+
+def rebuild_keyword_counts(connection: Connection, shop_id: UUID | None = None) -> None:
+    """원본 리뷰 본문으로부터 키워드 집계 테이블을 다시 계산합니다.
+
+    키워드 사전이 바뀌었을 때 실행합니다. 본문은 청크 단위로 스트리밍하고
+    매장 단위로 집계를 기록하므로 메모리에는 한 매장의 집계만 유지됩니다.
+    shop_id가 없으면 전체 매장을 재구축합니다.
+    """
+    table = cast(Table, ReviewKeywordCount.__table__)
+
+    source = (
+        select(Review.shop_id, Shop.type, Review.review_date, Review.content)
+        .join(Shop, Shop.id == Review.shop_id)
+        .where(Review.content.isnot(None))
+        .order_by(Review.shop_id)
+        .execution_options(yield_per=KEYWORD_REBUILD_CHUNK_SIZE)
+    )
+    clear = delete(table)
+    if shop_id is not None:
+        source = source.where(Review.shop_id == shop_id)
+        clear = clear.where(table.c.shop_id == shop_id)
+
+    connection.execute(clear)
+    counts: Counter[tuple[UUID, date, str]] = Counter()
+    current_shop: UUID | None = None
+    for row_shop_id, shop_type, review_date, content in connection.execute(source):
+        if row_shop_id != current_shop:
+            _insert_keyword_counts(connection, table, counts)
+            counts.clear()
+            current_shop = row_shop_id
+        if not content:
+            continue
+        day = review_day(review_date)
+        for keyword, count in get_keyword_engine(shop_type).count(content).items():
+            counts[(row_shop_id, day, keyword)] += count
+    _insert_keyword_counts(connection, table, counts)
+
+
+def rebuild_review_aggregates(
+    connection: Connection, shop_id: UUID | None = None
+) -> None:
+    """매장별 집계, 일별 통계, 키워드 집계를 모두 재구축합니다."""
+    rebuild_rollups(connection, shop_id)
+    rebuild_daily_stats(connection, shop_id)
+    rebuild_keyword_counts(connection, shop_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_review_rollups(session: Session, flush_context: UOWTransaction) -> None:
+    """flush된 리뷰 변경분을 같은 트랜잭션에서 집계 테이블에 반영합니다.
+
+    after_flush 시점에도 session.new/dirty/deleted와 속성 history는
+    flush 이전 상태를 유지하므로 변경 전/후 값을 모두 알 수 있습니다.
+    """
+    deleted_shops = {obj.id for obj in session.deleted if isinstance(obj, Shop)}
+    changes: list[ReviewChange] = []
+    resync_shops: set[UUID] = set()
+    # 매장 유형이 바뀌면 키워드 사전이 달라지므로 키워드 집계만 재구축
+    retyped_shops = {
+        obj.id
+        for obj in session.dirty
+        if isinstance(obj, Shop) and inspect(obj).attrs.type.history.has_changes()
+    }
+
+    for obj in session.new:
+        if isinstance(obj, Review):
+            changes.append((1, snapshot_review(obj)))
+
+    for obj in session.deleted:
+        if isinstance(obj, Review):
+            old = committed_snapshot(obj)
+            if old is None:
+                resync_shops.add(obj.shop_id)
+            else:
+                changes.append((-1, old))
+
+    for obj in session.dirty:
+        if isinstance(obj, Review) and session.is_modified(obj):
+            old = committed_snapshot(obj)
+            new = snapshot_review(obj)
+            if old is None:
+                resync_shops.add(new.shop_id)
+            elif old != new:
+                changes.extend([(-1, old), (1, new)])
+
+    # 삭제되는 매장의 집계는 FK CASCADE로 함께 삭제됨
+    resync_shops -= deleted_shops
+    changes = [
+        (sign, snapshot)
+        for sign, snapshot in changes
+        if snapshot.shop_id not in deleted_shops
+        and snapshot.shop_id not in resync_shops
+    ]
+    retyped_shops -= resync_shops
+    if not changes and not resync_shops and not retyped_shops:
+        return
+
+    connection = session.connection()
+    apply_review_changes(connection, changes)
+    for shop_id in resync_shops:
+        logger.info(
+            "Rebuilding review rollup from source rows",
+            extra={"shop_id": str(shop_id)},
+        )
+        rebuild_review_aggregates(connection, shop_id)
+    for shop_id in retyped_shops:
+        logger.info(
+            "Rebuilding review keyword counts after shop type change",
+            extra={"shop_id": str(shop_id)},
+        )
+        rebuild_keyword_counts(connection, shop_id)
+
+
+class ReviewRollupService:
+    """리뷰 집계 조회 및 재구축 서비스"""
+
+    def __init__(self, db: AsyncSession, shop_cache: ShopCache | None = None):
+        self.db = db
+        self.shop_cache = shop_cache
+
+    async def get_shop_rollups(self, shop_id: UUID) -> list[ShopReviewRollup]:
+        """매장의 플랫폼별 집계를 조회합니다."""
+        result = await self.db.execute(
+            select(ShopReviewRollup)
+            .where(ShopReviewRollup.shop_id == shop_id)
+            .order_by(ShopReviewRollup.platform)
+            # 집계는 Core UPDATE로 갱신되므로 identity map 값을 덮어씀
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    async def count_reviews(self, shop_id: UUID, status: str | None = None) -> int:
+        """매장의 리뷰 수를 집계 테이블에서 조회합니다 (상태 필터 선택)."""
+        counter = "review_count" if status is None else STATUS_COUNTERS.get(status)
+        if counter is None:
+            return 0
+        result = await self.db.execute(
+            select(func.sum(getattr(ShopReviewRollup, counter))).where(
+                ShopReviewRollup.shop_id == shop_id
+            )
+        )
+        return int(result.scalar() or 0)
+
+    async def get_daily_stats(
+        self, shop_id: UUID, start_day: date, end_day: date
+    ) -> Sequence[Row[date, int, int, int]]:
+        """기간 내 일별 통계를 플랫폼 합산하여 일자순으로 조회합니다.
+
+        각 행은 day, review_count, rating_sum, replied_count를 가집니다.
+        """
+        result = await self.db.execute(
+            select(
+                ReviewDailyStat.day,
+                func.sum(ReviewDailyStat.review_count).label("review_count"),
+                func.sum(ReviewDailyStat.rating_sum).label("rating_sum"),
+                func.sum(ReviewDailyStat.replied_count).label("replied_count"),
+            )
+            .where(ReviewDailyStat.shop_id == shop_id)
+            .where(ReviewDailyStat.day >= start_day)
+            .where(ReviewDailyStat.day <= end_day)
+            .group_by(ReviewDailyStat.day)
+            .having(func.sum(ReviewDailyStat.review_count) > 0)
+            .order_by(ReviewDailyStat.day)
+        )
+        return result.all()
+
+    async def get_keyword_counts(
+        self, shop_id: UUID, start_day: date, end_day: date, limit: int = 10
+    ) -> list[tuple[str, int]]:
+        """기간 내 키워드별 출현 횟수를 많은 순으로 조회합니다."""
+        total = func.sum(ReviewKeywordCount.count).label("total")
+        result = await self.db.execute(
+            select(ReviewKeywordCount.keyword, total)
+            .where(ReviewKeywordCount.shop_id == shop_id)
+            .where(ReviewKeywordCount.day >= start_day)
+            .where(ReviewKeywordCount.day <= end_day)
+            .group_by(ReviewKeywordCount.keyword)
+            .having(total > 0)
+            .order_by(total.desc(), ReviewKeywordCount.keyword)
+            .limit(limit)
+        )
+        return [(keyword, int(count)) for keyword, count in result]
+
+    async def rebuild_keywords(self, shop_id: UUID | None = None) -> None:
+        """키워드 집계를 원본 리뷰로부터 재구축합니다 (키워드 사전 변경 시)."""
+        logger.info(
+            "Rebuilding review keyword counts",
+            extra={"shop_id": str(shop_id) if shop_id else "all"},
+        )
+        await self.db.run_sync(
+            lambda session: rebuild_keyword_counts(session.connection(), shop_id)
+        )
+        await self.db.commit()
+        await self._bump_shop_versions(shop_id)
+
+    async def rebuild(self, shop_id: UUID | None = None) -> None:
+        """집계 테이블, 일별 통계, 키워드 집계를 원본 리뷰로부터 재구축합니다."""
+        logger.info(
+            "Rebuilding review rollups",
+            extra={"shop_id": str(shop_id) if shop_id else "all"},
+        )
+        await self.db.run_sync(
+            lambda session: rebuild_review_aggregates(session.connection(), shop_id)
+        )
+        await self.db.commit()
+        await self._bump_shop_versions(shop_id)
+
+    async def _bump_shop_versions(self, shop_id: UUID | None) -> None:
+        """재구축한 매장(shop_id가 없으면 전체 매장)의 캐시와 ETag를 무효화합니다."""
+        if self.shop_cache is None:
+            return
+        if shop_id is not None:
+            shop_ids: Sequence[UUID] = [shop_id]
+        else:
+            shop_ids = (await self.db.execute(select(Shop.id))).scalars().all()
+        for target_id in shop_ids:
+            await bump_shop_version(self.shop_cache, target_id)
@@ -3,18 +3,91 @@
 리뷰 CRUD 및 통계 비즈니스 로직
 """
 
+import asyncio
+import base64
+import binascii
 from collections import Counter
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Sequence,
+)
+from contextlib import nullcontext
 from datetime import UTC, datetime, timedelta
-from typing import Any
-from uuid import UUID
-
-from sqlalchemy import Date, Integer, cast, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
-
+from typing import Any, TypeVar, cast
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+from sqlalchemy import (
+    ColumnElement,
+    Executable,
+    String,
+    Table,
+    case,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from infrastructure.cache.shop_cache import ShopCache, bump_shop_version
+from infrastructure.repositories.upsert import dialect_insert
 from models.review import Review
 from models.shop import Shop
 from models.user import User
-from schemas.review import ReviewCreate, ReviewUpdate
+from schemas.review import ReviewCreate, ReviewStatusFilter, ReviewUpdate
+from services.review_rollup_service import (
+    ReviewChange,
+    ReviewRollupService,
+    apply_review_changes,
+    review_day,
+    review_platform,
+    snapshot_values,
+)
+
+T = TypeVar("T")
+
+# 일괄 등록 시 한 번의 INSERT와 커밋으로 처리할 리뷰 수
+BULK_BATCH_SIZE = 500
+
+# 일괄 등록에서 기존 리뷰(google_review_id 충돌)를 갱신할 필드
+BULK_UPDATE_FIELDS = (
+    "reviewer_name",
+    "reviewer_profile_url",
+    "rating",
+    "content",
+    "review_date",
+)
+
+# 상태 일괄 변경의 filter 조건으로 한 번에 바꿀 수 있는 최대 리뷰 수
+# (reviewIds 최대 개수와 같음)
+BULK_STATUS_FILTER_LIMIT = 1000
+
+# pg_trgm이 trigram을 만들 수 있는 최소 검색어 길이
+TRIGRAM_MIN_QUERY_LENGTH = 3
+
+# 내보내기 시 서버 사이드 커서에서 한 번에 가져올 행 수
+EXPORT_CHUNK_SIZE = 1000
+
+# 내보내기 컬럼 (키, 헤더)
+EXPORT_COLUMNS = (
+    ("id", "ID"),
+    ("reviewer_name", "작성자"),
+    ("rating", "평점"),
+    ("content", "내용"),
+    ("review_date", "작성일"),
+    ("status", "상태"),
+    ("platform", "플랫폼"),
+    ("response", "응답"),
+    ("responded_at", "응답일"),
+)
 
 
 class ReviewException(Exception):
@@ -26,11 +99,306 @@ class ReviewException(Exception):
         super().__init__(self.message)
 
 
+def _encode_cursor(*parts: object) -> str:
+    raw = "|".join(str(part) for part in parts)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, size: int) -> list[str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parts = base64.urlsafe_b64decode(padded.encode()).decode().split("|")
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ReviewException("잘못된 커서입니다.", status_code=400) from e
+    if len(parts) != size:
+        raise ReviewException("잘못된 커서입니다.", status_code=400)
+    return parts
+
+
+def encode_review_cursor(review: Review) -> str:
+    """리뷰의 정렬 키 (review_date, id)를 불투명한 커서 문자열로 인코딩합니다."""
+    return _encode_cursor(review.review_date.isoformat(), review.id)
+
+
+def decode_review_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """커서 문자열을 (review_date, id)로 디코딩합니다."""
+    review_date, review_id = _decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(review_date), UUID(review_id)
+    except ValueError as e:
+        raise ReviewException("잘못된 커서입니다.", status_code=400) from e
+
+
+def encode_search_cursor(rank: float, review: Review) -> str:
+    """검색 결과의 정렬 키 (rank, review_date, id)를 커서로 인코딩합니다."""
+    return _encode_cursor(repr(rank), review.review_date.isoformat(), review.id)
+
+
+def decode_search_cursor(cursor: str) -> tuple[float, datetime, UUID]:
+    """검색 커서를 (rank, review_date, id)로 디코딩합니다."""
+    rank, review_date, review_id = _decode_cursor(cursor, 3)
+    try:
+        return float(rank), datetime.fromisoformat(review_date), UUID(review_id)
+    except ValueError as e:
+        raise ReviewException("잘못된 커서입니다.", status_code=400) from e
+
+
+def uses_trigram_search(dialect_name: str, query: str) -> bool:
+    """trigram 인덱스와 유사도 연산자를 쓸 수 있는 검색어인지 확인합니다.
+
+    pg_trgm은 3글자 미만 검색어("친절" 등 두 글자 한국어 단어)에서 trigram을
+    만들지 못해 인덱스 전체를 훑게 되고 유사도도 의미가 없습니다.
+    """
+    return dialect_name == "postgresql" and len(query) >= TRIGRAM_MIN_QUERY_LENGTH
+
+
+def review_search_filter(dialect_name: str, query: str) -> ColumnElement[bool]:
+    """검색어와 일치하는 리뷰 조건을 반환합니다.
+
+    본문 또는 작성자 이름에 검색어가 포함되면 일치합니다. PostgreSQL에서
+    3글자 이상 검색어는 pg_trgm의 word_similarity 연산자(<%)로 오타가 섞인
+    검색어도 찾으며, 매장별 trigram GIN 인덱스로 처리됩니다. 더 짧은 검색어는
+    포함 여부만 확인하며 매장 리뷰를 shop_id 인덱스로 읽어 거릅니다.
+    """
+    condition = or_(
+        Review.content.icontains(query, autoescape=True),
+        Review.reviewer_name.icontains(query, autoescape=True),
+    )
+    if uses_trigram_search(dialect_name, query):
+        term = literal(query, String)
+        condition = or_(
+            condition,
+            term.op("<%", is_comparison=True)(Review.content),
+            term.op("<%", is_comparison=True)(Review.reviewer_name),
+        )
+    return condition
+
+
+def review_search_rank(dialect_name: str, query: str) -> ColumnElement[float]:
+    """검색 결과 정렬에 쓰는 관련도 점수 식을 반환합니다.
+
+    trigram 검색에서는 본문과 작성자 이름의 word_similarity 중 큰 값을,
+    그 외(짧은 검색어, SQLite 테스트 환경)에서는 검색어가 포함된 필드 수를
+    점수로 씁니다.
+    """
+    if uses_trigram_search(dialect_name, query):
+        return func.greatest(
+            func.word_similarity(query, func.coalesce(Review.content, "")),
+            func.word_similarity(query, Review.reviewer_name),
+        )
+    return cast(
+        ColumnElement[float],
+        case((Review.content.icontains(query, autoescape=True), 1.0), else_=0.0)
+        + case(
+            (Review.reviewer_name.icontains(query, autoescape=True), 1.0), else_=0.0
+        ),
+    )
+
+
+def _bulk_error(index: int, google_review_id: str | None, error: str) -> dict[str, Any]:
+    return {
+        "index": index,
+        "status": "error",
+        "id": None,
+        "google_review_id": google_review_id,
+        "error": error,
+    }
+
+
+def _lock_reviews_by_google_id(
+    connection: Connection, google_review_ids: list[str]
+) -> dict[str, Any]:
+    """google_review_id로 기존 리뷰를 잠그고 집계에 필요한 값을 읽습니다."""
+    rows = connection.execute(
+        select(
+            Review.id,
+            Review.shop_id,
+            Review.google_review_id,
+            Review.rating,
+            Review.status,
+            Review.review_date,
+            Review.content,
+        )
+        .where(Review.google_review_id.in_(google_review_ids))
+        .with_for_update()
+    )
+    return {row.google_review_id: row for row in rows}
+
+
+def upsert_review_batch(
+    connection: Connection, shop_id: UUID, batch: list[tuple[int, ReviewCreate]]
+) -> list[dict[str, Any]]:
+    """검증된 리뷰 묶음을 google_review_id 기준으로 등록하거나 갱신합니다.
+
+    기존 리뷰는 원본 필드만 갱신하고 상태와 답변은 유지합니다. 다른 매장에
+    등록된 google_review_id는 갱신하지 않으며, 같은 묶음에 중복된
+    google_review_id는 마지막 항목만 반영합니다. 집계 테이블은 묶음의
+    변경분을 모아 한 번에 갱신합니다. 항목별 결과를 반환합니다.
+
+    새 리뷰는 INSERT ... ON CONFLICT DO NOTHING RETURNING으로 넣어 실제로
+    삽입된 행만 생성으로 셉니다. 미리 조회한 뒤 다른 요청이 같은
+    google_review_id를 먼저 넣어 충돌한 항목은 그 행을 다시 읽어 갱신으로
+    처리하므로 집계가 두 번 더해지지 않습니다.
+    """
+    table = cast(Table, Review.__table__)
+    last_index = {
+        item.google_review_id: index for index, item in batch if item.google_review_id
+    }
+    existing = (
+        _lock_reviews_by_google_id(connection, list(last_index)) if last_index else {}
+    )
+
+    results: dict[int, dict[str, Any]] = {}
+    accepted: list[tuple[int, ReviewCreate]] = []
+    for index, item in batch:
+        google_review_id = item.google_review_id
+        if google_review_id and last_index[google_review_id] != index:
+            results[index] = _bulk_error(
+                index, google_review_id, "같은 요청에 중복된 google_review_id입니다."
+            )
+        else:
+            accepted.append((index, item))
+
+    def review_values(item: ReviewCreate, status: str) -> dict[str, Any]:
+        return {
+            "shop_id": shop_id,
+            "google_review_id": item.google_review_id,
+            "reviewer_name": item.reviewer_name,
+            "reviewer_profile_url": item.reviewer_profile_url,
+            "rating": item.rating,
+            "content": item.content,
+            "review_date": item.review_date,
+            "status": status,
+        }
+
+    inserts = {
+        index: {"id": uuid4(), **review_values(item, "pending")}
+        for index, item in accepted
+        if not item.google_review_id or item.google_review_id not in existing
+    }
+    inserted: set[UUID] = set()
+    if inserts:
+        stmt = (
+            dialect_insert(connection.dialect, table)
+            .on_conflict_do_nothing(index_elements=[table.c.google_review_id])
+            .returning(table.c.id)
+        )
+        inserted = set(connection.execute(stmt, list(inserts.values())).scalars())
+        raced = [
+            values["google_review_id"]
+            for values in inserts.values()
+            if values["id"] not in inserted
+        ]
+        if raced:
+            existing.update(_lock_reviews_by_google_id(connection, raced))
+
+    updates: list[dict[str, Any]] = []
+    changes: list[ReviewChange] = []
+    for index, item in accepted:
+        google_review_id = item.google_review_id
+        values = inserts.get(index)
+        if values is not None and values["id"] in inserted:
+            changes.append((1, snapshot_values(values)))
+            review_id = values["id"]
+        else:
+            # google_review_id가 없는 새 리뷰는 충돌 없이 항상 삽입됨
+            old = existing[cast(str, google_review_id)]
+            if old.shop_id != shop_id:
+                results[index] = _bulk_error(
+                    index, google_review_id, "다른 매장에 등록된 리뷰입니다."
+                )
+                continue
+            values = review_values(item, old.status)
+            review_id = old.id
+            updates.append({"id": review_id, **values})
+            previous = snapshot_values(old._mapping)
+            new = snapshot_values(values)
+            if previous != new:
+                changes.extend([(-1, previous), (1, new)])
+
+        results[index] = {
+            "index": index,
+            "status": "created" if review_id in inserted else "updated",
+            "id": review_id,
+            "google_review_id": google_review_id,
+            "error": None,
+        }
+
+    if updates:
+        stmt = dialect_insert(connection.dialect, table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.google_review_id],
+            set_={
+                **{field: stmt.excluded[field] for field in BULK_UPDATE_FIELDS},
+                "updated_at": func.now(),
+            },
+            where=table.c.shop_id == stmt.excluded.shop_id,
+        )
+        connection.execute(stmt, updates)
+    if changes:
+        apply_review_changes(connection, changes)
+    return [results[index] for index, _ in batch]
+
+
+def update_review_status(
+    session: Session,
+    shop_id: UUID,
+    status: str,
+    conditions: Sequence[ColumnElement[bool]],
+) -> list[tuple[UUID, str]]:
+    """조건에 맞는 매장 리뷰의 상태를 한 번의 UPDATE로 변경합니다.
+
+    대상 리뷰를 잠근 채 변경 전 상태를 읽고, 이미 같은 상태인 리뷰를 제외한
+    나머지만 갱신합니다. 세션에 로드된 리뷰 객체에도 변경 값을 반영하며,
+    집계 테이블은 변경분을 모아 한 번에 갱신합니다.
+    대상 리뷰의 (id, 변경 전 상태) 목록을 반환합니다.
+    """
+    where = (Review.shop_id == shop_id, *conditions)
+    rows = session.execute(
+        select(
+            Review.id,
+            Review.shop_id,
+            Review.google_review_id,
+            Review.rating,
+            Review.status,
+            Review.review_date,
+        )
+        .where(*where)
+        .with_for_update()
+    ).all()
+
+    changes: list[ReviewChange] = []
+    for row in rows:
+        if row.status == status:
+            continue
+        # 상태 변경은 키워드 집계에 영향이 없으므로 본문 분석을 생략
+        previous = snapshot_values({**row._mapping, "content": None})
+        changes.extend([(-1, previous), (1, previous._replace(status=status))])
+
+    if changes:
+        values: dict[str, Any] = {"status": status}
+        if status == "replied":
+            values["replied_at"] = datetime.now(UTC)
+        session.execute(
+            update(Review).where(*where, Review.status != status).values(**values),
+            execution_options={"synchronize_session": "evaluate"},
+        )
+        apply_review_changes(session.connection(), changes)
+    return [(row.id, row.status) for row in rows]
+
+
 class ReviewService:
     """리뷰 서비스"""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        shop_cache: ShopCache | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ):
         self.db = db
+        self.shop_cache = shop_cache
+        self.session_factory = session_factory
 
     async def _get_user_shop(self, user: User, shop_id: UUID) -> Shop | None:
         """사용자의 매장을 조회합니다."""
@@ -60,9 +428,62 @@ class ReviewService:
 
         self.db.add(review)
         await self.db.commit()
+        await bump_shop_version(self.shop_cache, shop_id)
         await self.db.refresh(review)
         return review
 
+    async def bulk_upsert_reviews(
+        self, user: User, shop_id: UUID, items: AsyncIterable[Any]
+    ) -> list[dict[str, Any]]:
+        """리뷰를 일괄 등록합니다 (google_review_id가 같으면 갱신).
+
+        항목을 하나씩 검증하여 BULK_BATCH_SIZE개씩 한 번의 upsert와 커밋으로
+        반영하므로 NDJSON 스트림도 전체를 메모리에 올리지 않고 처리합니다.
+        검증에 실패한 항목은 나머지 항목에 영향을 주지 않습니다.
+        """
+        shop = await self._get_user_shop(user, shop_id)
+        if not shop:
+            raise ReviewException("매장을 찾을 수 없습니다.", status_code=404)
+
+        results: list[dict[str, Any]] = []
+        batch: list[tuple[int, ReviewCreate]] = []
+        index = 0
+        async for raw in items:
+            try:
+                batch.append((index, ReviewCreate.model_validate(raw)))
+            except ValidationError as e:
+                error = e.errors()[0]
+                location = ".".join(str(part) for part in error["loc"])
+                google_review_id = (
+                    raw.get("googleReviewId") if isinstance(raw, dict) else None
+                )
+                results.append(
+                    _bulk_error(
+                        index,
+                        google_review_id if isinstance(google_review_id, str) else None,
+                        f"{location}: {error['msg']}" if location else error["msg"],
+                    )
+                )
+            index += 1
+            if len(batch) >= BULK_BATCH_SIZE:
+                results.extend(await self._upsert_batch(shop_id, batch))
+                batch = []
+        if batch:
+            results.extend(await self._upsert_batch(shop_id, batch))
+
+        if any(result["status"] != "error" for result in results):
+            await bump_shop_version(self.shop_cache, shop_id)
+        return sorted(results, key=lambda result: result["index"])
+
+    async def _upsert_batch(
+        self, shop_id: UUID, batch: list[tuple[int, ReviewCreate]]
+    ) -> list[dict[str, Any]]:
+        results = await self.db.run_sync(
+            lambda session: upsert_review_batch(session.connection(), shop_id, batch)
+        )
+        await self.db.commit()
+        return results
+
     async def get_reviews(
         self,
         user: User,
@@ -70,8 +491,16 @@ class ReviewService:
         status: str | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> tuple[list[Review], int]:
-        """매장의 리뷰 목록을 조회합니다."""
+        cursor: str | None = None,
+        include_total: bool = True,
+    ) -> tuple[list[Review], int | None, str | None]:
+        """매장의 리뷰 목록을 (review_date, id) 내림차순으로 조회합니다.
+
+        cursor가 주어지면 해당 리뷰 이후부터 키셋 방식으로 조회하므로
+        페이지 깊이와 관계없이 같은 비용이 듭니다 (offset은 무시됨).
+        총 개수는 include_total일 때만 집계 테이블에서 조회하며,
+        반환값의 마지막 요소는 다음 페이지 커서입니다 (마지막 페이지면 None).
+        """
         shop = await self._get_user_shop(user, shop_id)
         if not shop:
             raise ReviewException("매장을 찾을 수 없습니다.", status_code=404)
@@ -81,17 +510,73 @@ class ReviewService:
         if status:
             query = query.where(Review.status == status)
 
-        # 총 개수
-        count_query = select(func.count()).select_from(query.subquery())
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
+        if cursor:
+            query = query.where(
+                tuple_(Review.review_date, Review.id) < decode_review_cursor(cursor)
+            )
+        elif offset:
+            query = query.offset(offset)
 
-        # 리뷰 목록
-        query = query.order_by(Review.review_date.desc()).offset(offset).limit(limit)
+        # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+        query = query.order_by(Review.review_date.desc(), Review.id.desc()).limit(
+            limit + 1
+        )
         result = await self.db.execute(query)
         reviews = list(result.scalars().all())
 
-        return reviews, total
+        next_cursor = None
+        if len(reviews) > limit:
+            reviews = reviews[:limit]
+            next_cursor = encode_review_cursor(reviews[-1])
+
+        total = None
+        if include_total:
+            total = await ReviewRollupService(self.db).count_reviews(shop_id, status)
+
+        return reviews, total, next_cursor
+
+    async def search_reviews(
+        self,
+        user: User,
+        shop_id: UUID,
+        query: str,
+        limit: int = 20,
+        cursor: str | None = None,
+    ) -> tuple[list[tuple[Review, float]], str | None]:
+        """매장의 리뷰를 본문과 작성자 이름으로 검색합니다.
+
+        결과는 (관련도, review_date, id) 내림차순이며 같은 키로 키셋
+        페이지네이션합니다. 반환값은 ((리뷰, 관련도) 목록, 다음 페이지 커서)입니다.
+        """
+        shop = await self._get_user_shop(user, shop_id)
+        if not shop:
+            raise ReviewException("매장을 찾을 수 없습니다.", status_code=404)
+
+        dialect_name = self.db.get_bind().dialect.name
+        rank = review_search_rank(dialect_name, query).label("rank")
+        stmt = select(Review, rank).where(
+            Review.shop_id == shop_id, review_search_filter(dialect_name, query)
+        )
+        if cursor:
+            stmt = stmt.where(
+                tuple_(rank.element, Review.review_date, Review.id)
+                < decode_search_cursor(cursor)
+            )
+
+        # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+        stmt = stmt.order_by(
+            rank.desc(), Review.review_date.desc(), Review.id.desc()
+        ).limit(limit + 1)
+        result = await self.db.execute(stmt)
+        hits = [(review, float(score)) for review, score in result.all()]
+
+        next_cursor = None
+        if len(hits) > limit:
+            hits = hits[:limit]
+            review, score = hits[-1]
+            next_cursor = encode_search_cursor(score, review)
+
+        return hits, next_cursor
 
     async def get_review_by_id(
         self, user: User, shop_id: UUID, review_id: UUID
@@ -127,9 +612,79 @@ class ReviewService:
             review.replied_at = datetime.now(UTC)
 
         await self.db.commit()
+        await bump_shop_version(self.shop_cache, shop_id)
         await self.db.refresh(review)
         return review
 
+    async def bulk_update_status(
+        self,
+        user: User,
+        shop_id: UUID,
+        status: str,
+        review_ids: list[UUID] | None = None,
+        filters: ReviewStatusFilter | None = None,
+    ) -> list[dict[str, Any]]:
+        """리뷰 상태를 일괄 변경합니다.
+
+        review_ids 또는 filters 중 하나로 대상을 지정하며, 한 번의 UPDATE와
+        커밋으로 반영합니다. 항목별 결과(updated, unchanged, not_found)를
+        반환하며 review_ids로 지정하면 요청 순서를 따릅니다. filters에 맞는
+        리뷰가 BULK_STATUS_FILTER_LIMIT개를 넘으면 아무것도 바꾸지 않고
+        거절합니다.
+        """
+        if (review_ids is None) == (filters is None):
+            raise ReviewException(
+                "reviewIds와 filter 중 하나만 지정해야 합니다.", status_code=400
+            )
+
+        shop = await self._get_user_shop(user, shop_id)
+        if not shop:
+            raise ReviewException("매장을 찾을 수 없습니다.", status_code=404)
+
+        conditions: list[ColumnElement[bool]] = []
+        if review_ids is not None:
+            conditions.append(Review.id.in_(review_ids))
+        elif filters is not None:
+            if filters.status:
+                conditions.append(Review.status == filters.status)
+            if filters.rating:
+                conditions.append(Review.rating == filters.rating)
+            if filters.review_date_before:
+                conditions.append(Review.review_date < filters.review_date_before)
+
+            # 조건에 맞는 리뷰를 먼저 골라 변경 범위를 상한 이내로 고정
+            matched = await self.db.execute(
+                select(Review.id)
+                .where(Review.shop_id == shop_id, *conditions)
+                .limit(BULK_STATUS_FILTER_LIMIT + 1)
+            )
+            matched_ids = list(matched.scalars().all())
+            if len(matched_ids) > BULK_STATUS_FILTER_LIMIT:
+                raise ReviewException(
+                    f"조건에 맞는 리뷰가 {BULK_STATUS_FILTER_LIMIT}개를 넘습니다. "
+                    "조건을 좁혀 주세요.",
+                    status_code=400,
+                )
+            conditions = [Review.id.in_(matched_ids)]
+
+        rows = await self.db.run_sync(
+            lambda session: update_review_status(session, shop_id, status, conditions)
+        )
+        await self.db.commit()
+
+        previous = dict(rows)
+        if any(value != status for value in previous.values()):
+            await bump_shop_version(self.shop_cache, shop_id)
+
+        def outcome(review_id: UUID) -> dict[str, Any]:
+            if review_id not in previous:
+                return {"id": review_id, "result": "not_found"}
+            changed = previous[review_id] != status
+            return {"id": review_id, "result": "updated" if changed else "unchanged"}
+
+        ordered = list(dict.fromkeys(review_ids)) if review_ids else list(previous)
+        return [outcome(review_id) for review_id in ordered]
+
     async def delete_review(self, user: User, shop_id: UUID, review_id: UUID) -> None:
         """리뷰를 삭제합니다."""
         review = await self.get_review_by_id(user, shop_id, review_id)
@@ -138,6 +693,7 @@ class ReviewService:
 
         await self.db.delete(review)
         await self.db.commit()
+        await bump_shop_version(self.shop_cache, shop_id)
 
     async def get_review_stats(self, user: User, shop_id: UUID) -> dict[str, Any]:
         """리뷰 통계를 조회합니다."""
@@ -145,31 +701,18 @@ class ReviewService:
         if not shop:
             raise ReviewException("매장을 찾을 수 없습니다.", status_code=404)
 
-        # 총 리뷰 수와 평균 평점
-        stats_result = await self.db.execute(
-            select(
-                func.count(Review.id),
-                func.avg(Review.rating),
-            ).where(Review.shop_id == shop_id)
-        )
-        stats = stats_result.one()
-        total_reviews = stats[0] or 0
-        average_rating = float(stats[1]) if stats[1] else 0.0
-
-        # 상태별 개수
-        status_result = await self.db.execute(
-            select(Review.status, func.count(Review.id))
-            .where(Review.shop_id == shop_id)
-            .group_by(Review.status)
-        )
-        status_counts = {row[0]: row[1] for row in status_result.all()}
+        # 플랫폼별 집계 테이블에서 조회 (리뷰 수와 무관하게 O(1))
+        rollups = await ReviewRollupService(self.db).get_shop_rollups(shop_id)
+        total_reviews = sum(rollup.review_count for rollup in rollups)
+        rating_sum = sum(rollup.rating_sum for rollup in rollups)
+        average_rating = rating_sum / total_reviews if total_reviews > 0 else 0.0
 
         return {
             "total_reviews": total_reviews,
             "average_rating": round(average_rating, 2),
-            "pending_count": status_counts.get("pending", 0),
-            "replied_count": status_counts.get("replied", 0),
-            "ignored_count": status_counts.get("ignored", 0),
+            "pending_count": sum(rollup.pending_count for rollup in rollups),
+            "replied_count": sum(rollup.replied_count for rollup in rollups),
+            "ignored_count": sum(rollup.ignored_count for rollup in rollups),
         }
 
     async def get_analytics(
@@ -195,27 +738,33 @@ class ReviewService:
             current_start = now - timedelta(days=30)
             previous_start = current_start - timedelta(days=30)
 
-        previous_end = current_start
-
-        # Get current period metrics
-        current_metrics = await self._get_period_metrics(shop_id, current_start, now)
-        previous_metrics = await self._get_period_metrics(
-            shop_id, previous_start, previous_end
-        )
-
-        # Calculate rating distribution
-        rating_distribution = await self._get_rating_distribution(
-            shop_id, current_start, now
-        )
-
-        # Get trend data (daily)
-        trend_data = await self._get_trend_data(shop_id, current_start, now)
-
-        # Get keywords from reviews
-        keywords = await self._extract_keywords(shop_id, current_start, now)
-
-        # Calculate sentiment
-        sentiment = await self._get_sentiment(shop_id, current_start, now)
+        # 기간 지표/평점 분포/감성은 한 번의 집계로 계산하고,
+        # 세션 팩토리가 있으면 트렌드/키워드를 별도 세션에서 동시에 조회
+        if self.session_factory is None:
+            aggregates = await self._get_period_aggregates(
+                shop_id, previous_start, current_start, now
+            )
+            trend_data = await self._get_trend_data(shop_id, current_start, now)
+            keywords = await self._extract_keywords(shop_id, current_start, now)
+        else:
+            aggregates, trend_data, keywords = await asyncio.gather(
+                self._get_period_aggregates(
+                    shop_id, previous_start, current_start, now
+                ),
+                self._run_on_session(
+                    self.session_factory,
+                    lambda s: s._get_trend_data(shop_id, current_start, now),
+                ),
+                self._run_on_session(
+                    self.session_factory,
+                    lambda s: s._extract_keywords(shop_id, current_start, now),
+                ),
+            )
+        current_histogram = aggregates["current"]["histogram"]
+        current_metrics = self._period_metrics(aggregates["current"])
+        previous_metrics = self._period_metrics(aggregates["previous"])
+        rating_distribution = self._rating_distribution(current_histogram)
+        sentiment = self._sentiment(current_histogram)
 
         # Calculate change percentages
         def calc_change(current: float, previous: float) -> float:
@@ -258,26 +807,73 @@ class ReviewService:
             "sentiment": sentiment,
         }
 
-    async def _get_period_metrics(
-        self, shop_id: UUID, start: datetime, end: datetime
-    ) -> dict[str, Any]:
-        """기간별 메트릭을 조회합니다."""
-        result = await self.db.execute(
+    @staticmethod
+    async def _run_on_session(
+        session_factory: async_sessionmaker[AsyncSession],
+        query: Callable[["ReviewService"], Awaitable[T]],
+    ) -> T:
+        """풀에서 받은 별도 세션으로 쿼리를 실행합니다.
+
+        AsyncSession 하나로는 쿼리를 병렬 실행할 수 없으므로 동시에 실행할
+        쿼리마다 세션을 따로 사용합니다.
+        """
+        async with session_factory() as session:
+            return await query(ReviewService(session))
+
+    async def _get_period_aggregates(
+        self,
+        shop_id: UUID,
+        previous_start: datetime,
+        current_start: datetime,
+        end: datetime,
+    ) -> dict[str, dict[str, Any]]:
+        """이전/현재 기간의 평점별 리뷰 수와 답변 수를 한 번에 집계합니다.
+
+        두 기간을 합친 범위를 한 번만 스캔하여 (기간, 평점)별로 묶습니다.
+        """
+        period_reviews = (
             select(
-                func.count(Review.id),
-                func.avg(Review.rating),
-                func.sum(func.cast(Review.status == "replied", Integer)),
+                case(
+                    (Review.review_date >= current_start, "current"),
+                    else_="previous",
+                ).label("period"),
+                Review.rating,
+                Review.status,
             )
             .where(Review.shop_id == shop_id)
-            .where(Review.review_date >= start)
+            .where(Review.review_date >= previous_start)
             .where(Review.review_date <= end)
+            .cte("period_reviews")
+        )
+        result = await self.db.execute(
+            select(
+                period_reviews.c.period,
+                period_reviews.c.rating,
+                func.count().label("review_count"),
+                func.sum(
+                    case((period_reviews.c.status == "replied", 1), else_=0)
+                ).label("replied_count"),
+            ).group_by(period_reviews.c.period, period_reviews.c.rating)
         )
-        row = result.one()
-        total = row[0] or 0
-        avg_rating = float(row[1]) if row[1] else 0.0
-        replied = row[2] or 0
 
-        response_rate = (replied / total * 100) if total > 0 else 0.0
+        aggregates: dict[str, dict[str, Any]] = {
+            period: {"histogram": Counter(), "replied": 0}
+            for period in ("current", "previous")
+        }
+        for row in result.all():
+            aggregate = aggregates[row.period]
+            aggregate["histogram"][row.rating] += row.review_count
+            aggregate["replied"] += row.replied_count or 0
+        return aggregates
+
+    @staticmethod
+    def _period_metrics(aggregate: dict[str, Any]) -> dict[str, Any]:
+        """기간 집계로부터 리뷰 수, 평균 평점, 응답률을 계산합니다."""
+        histogram: Counter[int] = aggregate["histogram"]
+        total = sum(histogram.values())
+        rating_sum = sum(rating * count for rating, count in histogram.items())
+        avg_rating = rating_sum / total if total > 0 else 0.0
+        response_rate = (aggregate["replied"] / total * 100) if total > 0 else 0.0
 
         return {
             "total": total,
@@ -285,24 +881,14 @@ class ReviewService:
             "response_rate": round(response_rate, 1),
         }
 
-    async def _get_rating_distribution(
-        self, shop_id: UUID, start: datetime, end: datetime
-    ) -> list[dict[str, Any]]:
-        """평점 분포를 조회합니다."""
-        result = await self.db.execute(
-            select(Review.rating, func.count(Review.id))
-            .where(Review.shop_id == shop_id)
-            .where(Review.review_date >= start)
-            .where(Review.review_date <= end)
-            .group_by(Review.rating)
-            .order_by(Review.rating.desc())
-        )
-        rows = result.all()
-        total = sum(row[1] for row in rows)
+    @staticmethod
+    def _rating_distribution(histogram: Counter[int]) -> list[dict[str, Any]]:
+        """평점 분포를 계산합니다."""
+        total = sum(histogram.values())
 
         distribution = []
         for rating in range(5, 0, -1):
-            count = next((row[1] for row in rows if row[0] == rating), 0)
+            count = histogram[rating]
             percent = round((count / total * 100), 1) if total > 0 else 0.0
             distribution.append({"rating": rating, "count": count, "percent": percent})
 
@@ -312,25 +898,15 @@ class ReviewService:
         self, shop_id: UUID, start: datetime, end: datetime
     ) -> list[dict[str, Any]]:
         """일별 트렌드 데이터를 조회합니다."""
-        result = await self.db.execute(
-            select(
-                cast(Review.review_date, Date).label("date"),
-                func.count(Review.id),
-                func.avg(Review.rating),
-            )
-            .where(Review.shop_id == shop_id)
-            .where(Review.review_date >= start)
-            .where(Review.review_date <= end)
-            .group_by(cast(Review.review_date, Date))
-            .order_by(cast(Review.review_date, Date))
+        rows = await ReviewRollupService(self.db).get_daily_stats(
+            shop_id, review_day(start), review_day(end)
         )
-        rows = result.all()
 
         return [
             {
-                "date": row[0].isoformat() if row[0] else "",
-                "review_count": row[1] or 0,
-                "average_rating": round(float(row[2]), 2) if row[2] else 0.0,
+                "date": row.day.isoformat(),
+                "review_count": int(row.review_count),
+                "average_rating": round(float(row.rating_sum) / row.review_count, 2),
             }
             for row in rows
         ]
@@ -338,63 +914,19 @@ class ReviewService:
     async def _extract_keywords(
         self, shop_id: UUID, start: datetime, end: datetime, top_n: int = 10
     ) -> list[dict[str, Any]]:
-        """리뷰에서 키워드를 추출합니다."""
-        result = await self.db.execute(
-            select(Review.content)
-            .where(Review.shop_id == shop_id)
-            .where(Review.review_date >= start)
-            .where(Review.review_date <= end)
-            .where(Review.content.isnot(None))
+        """기간 내 키워드 출현 횟수를 키워드 집계 테이블에서 조회합니다."""
+        rows = await ReviewRollupService(self.db).get_keyword_counts(
+            shop_id, review_day(start), review_day(end), top_n
         )
-        contents = [row[0] for row in result.all() if row[0]]
-
-        # Simple Korean keyword extraction
-        # Positive keywords commonly found in salon reviews
-        positive_keywords = [
-            "친절",
-            "만족",
-            "좋",
-            "최고",
-            "추천",
-            "감사",
-            "편안",
-            "깔끔",
-            "스타일",
-            "서비스",
-            "분위기",
-            "재방문",
-            "가격",
-            "실력",
-            "전문",
-        ]
 
-        word_counts: Counter[str] = Counter()
-        for content in contents:
-            for keyword in positive_keywords:
-                if keyword in content:
-                    word_counts[keyword] += content.count(keyword)
+        return [{"keyword": keyword, "count": count} for keyword, count in rows]
 
-        return [
-            {"keyword": word, "count": count}
-            for word, count in word_counts.most_common(top_n)
-        ]
-
-    async def _get_sentiment(
-        self, shop_id: UUID, start: datetime, end: datetime
-    ) -> dict[str, Any]:
-        """감성 분석을 수행합니다."""
-        result = await self.db.execute(
-            select(Review.rating, func.count(Review.id))
-            .where(Review.shop_id == shop_id)
-            .where(Review.review_date >= start)
-            .where(Review.review_date <= end)
-            .group_by(Review.rating)
-        )
-        rows = {row[0]: row[1] for row in result.all()}
-
-        positive = sum(rows.get(r, 0) for r in [4, 5])
-        neutral = rows.get(3, 0)
-        negative = sum(rows.get(r, 0) for r in [1, 2])
+    @staticmethod
+    def _sentiment(histogram: Counter[int]) -> dict[str, Any]:
+        """평점 분포로 감성 분석을 수행합니다."""
+        positive = sum(histogram[r] for r in [4, 5])
+        neutral = histogram[3]
+        negative = sum(histogram[r] for r in [1, 2])
         total = positive + neutral + negative
 
         return {
@@ -417,13 +949,27 @@ class ReviewService:
         status_filter: str | None = None,
         date_from: datetime | None = None,
         date_to: datetime | None = None,
-    ) -> list[dict[str, Any]]:
-        """리뷰 데이터를 내보내기 형식으로 조회합니다."""
+    ) -> AsyncIterator[dict[str, Any]]:
+        """리뷰 데이터를 내보내기 형식으로 스트리밍합니다.
+
+        매장 접근 권한은 즉시 확인하고, 반환된 이터레이터는 내보낼 컬럼만
+        서버 사이드 커서로 EXPORT_CHUNK_SIZE개씩 읽어 한 행씩 반환합니다.
+        """
         shop = await self._get_user_shop(user, shop_id)
         if not shop:
             raise ReviewException("매장을 찾을 수 없습니다.", status_code=404)
 
-        query = select(Review).where(Review.shop_id == shop_id)
+        query = select(
+            Review.id,
+            Review.reviewer_name,
+            Review.rating,
+            Review.content,
+            Review.review_date,
+            Review.status,
+            Review.google_review_id,
+            Review.final_response,
+            Review.replied_at,
+        ).where(Review.shop_id == shop_id)
 
         if status_filter:
             query = query.where(Review.status == status_filter)
@@ -432,23 +978,34 @@ class ReviewService:
         if date_to:
             query = query.where(Review.review_date <= date_to)
 
-        query = query.order_by(Review.review_date.desc())
-        result = await self.db.execute(query)
-        reviews = result.scalars().all()
+        query = query.order_by(Review.review_date.desc(), Review.id.desc())
+        return self._stream_export_rows(
+            query.execution_options(yield_per=EXPORT_CHUNK_SIZE)
+        )
 
-        return [
-            {
-                "id": str(review.id),
-                "reviewer_name": review.reviewer_name,
-                "rating": review.rating,
-                "content": review.content,
-                "review_date": review.review_date.isoformat(),
-                "status": review.status,
-                "platform": "google",  # Single platform for now
-                "response": review.final_response,
-                "responded_at": review.replied_at.isoformat()
-                if review.replied_at
-                else None,
-            }
-            for review in reviews
-        ]
+    async def _stream_export_rows(
+        self, query: Executable
+    ) -> AsyncIterator[dict[str, Any]]:
+        """내보낼 행을 읽습니다.
+
+        응답 본문을 보내는 동안 실행되어 요청 세션이 이미 닫혔을 수 있으므로,
+        세션 팩토리가 있으면 스트리밍이 끝날 때까지 쓰는 별도 세션에서 읽습니다.
+        """
+        async with (
+            self.session_factory() if self.session_factory else nullcontext(self.db)
+        ) as session:
+            result = await session.stream(query)
+            async for row in result:
+                yield {
+                    "id": str(row.id),
+                    "reviewer_name": row.reviewer_name,
+                    "rating": row.rating,
+                    "content": row.content,
+                    "review_date": row.review_date.isoformat(),
+                    "status": row.status,
+                    "platform": review_platform(row.google_review_id),
+                    "response": row.final_response,
+                    "responded_at": row.replied_at.isoformat()
+                    if row.replied_at
+                    else None,
+                }
@@ -3,19 +3,78 @@ Vision AI 서비스
 OpenAI Vision API를 사용한 뷰티 시술 이미지 분석
 """
 
+import asyncio
 import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
-from typing import Any
-from uuid import UUID
+from functools import lru_cache
+from typing import Any, NamedTuple
+from uuid import UUID, uuid4
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.settings import get_settings
+from infrastructure.cache.shop_cache import ShopCache, bump_shop_version
+from infrastructure.external.http_clients import get_openai_http_client
 from models.style_tag import StyleTag
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# 일괄 분석 시 한 번의 UPDATE와 커밋으로 저장할 이미지 수
+STYLE_BATCH_CHUNK_SIZE = 25
+
+# 분석이 끊긴 StyleTag를 한 번에 다시 가져오는 최대 수
+STYLE_SWEEP_LIMIT = 500
+
+# 429(요청 한도 초과) 응답 시 재시도 횟수
+VISION_MAX_RETRIES = 2
+
+# 일괄 분석 진행 콜백: (성공 수, 실패 수)
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+
+class StaleStyleTag(NamedTuple):
+    """분석이 오래 끝나지 않은 StyleTag"""
+
+    id: UUID
+    shop_id: UUID
+    analysis_job_id: str | None
+
+
+class RequestRateLimiter:
+    """요청 시작 간격을 분당 requests_per_minute 이내로 맞추는 제한기
+
+    예약 시각 계산 사이에 await가 없으므로 같은 이벤트 루프의 여러 작업이
+    공유해도 잠금이 필요하지 않습니다.
+    """
+
+    def __init__(self, requests_per_minute: int):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_at = 0.0
+
+    async def acquire(self) -> None:
+        """다음 요청을 보낼 수 있을 때까지 기다립니다."""
+        now = time.monotonic()
+        wait = self._next_at - now
+        self._next_at = max(now, self._next_at) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+@lru_cache
+def get_vision_rate_limiter() -> RequestRateLimiter:
+    """프로세스 전역 Vision API 요청 제한기를 반환합니다.
+
+    같은 API 키를 쓰는 단건 분석, 일괄 분석, 복구 분석이 모두 이 제한기를
+    공유하므로 동시에 실행되는 작업 수와 관계없이
+    settings.vision_requests_per_minute를 넘지 않습니다.
+    """
+    return RequestRateLimiter(settings.vision_requests_per_minute)
 
 
 class VisionServiceError(Exception):
@@ -51,17 +110,45 @@ class VisionService:
 
     OpenAI Vision API를 사용하여 뷰티 시술 이미지를 분석합니다.
     분석 결과는 StyleTag 모델에 저장되어 스타일북 기능에 활용됩니다.
+    HTTP 클라이언트는 프로세스 공용 클라이언트를 주입받아 사용하며 닫지 않습니다.
+    Vision API 요청은 모두 프로세스 공용 요청 제한기를 거칩니다.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        shop_cache: ShopCache | None = None,
+        client: httpx.AsyncClient | None = None,
+        rate_limiter: RequestRateLimiter | None = None,
+    ):
         self.db = db
-        self.client = httpx.AsyncClient(timeout=60.0)
+        self.shop_cache = shop_cache
+        self.client = client or get_openai_http_client()
+        self.rate_limiter = rate_limiter or get_vision_rate_limiter()
         self.api_key = settings.openai_api_key
         self.model = settings.openai_model  # gpt-4o
 
-    async def close(self) -> None:
-        """HTTP 클라이언트 종료"""
-        await self.client.aclose()
+    async def create_style_tag(
+        self,
+        shop_id: UUID,
+        image_url: str,
+        thumbnail_url: str | None = None,
+    ) -> StyleTag:
+        """분석 대기(pending) 상태의 StyleTag를 생성합니다.
+
+        분석은 워커에서 mark_analyzing → analyze → save_analysis 순서로 진행합니다.
+        """
+        style_tag = StyleTag(
+            shop_id=shop_id,
+            image_url=image_url,
+            thumbnail_url=thumbnail_url,
+            analysis_status="pending",
+        )
+        self.db.add(style_tag)
+        await self.db.commit()
+        await bump_shop_version(self.shop_cache, shop_id)
+        await self.db.refresh(style_tag)
+        return style_tag
 
     async def analyze_image(
         self,
@@ -79,7 +166,7 @@ class VisionService:
         Returns:
             StyleTag: 분석 결과가 저장된 StyleTag 객체
         """
-        # StyleTag 생성 (pending 상태)
+        # StyleTag 생성 (analyzing 상태)
         style_tag = StyleTag(
             shop_id=shop_id,
             image_url=image_url,
@@ -92,40 +179,297 @@ class VisionService:
 
         try:
             # Vision API 호출
-            analysis_result = await self._call_vision_api(image_url)
-
-            # 결과 파싱 및 저장
-            style_tag.service_type = analysis_result.get("service_type")
-            style_tag.style_category = analysis_result.get("style_category")
-            style_tag.season_trend = analysis_result.get("season_trend")
-            style_tag.dominant_colors = analysis_result.get("dominant_colors", [])
-            style_tag.technique_tags = analysis_result.get("technique_tags", [])
-            style_tag.mood_tags = analysis_result.get("mood_tags", [])
-            style_tag.ai_description = analysis_result.get("ai_description")
-            style_tag.suggested_hashtags = analysis_result.get("suggested_hashtags", [])
-            style_tag.confidence_score = analysis_result.get("confidence_score", 0.8)
-            style_tag.raw_ai_response = analysis_result
-            style_tag.analysis_status = "completed"
-            style_tag.analyzed_at = datetime.now(UTC)
-
-            await self.db.commit()
-            await self.db.refresh(style_tag)
-
-            return style_tag
-
+            analysis_result = await self.analyze(image_url)
         except Exception as e:
             # 실패 시 상태 업데이트
             style_tag.analysis_status = "failed"
             await self.db.commit()
+            await bump_shop_version(self.shop_cache, shop_id)
             raise VisionServiceError(f"이미지 분석 실패: {str(e)}") from e
 
+        self._apply_analysis(style_tag, analysis_result)
+        await self.db.commit()
+        await bump_shop_version(self.shop_cache, shop_id)
+        await self.db.refresh(style_tag)
+
+        return style_tag
+
+    async def mark_analyzing(self, style_tag_id: UUID) -> StyleTag | None:
+        """대기 중인 StyleTag를 분석 중(analyzing)으로 바꿉니다.
+
+        이미 다른 작업이 가져갔거나 삭제된 경우 None을 반환합니다.
+        """
+        result = await self.db.execute(
+            select(StyleTag).where(
+                StyleTag.id == style_tag_id, StyleTag.analysis_status == "pending"
+            )
+        )
+        style_tag = result.scalar_one_or_none()
+        if style_tag is None:
+            return None
+        style_tag.analysis_status = "analyzing"
+        await self.db.commit()
+        return style_tag
+
+    async def find_stale_style_tags(
+        self, stale_before: datetime, limit: int = STYLE_SWEEP_LIMIT
+    ) -> list[StaleStyleTag]:
+        """stale_before 이후로 갱신되지 않은 pending/analyzing StyleTag를 찾습니다.
+
+        태그를 맡은 작업이 아직 살아 있는지는 호출하는 쪽에서 확인합니다.
+        """
+        result = await self.db.execute(
+            select(StyleTag.id, StyleTag.shop_id, StyleTag.analysis_job_id)
+            .where(
+                StyleTag.analysis_status.in_(("pending", "analyzing")),
+                StyleTag.updated_at < stale_before,
+            )
+            .order_by(StyleTag.updated_at)
+            .limit(limit)
+        )
+        stale = [StaleStyleTag(*row) for row in result.all()]
+        await self.db.commit()
+        return stale
+
+    async def reassign_style_tags(
+        self,
+        shop_id: UUID,
+        style_tag_ids: list[UUID],
+        job_id: str,
+        stale_before: datetime,
+    ) -> list[UUID]:
+        """분석이 끊긴 StyleTag를 job_id 작업에 넘기고 pending으로 되돌립니다.
+
+        그사이 갱신된 태그는 다른 프로세스가 먼저 가져간 것이므로 제외하며,
+        실제로 넘겨받은 태그 ID를 반환합니다.
+        """
+        result = await self.db.execute(
+            update(StyleTag)
+            .where(
+                StyleTag.shop_id == shop_id,
+                StyleTag.id.in_(style_tag_ids),
+                StyleTag.analysis_status.in_(("pending", "analyzing")),
+                StyleTag.updated_at < stale_before,
+            )
+            .values(analysis_status="pending", analysis_job_id=job_id)
+            .returning(StyleTag.id)
+            .execution_options(synchronize_session=False)
+        )
+        reassigned = list(result.scalars().all())
+        await self.db.commit()
+        return reassigned
+
+    async def analyze(self, image_url: str) -> dict[str, Any]:
+        """이미지를 Vision API로 분석합니다 (DB를 사용하지 않음).
+
+        요청 전에 프로세스 공용 제한기로 분당 요청 수를 맞춥니다.
+        """
+        await self.rate_limiter.acquire()
+        return await self._call_vision_api(image_url)
+
+    async def save_analysis(
+        self, style_tag_id: UUID, analysis_result: dict[str, Any] | None
+    ) -> StyleTag | None:
+        """분석 결과를 저장합니다 (결과가 None이면 실패로 기록)."""
+        style_tag = await self.db.get(StyleTag, style_tag_id)
+        if style_tag is None:
+            return None
+        if analysis_result is None:
+            style_tag.analysis_status = "failed"
+        else:
+            self._apply_analysis(style_tag, analysis_result)
+        await self.db.commit()
+        await bump_shop_version(self.shop_cache, style_tag.shop_id)
+        return style_tag
+
+    async def create_style_tags(
+        self,
+        shop_id: UUID,
+        images: list[tuple[str, str | None]],
+        job_id: str | None = None,
+    ) -> list[UUID]:
+        """(이미지 URL, 썸네일 URL) 목록으로 대기 상태 StyleTag를 한 번에 생성합니다.
+
+        하나의 INSERT 문으로 저장하고 생성된 ID를 입력 순서대로 반환합니다.
+        job_id는 분석을 맡을 작업으로, 작업이 살아 있는 동안에는 분석이 끊긴
+        태그 복구(find_stale_style_tags)가 태그를 가져가지 않습니다.
+        """
+        style_tag_ids = [uuid4() for _ in images]
+        rows = [
+            {
+                "id": style_tag_id,
+                "shop_id": shop_id,
+                "image_url": image_url,
+                "thumbnail_url": thumbnail_url,
+                "analysis_status": "pending",
+                "analysis_job_id": job_id,
+            }
+            for style_tag_id, (image_url, thumbnail_url) in zip(
+                style_tag_ids, images, strict=True
+            )
+        ]
+        await self.db.execute(insert(StyleTag), rows)
+        await self.db.commit()
+        await bump_shop_version(self.shop_cache, shop_id)
+        return style_tag_ids
+
+    async def analyze_batch(
+        self,
+        shop_id: UUID,
+        style_tag_ids: list[UUID],
+        on_progress: ProgressCallback | None = None,
+    ) -> tuple[int, int]:
+        """대기 중인 StyleTag 이미지를 일괄 분석합니다.
+
+        STYLE_BATCH_CHUNK_SIZE개씩 analyzing으로 바꿔 커밋한 뒤 DB 연결 없이
+        최대 settings.vision_batch_concurrency개를 동시에 분석하고, 청크마다
+        한 번의 일괄 UPDATE와 커밋으로 결과를 저장합니다. 요청 시작 간격은
+        프로세스 공용 제한기(analyze)가 맞추고 429 응답은 잠시 기다렸다가
+        재시도합니다. (성공 수, 실패 수)를 반환합니다.
+        """
+        slots = asyncio.Semaphore(settings.vision_batch_concurrency)
+
+        async def analyze(image_url: str) -> dict[str, Any]:
+            async with slots:
+                for attempt in range(VISION_MAX_RETRIES + 1):
+                    try:
+                        return await self.analyze(image_url)
+                    except VisionServiceError as e:
+                        if e.status_code != 429 or attempt == VISION_MAX_RETRIES:
+                            raise
+                    await asyncio.sleep(
+                        settings.vision_retry_backoff_seconds * 2**attempt
+                    )
+                raise AssertionError("unreachable")
+
+        succeeded = failed = 0
+        # analyzing으로 가져갔지만 아직 결과를 저장하지 않은 태그
+        claimed: list[UUID] = []
+        try:
+            for start in range(0, len(style_tag_ids), STYLE_BATCH_CHUNK_SIZE):
+                chunk = style_tag_ids[start : start + STYLE_BATCH_CHUNK_SIZE]
+                result = await self.db.execute(
+                    update(StyleTag)
+                    .where(
+                        StyleTag.shop_id == shop_id,
+                        StyleTag.id.in_(chunk),
+                        StyleTag.analysis_status == "pending",
+                    )
+                    .values(analysis_status="analyzing")
+                    .returning(StyleTag.id, StyleTag.image_url)
+                    .execution_options(synchronize_session=False)
+                )
+                targets = result.all()
+                claimed = [style_tag_id for style_tag_id, _ in targets]
+                # 분석을 기다리는 동안 DB 연결을 잡지 않도록 먼저 커밋
+                await self.db.commit()
+
+                outcomes = await asyncio.gather(
+                    *(analyze(image_url) for _, image_url in targets),
+                    return_exceptions=True,
+                )
+                analyzed_at = datetime.now(UTC)
+                rows: list[dict[str, Any]] = []
+                for (style_tag_id, _), outcome in zip(targets, outcomes, strict=True):
+                    if isinstance(outcome, BaseException):
+                        logger.warning(
+                            "Style image analysis failed",
+                            extra={
+                                "style_tag_id": str(style_tag_id),
+                                "error": str(outcome),
+                            },
+                        )
+                        rows.append({"id": style_tag_id, "analysis_status": "failed"})
+                    else:
+                        rows.append(
+                            {
+                                "id": style_tag_id,
+                                **self._analysis_values(outcome),
+                                "analyzed_at": analyzed_at,
+                            }
+                        )
+                if rows:
+                    await self.db.execute(update(StyleTag), rows)
+                    await self.db.commit()
+                    await bump_shop_version(self.shop_cache, shop_id)
+                claimed = []
+
+                chunk_succeeded = sum(
+                    row["analysis_status"] == "completed" for row in rows
+                )
+                # 이미 처리됐거나 삭제된 태그도 실패로 집계
+                chunk_failed = len(chunk) - chunk_succeeded
+                succeeded += chunk_succeeded
+                failed += chunk_failed
+                if on_progress is not None:
+                    await on_progress(chunk_succeeded, chunk_failed)
+        except asyncio.CancelledError:
+            # 종료로 중단된 태그는 다시 분석할 수 있도록 대기 상태로 되돌림
+            await self._release_style_tags(shop_id, claimed, "pending")
+            raise
+        except Exception:
+            await self._release_style_tags(shop_id, claimed, "failed")
+            raise
+        return succeeded, failed
+
+    async def _release_style_tags(
+        self, shop_id: UUID, style_tag_ids: list[UUID], status: str
+    ) -> None:
+        """결과를 저장하지 못한 analyzing 태그를 status로 바꿉니다."""
+        if not style_tag_ids:
+            return
+        try:
+            await self.db.rollback()
+            await self.db.execute(
+                update(StyleTag)
+                .where(
+                    StyleTag.id.in_(style_tag_ids),
+                    StyleTag.analysis_status == "analyzing",
+                )
+                .values(analysis_status=status)
+                .execution_options(synchronize_session=False)
+            )
+            await self.db.commit()
+            await bump_shop_version(self.shop_cache, shop_id)
+        except Exception:
+            logger.exception(
+                "Failed to release claimed style tags",
+                extra={"shop_id": str(shop_id), "count": len(style_tag_ids)},
+            )
+
+    @staticmethod
+    def _analysis_values(analysis_result: dict[str, Any]) -> dict[str, Any]:
+        """분석 결과를 StyleTag 컬럼 값으로 변환합니다 (완료 상태 포함)."""
+        return {
+            "service_type": analysis_result.get("service_type"),
+            "style_category": analysis_result.get("style_category"),
+            "season_trend": analysis_result.get("season_trend"),
+            "dominant_colors": analysis_result.get("dominant_colors", []),
+            "technique_tags": analysis_result.get("technique_tags", []),
+            "mood_tags": analysis_result.get("mood_tags", []),
+            "ai_description": analysis_result.get("ai_description"),
+            "suggested_hashtags": analysis_result.get("suggested_hashtags", []),
+            "confidence_score": analysis_result.get("confidence_score", 0.8),
+            "raw_ai_response": analysis_result,
+            "analysis_status": "completed",
+        }
+
+    @classmethod
+    def _apply_analysis(
+        cls, style_tag: StyleTag, analysis_result: dict[str, Any]
+    ) -> None:
+        """분석 결과를 StyleTag에 반영하고 완료 상태로 바꿉니다."""
+        for column, value in cls._analysis_values(analysis_result).items():
+            setattr(style_tag, column, value)
+        style_tag.analyzed_at = datetime.now(UTC)
+
     async def _call_vision_api(self, image_url: str) -> dict[str, Any]:
         """OpenAI Vision API 호출"""
         if not self.api_key:
             raise VisionServiceError("OpenAI API 키가 설정되지 않았습니다.")
 
         response = await self.client.post(
-            "https://api.openai.com/v1/chat/completions",
+            f"{settings.openai_base_url}/chat/completions",
             headers={
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json",
@@ -153,6 +497,7 @@ class VisionService:
                 "max_tokens": 1000,
                 "temperature": 0.3,
             },
+            timeout=settings.openai_vision_timeout_seconds,
         )
 
         if response.status_code != 200:
@@ -267,6 +612,7 @@ class VisionService:
 
         await self.db.delete(style_tag)
         await self.db.commit()
+        await bump_shop_version(self.shop_cache, shop_id)
         return True
 
     async def get_style_statistics(self, shop_id: UUID) -> dict[str, Any]:
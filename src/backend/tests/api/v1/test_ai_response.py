@@ -11,6 +11,7 @@ from core.security import create_tokens, hash_password
 from models.review import Review
 from models.shop import Shop
 from models.user import User
+from services.ai_response_service import AIResponseService
 
 
 @pytest.fixture
@@ -245,3 +246,216 @@ class TestAIResponseErrors:
         )
 
         assert response.status_code == 404
+
+
+class TestBatchAIResponse:
+    """AI 답변 일괄 생성 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_generate_responses_for_pending_reviews(
+        self, client: AsyncClient, db_session, job_queue, review_fixture
+    ):
+        """답변 없는 대기 리뷰 전체를 백그라운드에서 생성하고 진행 상황을 보고해야 함"""
+        shop = review_fixture["shop"]
+        headers = {"Authorization": f"Bearer {review_fixture['token']}"}
+
+        response = await client.post(
+            f"/v1/shops/{shop.id}/reviews/ai-responses", headers=headers
+        )
+
+        assert response.status_code == 202
+        job = response.json()
+        assert job["status"] == "queued"
+        assert job["total"] == 3
+
+        await job_queue.join()
+        status_response = await client.get(
+            f"/v1/shops/{shop.id}/reviews/ai-responses/jobs/{job['id']}",
+            headers=headers,
+        )
+
+        assert status_response.status_code == 200
+        data = status_response.json()
+        assert data["status"] == "completed"
+        assert (data["processed"], data["succeeded"], data["failed"]) == (3, 3, 0)
+        assert data["finishedAt"] is not None
+        for key in ("positive_review", "negative_review", "no_content_review"):
+            review = review_fixture[key]
+            await db_session.refresh(review)
+            assert review.ai_response
+            assert review.ai_response_generated_at is not None
+
+    @pytest.mark.asyncio
+    async def test_should_skip_reviews_with_existing_response(
+        self, client: AsyncClient, review_fixture
+    ):
+        """대상 미지정 시 이미 답변이 있는 리뷰는 제외해야 함"""
+        shop = review_fixture["shop"]
+        headers = {"Authorization": f"Bearer {review_fixture['token']}"}
+        await client.post(
+            f"/v1/shops/{shop.id}/reviews/{review_fixture['positive_review'].id}"
+            "/ai-response",
+            headers=headers,
+        )
+
+        response = await client.post(
+            f"/v1/shops/{shop.id}/reviews/ai-responses", headers=headers
+        )
+
+        assert response.json()["total"] == 2
+
+    @pytest.mark.asyncio
+    async def test_should_generate_only_selected_reviews(
+        self, client: AsyncClient, db_session, job_queue, review_fixture
+    ):
+        """지정한 리뷰 중 매장에 속한 리뷰만 생성해야 함"""
+        from uuid import uuid4
+
+        shop = review_fixture["shop"]
+        negative_review = review_fixture["negative_review"]
+
+        response = await client.post(
+            f"/v1/shops/{shop.id}/reviews/ai-responses",
+            json={"reviewIds": [str(negative_review.id), str(uuid4())]},
+            headers={"Authorization": f"Bearer {review_fixture['token']}"},
+        )
+        await job_queue.join()
+
+        assert response.json()["total"] == 1
+        positive_review = review_fixture["positive_review"]
+        await db_session.refresh(negative_review)
+        await db_session.refresh(positive_review)
+        assert negative_review.ai_response is not None
+        assert positive_review.ai_response is None
+
+    @pytest.mark.asyncio
+    async def test_should_complete_empty_batch_immediately(
+        self, client: AsyncClient, review_fixture
+    ):
+        """대상 리뷰가 없으면 완료 상태의 작업을 반환해야 함"""
+        from uuid import uuid4
+
+        shop = review_fixture["shop"]
+
+        response = await client.post(
+            f"/v1/shops/{shop.id}/reviews/ai-responses",
+            json={"reviewIds": [str(uuid4())]},
+            headers={"Authorization": f"Bearer {review_fixture['token']}"},
+        )
+
+        assert response.status_code == 202
+        assert response.json()["status"] == "completed"
+        assert response.json()["total"] == 0
+
+    @pytest.mark.asyncio
+    async def test_should_return_404_for_unknown_job(
+        self, client: AsyncClient, review_fixture
+    ):
+        """존재하지 않는 작업은 404를 반환해야 함"""
+        shop = review_fixture["shop"]
+
+        response = await client.get(
+            f"/v1/shops/{shop.id}/reviews/ai-responses/jobs/unknown",
+            headers={"Authorization": f"Bearer {review_fixture['token']}"},
+        )
+
+        assert response.status_code == 404
+
+
+class TestStreamAIResponse:
+    """AI 답변 스트리밍 생성 테스트"""
+
+    @staticmethod
+    def _parse_events(body: str) -> list[tuple[str, dict]]:
+        import json
+
+        events = []
+        for block in body.strip().split("\n\n"):
+            lines = dict(line.split(": ", 1) for line in block.splitlines())
+            events.append((lines["event"], json.loads(lines["data"])))
+        return events
+
+    @pytest.mark.asyncio
+    async def test_should_stream_tokens_and_save_reply(
+        self, client: AsyncClient, db_session, review_fixture, monkeypatch
+    ):
+        """토큰 이벤트 뒤에 저장된 답변으로 done 이벤트를 보내야 함"""
+        shop = review_fixture["shop"]
+        review = review_fixture["positive_review"]
+        headers = {"Authorization": f"Bearer {review_fixture['token']}"}
+        phase = {"streaming": False, "commits_while_streaming": 0}
+        stream_tokens = AIResponseService._stream_tokens
+        commit = db_session.commit
+
+        async def record_stream_tokens(self, *args):
+            phase["streaming"] = True
+            async for token in stream_tokens(self, *args):
+                yield token
+
+        async def record_commit():
+            phase["commits_while_streaming"] += phase["streaming"]
+            await commit()
+
+        # 응답을 보내는 동안에는 요청 세션을 쓰지 않아야 함
+        monkeypatch.setattr(AIResponseService, "_stream_tokens", record_stream_tokens)
+        monkeypatch.setattr(db_session, "commit", record_commit)
+
+        response = await client.post(
+            f"/v1/shops/{shop.id}/reviews/{review.id}/ai-response/stream",
+            json={"tone": "formal"},
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = self._parse_events(response.text)
+        tokens = [data["text"] for event, data in events if event == "token"]
+        assert len(tokens) > 1
+        event, done = events[-1]
+        assert event == "done"
+        assert done["aiResponse"] == "".join(tokens).strip()
+        assert phase["commits_while_streaming"] == 0
+
+        review_url = f"/v1/shops/{shop.id}/reviews/{review.id}"
+        db_session.expire_all()
+        get_response = await client.get(review_url, headers=headers)
+        assert get_response.json()["aiResponse"] == done["aiResponse"]
+
+    @pytest.mark.asyncio
+    async def test_should_return_404_before_streaming(
+        self, client: AsyncClient, review_fixture
+    ):
+        """존재하지 않는 리뷰는 스트림을 열지 않고 404를 반환해야 함"""
+        from uuid import uuid4
+
+        shop = review_fixture["shop"]
+
+        response = await client.post(
+            f"/v1/shops/{shop.id}/reviews/{uuid4()}/ai-response/stream",
+            headers={"Authorization": f"Bearer {review_fixture['token']}"},
+        )
+
+        assert response.status_code == 404
+
+
+class TestAIReplyCacheStats:
+    """AI 답변 캐시 통계 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_return_hit_rate(
+        self, client: AsyncClient, review_fixture, reply_cache
+    ):
+        """매장의 캐시 적중·미스 수와 적중률을 반환해야 함"""
+        shop = review_fixture["shop"]
+        await reply_cache.set(shop.id, "praise", "{{reviewer_name}}님, 감사합니다.")
+        await reply_cache.get(shop.id, "praise")
+        await reply_cache.get(shop.id, "praise")
+        await reply_cache.get(shop.id, "unknown")
+
+        response = await client.get(
+            f"/v1/shops/{shop.id}/reviews/ai-responses/cache",
+            headers={"Authorization": f"Bearer {review_fixture['token']}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"hits": 2, "misses": 1, "hitRate": 0.6667}
@@ -305,3 +305,31 @@ class TestOptimalTimes:
         data = response.json()
         assert "times" in data
         assert len(data["times"]) > 0
+
+
+class TestPostConditionalGet:
+    """포스트 조회 ETag 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_return_304_until_posts_change(
+        self, client: AsyncClient, authenticated_user_with_shop
+    ):
+        """포스트가 변경되기 전까지 If-None-Match에 304를 반환해야 함"""
+        shop_id = authenticated_user_with_shop["shop"].id
+        headers = {"Authorization": f"Bearer {authenticated_user_with_shop['token']}"}
+        url = f"/v1/shops/{shop_id}/posts"
+
+        first = await client.get(url, headers=headers)
+        etag = first.headers["etag"]
+        cached = await client.get(url, headers={**headers, "If-None-Match": etag})
+
+        await client.post(
+            url,
+            headers=headers,
+            json={"imageUrl": "https://example.com/image.jpg"},
+        )
+        changed = await client.get(url, headers={**headers, "If-None-Match": etag})
+
+        assert cached.status_code == 304
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
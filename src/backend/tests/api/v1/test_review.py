@@ -2,16 +2,24 @@
 리뷰 CRUD API 테스트
 """
 
-from datetime import UTC, datetime
+import csv
+import io
+import json
+import zipfile
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
+from xml.etree import ElementTree
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import insert
 
 from core.security import create_tokens, hash_password
 from models.review import Review
 from models.shop import Shop
 from models.user import User
+from services import review_service
+from services.review_rollup_service import apply_review_changes, snapshot_values
 
 
 @pytest.fixture
@@ -208,6 +216,220 @@ class TestGetReviews:
         assert len(data["reviews"]) == 1
         assert data["reviews"][0]["status"] == "pending"
 
+    @pytest.mark.asyncio
+    async def test_should_paginate_reviews_with_cursor(
+        self, client: AsyncClient, db_session, authenticated_user_with_shop
+    ):
+        """커서로 모든 리뷰를 중복/누락 없이 순회해야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        base = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
+
+        # 같은 작성 시각의 리뷰가 페이지 경계에 걸치도록 생성
+        reviews = [
+            Review(
+                shop_id=shop.id,
+                reviewer_name=f"고객{i}",
+                rating=5,
+                review_date=base - timedelta(days=i // 2),
+            )
+            for i in range(5)
+        ]
+        db_session.add_all(reviews)
+        await db_session.commit()
+
+        headers = {"Authorization": f"Bearer {authenticated_user_with_shop['token']}"}
+        seen: list[str] = []
+        cursor = None
+        for _ in range(3):
+            params: dict[str, str | int] = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get(
+                f"/v1/shops/{shop.id}/reviews", params=params, headers=headers
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] == 5
+            seen.extend(r["id"] for r in data["reviews"])
+            cursor = data["nextCursor"]
+
+        assert cursor is None
+        expected = sorted(reviews, key=lambda r: (r.review_date, r.id), reverse=True)
+        assert seen == [str(r.id) for r in expected]
+
+    @pytest.mark.asyncio
+    async def test_should_omit_total_when_not_requested(
+        self, client: AsyncClient, db_session, authenticated_user_with_shop
+    ):
+        """includeTotal=false면 총 개수를 생략해야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        db_session.add(
+            Review(
+                shop_id=shop.id,
+                reviewer_name="고객",
+                rating=5,
+                review_date=datetime.now(UTC),
+            )
+        )
+        await db_session.commit()
+
+        response = await client.get(
+            f"/v1/shops/{shop.id}/reviews?includeTotal=false",
+            headers={
+                "Authorization": f"Bearer {authenticated_user_with_shop['token']}"
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        assert data["nextCursor"] is None
+        assert len(data["reviews"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_should_reject_invalid_cursor(
+        self, client: AsyncClient, authenticated_user_with_shop
+    ):
+        """잘못된 커서는 400을 반환해야 함"""
+        shop = authenticated_user_with_shop["shop"]
+
+        response = await client.get(
+            f"/v1/shops/{shop.id}/reviews?cursor=not-a-cursor",
+            headers={
+                "Authorization": f"Bearer {authenticated_user_with_shop['token']}"
+            },
+        )
+
+        assert response.status_code == 400
+
+
+class TestSearchReviews:
+    """리뷰 검색 API 테스트"""
+
+    @pytest.fixture
+    async def searchable_reviews(self, db_session, authenticated_user_with_shop):
+        shop = authenticated_user_with_shop["shop"]
+        base = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
+        reviews = [
+            Review(
+                shop_id=shop.id,
+                reviewer_name="친절한고객",
+                rating=5,
+                content="원장님이 정말 친절해요",
+                review_date=base - timedelta(days=3),
+            ),
+            Review(
+                shop_id=shop.id,
+                reviewer_name="김고객",
+                rating=4,
+                content="친절하고 꼼꼼했어요",
+                review_date=base - timedelta(days=1),
+            ),
+            Review(
+                shop_id=shop.id,
+                reviewer_name="이고객",
+                rating=2,
+                content="예약 시간을 안 지켜서 아쉬웠어요 (100% 불만)",
+                review_date=base - timedelta(days=2),
+            ),
+            Review(
+                shop_id=shop.id,
+                reviewer_name="박고객",
+                rating=5,
+                content="친절 그 자체",
+                review_date=base,
+            ),
+        ]
+        db_session.add_all(reviews)
+        await db_session.commit()
+        return reviews
+
+    @pytest.mark.asyncio
+    async def test_should_rank_matches_then_order_by_date(
+        self, client: AsyncClient, authenticated_user_with_shop, searchable_reviews
+    ):
+        """본문과 작성자 이름이 모두 일치하는 리뷰가 먼저, 나머지는 최신순이어야 함"""
+        shop = authenticated_user_with_shop["shop"]
+
+        response = await client.get(
+            f"/v1/shops/{shop.id}/reviews/search",
+            params={"q": "친절"},
+            headers={
+                "Authorization": f"Bearer {authenticated_user_with_shop['token']}"
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        expected = [searchable_reviews[i] for i in (0, 3, 1)]
+        assert [r["id"] for r in data["reviews"]] == [str(r.id) for r in expected]
+        assert data["reviews"][0]["rank"] > data["reviews"][1]["rank"]
+        assert data["nextCursor"] is None
+
+    @pytest.mark.asyncio
+    async def test_should_paginate_search_results_with_cursor(
+        self, client: AsyncClient, authenticated_user_with_shop, searchable_reviews
+    ):
+        """커서로 검색 결과를 중복/누락 없이 순회해야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        headers = {"Authorization": f"Bearer {authenticated_user_with_shop['token']}"}
+
+        seen: list[str] = []
+        cursor = None
+        for _ in range(3):
+            params: dict[str, str | int] = {"q": "친절", "limit": 1}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get(
+                f"/v1/shops/{shop.id}/reviews/search", params=params, headers=headers
+            )
+            assert response.status_code == 200
+            data = response.json()
+            seen.extend(r["id"] for r in data["reviews"])
+            cursor = data["nextCursor"]
+
+        assert cursor is None
+        expected = [searchable_reviews[i] for i in (0, 3, 1)]
+        assert seen == [str(r.id) for r in expected]
+
+    @pytest.mark.asyncio
+    async def test_should_match_wildcards_literally(
+        self, client: AsyncClient, authenticated_user_with_shop, searchable_reviews
+    ):
+        """검색어의 %, _는 와일드카드가 아닌 문자로 취급해야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        headers = {"Authorization": f"Bearer {authenticated_user_with_shop['token']}"}
+
+        percent = await client.get(
+            f"/v1/shops/{shop.id}/reviews/search",
+            params={"q": "100%"},
+            headers=headers,
+        )
+        underscore = await client.get(
+            f"/v1/shops/{shop.id}/reviews/search", params={"q": "_"}, headers=headers
+        )
+
+        assert [r["id"] for r in percent.json()["reviews"]] == [
+            str(searchable_reviews[2].id)
+        ]
+        assert underscore.json()["reviews"] == []
+
+    @pytest.mark.asyncio
+    async def test_should_require_search_query(
+        self, client: AsyncClient, authenticated_user_with_shop
+    ):
+        """검색어가 없으면 422를 반환해야 함"""
+        shop = authenticated_user_with_shop["shop"]
+
+        response = await client.get(
+            f"/v1/shops/{shop.id}/reviews/search",
+            headers={
+                "Authorization": f"Bearer {authenticated_user_with_shop['token']}"
+            },
+        )
+
+        assert response.status_code == 422
+
 
 class TestGetReviewById:
     """리뷰 상세 조회 테스트"""
@@ -418,3 +640,630 @@ class TestReviewStatistics:
         assert data["totalReviews"] == 4
         assert data["averageRating"] == 4.25  # (5+5+4+3)/4
         assert data["pendingCount"] >= 0
+
+
+class TestReviewAnalytics:
+    """리뷰 분석 API 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_return_review_analytics(
+        self, client: AsyncClient, db_session, authenticated_user_with_shop
+    ):
+        """분석 경로가 리뷰 상세 경로보다 먼저 매칭되어야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        db_session.add(
+            Review(
+                shop_id=shop.id,
+                reviewer_name="고객",
+                rating=5,
+                content="친절해요",
+                review_date=datetime.now(UTC),
+            )
+        )
+        await db_session.commit()
+
+        response = await client.get(
+            f"/v1/shops/{shop.id}/reviews/analytics?period=week",
+            headers={
+                "Authorization": f"Bearer {authenticated_user_with_shop['token']}"
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["totalReviews"]["current"] == 1
+        assert data["keywords"] == [{"keyword": "친절", "count": 1}]
+
+
+class TestReviewConditionalGet:
+    """리뷰 조회 ETag 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_return_304_until_reviews_change(
+        self, client: AsyncClient, authenticated_user_with_shop
+    ):
+        """리뷰가 변경되기 전까지 If-None-Match에 304를 반환해야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        headers = {"Authorization": f"Bearer {authenticated_user_with_shop['token']}"}
+        url = f"/v1/shops/{shop.id}/reviews"
+
+        first = await client.get(url, headers=headers)
+        etag = first.headers["etag"]
+        cached = await client.get(url, headers={**headers, "If-None-Match": etag})
+
+        await client.post(
+            url,
+            headers=headers,
+            json={
+                "reviewerName": "김고객",
+                "rating": 5,
+                "reviewDate": "2024-01-15T10:00:00Z",
+            },
+        )
+        changed = await client.get(url, headers={**headers, "If-None-Match": etag})
+
+        assert cached.status_code == 304
+        assert changed.status_code == 200
+        assert changed.json()["total"] == 1
+        assert changed.headers["etag"] != etag
+
+
+class TestExportReviews:
+    """리뷰 내보내기 API 테스트"""
+
+    @pytest.fixture
+    async def exported_reviews(self, db_session, authenticated_user_with_shop):
+        shop = authenticated_user_with_shop["shop"]
+        db_session.add_all(
+            [
+                Review(
+                    shop_id=shop.id,
+                    reviewer_name="김고객",
+                    rating=5,
+                    content='친절해요, "최고"',
+                    review_date=datetime(2024, 1, 2, tzinfo=UTC),
+                    google_review_id="g-export",
+                ),
+                Review(
+                    shop_id=shop.id,
+                    reviewer_name="이고객",
+                    rating=3,
+                    content="보통이에요",
+                    review_date=datetime(2024, 1, 1, tzinfo=UTC),
+                    status="replied",
+                    final_response="감사합니다",
+                ),
+            ]
+        )
+        await db_session.commit()
+        return shop
+
+    async def _export(self, client, shop, token, export_format=None):
+        params = {"format": export_format} if export_format else {}
+        return await client.get(
+            f"/v1/shops/{shop.id}/reviews/export",
+            params=params,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_should_export_json_array_by_default(
+        self, client: AsyncClient, authenticated_user_with_shop, exported_reviews
+    ):
+        """기본 형식은 기존과 같은 JSON 배열이어야 함"""
+        response = await self._export(
+            client, exported_reviews, authenticated_user_with_shop["token"]
+        )
+
+        assert response.status_code == 200
+        items = response.json()
+        assert [item["reviewerName"] for item in items] == ["김고객", "이고객"]
+        assert items[0]["platform"] == "google"
+        assert items[1]["platform"] == "naver"
+        assert items[1]["response"] == "감사합니다"
+
+    @pytest.mark.asyncio
+    async def test_should_export_csv(
+        self, client: AsyncClient, authenticated_user_with_shop, exported_reviews
+    ):
+        """CSV는 BOM과 헤더로 시작하고 값이 이스케이프되어야 함"""
+        response = await self._export(
+            client, exported_reviews, authenticated_user_with_shop["token"], "csv"
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers["content-disposition"]
+        text = response.content.decode("utf-8-sig")
+        rows = list(csv.reader(io.StringIO(text)))
+        assert rows[0][:3] == ["ID", "작성자", "평점"]
+        assert rows[1][3] == '친절해요, "최고"'
+        assert len(rows) == 3
+
+    @pytest.mark.asyncio
+    async def test_should_export_ndjson(
+        self, client: AsyncClient, authenticated_user_with_shop, exported_reviews
+    ):
+        """NDJSON은 한 줄에 리뷰 하나여야 함"""
+        response = await self._export(
+            client, exported_reviews, authenticated_user_with_shop["token"], "ndjson"
+        )
+
+        assert response.status_code == 200
+        lines = response.text.strip().split("\n")
+        assert [json.loads(line)["rating"] for line in lines] == [5, 3]
+
+    @pytest.mark.asyncio
+    async def test_should_export_xlsx(
+        self, client: AsyncClient, authenticated_user_with_shop, exported_reviews
+    ):
+        """XLSX는 시트에 헤더와 리뷰 행을 담은 ZIP이어야 함"""
+        response = await self._export(
+            client, exported_reviews, authenticated_user_with_shop["token"], "xlsx"
+        )
+
+        assert response.status_code == 200
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            assert "xl/workbook.xml" in archive.namelist()
+            sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+        namespace = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+        rows = sheet.findall("s:sheetData/s:row", namespace)
+        assert len(rows) == 3
+        cells = rows[1].findall("s:c", namespace)
+        assert cells[2].findtext("s:v", namespaces=namespace) == "5"
+        assert cells[3].findtext("s:is/s:t", namespaces=namespace) == (
+            '친절해요, "최고"'
+        )
+
+    @pytest.mark.asyncio
+    async def test_should_stream_rows_from_dedicated_session(
+        self,
+        client: AsyncClient,
+        db_session,
+        authenticated_user_with_shop,
+        exported_reviews,
+        monkeypatch,
+    ):
+        """본문은 요청 세션이 아닌 별도 세션에서 읽어야 함"""
+
+        async def request_session_stream(*args, **kwargs):
+            raise AssertionError("request session used while streaming")
+
+        monkeypatch.setattr(db_session, "stream", request_session_stream)
+
+        response = await self._export(
+            client, exported_reviews, authenticated_user_with_shop["token"]
+        )
+
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+
+    @pytest.mark.asyncio
+    async def test_should_return_404_for_other_users_shop(
+        self, client: AsyncClient, authenticated_user_with_shop
+    ):
+        """다른 사용자의 매장은 내보낼 수 없어야 함"""
+        response = await client.get(
+            f"/v1/shops/{uuid4()}/reviews/export?format=csv",
+            headers={
+                "Authorization": f"Bearer {authenticated_user_with_shop['token']}"
+            },
+        )
+
+        assert response.status_code == 404
+
+
+class TestBulkImportReviews:
+    """리뷰 일괄 등록 API 테스트"""
+
+    @staticmethod
+    def _item(google_review_id: str | None, rating: int = 5, **kwargs) -> dict:
+        return {
+            "reviewerName": "일괄 고객",
+            "rating": rating,
+            "reviewDate": "2024-01-15T10:00:00Z",
+            "googleReviewId": google_review_id,
+            **kwargs,
+        }
+
+    @pytest.mark.asyncio
+    async def test_should_upsert_reviews_and_report_per_item_results(
+        self, client: AsyncClient, db_session, authenticated_user_with_shop
+    ):
+        """신규는 생성, 기존 google_review_id는 갱신, 잘못된 항목은 오류여야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        existing = Review(
+            shop_id=shop.id,
+            reviewer_name="기존 고객",
+            rating=2,
+            review_date=datetime(2024, 1, 10, tzinfo=UTC),
+            google_review_id="g-existing",
+            status="replied",
+        )
+        db_session.add(existing)
+        await db_session.commit()
+
+        response = await client.post(
+            f"/v1/shops/{shop.id}/reviews/bulk",
+            json=[
+                self._item("g-new-1"),
+                self._item("g-existing", rating=4, content="다시 방문"),
+                self._item(None, rating=3),
+                self._item("g-bad", rating=9),
+            ],
+            headers={
+                "Authorization": f"Bearer {authenticated_user_with_shop['token']}"
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["created"], data["updated"], data["failed"]) == (2, 1, 1)
+        assert [r["status"] for r in data["results"]] == [
+            "created",
+            "updated",
+            "created",
+            "error",
+        ]
+        assert data["results"][1]["id"] == str(existing.id)
+        assert data["results"][3]["error"].startswith("rating")
+
+        stats = await client.get(
+            f"/v1/shops/{shop.id}/reviews/stats",
+            headers={
+                "Authorization": f"Bearer {authenticated_user_with_shop['token']}"
+            },
+        )
+        stats_data = stats.json()
+        assert stats_data["totalReviews"] == 3
+        assert stats_data["repliedCount"] == 1
+        assert stats_data["averageRating"] == pytest.approx(4.0)
+
+    @pytest.mark.asyncio
+    async def test_should_accept_ndjson_stream(
+        self, client: AsyncClient, authenticated_user_with_shop
+    ):
+        """NDJSON 본문을 줄 단위로 처리하고 중복/깨진 줄을 오류로 보고해야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        lines = [
+            json.dumps(self._item("g-1")),
+            "{not json",
+            json.dumps(self._item("g-2")),
+            json.dumps(self._item("g-1", rating=4)),
+        ]
+
+        response = await client.post(
+            f"/v1/shops/{shop.id}/reviews/bulk",
+            content="\n".join(lines) + "\n",
+            headers={
+                "Authorization": f"Bearer {authenticated_user_with_shop['token']}",
+                "Content-Type": "application/x-ndjson",
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["status"] for r in results] == [
+            "error",
+            "error",
+            "created",
+            "created",
+        ]
+        assert results[0]["googleReviewId"] == "g-1"
+
+    @pytest.mark.asyncio
+    async def test_should_not_overwrite_other_shops_review(
+        self, client: AsyncClient, db_session, authenticated_user_with_shop
+    ):
+        """다른 매장에 등록된 google_review_id는 갱신하지 않아야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        other_shop = Shop(
+            user_id=authenticated_user_with_shop["user"].id,
+            name="다른 매장",
+            type="hair",
+        )
+        db_session.add(other_shop)
+        await db_session.commit()
+        db_session.add(
+            Review(
+                shop_id=other_shop.id,
+                reviewer_name="다른 고객",
+                rating=1,
+                review_date=datetime(2024, 1, 10, tzinfo=UTC),
+                google_review_id="g-other",
+            )
+        )
+        await db_session.commit()
+
+        response = await client.post(
+            f"/v1/shops/{shop.id}/reviews/bulk",
+            json=[self._item("g-other")],
+            headers={
+                "Authorization": f"Bearer {authenticated_user_with_shop['token']}"
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"][0]["status"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_should_reject_non_array_body(
+        self, client: AsyncClient, authenticated_user_with_shop
+    ):
+        """JSON 본문은 배열이어야 함"""
+        shop = authenticated_user_with_shop["shop"]
+
+        response = await client.post(
+            f"/v1/shops/{shop.id}/reviews/bulk",
+            json=self._item("g-1"),
+            headers={
+                "Authorization": f"Bearer {authenticated_user_with_shop['token']}"
+            },
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_should_update_review_inserted_concurrently(
+        self, client: AsyncClient, authenticated_user_with_shop, monkeypatch
+    ):
+        """미리 조회한 뒤 다른 요청이 넣은 리뷰는 갱신으로 처리하고 한 번만 집계해야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        headers = {"Authorization": f"Bearer {authenticated_user_with_shop['token']}"}
+        raced_id = uuid4()
+        lock_reviews = review_service._lock_reviews_by_google_id
+        calls = []
+
+        def lock_after_concurrent_insert(connection, google_review_ids):
+            calls.append(google_review_ids)
+            if len(calls) > 1:
+                return lock_reviews(connection, google_review_ids)
+            # 조회 직후 다른 요청이 같은 google_review_id를 먼저 등록
+            values = {
+                "id": raced_id,
+                "shop_id": shop.id,
+                "google_review_id": "g-raced",
+                "reviewer_name": "먼저 온 고객",
+                "reviewer_profile_url": None,
+                "rating": 2,
+                "content": None,
+                "review_date": datetime(2024, 1, 15, 10, tzinfo=UTC),
+                "status": "pending",
+            }
+            connection.execute(insert(Review), values)
+            apply_review_changes(connection, [(1, snapshot_values(values))])
+            return {}
+
+        monkeypatch.setattr(
+            review_service, "_lock_reviews_by_google_id", lock_after_concurrent_insert
+        )
+
+        response = await client.post(
+            f"/v1/shops/{shop.id}/reviews/bulk",
+            json=[self._item("g-raced", rating=4), self._item("g-fresh")],
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["status"] for r in results] == ["updated", "created"]
+        assert results[0]["id"] == str(raced_id)
+
+        stats = await client.get(f"/v1/shops/{shop.id}/reviews/stats", headers=headers)
+        stats_data = stats.json()
+        assert stats_data["totalReviews"] == 2
+        assert stats_data["averageRating"] == pytest.approx(4.5)
+
+
+class TestBulkUpdateReviewStatus:
+    """리뷰 상태 일괄 변경 API 테스트"""
+
+    @pytest.fixture
+    async def reviews(self, db_session, authenticated_user_with_shop):
+        shop = authenticated_user_with_shop["shop"]
+        now = datetime.now(UTC)
+        reviews = [
+            Review(
+                shop_id=shop.id,
+                reviewer_name="오래된 5점",
+                rating=5,
+                review_date=now - timedelta(days=40),
+            ),
+            Review(
+                shop_id=shop.id,
+                reviewer_name="최근 5점",
+                rating=5,
+                review_date=now - timedelta(days=1),
+            ),
+            Review(
+                shop_id=shop.id,
+                reviewer_name="오래된 2점",
+                rating=2,
+                review_date=now - timedelta(days=40),
+            ),
+            Review(
+                shop_id=shop.id,
+                reviewer_name="응답 완료",
+                rating=5,
+                review_date=now - timedelta(days=50),
+                status="replied",
+            ),
+        ]
+        db_session.add_all(reviews)
+        await db_session.commit()
+        return reviews
+
+    async def _stats(self, client: AsyncClient, shop_id, headers) -> dict:
+        response = await client.get(
+            f"/v1/shops/{shop_id}/reviews/stats", headers=headers
+        )
+        return response.json()
+
+    @pytest.mark.asyncio
+    async def test_should_update_listed_reviews_and_report_per_id_results(
+        self, client: AsyncClient, authenticated_user_with_shop, reviews
+    ):
+        """ID 목록의 리뷰를 변경하고 요청 순서대로 결과를 보고해야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        headers = {"Authorization": f"Bearer {authenticated_user_with_shop['token']}"}
+        missing = uuid4()
+
+        response = await client.patch(
+            f"/v1/shops/{shop.id}/reviews/bulk",
+            json={
+                "status": "replied",
+                "reviewIds": [str(reviews[0].id), str(missing), str(reviews[3].id)],
+            },
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["updated"], data["unchanged"], data["notFound"]) == (1, 1, 1)
+        assert [(r["id"], r["result"]) for r in data["results"]] == [
+            (str(reviews[0].id), "updated"),
+            (str(missing), "not_found"),
+            (str(reviews[3].id), "unchanged"),
+        ]
+
+        detail = await client.get(
+            f"/v1/shops/{shop.id}/reviews/{reviews[0].id}", headers=headers
+        )
+        assert detail.json()["status"] == "replied"
+        assert detail.json()["repliedAt"] is not None
+
+        stats = await self._stats(client, shop.id, headers)
+        assert (stats["pendingCount"], stats["repliedCount"]) == (2, 2)
+
+    @pytest.mark.asyncio
+    async def test_should_update_reviews_matching_filter(
+        self, client: AsyncClient, authenticated_user_with_shop, reviews
+    ):
+        """30일 지난 미응답 5점 리뷰만 무시 처리해야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        headers = {"Authorization": f"Bearer {authenticated_user_with_shop['token']}"}
+        cutoff = datetime.now(UTC) - timedelta(days=30)
+
+        response = await client.patch(
+            f"/v1/shops/{shop.id}/reviews/bulk",
+            json={
+                "status": "ignored",
+                "filter": {
+                    "status": "pending",
+                    "rating": 5,
+                    "reviewDateBefore": cutoff.isoformat(),
+                },
+            },
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["results"] == [{"id": str(reviews[0].id), "result": "updated"}]
+
+        stats = await self._stats(client, shop.id, headers)
+        assert (
+            stats["pendingCount"],
+            stats["repliedCount"],
+            stats["ignoredCount"],
+        ) == (2, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_should_not_update_other_shops_reviews(
+        self, client: AsyncClient, db_session, authenticated_user_with_shop
+    ):
+        """다른 매장의 리뷰 ID는 not_found로 보고하고 변경하지 않아야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        other_shop = Shop(
+            user_id=authenticated_user_with_shop["user"].id,
+            name="다른 매장",
+            type="hair",
+        )
+        db_session.add(other_shop)
+        await db_session.commit()
+        other = Review(
+            shop_id=other_shop.id,
+            reviewer_name="다른 매장 고객",
+            rating=4,
+            review_date=datetime.now(UTC),
+        )
+        db_session.add(other)
+        await db_session.commit()
+
+        response = await client.patch(
+            f"/v1/shops/{shop.id}/reviews/bulk",
+            json={"status": "ignored", "reviewIds": [str(other.id)]},
+            headers={
+                "Authorization": f"Bearer {authenticated_user_with_shop['token']}"
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"] == [
+            {"id": str(other.id), "result": "not_found"}
+        ]
+        await db_session.refresh(other)
+        assert other.status == "pending"
+
+    @pytest.mark.asyncio
+    async def test_should_require_exactly_one_target(
+        self, client: AsyncClient, authenticated_user_with_shop
+    ):
+        """reviewIds와 filter를 모두 지정하거나 모두 생략하면 400이어야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        headers = {"Authorization": f"Bearer {authenticated_user_with_shop['token']}"}
+
+        neither = await client.patch(
+            f"/v1/shops/{shop.id}/reviews/bulk",
+            json={"status": "ignored"},
+            headers=headers,
+        )
+        both = await client.patch(
+            f"/v1/shops/{shop.id}/reviews/bulk",
+            json={
+                "status": "ignored",
+                "reviewIds": [str(uuid4())],
+                "filter": {"rating": 5},
+            },
+            headers=headers,
+        )
+
+        assert neither.status_code == 400
+        assert both.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_should_reject_empty_filter(
+        self, client: AsyncClient, authenticated_user_with_shop, reviews
+    ):
+        """조건 없는 filter로 매장의 모든 리뷰를 바꿀 수 없어야 함"""
+        shop = authenticated_user_with_shop["shop"]
+        headers = {"Authorization": f"Bearer {authenticated_user_with_shop['token']}"}
+
+        response = await client.patch(
+            f"/v1/shops/{shop.id}/reviews/bulk",
+            json={"status": "ignored", "filter": {}},
+            headers=headers,
+        )
+
+        assert response.status_code == 422
+        stats = await self._stats(client, shop.id, headers)
+        assert stats["ignoredCount"] == 0
+
+    @pytest.mark.asyncio
+    async def test_should_reject_filter_matching_too_many_reviews(
+        self, client: AsyncClient, authenticated_user_with_shop, reviews, monkeypatch
+    ):
+        """filter에 맞는 리뷰가 상한을 넘으면 변경하지 않고 400이어야 함"""
+        monkeypatch.setattr(review_service, "BULK_STATUS_FILTER_LIMIT", 2)
+        shop = authenticated_user_with_shop["shop"]
+        headers = {"Authorization": f"Bearer {authenticated_user_with_shop['token']}"}
+
+        response = await client.patch(
+            f"/v1/shops/{shop.id}/reviews/bulk",
+            json={"status": "ignored", "filter": {"rating": 5}},
+            headers=headers,
+        )
+
+        assert response.status_code == 400
+        stats = await self._stats(client, shop.id, headers)
+        assert stats["ignoredCount"] == 0
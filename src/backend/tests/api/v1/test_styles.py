@@ -0,0 +1,527 @@
+"""
+스타일북 API 테스트
+"""
+
+import asyncio
+import itertools
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.security import create_tokens, hash_password
+from infrastructure.cache.job_store import JOB_INTERRUPTED_ERROR
+from models.shop import Shop
+from models.style_tag import StyleTag
+from models.user import User
+from services import vision_service
+from services.vision_service import (
+    RequestRateLimiter,
+    VisionService,
+    VisionServiceError,
+)
+from worker.tasks.style_analysis import requeue_stale_style_tags
+
+ANALYSIS_RESULT = {
+    "service_type": "nail",
+    "style_category": "minimal",
+    "dominant_colors": ["#FFB6C1"],
+    "technique_tags": ["프렌치"],
+    "mood_tags": ["청순"],
+    "ai_description": "깔끔한 프렌치 네일",
+    "suggested_hashtags": ["네일"],
+    "confidence_score": 0.9,
+}
+
+
+@pytest.fixture
+async def style_owner(db_session):
+    """매장을 가진 인증된 사용자 fixture"""
+    user = User(
+        email="styleowner@example.com",
+        name="스타일 오너",
+        password_hash=hash_password("password123"),
+        auth_provider="email",
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    shop = Shop(user_id=user.id, name="테스트 네일샵", type="nail")
+    db_session.add(shop)
+    await db_session.commit()
+
+    access_token, _, _ = create_tokens(str(user.id))
+    return {"user": user, "shop": shop, "token": access_token}
+
+
+class TestAnalyzeImage:
+    """이미지 분석 요청 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_accept_and_analyze_in_background(
+        self, client: AsyncClient, db_session, job_queue, style_owner, monkeypatch
+    ):
+        """pending 상태로 202를 반환하고 백그라운드에서 분석을 완료해야 함"""
+        analyzed: list[str] = []
+
+        async def analyze(self, image_url: str) -> dict[str, Any]:
+            analyzed.append(image_url)
+            return ANALYSIS_RESULT
+
+        monkeypatch.setattr(VisionService, "analyze", analyze)
+        shop_id = style_owner["shop"].id
+        headers = {"Authorization": f"Bearer {style_owner['token']}"}
+
+        response = await client.post(
+            f"/v1/shops/{shop_id}/styles",
+            json={"image_url": "https://example.com/nail.jpg"},
+            headers=headers,
+        )
+
+        assert response.status_code == 202
+        style_tag = response.json()
+        assert style_tag["analysis_status"] == "pending"
+
+        await job_queue.join()
+        db_session.expire_all()
+        get_response = await client.get(
+            f"/v1/shops/{shop_id}/styles/{style_tag['id']}", headers=headers
+        )
+
+        data = get_response.json()
+        assert data["analysis_status"] == "completed"
+        assert data["service_type"] == "nail"
+        assert data["analyzed_at"] is not None
+        assert analyzed == ["https://example.com/nail.jpg"]
+
+    @pytest.mark.asyncio
+    async def test_should_mark_failed_analysis(
+        self, client: AsyncClient, db_session, job_queue, style_owner, monkeypatch
+    ):
+        """분석이 실패하면 failed 상태로 기록해야 함"""
+
+        async def analyze(self, image_url: str) -> dict[str, Any]:
+            raise VisionServiceError("OpenAI API 키가 설정되지 않았습니다.")
+
+        monkeypatch.setattr(VisionService, "analyze", analyze)
+        shop_id = style_owner["shop"].id
+        headers = {"Authorization": f"Bearer {style_owner['token']}"}
+
+        response = await client.post(
+            f"/v1/shops/{shop_id}/styles",
+            json={"image_url": "https://example.com/nail.jpg"},
+            headers=headers,
+        )
+        await job_queue.join()
+        db_session.expire_all()
+        get_response = await client.get(
+            f"/v1/shops/{shop_id}/styles/{response.json()['id']}", headers=headers
+        )
+
+        assert get_response.json()["analysis_status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_should_return_404_for_other_shop(
+        self, client: AsyncClient, db_session, job_queue, style_owner
+    ):
+        """다른 사용자의 매장에는 분석을 요청할 수 없어야 함"""
+        other = User(
+            email="otherstyle@example.com",
+            name="다른 오너",
+            password_hash=hash_password("password123"),
+            auth_provider="email",
+        )
+        db_session.add(other)
+        await db_session.commit()
+        token, _, _ = create_tokens(str(other.id))
+
+        response = await client.post(
+            f"/v1/shops/{style_owner['shop'].id}/styles",
+            json={"image_url": "https://example.com/nail.jpg"},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 404
+
+
+class TestAnalyzeImages:
+    """이미지 일괄 분석 요청 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def no_rate_limit(self, monkeypatch):
+        """테스트에서는 요청 간격 제한을 두지 않음"""
+
+    @pytest.mark.asyncio
+    async def test_should_analyze_all_images_with_progress(
+        self, client: AsyncClient, db_session, job_queue, style_owner, monkeypatch
+    ):
+        """모든 이미지를 pending으로 만들고 작업 진행 상황을 집계해야 함"""
+        analyzed: list[str] = []
+
+        async def analyze(self, image_url: str) -> dict[str, Any]:
+            analyzed.append(image_url)
+            if image_url.endswith("broken.jpg"):
+                raise VisionServiceError("이미지 분석에 실패했습니다.")
+            return ANALYSIS_RESULT
+
+        monkeypatch.setattr(VisionService, "analyze", analyze)
+        monkeypatch.setattr(vision_service, "STYLE_BATCH_CHUNK_SIZE", 2)
+        shop_id = style_owner["shop"].id
+        headers = {"Authorization": f"Bearer {style_owner['token']}"}
+        image_urls = [f"https://example.com/nail{i}.jpg" for i in range(4)]
+        image_urls.append("https://example.com/broken.jpg")
+
+        response = await client.post(
+            f"/v1/shops/{shop_id}/styles/batch",
+            json={"images": [{"image_url": url} for url in image_urls]},
+            headers=headers,
+        )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["job"]["total"] == 5
+        assert len(data["style_tag_ids"]) == 5
+
+        await job_queue.join()
+        db_session.expire_all()
+        job_response = await client.get(
+            f"/v1/shops/{shop_id}/styles/jobs/{data['job']['id']}", headers=headers
+        )
+        job = job_response.json()
+        assert job["status"] == "completed"
+        assert job["processed"] == 5
+        assert job["succeeded"] == 4
+        assert job["failed"] == 1
+        assert sorted(analyzed) == sorted(image_urls)
+
+        statuses = []
+        for style_tag_id in data["style_tag_ids"]:
+            tag_response = await client.get(
+                f"/v1/shops/{shop_id}/styles/{style_tag_id}", headers=headers
+            )
+            statuses.append(tag_response.json()["analysis_status"])
+        assert statuses == ["completed"] * 4 + ["failed"]
+
+    @pytest.mark.asyncio
+    async def test_should_retry_rate_limited_requests(
+        self, client: AsyncClient, db_session, job_queue, style_owner, monkeypatch
+    ):
+        """429 응답은 잠시 기다린 뒤 재시도해야 함"""
+        attempts: list[str] = []
+
+        async def analyze(self, image_url: str) -> dict[str, Any]:
+            attempts.append(image_url)
+            if len(attempts) == 1:
+                raise VisionServiceError("요청 한도 초과", status_code=429)
+            return ANALYSIS_RESULT
+
+        monkeypatch.setattr(VisionService, "analyze", analyze)
+        monkeypatch.setattr(
+            vision_service.settings, "vision_retry_backoff_seconds", 0.0
+        )
+        shop_id = style_owner["shop"].id
+        headers = {"Authorization": f"Bearer {style_owner['token']}"}
+
+        response = await client.post(
+            f"/v1/shops/{shop_id}/styles/batch",
+            json={"images": [{"image_url": "https://example.com/nail.jpg"}]},
+            headers=headers,
+        )
+        await job_queue.join()
+        job_response = await client.get(
+            f"/v1/shops/{shop_id}/styles/jobs/{response.json()['job']['id']}",
+            headers=headers,
+        )
+
+        assert job_response.json()["succeeded"] == 1
+        assert len(attempts) == 2
+
+    @pytest.mark.asyncio
+    async def test_should_return_404_for_unknown_job(
+        self, client: AsyncClient, style_owner
+    ):
+        """존재하지 않는 작업은 404를 반환해야 함"""
+        response = await client.get(
+            f"/v1/shops/{style_owner['shop'].id}/styles/jobs/unknown",
+            headers={"Authorization": f"Bearer {style_owner['token']}"},
+        )
+
+        assert response.status_code == 404
+
+
+class TestVisionRateLimit:
+    """Vision API 요청 제한 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_share_rate_limit_across_services(
+        self, db_session, style_owner, monkeypatch
+    ):
+        """단건 분석과 일괄 분석이 하나의 분당 요청 한도를 나눠 써야 함"""
+        started: list[float] = []
+
+        async def call_vision_api(self, image_url: str) -> dict[str, Any]:
+            started.append(time.monotonic())
+            return ANALYSIS_RESULT
+
+        limiter = RequestRateLimiter(requests_per_minute=600)
+        monkeypatch.setattr(VisionService, "_call_vision_api", call_vision_api)
+        monkeypatch.setattr(vision_service, "get_vision_rate_limiter", lambda: limiter)
+        shop_id = style_owner["shop"].id
+        style_tag_ids = await VisionService(db_session).create_style_tags(
+            shop_id, [("https://example.com/nail1.jpg", None)] * 2
+        )
+
+        await asyncio.gather(
+            VisionService(db_session).analyze("https://example.com/single.jpg"),
+            VisionService(db_session).analyze_batch(shop_id, style_tag_ids),
+        )
+
+        assert len(started) == 3
+        gaps = [b - a for a, b in itertools.pairwise(sorted(started))]
+        assert min(gaps) >= limiter.interval * 0.9
+
+
+class TestRequeueStaleStyleTags:
+    """분석이 끊긴 스타일 태그 복구 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_resume_stale_pending_and_analyzing_tags(
+        self,
+        db_session,
+        test_engine,
+        shop_cache,
+        job_store,
+        job_queue,
+        style_owner,
+        monkeypatch,
+    ):
+        """오래된 pending/analyzing 태그만 다시 분석해야 함"""
+        analyzed: list[str] = []
+
+        async def analyze(self, image_url: str) -> dict[str, Any]:
+            analyzed.append(image_url)
+            return ANALYSIS_RESULT
+
+        monkeypatch.setattr(VisionService, "analyze", analyze)
+        shop_id = style_owner["shop"].id
+        tags = {
+            key: StyleTag(
+                shop_id=shop_id,
+                image_url=f"https://example.com/{key}.jpg",
+                analysis_status=key.removeprefix("fresh-"),
+            )
+            for key in ("pending", "analyzing", "fresh-pending", "failed")
+        }
+        db_session.add_all(tags.values())
+        await db_session.commit()
+        stale_at = datetime.now(UTC) - timedelta(hours=1)
+        await db_session.execute(
+            update(StyleTag)
+            .where(StyleTag.id != tags["fresh-pending"].id)
+            .values(updated_at=stale_at)
+        )
+        await db_session.commit()
+        session_factory = async_sessionmaker(test_engine, expire_on_commit=False)
+
+        count = await requeue_stale_style_tags(
+            session_factory, job_store, shop_cache, job_queue
+        )
+        await job_queue.join()
+
+        assert count == 2
+        assert sorted(analyzed) == [
+            "https://example.com/analyzing.jpg",
+            "https://example.com/pending.jpg",
+        ]
+        expected = {
+            "pending": "completed",
+            "analyzing": "completed",
+            "fresh-pending": "pending",
+            "failed": "failed",
+        }
+        for key, style_tag in tags.items():
+            await db_session.refresh(style_tag)
+            assert style_tag.analysis_status == expected[key]
+        job = await job_store.get(tags["pending"].analysis_job_id)
+        assert job is not None
+        assert job["status"] == "completed"
+        assert job["succeeded"] == 2
+
+    @pytest.mark.asyncio
+    async def test_should_leave_tags_of_long_running_batch(
+        self,
+        client: AsyncClient,
+        db_session,
+        test_engine,
+        shop_cache,
+        job_store,
+        job_queue,
+        style_owner,
+        monkeypatch,
+    ):
+        """분석 대기 시간보다 오래 걸리는 일괄 분석의 태그는 가져가지 않아야 함"""
+        release = asyncio.Event()
+        analyzed: list[str] = []
+
+        async def analyze(self, image_url: str) -> dict[str, Any]:
+            await release.wait()
+            analyzed.append(image_url)
+            return ANALYSIS_RESULT
+
+        monkeypatch.setattr(VisionService, "analyze", analyze)
+        monkeypatch.setattr(vision_service, "STYLE_BATCH_CHUNK_SIZE", 1)
+        shop_id = style_owner["shop"].id
+        response = await client.post(
+            f"/v1/shops/{shop_id}/styles/batch",
+            json={
+                "images": [
+                    {"image_url": f"https://example.com/nail{i}.jpg"} for i in range(3)
+                ]
+            },
+            headers={"Authorization": f"Bearer {style_owner['token']}"},
+        )
+        job_id = response.json()["job"]["id"]
+        # 일괄 분석이 대기 시간보다 오래 진행 중인 상황
+        await db_session.execute(
+            update(StyleTag)
+            .where(StyleTag.shop_id == shop_id)
+            .values(updated_at=datetime.now(UTC) - timedelta(hours=1))
+        )
+        await db_session.commit()
+        session_factory = async_sessionmaker(test_engine, expire_on_commit=False)
+
+        count = await requeue_stale_style_tags(
+            session_factory, job_store, shop_cache, job_queue
+        )
+        release.set()
+        await job_queue.join()
+
+        assert count == 0
+        assert len(analyzed) == 3
+        job = await job_store.get(job_id)
+        assert job is not None
+        assert job["status"] == "completed"
+        assert (job["succeeded"], job["failed"]) == (3, 0)
+
+    @pytest.mark.asyncio
+    async def test_should_resume_tags_of_interrupted_job(
+        self,
+        db_session,
+        test_engine,
+        shop_cache,
+        job_store,
+        job_queue,
+        style_owner,
+        monkeypatch,
+    ):
+        """중단된 작업이 남긴 태그는 새 작업으로 다시 분석해야 함"""
+
+        async def analyze(self, image_url: str) -> dict[str, Any]:
+            return ANALYSIS_RESULT
+
+        monkeypatch.setattr(VisionService, "analyze", analyze)
+        shop_id = style_owner["shop"].id
+        interrupted = await job_store.create("style_analysis", shop_id, 1)
+        await job_store.finish(interrupted["id"], error=JOB_INTERRUPTED_ERROR)
+        style_tag = StyleTag(
+            shop_id=shop_id,
+            image_url="https://example.com/nail.jpg",
+            analysis_status="pending",
+            analysis_job_id=interrupted["id"],
+        )
+        db_session.add(style_tag)
+        await db_session.commit()
+        await db_session.execute(
+            update(StyleTag)
+            .where(StyleTag.id == style_tag.id)
+            .values(updated_at=datetime.now(UTC) - timedelta(hours=1))
+        )
+        await db_session.commit()
+        session_factory = async_sessionmaker(test_engine, expire_on_commit=False)
+
+        count = await requeue_stale_style_tags(
+            session_factory, job_store, shop_cache, job_queue
+        )
+        await job_queue.join()
+
+        assert count == 1
+        await db_session.refresh(style_tag)
+        assert style_tag.analysis_status == "completed"
+        assert style_tag.analysis_job_id != interrupted["id"]
+
+
+class TestAnalyzeBatchRelease:
+    """일괄 분석이 중단됐을 때 가져간 태그 복구 테스트"""
+
+    @pytest.fixture
+    async def pending_tags(self, db_session, style_owner) -> list[StyleTag]:
+        """분석 대기 중인 스타일 태그 두 개"""
+        tags = [
+            StyleTag(
+                shop_id=style_owner["shop"].id,
+                image_url=f"https://example.com/nail{i}.jpg",
+                analysis_status="pending",
+            )
+            for i in range(2)
+        ]
+        db_session.add_all(tags)
+        await db_session.commit()
+        return tags
+
+    @pytest.mark.asyncio
+    async def test_should_fail_claimed_tags_when_saving_fails(
+        self, db_session, pending_tags, monkeypatch
+    ):
+        """결과 저장이 실패하면 가져간 태그를 failed로 바꿔야 함"""
+
+        async def analyze(self, image_url: str) -> dict[str, Any]:
+            return ANALYSIS_RESULT
+
+        def broken_values(analysis_result: dict[str, Any]) -> dict[str, Any]:
+            raise RuntimeError("cannot build update")
+
+        monkeypatch.setattr(VisionService, "analyze", analyze)
+        monkeypatch.setattr(
+            VisionService, "_analysis_values", staticmethod(broken_values)
+        )
+
+        with pytest.raises(RuntimeError):
+            await VisionService(db_session).analyze_batch(
+                pending_tags[0].shop_id, [tag.id for tag in pending_tags]
+            )
+
+        for style_tag in pending_tags:
+            await db_session.refresh(style_tag)
+            assert style_tag.analysis_status == "failed"
+
+    @pytest.mark.asyncio
+    async def test_should_return_claimed_tags_to_pending_when_cancelled(
+        self, db_session, pending_tags, monkeypatch
+    ):
+        """작업이 취소되면 가져간 태그를 pending으로 되돌려야 함"""
+        started = asyncio.Event()
+
+        async def analyze(self, image_url: str) -> dict[str, Any]:
+            started.set()
+            await asyncio.sleep(60)
+            return ANALYSIS_RESULT
+
+        monkeypatch.setattr(VisionService, "analyze", analyze)
+
+        task = asyncio.create_task(
+            VisionService(db_session).analyze_batch(
+                pending_tags[0].shop_id, [tag.id for tag in pending_tags]
+            )
+        )
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        for style_tag in pending_tags:
+            await db_session.refresh(style_tag)
+            assert style_tag.analysis_status == "pending"
@@ -3,6 +3,7 @@ pytest 설정 및 공통 fixture
 """
 
 import asyncio
+import json
 from collections.abc import AsyncGenerator
 from typing import Any
 
@@ -12,16 +13,24 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
-from config.database import Base, get_db
+from config.database import Base, get_db, get_session_factory
+from infrastructure.cache.job_store import JobStore, get_job_store
+from infrastructure.cache.redis_cache import RedisCache
+from infrastructure.cache.reply_cache import ReplyCache, get_reply_cache
+from infrastructure.cache.shop_cache import ShopCache, get_shop_cache
 from main import app
 from models.post import Post  # noqa: F401
 from models.review import Review  # noqa: F401
+from models.review_daily_stat import ReviewDailyStat  # noqa: F401
+from models.review_keyword_count import ReviewKeywordCount  # noqa: F401
+from models.review_rollup import ShopReviewRollup  # noqa: F401
 from models.shop import Shop  # noqa: F401
 from models.social_account import SocialAccount  # noqa: F401
 from models.style_tag import StyleTag  # noqa: F401
 
 # 모든 모델 임포트 (테이블 생성을 위해 필요)
 from models.user import User  # noqa: F401
+from worker.queue import JobQueue, get_job_queue
 
 # 테스트용 인메모리 SQLite 데이터베이스
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -72,14 +81,113 @@ async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
+class InMemoryCache(RedisCache):
+    """Redis 서버 없이 동작하는 테스트용 캐시 (값은 JSON 직렬화하여 보관)"""
+
+    def __init__(self) -> None:
+        super().__init__(url="redis://test")
+        self.store: dict[str, str] = {}
+        self.sorted_sets: dict[str, dict[str, float]] = {}
+
+    async def get(self, key: str) -> Any | None:
+        value = self.store.get(key)
+        return json.loads(value) if value is not None else None
+
+    async def set(
+        self, key: str, value: Any, ttl: int | None = None, nx: bool = False
+    ) -> bool:
+        if nx and key in self.store:
+            return False
+        self.store[key] = json.dumps(value)
+        return True
+
+    async def delete(self, key: str) -> int:
+        return int(self.store.pop(key, None) is not None)
+
+    async def incr(self, key: str) -> int:
+        value = int(json.loads(self.store.get(key, "0"))) + 1
+        self.store[key] = json.dumps(value)
+        return value
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        return key in self.store or key in self.sorted_sets
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        members = self.sorted_sets.setdefault(key, {})
+        added = len(mapping.keys() - members.keys())
+        members.update(mapping)
+        return added
+
+    async def zcard(self, key: str) -> int:
+        return len(self.sorted_sets.get(key, {}))
+
+    async def zpopmin(self, key: str, count: int = 1) -> list[str]:
+        members = self.sorted_sets.get(key, {})
+        popped = sorted(members, key=members.__getitem__)[:count]
+        for member in popped:
+            del members[member]
+        return popped
+
+    async def zrem(self, key: str, *members: str) -> int:
+        existing = self.sorted_sets.get(key, {})
+        return sum(existing.pop(member, None) is not None for member in members)
+
+
+@pytest.fixture
+def shop_cache() -> ShopCache:
+    """테스트용 매장 캐시"""
+    return ShopCache(InMemoryCache())
+
+
+@pytest.fixture
+def reply_cache(shop_cache: ShopCache) -> ReplyCache:
+    """테스트용 답변 캐시 (매장 캐시와 같은 인메모리 캐시 사용)"""
+    return ReplyCache(shop_cache.cache)
+
+
+@pytest.fixture
+def job_store(shop_cache: ShopCache) -> JobStore:
+    """테스트용 작업 상태 저장소 (매장 캐시와 같은 인메모리 캐시 사용)"""
+    return JobStore(shop_cache.cache)
+
+
+@pytest_asyncio.fixture
+async def job_queue() -> AsyncGenerator[JobQueue, None]:
+    """테스트마다 새로 만드는 백그라운드 작업 큐"""
+    queue = JobQueue()
+    yield queue
+    await queue.shutdown()
+
+
 @pytest_asyncio.fixture(scope="function")
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def client(
+    db_session: AsyncSession,
+    test_engine,
+    shop_cache: ShopCache,
+    reply_cache: ReplyCache,
+    job_store: JobStore,
+    job_queue: JobQueue,
+) -> AsyncGenerator[AsyncClient, None]:
     """테스트용 HTTP 클라이언트"""
 
     async def override_get_db():
         yield db_session
 
+    def override_get_session_factory():
+        return async_sessionmaker(
+            test_engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False,
+        )
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = override_get_session_factory
+    app.dependency_overrides[get_shop_cache] = lambda: shop_cache
+    app.dependency_overrides[get_reply_cache] = lambda: reply_cache
+    app.dependency_overrides[get_job_store] = lambda: job_store
+    app.dependency_overrides[get_job_queue] = lambda: job_queue
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
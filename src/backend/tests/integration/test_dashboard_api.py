@@ -15,6 +15,7 @@ from models.post import Post
 from models.review import Review
 from models.shop import Shop
 from models.user import User
+from services.dashboard_service import DashboardService
 
 
 @pytest.fixture
@@ -1230,3 +1231,231 @@ class TestPublishReviewResponse:
         )
 
         assert response.status_code == 403
+
+
+# ============== Dashboard Overview Integration Tests ==============
+
+
+class TestGetDashboardOverview:
+    """Integration tests for GET /dashboard/{shop_id}/overview"""
+
+    @pytest.mark.asyncio
+    async def test_should_return_all_sections_for_authenticated_owner(
+        self,
+        client: AsyncClient,
+        dashboard_user,
+        dashboard_shop: Shop,
+        dashboard_reviews: list[Review],
+        calendar_posts: list[Post],
+    ):
+        """Should combine every dashboard section in one payload"""
+        headers = {"Authorization": f"Bearer {dashboard_user['token']}"}
+
+        response = await client.get(
+            f"/v1/dashboard/{dashboard_shop.id}/overview", headers=headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["stats"]["total_reviews"] == len(dashboard_reviews)
+        assert data["engagement"]["total_likes"] == 50
+        assert data["trends"]["period"] == "month"
+
+        pending = await client.get(
+            f"/v1/dashboard/{dashboard_shop.id}/pending-reviews", headers=headers
+        )
+        expected = pending.json()
+        assert data["pending_reviews"]["total_pending"] == expected["total_pending"]
+        assert [review["id"] for review in data["pending_reviews"]["reviews"]] == [
+            review["id"] for review in expected["reviews"]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_should_default_calendar_to_current_month(
+        self,
+        client: AsyncClient,
+        dashboard_user,
+        dashboard_shop: Shop,
+    ):
+        """Calendar section should cover this month when no range is given"""
+        response = await client.get(
+            f"/v1/dashboard/{dashboard_shop.id}/overview",
+            headers={"Authorization": f"Bearer {dashboard_user['token']}"},
+        )
+
+        assert response.status_code == 200
+        calendar = response.json()["calendar"]
+        today = datetime.now(UTC).date()
+        assert calendar["start_date"] == today.replace(day=1).isoformat()
+        assert calendar["end_date"] >= today.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_should_report_section_timings(
+        self,
+        client: AsyncClient,
+        dashboard_user,
+        dashboard_shop: Shop,
+    ):
+        """Should expose per-section durations in Server-Timing"""
+        response = await client.get(
+            f"/v1/dashboard/{dashboard_shop.id}/overview",
+            headers={"Authorization": f"Bearer {dashboard_user['token']}"},
+        )
+
+        assert response.status_code == 200
+        metrics = {
+            entry.split(";")[0].strip()
+            for entry in response.headers["server-timing"].split(",")
+        }
+        assert metrics == {
+            "stats",
+            "calendar",
+            "engagement",
+            "trends",
+            "pending_reviews",
+        }
+
+    @pytest.mark.asyncio
+    async def test_should_return_401_without_auth(
+        self, client: AsyncClient, dashboard_shop: Shop
+    ):
+        """Should return 401 when not authenticated"""
+        response = await client.get(f"/v1/dashboard/{dashboard_shop.id}/overview")
+
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_should_return_403_for_non_owner(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        dashboard_shop: Shop,
+    ):
+        """Should return 403 when user doesn't own the shop"""
+        other_user = User(
+            email="other-overview@example.com",
+            name="Other Overview User",
+            password_hash=hash_password("password123"),
+            auth_provider="email",
+        )
+        db_session.add(other_user)
+        await db_session.commit()
+        await db_session.refresh(other_user)
+
+        other_token, _, _ = create_tokens(str(other_user.id))
+
+        response = await client.get(
+            f"/v1/dashboard/{dashboard_shop.id}/overview",
+            headers={"Authorization": f"Bearer {other_token}"},
+        )
+
+        assert response.status_code == 403
+
+
+# ============== Conditional GET Integration Tests ==============
+
+
+class TestDashboardConditionalGet:
+    """ETag / If-None-Match support on dashboard reads"""
+
+    @pytest.mark.asyncio
+    async def test_should_return_weak_etag(
+        self, client: AsyncClient, dashboard_user, dashboard_shop: Shop
+    ):
+        """GET responses should carry a weak ETag"""
+        response = await client.get(
+            f"/v1/dashboard/{dashboard_shop.id}/stats",
+            headers={"Authorization": f"Bearer {dashboard_user['token']}"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+
+    @pytest.mark.asyncio
+    async def test_should_return_304_before_querying_when_unchanged(
+        self,
+        client: AsyncClient,
+        dashboard_user,
+        dashboard_shop: Shop,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Matching If-None-Match should skip the aggregate queries"""
+        headers = {"Authorization": f"Bearer {dashboard_user['token']}"}
+        first = await client.get(
+            f"/v1/dashboard/{dashboard_shop.id}/stats", headers=headers
+        )
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("aggregate query should not run")
+
+        monkeypatch.setattr(DashboardService, "get_review_stats", fail)
+        response = await client.get(
+            f"/v1/dashboard/{dashboard_shop.id}/stats",
+            headers={**headers, "If-None-Match": first.headers["etag"]},
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == first.headers["etag"]
+
+    @pytest.mark.asyncio
+    async def test_should_change_etag_after_write(
+        self,
+        client: AsyncClient,
+        dashboard_user,
+        dashboard_shop: Shop,
+        dashboard_reviews: list[Review],
+    ):
+        """Publishing a response should invalidate the previous ETag"""
+        headers = {"Authorization": f"Bearer {dashboard_user['token']}"}
+        first = await client.get(
+            f"/v1/dashboard/{dashboard_shop.id}/pending-reviews", headers=headers
+        )
+        review_id = first.json()["reviews"][0]["id"]
+
+        await client.post(
+            f"/v1/dashboard/{dashboard_shop.id}/reviews/{review_id}/publish-response",
+            headers=headers,
+            json={"final_response": "감사합니다!"},
+        )
+        response = await client.get(
+            f"/v1/dashboard/{dashboard_shop.id}/pending-reviews",
+            headers={**headers, "If-None-Match": first.headers["etag"]},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != first.headers["etag"]
+        assert review_id not in [r["id"] for r in response.json()["reviews"]]
+
+    @pytest.mark.asyncio
+    async def test_should_not_answer_304_for_non_owner(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        dashboard_user,
+        dashboard_shop: Shop,
+    ):
+        """Authorization should run before the ETag check"""
+        first = await client.get(
+            f"/v1/dashboard/{dashboard_shop.id}/stats",
+            headers={"Authorization": f"Bearer {dashboard_user['token']}"},
+        )
+        other_user = User(
+            email="other-etag@example.com",
+            name="Other ETag User",
+            password_hash=hash_password("password123"),
+            auth_provider="email",
+        )
+        db_session.add(other_user)
+        await db_session.commit()
+        other_token, _, _ = create_tokens(str(other_user.id))
+
+        response = await client.get(
+            f"/v1/dashboard/{dashboard_shop.id}/stats",
+            headers={
+                "Authorization": f"Bearer {other_token}",
+                "If-None-Match": first.headers["etag"],
+            },
+        )
+
+        assert response.status_code == 403
@@ -204,6 +204,25 @@ class TestDashboardPerformance:
             f"\n✓ Parallel dashboard load: {total_ms:.2f}ms (target: <{self.TARGET_TOTAL_LOAD_MS}ms)"
         )
 
+    @pytest.mark.asyncio
+    async def test_overview_load(self, client: AsyncClient, perf_test_user):
+        """통합 대시보드 개요 API 로드 < 3초 (인증 1회)"""
+        shop_id = perf_test_user["shop"].id
+        headers = {"Authorization": f"Bearer {perf_test_user['token']}"}
+
+        start = time.perf_counter()
+        response = await client.get(
+            f"/v1/dashboard/{shop_id}/overview", headers=headers
+        )
+        total_ms = (time.perf_counter() - start) * 1000
+
+        assert response.status_code == 200
+        assert total_ms < self.TARGET_TOTAL_LOAD_MS, (
+            f"Overview load took {total_ms:.2f}ms, target is {self.TARGET_TOTAL_LOAD_MS}ms"
+        )
+        assert "server-timing" in response.headers
+        print(f"\n✓ Dashboard overview: {total_ms:.2f}ms")
+
     @pytest.mark.asyncio
     async def test_response_has_timing_header(
         self, client: AsyncClient, perf_test_user
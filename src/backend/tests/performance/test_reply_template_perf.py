@@ -0,0 +1,40 @@
+"""
+답변 템플릿 렌더링 성능 테스트
+LLM 장애 시 대체 경로가 초당 10만 건 이상 렌더링하는지 검증
+"""
+
+import time
+
+from core.reply_templates import get_shop_reply_templates
+
+
+class TestReplyTemplatePerformance:
+    """답변 템플릿 렌더링 성능 테스트"""
+
+    TARGET_RENDERS_PER_SECOND = 100_000
+    RENDERS = 200_000
+
+    def test_render_throughput(self):
+        """조회·렌더링·max_length 적용 포함 초당 10만 건 이상"""
+        combos = [
+            (sentiment, tone, shop_type)
+            for sentiment in ("positive", "neutral", "negative")
+            for tone in ("friendly", "formal", "casual")
+            for shop_type in ("nail", "hair", "skin", "lash")
+        ]
+        values = {
+            "reviewer_name": "김민지",
+            "shop_name": "살롱메이트 강남점",
+            "shop_type": "네일",
+        }
+        registry = get_shop_reply_templates({})
+
+        start = time.perf_counter()
+        for i in range(self.RENDERS):
+            sentiment, tone, shop_type = combos[i % len(combos)]
+            registry.render(sentiment, tone, shop_type, values, 150)
+        elapsed = time.perf_counter() - start
+
+        renders_per_second = self.RENDERS / elapsed
+        print(f"\n답변 템플릿 렌더링: {renders_per_second:,.0f}건/초")
+        assert renders_per_second >= self.TARGET_RENDERS_PER_SECOND
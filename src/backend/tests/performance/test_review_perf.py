@@ -0,0 +1,70 @@
+"""
+리뷰 API 성능 테스트
+일괄 등록 처리 시간 검증
+"""
+
+import time
+
+import pytest
+from httpx import AsyncClient
+
+from core.security import create_tokens, hash_password
+from models.shop import Shop
+from models.user import User
+
+
+@pytest.fixture
+async def bulk_test_user(db_session):
+    """성능 테스트용 사용자 및 매장 생성"""
+    user = User(
+        email="bulkperf@example.com",
+        name="일괄 등록 테스트 사용자",
+        password_hash=hash_password("password123"),
+        auth_provider="email",
+    )
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+
+    shop = Shop(user_id=user.id, name="일괄 등록 매장", type="hair")
+    db_session.add(shop)
+    await db_session.commit()
+    await db_session.refresh(shop)
+
+    access_token, _, _ = create_tokens(str(user.id))
+    return {"user": user, "shop": shop, "token": access_token}
+
+
+class TestReviewBulkImportPerformance:
+    """리뷰 일괄 등록 성능 테스트"""
+
+    REVIEW_COUNT = 2000
+    TARGET_IMPORT_MS = 5000
+
+    @pytest.mark.asyncio
+    async def test_bulk_import_time(self, client: AsyncClient, bulk_test_user):
+        """리뷰 2,000건 일괄 등록 < 5초"""
+        shop_id = bulk_test_user["shop"].id
+        headers = {"Authorization": f"Bearer {bulk_test_user['token']}"}
+        items = [
+            {
+                "reviewerName": f"고객{i}",
+                "rating": i % 5 + 1,
+                "content": "친절하고 커트가 마음에 들어요",
+                "reviewDate": f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}T10:00:00Z",
+                "googleReviewId": f"g-perf-{i}",
+            }
+            for i in range(self.REVIEW_COUNT)
+        ]
+
+        start = time.perf_counter()
+        response = await client.post(
+            f"/v1/shops/{shop_id}/reviews/bulk", json=items, headers=headers
+        )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert response.status_code == 200
+        assert response.json()["created"] == self.REVIEW_COUNT
+        assert elapsed_ms < self.TARGET_IMPORT_MS, (
+            f"Bulk import took {elapsed_ms:.0f}ms, target < {self.TARGET_IMPORT_MS}ms"
+        )
@@ -0,0 +1,407 @@
+"""
+Unit tests for AIResponseService
+일괄 답변 생성의 청크 단위 저장, LLM 답변 스트리밍 및 답변 캐시 검증
+"""
+
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.security import hash_password
+from infrastructure.cache.reply_cache import ReplyCache
+from infrastructure.external.llm_client import ChatMessages, LLMProviderError
+from models.review import Review
+from models.shop import Shop
+from models.user import User
+from services import ai_response_service
+from services.ai_response_service import (
+    AIResponseService,
+    ReplyOptions,
+    reply_fingerprint,
+)
+
+
+class FakeLLM:
+    """토큰 목록을 돌려주는 LLM 제공자 (fail_after개 토큰 이후 실패)"""
+
+    def __init__(self, tokens: list[str], fail_after: int | None = None) -> None:
+        self.tokens = tokens
+        self.fail_after = fail_after
+        self.messages: list[dict[str, str]] = []
+        self.calls = 0
+
+    async def complete(
+        self, messages: ChatMessages, max_tokens: int, temperature: float = 0.7
+    ) -> str:
+        return "".join([token async for token in self.stream(messages, max_tokens)])
+
+    async def stream(
+        self, messages: ChatMessages, max_tokens: int, temperature: float = 0.7
+    ) -> AsyncGenerator[str, None]:
+        self.messages = list(messages)
+        self.calls += 1
+        for index, token in enumerate(self.tokens):
+            if index == self.fail_after:
+                raise LLMProviderError("unavailable", retryable=True)
+            yield token
+        if self.fail_after is not None and self.fail_after >= len(self.tokens):
+            raise LLMProviderError("unavailable", retryable=True)
+
+
+@pytest.fixture
+async def batch_user(db_session: AsyncSession) -> User:
+    """Create test user"""
+    user = User(
+        email="batch@example.com",
+        name="Batch Test User",
+        password_hash=hash_password("password123"),
+        auth_provider="email",
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+@pytest.fixture
+async def batch_reviews(db_session: AsyncSession, batch_user: User) -> list[Review]:
+    """Create a shop with five pending reviews"""
+    shop = Shop(user_id=batch_user.id, name="Batch Salon", type="nail")
+    db_session.add(shop)
+    await db_session.commit()
+
+    now = datetime.now(UTC)
+    reviews = [
+        Review(
+            shop_id=shop.id,
+            reviewer_name=f"고객{i}",
+            rating=5 - i,
+            review_date=now - timedelta(days=i),
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(reviews)
+    await db_session.commit()
+    return reviews
+
+
+class TestGenerateBatch:
+    """generate_batch 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_persist_each_chunk_with_one_update(
+        self, db_session: AsyncSession, batch_reviews: list[Review], monkeypatch
+    ):
+        """청크마다 한 번의 UPDATE로 저장하고 진행 상황을 보고해야 함"""
+        monkeypatch.setattr(ai_response_service, "AI_BATCH_CHUNK_SIZE", 2)
+        updates: list[str] = []
+        progress: list[tuple[int, int]] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE reviews"):
+                updates.append(statement)
+
+        async def on_progress(succeeded: int, failed: int) -> None:
+            progress.append((succeeded, failed))
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = await AIResponseService(db_session).generate_batch(
+                batch_reviews[0].shop_id,
+                [review.id for review in batch_reviews],
+                ReplyOptions(),
+                on_progress,
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert result == (5, 0)
+        assert len(updates) == 3
+        assert progress == [(2, 0), (2, 0), (1, 0)]
+        for review in batch_reviews:
+            await db_session.refresh(review)
+            assert review.ai_response
+
+    @pytest.mark.asyncio
+    async def test_should_count_failed_generations(
+        self, db_session: AsyncSession, batch_reviews: list[Review], monkeypatch
+    ):
+        """생성에 실패한 리뷰는 저장하지 않고 실패로 집계해야 함"""
+        failing = batch_reviews[1]
+        service = AIResponseService(db_session)
+        original = service.compose_reply
+
+        async def compose_reply(review, shop, options):
+            if review.id == failing.id:
+                raise RuntimeError("generation failed")
+            return await original(review, shop, options)
+
+        monkeypatch.setattr(service, "compose_reply", compose_reply)
+
+        result = await service.generate_batch(
+            failing.shop_id, [review.id for review in batch_reviews], ReplyOptions()
+        )
+
+        assert result == (4, 1)
+        await db_session.refresh(failing)
+        assert failing.ai_response is None
+
+    @pytest.mark.asyncio
+    async def test_should_not_hold_transaction_while_composing(
+        self, db_session: AsyncSession, batch_reviews: list[Review], monkeypatch
+    ):
+        """답변을 생성하는 동안에는 트랜잭션이 열려 있지 않아야 함"""
+        service = AIResponseService(db_session)
+        original = service.compose_reply
+        in_transaction: list[bool] = []
+
+        async def compose_reply(review, shop, options):
+            in_transaction.append(db_session.in_transaction())
+            return await original(review, shop, options)
+
+        monkeypatch.setattr(service, "compose_reply", compose_reply)
+
+        await service.generate_batch(
+            batch_reviews[0].shop_id,
+            [review.id for review in batch_reviews],
+            ReplyOptions(),
+        )
+
+        assert in_transaction == [False] * 5
+
+
+class TestComposeReply:
+    """compose_reply 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_use_llm_reply_within_max_length(
+        self, db_session: AsyncSession, batch_reviews: list[Review]
+    ):
+        """LLM 답변을 max_length 이내로 사용해야 함"""
+        llm = FakeLLM(["감사합니다! "] * 20)
+        service = AIResponseService(db_session, llm=llm)
+
+        reply = await service.compose_reply(
+            batch_reviews[0], None, ReplyOptions(max_length=50)
+        )
+
+        assert reply == ("감사합니다! " * 20)[:50]
+        assert batch_reviews[0].reviewer_name in llm.messages[-1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_should_fall_back_to_template_when_llm_fails(
+        self, db_session: AsyncSession, batch_reviews: list[Review]
+    ):
+        """LLM 호출이 실패하면 템플릿 답변을 반환해야 함"""
+        service = AIResponseService(db_session, llm=FakeLLM([], fail_after=0))
+
+        reply = await service.compose_reply(batch_reviews[0], None, ReplyOptions())
+
+        assert reply.startswith(f"{batch_reviews[0].reviewer_name}님")
+
+    @pytest.mark.asyncio
+    async def test_should_render_shop_template_override(
+        self, db_session: AsyncSession, batch_reviews: list[Review]
+    ):
+        """LLM이 없으면 매장의 템플릿 재정의를 max_length 이내로 렌더링해야 함"""
+        shop = Shop(
+            id=batch_reviews[0].shop_id,
+            name="Batch Salon",
+            type="nail",
+            settings={
+                "reply_templates": {
+                    "positive": "{reviewer_name}님, {shop_type} 만족하셨다니 기뻐요! 💅🏽"
+                }
+            },
+        )
+        service = AIResponseService(db_session)
+
+        reply = await service.compose_reply(batch_reviews[0], shop, ReplyOptions())
+        truncated = await service.compose_reply(
+            batch_reviews[0], shop, ReplyOptions(max_length=22)
+        )
+
+        assert reply == "고객0님, 네일 만족하셨다니 기뻐요! 💅🏽"
+        assert truncated == "고객0님, 네일 만족하셨다니 기뻐요!"
+
+
+class TestStreamResponse:
+    """stream_response 테스트"""
+
+    @staticmethod
+    async def _collect(
+        service: AIResponseService, user: User, review: Review, **options
+    ):
+        events = await service.stream_response(
+            user, review.shop_id, review.id, ReplyOptions(**options)
+        )
+        return [event async for event in events]
+
+    @pytest.mark.asyncio
+    async def test_should_stream_tokens_then_persist_reply(
+        self,
+        db_session: AsyncSession,
+        batch_user: User,
+        batch_reviews: list[Review],
+    ):
+        """토큰을 차례로 내보낸 뒤 전체 답변을 저장해야 함"""
+        review = batch_reviews[0]
+        service = AIResponseService(db_session, llm=FakeLLM(["감사", "합니다", "!"]))
+
+        events = await self._collect(service, batch_user, review)
+
+        assert events[:-1] == [
+            ("token", {"text": "감사"}),
+            ("token", {"text": "합니다"}),
+            ("token", {"text": "!"}),
+        ]
+        assert events[-1][0] == "done"
+        assert events[-1][1]["ai_response"] == "감사합니다!"
+        await db_session.refresh(review)
+        assert review.ai_response == "감사합니다!"
+        assert review.ai_response_generated_at is not None
+
+    @pytest.mark.asyncio
+    async def test_should_stop_at_max_length(
+        self,
+        db_session: AsyncSession,
+        batch_user: User,
+        batch_reviews: list[Review],
+    ):
+        """max_length에 도달하면 토큰을 잘라 생성을 멈춰야 함"""
+        service = AIResponseService(db_session, llm=FakeLLM(["가나다라마"] * 30))
+
+        events = await self._collect(
+            service, batch_user, batch_reviews[0], max_length=52
+        )
+
+        assert len(events[-1][1]["ai_response"]) == 52
+        assert events[-2] == ("token", {"text": "가나"})
+
+    @pytest.mark.asyncio
+    async def test_should_stream_template_when_llm_fails_before_first_token(
+        self,
+        db_session: AsyncSession,
+        batch_user: User,
+        batch_reviews: list[Review],
+    ):
+        """첫 토큰 전에 LLM이 실패하면 템플릿 답변을 스트리밍해야 함"""
+        review = batch_reviews[0]
+        service = AIResponseService(db_session, llm=FakeLLM([], fail_after=0))
+
+        events = await self._collect(service, batch_user, review)
+
+        assert len(events) > 2
+        assert events[-1][0] == "done"
+        assert events[-1][1]["ai_response"].startswith(f"{review.reviewer_name}님")
+
+    @pytest.mark.asyncio
+    async def test_should_report_error_without_saving_when_stream_breaks(
+        self,
+        db_session: AsyncSession,
+        batch_user: User,
+        batch_reviews: list[Review],
+    ):
+        """토큰을 보낸 뒤 실패하면 오류 이벤트로 끝내고 저장하지 않아야 함"""
+        review = batch_reviews[0]
+        service = AIResponseService(
+            db_session, llm=FakeLLM(["감사", "합니다"], fail_after=1)
+        )
+
+        events = await self._collect(service, batch_user, review)
+
+        assert events[0] == ("token", {"text": "감사"})
+        assert events[-1][0] == "error"
+        await db_session.refresh(review)
+        assert review.ai_response is None
+
+
+class TestReplyCache:
+    """비슷한 리뷰의 답변 재사용 테스트"""
+
+    @staticmethod
+    def _review(shop: Shop, name: str, rating: int, content: str) -> Review:
+        return Review(
+            id=uuid4(),
+            shop_id=shop.id,
+            reviewer_name=name,
+            rating=rating,
+            content=content,
+            review_date=datetime.now(UTC),
+        )
+
+    def test_should_fingerprint_normalized_content(self):
+        """문장부호·반복 글자·공백만 다른 리뷰는 같은 지문이어야 함"""
+        shop = Shop(id=uuid4(), name="Cache Salon", type="nail")
+        options = ReplyOptions()
+
+        first = reply_fingerprint(
+            self._review(shop, "김민지", 5, "친절하고 좋아요!!"), shop, options
+        )
+        second = reply_fingerprint(
+            self._review(shop, "이서연", 4, "  친절하고   좋아요~~~ 😊"), shop, options
+        )
+        negative = reply_fingerprint(
+            self._review(shop, "박지훈", 2, "친절하고 좋아요"), shop, options
+        )
+        formal = reply_fingerprint(
+            self._review(shop, "김민지", 5, "친절하고 좋아요"),
+            shop,
+            ReplyOptions(tone="formal"),
+        )
+        long_review = reply_fingerprint(
+            self._review(shop, "김민지", 5, "디자인이 마음에 들어요 " * 10),
+            shop,
+            options,
+        )
+
+        assert first == second
+        assert negative != first
+        assert formal != first
+        assert long_review is None
+
+    @pytest.mark.asyncio
+    async def test_should_reuse_reply_with_reviewer_name(
+        self, db_session: AsyncSession, reply_cache: ReplyCache
+    ):
+        """같은 지문의 리뷰는 LLM을 다시 호출하지 않고 이름만 바꿔 재사용해야 함"""
+        shop = Shop(id=uuid4(), name="Cache Salon", type="nail")
+        llm = FakeLLM(["김민지님, 안녕하세요! ", "친절하다고 해주셔서 감사해요."])
+        service = AIResponseService(db_session, llm=llm, reply_cache=reply_cache)
+
+        first = await service.compose_reply(
+            self._review(shop, "김민지", 5, "친절하고 좋아요"), shop, ReplyOptions()
+        )
+        second = await service.compose_reply(
+            self._review(shop, "이서연", 5, "친절하고 좋아요!"), shop, ReplyOptions()
+        )
+
+        assert first == "김민지님, 안녕하세요! 친절하다고 해주셔서 감사해요."
+        assert second.startswith("이서연님, ")
+        assert second.endswith("! 친절하다고 해주셔서 감사해요.")
+        assert "김민지" not in second
+        assert llm.calls == 1
+        assert await reply_cache.stats(shop.id) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_should_stream_cached_reply(
+        self, db_session: AsyncSession, reply_cache: ReplyCache
+    ):
+        """끝까지 스트리밍한 답변은 캐시되어 다음 스트림에서 재사용되어야 함"""
+        shop = Shop(id=uuid4(), name="Cache Salon", type="nail")
+        llm = FakeLLM(["박지훈님, ", "감사합니다."])
+        service = AIResponseService(db_session, llm=llm, reply_cache=reply_cache)
+
+        for name in ("박지훈", "최유나"):
+            review = self._review(shop, name, 5, "최고예요")
+            tokens = [
+                token
+                async for token in service._stream_tokens(review, shop, ReplyOptions())
+            ]
+            assert "".join(tokens) == f"{name}님, 감사합니다."
+
+        assert llm.calls == 1
@@ -3,10 +3,11 @@ Unit tests for DashboardService
 T015: Test get_review_stats service method
 """
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.security import hash_password
@@ -193,6 +194,40 @@ class TestGetReviewStats:
         # Should have platform breakdown in by_platform dict
         assert isinstance(result.by_platform, dict)
 
+    @pytest.mark.asyncio
+    async def test_should_split_platform_stats_by_google_review_id(
+        self, db_session: AsyncSession, test_shop: Shop, test_reviews: list[Review]
+    ):
+        """Platform breakdown should be consistent with overall totals"""
+        db_session.add(
+            Review(
+                shop_id=test_shop.id,
+                google_review_id="google-review-1",
+                reviewer_name="Google Customer",
+                rating=1,
+                review_date=datetime.now(UTC),
+                status="replied",
+            )
+        )
+        await db_session.commit()
+        service = DashboardService(db_session)
+
+        result = await service.get_review_stats(test_shop.id)
+
+        assert result.total_reviews == 6
+        assert result.pending_count == 2
+        # (5 + 4 + 3 + 5 + 2 + 1) / 6 = 3.33
+        assert result.average_rating == pytest.approx(3.33, rel=0.01)
+        # 3 replied out of 6 total = 50%
+        assert result.response_rate == pytest.approx(50.0, rel=0.01)
+        assert list(result.by_platform) == ["google", "naver"]
+        assert result.by_platform["google"].total_reviews == 1
+        assert result.by_platform["google"].average_rating == pytest.approx(1.0)
+        assert result.by_platform["google"].response_rate == pytest.approx(100.0)
+        assert result.by_platform["naver"].total_reviews == 5
+        assert result.by_platform["naver"].average_rating == pytest.approx(3.8)
+        assert result.by_platform["naver"].response_rate == pytest.approx(40.0)
+
 
 class TestVerifyShopOwnership:
     """Tests for shop ownership verification"""
@@ -425,6 +460,83 @@ class TestGetPostingCalendar:
 
         assert result.last_synced_at is not None
 
+    @pytest.mark.asyncio
+    async def test_should_use_half_open_day_ranges(
+        self, db_session: AsyncSession, test_shop: Shop
+    ):
+        """A post at midnight belongs to the next day only"""
+        midnight = datetime(2025, 3, 2, tzinfo=UTC)
+        post = Post(
+            shop_id=test_shop.id,
+            status="scheduled",
+            image_url="https://example.com/midnight.jpg",
+            scheduled_at=midnight,
+        )
+        db_session.add(post)
+        await db_session.commit()
+
+        service = DashboardService(db_session)
+        before = await service.get_posting_calendar(
+            test_shop.id, date(2025, 3, 1), date(2025, 3, 1)
+        )
+        after = await service.get_posting_calendar(
+            test_shop.id, date(2025, 3, 2), date(2025, 3, 2)
+        )
+
+        assert before.entries == []
+        assert [entry.date for entry in after.entries] == [date(2025, 3, 2)]
+
+    @pytest.mark.asyncio
+    async def test_should_bucket_posts_in_shop_timezone(
+        self, db_session: AsyncSession, test_shop: Shop
+    ):
+        """Day boundaries should follow the shop's configured timezone"""
+        test_shop.settings = {"timezone": "Asia/Seoul"}
+        db_session.add(
+            Post(
+                shop_id=test_shop.id,
+                status="published",
+                image_url="https://example.com/late.jpg",
+                # 2025-03-01 23:30 UTC == 2025-03-02 08:30 KST
+                published_at=datetime(2025, 3, 1, 23, 30, tzinfo=UTC),
+            )
+        )
+        await db_session.commit()
+
+        result = await DashboardService(db_session).get_posting_calendar(
+            test_shop.id, date(2025, 3, 2), date(2025, 3, 2)
+        )
+
+        assert [entry.date for entry in result.entries] == [date(2025, 3, 2)]
+
+    @pytest.mark.asyncio
+    async def test_should_follow_rescheduled_posts(
+        self, db_session: AsyncSession, test_shop: Shop
+    ):
+        """display_at should track scheduled_at changes"""
+        post = Post(
+            shop_id=test_shop.id,
+            status="scheduled",
+            image_url="https://example.com/moved.jpg",
+            scheduled_at=datetime(2025, 3, 5, 10, tzinfo=UTC),
+        )
+        db_session.add(post)
+        await db_session.commit()
+
+        post.scheduled_at = datetime(2025, 4, 5, 10, tzinfo=UTC)
+        await db_session.commit()
+
+        service = DashboardService(db_session)
+        march = await service.get_posting_calendar(
+            test_shop.id, date(2025, 3, 1), date(2025, 3, 31)
+        )
+        april = await service.get_posting_calendar(
+            test_shop.id, date(2025, 4, 1), date(2025, 4, 30)
+        )
+
+        assert march.entries == []
+        assert [entry.date for entry in april.entries] == [date(2025, 4, 5)]
+
 
 # ============== User Story 3: Engagement Metrics Tests ==============
 
@@ -535,6 +647,37 @@ class TestGetEngagementMetrics:
 
         assert result.last_synced_at is not None
 
+    @pytest.mark.asyncio
+    async def test_should_recompute_score_when_metrics_sync(
+        self, db_session: AsyncSession, test_shop: Shop
+    ):
+        """FR-009: Persisted score should follow synced likes/comments/reach"""
+        quiet = Post(
+            shop_id=test_shop.id,
+            status="published",
+            image_url="https://example.com/quiet.jpg",
+            likes_count=10,
+            comments_count=1,
+            reach_count=99,
+        )
+        busy = Post(
+            shop_id=test_shop.id,
+            status="published",
+            image_url="https://example.com/busy.jpg",
+            likes_count=20,
+        )
+        db_session.add_all([quiet, busy])
+        await db_session.commit()
+        assert quiet.engagement_score == 10 + 2 + 9
+
+        quiet.likes_count = 100
+        await db_session.commit()
+        assert quiet.engagement_score == 100 + 2 + 9
+
+        result = await DashboardService(db_session).get_engagement_metrics(test_shop.id)
+        assert [post.id for post in result.top_posts] == [quiet.id, busy.id]
+        assert result.top_posts[0].engagement_score == 111
+
 
 # ============== User Story 4: Trend Data Tests ==============
 
@@ -887,3 +1030,64 @@ class TestPublishResponse:
         assert updated_pending.total_pending == initial_pending_count - 1
         # The review should not be in the pending list
         assert review_id not in [r.id for r in updated_pending.reviews]
+
+
+class TestGetUserShops:
+    """Tests for get_user_shops method (FR-016)"""
+
+    @staticmethod
+    async def _count_queries(db_session: AsyncSession, user: User) -> int:
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            await DashboardService(db_session).get_user_shops(user.id)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        return len(statements)
+
+    @pytest.mark.asyncio
+    async def test_should_flag_shops_with_reviews_and_posts(
+        self, db_session: AsyncSession, test_user: User, test_shop: Shop
+    ):
+        """FR-016: Should report whether each shop has reviews and posts"""
+        empty_shop = Shop(user_id=test_user.id, name="Empty Salon", type="hair")
+        db_session.add(empty_shop)
+        db_session.add(
+            Review(
+                shop_id=test_shop.id,
+                reviewer_name="Customer",
+                rating=5,
+                review_date=datetime.now(UTC),
+            )
+        )
+        db_session.add(
+            Post(shop_id=test_shop.id, image_url="https://example.com/1.jpg")
+        )
+        await db_session.commit()
+
+        result = await DashboardService(db_session).get_user_shops(test_user.id)
+
+        flags = {shop.id: (shop.has_reviews, shop.has_posts) for shop in result.shops}
+        assert flags == {test_shop.id: (True, True), empty_shop.id: (False, False)}
+
+    @pytest.mark.asyncio
+    async def test_should_use_constant_query_count(
+        self, db_session: AsyncSession, test_user: User, test_shop: Shop
+    ):
+        """FR-016: Query count should not grow with the number of shops"""
+        baseline = await self._count_queries(db_session, test_user)
+
+        db_session.add_all(
+            [
+                Shop(user_id=test_user.id, name=f"Branch {i}", type="nail")
+                for i in range(5)
+            ]
+        )
+        await db_session.commit()
+
+        assert await self._count_queries(db_session, test_user) == baseline == 1
@@ -0,0 +1,84 @@
+"""
+Unit tests for HTTP client registry
+업스트림별 공용 클라이언트 재사용, 설정 적용, 종료 및 서비스 주입 검증
+"""
+
+from collections.abc import AsyncGenerator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.external.http_clients import (
+    HTTPClientRegistry,
+    UpstreamConfig,
+    close_http_clients,
+    get_http_clients,
+)
+from services.instagram_service import InstagramService
+from services.oauth_service import OAuthService
+from services.vision_service import VisionService
+
+
+@pytest.fixture
+async def registry() -> AsyncGenerator[HTTPClientRegistry, None]:
+    registry = HTTPClientRegistry(
+        {
+            "openai": UpstreamConfig(timeout=12.0, max_connections=4),
+            "graph": UpstreamConfig(timeout=5.0, max_connections=2, http2=False),
+        }
+    )
+    yield registry
+    await registry.aclose()
+
+
+@pytest.fixture
+async def shared_clients() -> AsyncGenerator[HTTPClientRegistry, None]:
+    yield get_http_clients()
+    await close_http_clients()
+
+
+class TestHTTPClientRegistry:
+    """HTTPClientRegistry 테스트"""
+
+    def test_should_reuse_client_per_upstream(self, registry: HTTPClientRegistry):
+        """같은 업스트림은 같은 클라이언트를, 다른 업스트림은 별도 클라이언트를 반환해야 함"""
+        openai = registry.get("openai")
+
+        assert registry.get("openai") is openai
+        assert registry.get("graph") is not openai
+
+    def test_should_apply_upstream_timeouts(self, registry: HTTPClientRegistry):
+        """업스트림별 타임아웃을 적용해야 함"""
+        assert registry.get("openai").timeout.read == 12.0
+        assert registry.get("graph").timeout.read == 5.0
+
+    @pytest.mark.asyncio
+    async def test_should_close_all_clients(self, registry: HTTPClientRegistry):
+        """종료 시 모든 클라이언트를 닫고 이후에는 새 클라이언트를 만들어야 함"""
+        registry.warm_up()
+        openai = registry.get("openai")
+        graph = registry.get("graph")
+
+        await registry.aclose()
+
+        assert openai.is_closed
+        assert graph.is_closed
+        assert registry.get("openai") is not openai
+
+    def test_should_reject_unknown_upstream(self, registry: HTTPClientRegistry):
+        """설정되지 않은 업스트림은 KeyError를 발생시켜야 함"""
+        with pytest.raises(KeyError):
+            registry.get("kakao")
+
+
+class TestServiceInjection:
+    """서비스의 공용 클라이언트 사용 테스트"""
+
+    def test_should_default_to_shared_clients(
+        self, db_session: AsyncSession, shared_clients: HTTPClientRegistry
+    ):
+        """클라이언트를 주입하지 않으면 프로세스 공용 클라이언트를 사용해야 함"""
+        assert VisionService(db_session).client is shared_clients.get("openai")
+        assert InstagramService(db_session).client is shared_clients.get("graph")
+        assert OAuthService(db_session).http_clients is shared_clients
+        assert VisionService(db_session).client is VisionService(db_session).client
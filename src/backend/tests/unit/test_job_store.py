@@ -0,0 +1,152 @@
+"""
+Unit tests for JobStore and JobQueue
+중단된 백그라운드 작업이 실행 중 상태로 남지 않는지 검증
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from infrastructure.cache.job_store import JOB_INTERRUPTED_ERROR, JobStore
+from services.ai_response_service import ReplyOptions
+from worker.queue import JobQueue, heartbeat_jobs
+from worker.tasks.ai_replies import generate_ai_replies
+
+
+class TestJobStore:
+    """JobStore 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_fail_stale_unfinished_job(self, job_store: JobStore):
+        """오래 갱신되지 않은 미완료 작업은 중단된 것으로 실패 처리해야 함"""
+        job = await job_store.create("test", uuid4(), 3)
+        job["status"] = "running"
+        job["updated_at"] = (
+            datetime.now(UTC) - timedelta(seconds=job_store.stale_after + 1)
+        ).isoformat()
+        await job_store.cache.set(job_store.job_key(job["id"]), job)
+
+        result = await job_store.get(job["id"])
+
+        assert result is not None
+        assert result["status"] == "failed"
+        assert result["error"] == JOB_INTERRUPTED_ERROR
+
+    @pytest.mark.asyncio
+    async def test_should_keep_waiting_job_with_heartbeat(self, job_store: JobStore):
+        """생존 신호가 갱신되는 작업은 오래 대기해도 실패 처리하지 않아야 함"""
+        job = await job_store.create("test", uuid4(), 3)
+        job["updated_at"] = (
+            datetime.now(UTC) - timedelta(seconds=job_store.stale_after + 1)
+        ).isoformat()
+        await job_store.cache.set(job_store.job_key(job["id"]), job)
+        await job_store.touch(job["id"])
+
+        result = await job_store.get(job["id"])
+
+        assert result is not None
+        assert result["status"] == "queued"
+
+    @pytest.mark.asyncio
+    async def test_should_ignore_updates_after_interruption(self, job_store: JobStore):
+        """중단으로 실패 처리된 작업은 이후 진행 기록으로 바뀌지 않아야 함"""
+        job = await job_store.create("test", uuid4(), 3)
+        await job_store.finish(job["id"], error=JOB_INTERRUPTED_ERROR)
+
+        await job_store.update(job["id"], status="running")
+        await job_store.advance(job["id"], succeeded=2)
+        await job_store.finish(job["id"])
+
+        result = await job_store.get(job["id"])
+        assert result is not None
+        assert result["status"] == "failed"
+        assert result["error"] == JOB_INTERRUPTED_ERROR
+        assert result["processed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_should_keep_recently_updated_job(self, job_store: JobStore):
+        """최근 갱신된 작업은 그대로 반환해야 함"""
+        job = await job_store.create("test", uuid4(), 3)
+        await job_store.advance(job["id"], succeeded=1)
+
+        result = await job_store.get(job["id"])
+
+        assert result is not None
+        assert result["status"] == "queued"
+        assert result["processed"] == 1
+
+
+class TestJobQueueHeartbeat:
+    """JobQueue 생존 신호 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_heartbeat_jobs_waiting_for_slot(self, job_store: JobStore):
+        """슬롯을 기다리는 작업도 생존 신호를 갱신해야 함"""
+        release = asyncio.Event()
+
+        async def blocking() -> None:
+            await release.wait()
+
+        running = await job_store.create("test", uuid4(), 1)
+        waiting = await job_store.create("test", uuid4(), 1)
+        queue = JobQueue(max_concurrency=1)
+        queue.submit(blocking(), job_id=running["id"])
+        queue.submit(blocking(), job_id=waiting["id"])
+
+        heartbeat = asyncio.create_task(heartbeat_jobs(queue, job_store))
+        await asyncio.sleep(0)
+        heartbeat.cancel()
+
+        assert queue.job_ids == {running["id"], waiting["id"]}
+        for job_id in (running["id"], waiting["id"]):
+            assert await job_store.cache.get(job_store.heartbeat_key(job_id))
+
+        release.set()
+        await queue.join()
+        assert queue.job_ids == set()
+
+
+class TestJobQueueShutdown:
+    """JobQueue 종료 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_fail_running_job_on_shutdown(
+        self, db_session: AsyncSession, job_store: JobStore, monkeypatch
+    ):
+        """종료 시 취소된 작업은 실패로 기록해야 함"""
+        started = asyncio.Event()
+
+        async def generate_batch(self, shop_id, review_ids, options, on_progress):
+            started.set()
+            await asyncio.sleep(60)
+
+        monkeypatch.setattr(
+            "services.ai_response_service.AIResponseService.generate_batch",
+            generate_batch,
+        )
+        shop_id = uuid4()
+        job = await job_store.create("ai_replies", shop_id, 1)
+        queue = JobQueue()
+
+        queue.submit(
+            generate_ai_replies(
+                async_sessionmaker(db_session.bind, expire_on_commit=False),
+                job_store,
+                None,
+                None,
+                job["id"],
+                shop_id,
+                [uuid4()],
+                ReplyOptions(),
+            )
+        )
+        await started.wait()
+        await queue.shutdown()
+
+        result = await job_store.get(job["id"])
+        assert result is not None
+        assert result["status"] == "failed"
+        assert result["error"] == JOB_INTERRUPTED_ERROR
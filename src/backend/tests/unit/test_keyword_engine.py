@@ -0,0 +1,99 @@
+"""
+Unit tests for keyword engine
+Aho-Corasick 매칭, 부정 표현, 조사 제거 정규화 검증
+"""
+
+from config.keywords import KeywordVocabulary
+from core.keyword_engine import (
+    AhoCorasick,
+    KeywordEngine,
+    get_keyword_engine,
+    normalize_text,
+)
+
+
+class TestAhoCorasick:
+    """AhoCorasick 오토마톤 테스트"""
+
+    def test_should_find_overlapping_patterns_in_one_pass(self):
+        """겹치는 패턴과 접미사 패턴을 모두 찾아야 함"""
+        automaton = AhoCorasick(["he", "she", "his", "hers"])
+
+        matches = list(automaton.iter_matches("ushers"))
+
+        assert matches == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+    def test_should_count_repeated_occurrences(self):
+        """같은 패턴의 모든 출현 위치를 반환해야 함"""
+        automaton = AhoCorasick(["친절"])
+
+        matches = list(automaton.iter_matches("친절 친절 친절"))
+
+        assert [start for start, _, _ in matches] == [0, 3, 6]
+
+
+class TestNormalizeText:
+    """본문 정규화 테스트"""
+
+    def test_should_strip_trailing_particles(self):
+        """어절 끝의 조사를 제거해야 함"""
+        assert normalize_text("추천을 안 해요!") == "추천 안 해요"
+        assert normalize_text("가격이 저렴하고 서비스가 좋아요") == (
+            "가격 저렴하고 서비스 좋아요"
+        )
+
+    def test_should_keep_short_stems(self):
+        """조사를 떼면 한 글자만 남는 어절은 유지해야 함"""
+        assert normalize_text("고가 사이") == "고가 사이"
+
+    def test_should_keep_tokens_ending_with_kept_expression(self):
+        """keep 표현으로 끝나는 어절은 조사를 떼지 않아야 함"""
+        assert normalize_text("네일이 오래가", keep=("오래가",)) == "네일 오래가"
+
+
+class TestKeywordEngine:
+    """KeywordEngine 테스트"""
+
+    def test_should_count_keywords_by_canonical_form(self):
+        """표현들을 대표 키워드로 합산해야 함"""
+        engine = KeywordEngine(
+            KeywordVocabulary(keywords={"친절": ("친절", "상냥"), "최고": ("최고",)})
+        )
+
+        counts = engine.count("친절하고 상냥해요. 최고!")
+
+        assert counts == {"친절": 2, "최고": 1}
+
+    def test_should_skip_matches_covered_by_negatives(self):
+        """부정 표현과 겹치는 매칭은 제외해야 함"""
+        engine = KeywordEngine(
+            KeywordVocabulary(
+                keywords={"친절": ("친절",), "추천": ("추천",)},
+                negatives=("불친절", "추천 안"),
+            )
+        )
+
+        counts = engine.count("불친절해서 추천을 안 해요. 직원은 친절했는데")
+
+        assert counts == {"친절": 1}
+
+    def test_should_count_overlapping_aliases_once(self):
+        """같은 키워드의 겹치는 표현은 한 번만 세야 함"""
+        engine = KeywordEngine(KeywordVocabulary(keywords={"젤네일": ("젤네일", "젤")}))
+
+        assert engine.count("젤네일 했어요, 젤 색상도 예뻐요") == {"젤네일": 2}
+
+    def test_should_match_alias_ending_like_particle(self):
+        """끝 글자가 조사처럼 보이는 표현도 어절 끝에서 매칭해야 함"""
+        engine = get_keyword_engine("nail")
+
+        assert engine.count("색이 오래가") == {"지속력": 1}
+        assert engine.count("색이 오래가요") == {"지속력": 1}
+        assert engine.count("머리가 예뻐요") == engine.count("머리 예뻐요")
+
+    def test_should_use_shop_type_vocabulary(self):
+        """매장 유형별 키워드를 공통 키워드와 함께 집계해야 함"""
+        text = "파마가 잘 나왔고 친절해요"
+
+        assert get_keyword_engine("hair").count(text) == {"펌": 1, "친절": 1}
+        assert get_keyword_engine("nail").count(text) == {"친절": 1}
@@ -0,0 +1,171 @@
+"""
+Unit tests for LLM client
+로컬 OpenAI 호환 스텁 서버로 헤지 요청, 타임아웃, 대체 모델 전환 검증
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import Body, FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from infrastructure.external.llm_client import LLMProviderError, OpenAIChatProvider
+
+PRIMARY = "primary-model"
+FALLBACK = "fallback-model"
+MESSAGES = [{"role": "user", "content": "안녕하세요"}]
+
+
+class StubOpenAI:
+    """모델별로 (지연 초, 상태 코드) 시나리오를 차례로 재생하는 스텁 서버"""
+
+    def __init__(self) -> None:
+        self.scenarios: dict[str, list[tuple[float, int]]] = {}
+        self.calls: list[str] = []
+        self.app = FastAPI()
+        self.app.post("/v1/chat/completions")(self.completions)
+
+    async def completions(self, body: dict[str, Any] = Body(...)) -> Any:
+        model = body["model"]
+        self.calls.append(model)
+        scenario = self.scenarios.get(model) or [(0.0, 200)]
+        delay, status = scenario.pop(0) if len(scenario) > 1 else scenario[0]
+        await asyncio.sleep(delay)
+        if status != 200:
+            return JSONResponse(
+                {"error": {"message": "stub error"}}, status_code=status
+            )
+        if body.get("stream"):
+            return StreamingResponse(
+                self._chunks(model), media_type="text/event-stream"
+            )
+        return {"choices": [{"message": {"role": "assistant", "content": model}}]}
+
+    @staticmethod
+    async def _chunks(model: str) -> AsyncIterator[str]:
+        for token in (model, " ", "답변"):
+            chunk = {"choices": [{"delta": {"content": token}}]}
+            yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+        yield "data: [DONE]\n\n"
+
+
+@pytest.fixture
+def stub() -> StubOpenAI:
+    return StubOpenAI()
+
+
+@pytest.fixture
+async def http_client(stub: StubOpenAI) -> AsyncGenerator[httpx.AsyncClient, None]:
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=stub.app)) as client:
+        yield client
+
+
+def make_provider(client: httpx.AsyncClient, **kwargs: Any) -> OpenAIChatProvider:
+    options: dict[str, Any] = {"timeout": 2.0, "hedge_delay": 1.0, **kwargs}
+    return OpenAIChatProvider(
+        client, "test-key", [PRIMARY, FALLBACK], base_url="http://stub/v1", **options
+    )
+
+
+class TestOpenAIChatProvider:
+    """OpenAIChatProvider 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_return_primary_model_completion(
+        self, stub: StubOpenAI, http_client: httpx.AsyncClient
+    ):
+        """정상 응답이면 기본 모델 결과를 한 번의 요청으로 반환해야 함"""
+        result = await make_provider(http_client).complete(MESSAGES, max_tokens=100)
+
+        assert result == PRIMARY
+        assert stub.calls == [PRIMARY]
+
+    @pytest.mark.asyncio
+    async def test_should_hedge_slow_request(
+        self, stub: StubOpenAI, http_client: httpx.AsyncClient
+    ):
+        """응답이 늦으면 같은 요청을 한 번 더 보내 먼저 온 응답을 사용해야 함"""
+        stub.scenarios[PRIMARY] = [(1.0, 200), (0.0, 200)]
+        provider = make_provider(http_client, hedge_delay=0.05)
+
+        started = time.perf_counter()
+        result = await provider.complete(MESSAGES, max_tokens=100)
+
+        assert result == PRIMARY
+        assert time.perf_counter() - started < 0.5
+        assert stub.calls == [PRIMARY, PRIMARY]
+
+    @pytest.mark.asyncio
+    async def test_should_fall_back_on_server_error(
+        self, stub: StubOpenAI, http_client: httpx.AsyncClient
+    ):
+        """기본 모델이 5xx를 반환하면 재시도 후 대체 모델을 사용해야 함"""
+        stub.scenarios[PRIMARY] = [(0.0, 503)]
+
+        result = await make_provider(http_client).complete(MESSAGES, max_tokens=100)
+
+        assert result == FALLBACK
+        assert stub.calls == [PRIMARY, PRIMARY, FALLBACK]
+
+    @pytest.mark.asyncio
+    async def test_should_fall_back_on_timeout(
+        self, stub: StubOpenAI, http_client: httpx.AsyncClient
+    ):
+        """기본 모델이 타임아웃되면 대체 모델을 사용해야 함"""
+        stub.scenarios[PRIMARY] = [(1.0, 200)]
+        provider = make_provider(http_client, timeout=0.1, hedge_delay=0.05)
+
+        started = time.perf_counter()
+        result = await provider.complete(MESSAGES, max_tokens=100)
+
+        assert result == FALLBACK
+        assert time.perf_counter() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_should_not_retry_client_error(
+        self, stub: StubOpenAI, http_client: httpx.AsyncClient
+    ):
+        """4xx 오류는 재시도나 대체 모델 없이 실패해야 함"""
+        stub.scenarios[PRIMARY] = [(0.0, 400)]
+
+        with pytest.raises(LLMProviderError) as exc_info:
+            await make_provider(http_client).complete(MESSAGES, max_tokens=100)
+
+        assert exc_info.value.retryable is False
+        assert stub.calls == [PRIMARY]
+
+    @pytest.mark.asyncio
+    async def test_should_stream_tokens(
+        self, stub: StubOpenAI, http_client: httpx.AsyncClient
+    ):
+        """스트리밍 응답의 토큰을 순서대로 내보내야 함"""
+        tokens = [
+            token
+            async for token in make_provider(http_client).stream(
+                MESSAGES, max_tokens=100
+            )
+        ]
+
+        assert tokens == [PRIMARY, " ", "답변"]
+
+    @pytest.mark.asyncio
+    async def test_should_fall_back_before_first_token(
+        self, stub: StubOpenAI, http_client: httpx.AsyncClient
+    ):
+        """첫 토큰 전에 실패하면 대체 모델로 스트리밍해야 함"""
+        stub.scenarios[PRIMARY] = [(0.0, 502)]
+
+        tokens = [
+            token
+            async for token in make_provider(http_client).stream(
+                MESSAGES, max_tokens=100
+            )
+        ]
+
+        assert tokens[0] == FALLBACK
+        assert stub.calls == [PRIMARY, FALLBACK]
@@ -0,0 +1,67 @@
+"""
+Unit tests for ReplyCache
+매장별 LRU 답변 캐시의 축출과 Redis 장애 시 동작 검증
+"""
+
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from infrastructure.cache.redis_cache import RedisCache
+from infrastructure.cache.reply_cache import ReplyCache
+from infrastructure.cache.shop_cache import ShopCache
+
+
+class UnavailableCache(RedisCache):
+    """Redis 서버에 연결할 수 없는 캐시"""
+
+    async def get(self, key: str) -> Any | None:
+        raise RedisConnectionError("connection refused")
+
+    async def set(
+        self, key: str, value: Any, ttl: int | None = None, nx: bool = False
+    ) -> bool:
+        raise RedisConnectionError("connection refused")
+
+
+class TestReplyCache:
+    """ReplyCache 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_evict_least_recently_used_entry(self, shop_cache: ShopCache):
+        """항목 수가 한도를 넘으면 가장 오래 사용하지 않은 답변을 지워야 함"""
+        cache = ReplyCache(shop_cache.cache, max_entries=2)
+        shop_id = uuid4()
+
+        await cache.set(shop_id, "a", "답변 A")
+        await cache.set(shop_id, "b", "답변 B")
+        assert await cache.get(shop_id, "a") == "답변 A"
+        await cache.set(shop_id, "c", "답변 C")
+
+        assert await cache.get(shop_id, "b") is None
+        assert await cache.get(shop_id, "a") == "답변 A"
+        assert await cache.get(shop_id, "c") == "답변 C"
+        assert await cache.stats(shop_id) == (3, 1)
+
+    @pytest.mark.asyncio
+    async def test_should_keep_shops_separate(self, shop_cache: ShopCache):
+        """다른 매장의 답변은 조회되지 않아야 함"""
+        cache = ReplyCache(shop_cache.cache)
+        shop_id = uuid4()
+
+        await cache.set(shop_id, "a", "답변 A")
+
+        assert await cache.get(uuid4(), "a") is None
+
+    @pytest.mark.asyncio
+    async def test_should_treat_redis_failure_as_miss(self):
+        """Redis에 연결할 수 없으면 예외 없이 캐시 미스로 처리해야 함"""
+        cache = ReplyCache(UnavailableCache())
+        shop_id = uuid4()
+
+        await cache.set(shop_id, "a", "답변 A")
+
+        assert await cache.get(shop_id, "a") is None
+        assert await cache.stats(shop_id) == (0, 0)
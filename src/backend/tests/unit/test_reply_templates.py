@@ -0,0 +1,110 @@
+"""
+Unit tests for reply template engine
+템플릿 컴파일 검증, 레지스트리 조회 순서, 매장 재정의, 문자소 경계 자르기 검증
+"""
+
+import pytest
+
+from core.reply_templates import (
+    ReplyTemplate,
+    ReplyTemplateRegistry,
+    get_reply_template_registry,
+    get_shop_reply_templates,
+    truncate_graphemes,
+)
+
+VALUES = {"reviewer_name": "김민지", "shop_name": "저희 매장", "shop_type": "네일"}
+
+
+class TestTruncateGraphemes:
+    """문자소 경계 자르기 테스트"""
+
+    def test_should_keep_short_text(self):
+        """max_length 이내의 텍스트는 그대로 반환해야 함"""
+        assert truncate_graphemes("감사합니다", 5) == "감사합니다"
+
+    def test_should_not_split_emoji_sequences(self):
+        """이모지 수정자, ZWJ 시퀀스, 국기를 중간에서 자르지 않아야 함"""
+        family = "👩\u200d👩\u200d👧"
+
+        assert truncate_graphemes("좋아요 👍🏽", 5) == "좋아요"
+        assert truncate_graphemes(f"가{family}", 4) == "가"
+        assert truncate_graphemes("가🇰🇷🇯🇵", 4) == "가🇰🇷"
+
+    def test_should_not_split_combining_characters(self):
+        """결합 문자와 한글 조합형 자모를 앞 글자와 함께 다뤄야 함"""
+        assert truncate_graphemes("cafe\u0301s", 4) == "caf"
+        assert truncate_graphemes("가\u1100\u1161\u11a8", 2) == "가"
+
+
+class TestReplyTemplate:
+    """ReplyTemplate 컴파일 테스트"""
+
+    def test_should_reject_unknown_fields(self):
+        """허용되지 않은 필드나 잘못된 형식은 컴파일 시 거부해야 함"""
+        with pytest.raises(ValueError):
+            ReplyTemplate("{customer}님 감사합니다")
+        with pytest.raises(ValueError):
+            ReplyTemplate("{reviewer_name.__class__}")
+        with pytest.raises(ValueError):
+            ReplyTemplate("{reviewer_name")
+
+    def test_should_render_with_max_length(self):
+        """필드를 채우고 max_length를 적용해야 함"""
+        template = ReplyTemplate("{reviewer_name}님, {{감사}}합니다")
+
+        assert template.render(VALUES) == "김민지님, {감사}합니다"
+        assert template.render(VALUES, max_length=5) == "김민지님,"
+
+
+class TestReplyTemplateRegistry:
+    """ReplyTemplateRegistry 테스트"""
+
+    def test_should_resolve_most_specific_template(self):
+        """매장 유형별 템플릿이 공통 템플릿보다 우선해야 함"""
+        registry = ReplyTemplateRegistry(
+            {
+                ("positive", "*", "*"): "공통 {reviewer_name}",
+                ("positive", "casual", "*"): "캐주얼 {reviewer_name}",
+                ("positive", "casual", "hair"): "헤어 {reviewer_name}",
+                ("neutral", "*", "*"): "중립",
+                ("negative", "*", "*"): "부정",
+            }
+        )
+
+        assert registry.render("positive", "casual", "hair", VALUES) == "헤어 김민지"
+        assert registry.render("positive", "casual", "nail", VALUES) == "캐주얼 김민지"
+        assert registry.render("positive", "formal", "nail", VALUES) == "공통 김민지"
+        assert registry.render("positive", "unknown", "spa", VALUES) == "공통 김민지"
+
+    def test_should_prefer_shop_overrides(self):
+        """매장 재정의가 기본 템플릿보다 우선하고, 잘못된 재정의는 무시해야 함"""
+        registry = get_shop_reply_templates(
+            {
+                "reply_templates": {
+                    "positive": {"casual": "{reviewer_name}님 최고예요!"},
+                    "negative": "{unknown}",
+                }
+            }
+        )
+        default = get_reply_template_registry()
+
+        assert (
+            registry.render("positive", "casual", "nail", VALUES)
+            == "김민지님 최고예요!"
+        )
+        assert registry.render("positive", "formal", "nail", VALUES) == (
+            default.render("positive", "formal", "nail", VALUES)
+        )
+        assert registry.render("negative", "friendly", "nail", VALUES) == (
+            default.render("negative", "friendly", "nail", VALUES)
+        )
+
+    def test_should_reuse_compiled_registries(self):
+        """같은 재정의는 컴파일 결과를 재사용해야 함"""
+        settings = {"reply_templates": {"neutral": "{reviewer_name}님 감사합니다"}}
+
+        assert get_shop_reply_templates(settings) is get_shop_reply_templates(
+            dict(settings)
+        )
+        assert get_shop_reply_templates({}) is get_reply_template_registry()
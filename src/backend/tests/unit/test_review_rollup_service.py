@@ -0,0 +1,423 @@
+"""
+Unit tests for ReviewRollupService
+shop_review_rollups / review_daily_stats 증분 갱신 및 재구축 검증
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.security import hash_password
+from infrastructure.cache.shop_cache import ShopCache
+from models.review import Review
+from models.review_daily_stat import ReviewDailyStat
+from models.review_keyword_count import ReviewKeywordCount
+from models.review_rollup import ShopReviewRollup
+from models.shop import Shop
+from models.user import User
+from schemas.review import ReviewCreate, ReviewUpdate
+from services.dashboard_service import DashboardService
+from services.review_rollup_service import ReviewRollupService
+from services.review_service import ReviewService
+
+
+@pytest.fixture
+async def rollup_user(db_session: AsyncSession) -> User:
+    """Create test user"""
+    user = User(
+        email="rollup@example.com",
+        name="Rollup Test User",
+        password_hash=hash_password("password123"),
+        auth_provider="email",
+    )
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    return user
+
+
+@pytest.fixture
+async def rollup_shop(db_session: AsyncSession, rollup_user: User) -> Shop:
+    """Create test shop"""
+    shop = Shop(user_id=rollup_user.id, name="Rollup Salon", type="nail")
+    db_session.add(shop)
+    await db_session.commit()
+    await db_session.refresh(shop)
+    return shop
+
+
+def _review(shop: Shop, rating: int, **kwargs) -> Review:
+    kwargs.setdefault("review_date", datetime.now(UTC))
+    return Review(shop_id=shop.id, reviewer_name="Customer", rating=rating, **kwargs)
+
+
+async def _rollups(db_session: AsyncSession, shop: Shop) -> dict:
+    rollups = await ReviewRollupService(db_session).get_shop_rollups(shop.id)
+    return {rollup.platform: rollup for rollup in rollups}
+
+
+class TestIncrementalRollup:
+    """Rollups should follow review writes within the same transaction"""
+
+    @pytest.mark.asyncio
+    async def test_should_count_new_reviews_per_platform(
+        self, db_session: AsyncSession, rollup_shop: Shop
+    ):
+        db_session.add_all(
+            [
+                _review(rollup_shop, 5),
+                _review(rollup_shop, 3, status="replied"),
+                _review(rollup_shop, 4, google_review_id="g-1"),
+            ]
+        )
+        await db_session.commit()
+
+        rollups = await _rollups(db_session, rollup_shop)
+
+        assert set(rollups) == {"google", "naver"}
+        naver = rollups["naver"]
+        assert naver.review_count == 2
+        assert naver.pending_count == 1
+        assert naver.replied_count == 1
+        assert naver.rating_sum == 8
+        assert naver.rating_histogram == {1: 0, 2: 0, 3: 1, 4: 0, 5: 1}
+        assert rollups["google"].review_count == 1
+        assert rollups["google"].average_rating == pytest.approx(4.0)
+
+    @pytest.mark.asyncio
+    async def test_should_follow_review_service_create_update_delete(
+        self, db_session: AsyncSession, rollup_user: User, rollup_shop: Shop
+    ):
+        service = ReviewService(db_session)
+        review = await service.create_review(
+            rollup_user,
+            rollup_shop.id,
+            ReviewCreate(reviewerName="김고객", rating=2, reviewDate=datetime.now(UTC)),
+        )
+        assert (await _rollups(db_session, rollup_shop))["naver"].pending_count == 1
+
+        await service.update_review(
+            rollup_user, rollup_shop.id, review.id, ReviewUpdate(status="ignored")
+        )
+        naver = (await _rollups(db_session, rollup_shop))["naver"]
+        assert naver.pending_count == 0
+        assert naver.ignored_count == 1
+
+        await service.delete_review(rollup_user, rollup_shop.id, review.id)
+        naver = (await _rollups(db_session, rollup_shop))["naver"]
+        assert naver.review_count == 0
+        assert naver.ignored_count == 0
+        assert naver.rating_sum == 0
+        assert naver.rating_2_count == 0
+
+    @pytest.mark.asyncio
+    async def test_should_follow_publish_response(
+        self, db_session: AsyncSession, rollup_shop: Shop
+    ):
+        review = _review(rollup_shop, 5)
+        db_session.add(review)
+        await db_session.commit()
+
+        await DashboardService(db_session).publish_response(
+            rollup_shop.id, review.id, "감사합니다!"
+        )
+
+        naver = (await _rollups(db_session, rollup_shop))["naver"]
+        assert naver.pending_count == 0
+        assert naver.replied_count == 1
+
+    @pytest.mark.asyncio
+    async def test_should_move_review_between_platforms(
+        self, db_session: AsyncSession, rollup_shop: Shop
+    ):
+        review = _review(rollup_shop, 4)
+        db_session.add(review)
+        await db_session.commit()
+
+        review.google_review_id = "g-2"
+        await db_session.commit()
+
+        rollups = await _rollups(db_session, rollup_shop)
+        assert "naver" not in rollups or rollups["naver"].review_count == 0
+        assert rollups["google"].review_count == 1
+        assert rollups["google"].rating_4_count == 1
+
+    @pytest.mark.asyncio
+    async def test_should_resync_when_previous_values_are_unknown(
+        self, db_session: AsyncSession, rollup_shop: Shop
+    ):
+        review = _review(rollup_shop, 3)
+        db_session.add(review)
+        await db_session.commit()
+
+        db_session.expire(review, ["status"])
+        review.status = "replied"
+        await db_session.commit()
+
+        naver = (await _rollups(db_session, rollup_shop))["naver"]
+        assert naver.pending_count == 0
+        assert naver.replied_count == 1
+
+    @pytest.mark.asyncio
+    async def test_should_allow_deleting_shop_with_reviews(
+        self, db_session: AsyncSession, rollup_shop: Shop
+    ):
+        db_session.add(_review(rollup_shop, 5))
+        await db_session.commit()
+
+        await db_session.delete(rollup_shop)
+        await db_session.commit()
+
+
+async def _daily(db_session: AsyncSession, shop: Shop) -> dict:
+    today = datetime.now(UTC).date()
+    rows = await ReviewRollupService(db_session).get_daily_stats(
+        shop.id, today - timedelta(days=365), today
+    )
+    return {row.day: row for row in rows}
+
+
+class TestDailyStats:
+    """Daily stats should follow review writes per UTC day"""
+
+    @pytest.mark.asyncio
+    async def test_should_bucket_reviews_by_utc_day(
+        self, db_session: AsyncSession, rollup_shop: Shop
+    ):
+        now = datetime.now(UTC)
+        yesterday = now - timedelta(days=1)
+        db_session.add_all(
+            [
+                _review(rollup_shop, 5, review_date=now, status="replied"),
+                _review(rollup_shop, 3, review_date=now, google_review_id="g-1"),
+                _review(rollup_shop, 2, review_date=yesterday),
+            ]
+        )
+        await db_session.commit()
+
+        daily = await _daily(db_session, rollup_shop)
+
+        assert list(daily) == [yesterday.date(), now.date()]
+        today = daily[now.date()]
+        assert today.review_count == 2
+        assert today.rating_sum == 8
+        assert today.replied_count == 1
+        assert daily[yesterday.date()].review_count == 1
+
+        stats = await db_session.get(
+            ReviewDailyStat, (rollup_shop.id, now.date(), "google")
+        )
+        assert stats is not None
+        assert stats.rating_histogram == {1: 0, 2: 0, 3: 1, 4: 0, 5: 0}
+
+    @pytest.mark.asyncio
+    async def test_should_move_review_between_days(
+        self, db_session: AsyncSession, rollup_shop: Shop
+    ):
+        now = datetime.now(UTC)
+        review = _review(rollup_shop, 4, review_date=now)
+        db_session.add(review)
+        await db_session.commit()
+
+        review.review_date = now - timedelta(days=3)
+        review.status = "replied"
+        await db_session.commit()
+
+        daily = await _daily(db_session, rollup_shop)
+        assert list(daily) == [(now - timedelta(days=3)).date()]
+        assert daily[(now - timedelta(days=3)).date()].replied_count == 1
+
+    @pytest.mark.asyncio
+    async def test_should_feed_trend_endpoints(
+        self, db_session: AsyncSession, rollup_shop: Shop
+    ):
+        now = datetime.now(UTC)
+        db_session.add_all(
+            [
+                _review(rollup_shop, 5, review_date=now, status="replied"),
+                _review(rollup_shop, 2, review_date=now),
+                _review(rollup_shop, 1, review_date=now - timedelta(days=400)),
+            ]
+        )
+        await db_session.commit()
+
+        trends = await DashboardService(db_session).get_trend_data(
+            rollup_shop.id, "year"
+        )
+        assert len(trends.data_points) == 1
+        point = trends.data_points[0]
+        assert point.date == now.date()
+        assert point.review_count == 2
+        assert point.average_rating == pytest.approx(3.5)
+        assert point.response_rate == pytest.approx(50.0)
+
+
+async def _keywords(db_session: AsyncSession, shop: Shop) -> dict[str, int]:
+    today = datetime.now(UTC).date()
+    rows = await ReviewRollupService(db_session).get_keyword_counts(
+        shop.id, today - timedelta(days=30), today, limit=100
+    )
+    return dict(rows)
+
+
+class TestKeywordCounts:
+    """Keyword counts should follow review content within the same transaction"""
+
+    @pytest.mark.asyncio
+    async def test_should_count_keywords_of_new_reviews(
+        self, db_session: AsyncSession, rollup_shop: Shop
+    ):
+        db_session.add_all(
+            [
+                _review(rollup_shop, 5, content="친절하고 젤네일이 최고예요"),
+                _review(rollup_shop, 4, content="친절해요"),
+                _review(rollup_shop, 3),
+            ]
+        )
+        await db_session.commit()
+
+        assert await _keywords(db_session, rollup_shop) == {
+            "친절": 2,
+            "젤네일": 1,
+            "최고": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_should_follow_content_changes_and_deletes(
+        self, db_session: AsyncSession, rollup_shop: Shop
+    ):
+        review = _review(rollup_shop, 5, content="친절해요")
+        db_session.add(review)
+        await db_session.commit()
+
+        review.status = "replied"
+        await db_session.commit()
+        assert await _keywords(db_session, rollup_shop) == {"친절": 1}
+
+        review.content = "불친절하지만 가격은 괜찮아요"
+        await db_session.commit()
+        assert await _keywords(db_session, rollup_shop) == {"가격": 1}
+
+        await db_session.delete(review)
+        await db_session.commit()
+        assert await _keywords(db_session, rollup_shop) == {}
+
+    @pytest.mark.asyncio
+    async def test_should_recount_when_shop_type_changes(
+        self, db_session: AsyncSession, rollup_shop: Shop
+    ):
+        db_session.add(_review(rollup_shop, 5, content="파마가 예쁘게 나왔어요"))
+        await db_session.commit()
+        assert await _keywords(db_session, rollup_shop) == {}
+
+        rollup_shop.type = "hair"
+        await db_session.commit()
+
+        assert await _keywords(db_session, rollup_shop) == {"펌": 1}
+
+    @pytest.mark.asyncio
+    async def test_should_feed_review_analytics(
+        self, db_session: AsyncSession, rollup_user: User, rollup_shop: Shop
+    ):
+        db_session.add_all(
+            [
+                _review(rollup_shop, 5, content="최고 최고"),
+                _review(rollup_shop, 4, content="친절"),
+            ]
+        )
+        await db_session.commit()
+
+        analytics = await ReviewService(db_session).get_analytics(
+            rollup_user, rollup_shop.id, "month"
+        )
+
+        assert analytics["keywords"] == [
+            {"keyword": "최고", "count": 2},
+            {"keyword": "친절", "count": 1},
+        ]
+
+
+class TestRebuildRollups:
+    """Backfill/repair should restore rollups from raw reviews"""
+
+    @pytest.mark.asyncio
+    async def test_should_repair_drifted_rollup(
+        self, db_session: AsyncSession, rollup_shop: Shop
+    ):
+        db_session.add_all([_review(rollup_shop, 5), _review(rollup_shop, 1)])
+        await db_session.commit()
+        await db_session.execute(
+            update(ShopReviewRollup)
+            .where(ShopReviewRollup.shop_id == rollup_shop.id)
+            .values(review_count=99, rating_sum=0)
+        )
+        await db_session.commit()
+
+        await ReviewRollupService(db_session).rebuild(rollup_shop.id)
+
+        naver = (await _rollups(db_session, rollup_shop))["naver"]
+        assert naver.review_count == 2
+        assert naver.rating_sum == 6
+        assert naver.pending_count == 2
+        assert naver.rating_histogram == {1: 1, 2: 0, 3: 0, 4: 0, 5: 1}
+
+    @pytest.mark.asyncio
+    async def test_should_repair_drifted_daily_stats(
+        self, db_session: AsyncSession, rollup_shop: Shop
+    ):
+        db_session.add_all([_review(rollup_shop, 5), _review(rollup_shop, 1)])
+        await db_session.commit()
+        await db_session.execute(
+            update(ReviewDailyStat)
+            .where(ReviewDailyStat.shop_id == rollup_shop.id)
+            .values(review_count=99, rating_sum=0)
+        )
+        await db_session.commit()
+
+        await ReviewRollupService(db_session).rebuild(rollup_shop.id)
+
+        daily = await _daily(db_session, rollup_shop)
+        today = daily[datetime.now(UTC).date()]
+        assert today.review_count == 2
+        assert today.rating_sum == 6
+
+    @pytest.mark.asyncio
+    async def test_should_rebuild_keyword_counts(
+        self, db_session: AsyncSession, rollup_shop: Shop
+    ):
+        db_session.add_all(
+            [
+                _review(rollup_shop, 5, content="친절하고 최고"),
+                _review(rollup_shop, 4, content="친절"),
+            ]
+        )
+        await db_session.commit()
+        await db_session.execute(
+            update(ReviewKeywordCount)
+            .where(ReviewKeywordCount.shop_id == rollup_shop.id)
+            .values(count=99)
+        )
+        await db_session.commit()
+
+        await ReviewRollupService(db_session).rebuild_keywords(rollup_shop.id)
+
+        assert await _keywords(db_session, rollup_shop) == {"친절": 2, "최고": 1}
+
+    @pytest.mark.asyncio
+    async def test_should_bump_shop_version_after_rebuild(
+        self, db_session: AsyncSession, rollup_shop: Shop, shop_cache: ShopCache
+    ):
+        """재구축 후에는 캐시된 통계와 ETag가 무효화되어야 함"""
+        service = ReviewRollupService(db_session, shop_cache)
+        before = await shop_cache.get_version(rollup_shop.id)
+
+        await service.rebuild(rollup_shop.id)
+        after_rebuild = await shop_cache.get_version(rollup_shop.id)
+        await service.rebuild_keywords()
+        after_keywords = await shop_cache.get_version(rollup_shop.id)
+
+        assert before is not None and after_rebuild is not None
+        assert after_keywords is not None
+        assert before < after_rebuild < after_keywords
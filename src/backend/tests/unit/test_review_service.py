@@ -0,0 +1,186 @@
+"""
+Unit tests for ReviewService
+리뷰 분석 집계 검증
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.security import hash_password
+from models.review import Review
+from models.shop import Shop
+from models.user import User
+from services.review_service import (
+    ReviewService,
+    review_search_filter,
+    review_search_rank,
+)
+
+
+@pytest.fixture
+async def analytics_user(db_session: AsyncSession) -> User:
+    """Create test user"""
+    user = User(
+        email="analytics@example.com",
+        name="Analytics Test User",
+        password_hash=hash_password("password123"),
+        auth_provider="email",
+    )
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    return user
+
+
+@pytest.fixture
+async def analytics_shop(db_session: AsyncSession, analytics_user: User) -> Shop:
+    """Create test shop with reviews in the current and previous month"""
+    shop = Shop(user_id=analytics_user.id, name="Analytics Salon", type="hair")
+    db_session.add(shop)
+    await db_session.commit()
+    await db_session.refresh(shop)
+
+    now = datetime.now(UTC)
+    current = [
+        (5, "replied", "친절하고 최고예요"),
+        (5, "pending", "추천합니다"),
+        (4, "replied", None),
+        (3, "pending", "가격이 조금 비싸요"),
+        (1, "ignored", None),
+    ]
+    previous = [(4, "replied", None), (2, "pending", None)]
+    db_session.add_all(
+        [
+            Review(
+                shop_id=shop.id,
+                reviewer_name=f"현재{i}",
+                rating=rating,
+                status=status,
+                content=content,
+                review_date=now - timedelta(days=i + 1),
+            )
+            for i, (rating, status, content) in enumerate(current)
+        ]
+        + [
+            Review(
+                shop_id=shop.id,
+                reviewer_name=f"이전{i}",
+                rating=rating,
+                status=status,
+                content=content,
+                review_date=now - timedelta(days=40 + i),
+            )
+            for i, (rating, status, content) in enumerate(previous)
+        ]
+    )
+    await db_session.commit()
+    return shop
+
+
+class TestGetAnalytics:
+    """get_analytics 집계 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_should_compute_metrics_from_single_aggregation(
+        self, db_session: AsyncSession, analytics_user: User, analytics_shop: Shop
+    ):
+        """기간 지표, 평점 분포, 감성을 한 번의 집계로 계산해야 함"""
+        analytics = await ReviewService(db_session).get_analytics(
+            analytics_user, analytics_shop.id, "month"
+        )
+
+        assert analytics["total_reviews"] == {
+            "current": 5,
+            "previous": 2,
+            "change_percent": 150.0,
+        }
+        assert analytics["average_rating"]["current"] == 3.6
+        assert analytics["average_rating"]["previous"] == 3.0
+        assert analytics["response_rate"]["current"] == 40.0
+        assert analytics["response_rate"]["previous"] == 50.0
+        assert [item["count"] for item in analytics["rating_distribution"]] == [
+            2,
+            1,
+            1,
+            0,
+            1,
+        ]
+        assert analytics["sentiment"]["positive"] == 3
+        assert analytics["sentiment"]["neutral"] == 1
+        assert analytics["sentiment"]["negative"] == 1
+        assert sum(point["review_count"] for point in analytics["trend_data"]) == 5
+        assert {item["keyword"] for item in analytics["keywords"]} >= {"친절", "최고"}
+
+    @pytest.mark.asyncio
+    async def test_should_scan_reviews_once_for_period_metrics(
+        self, db_session: AsyncSession, analytics_user: User, analytics_shop: Shop
+    ):
+        """리뷰 테이블 집계는 이전/현재 기간을 합쳐 한 번만 실행되어야 함"""
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if "GROUP BY" in statement and "FROM reviews" in statement:
+                statements.append(statement)
+
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            await ReviewService(db_session).get_analytics(
+                analytics_user, analytics_shop.id, "year"
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        assert "WITH period_reviews" in statements[0]
+
+    @pytest.mark.asyncio
+    async def test_should_match_sequential_result_when_run_concurrently(
+        self,
+        db_session: AsyncSession,
+        test_engine,
+        analytics_user: User,
+        analytics_shop: Shop,
+    ):
+        """세션 팩토리로 동시에 조회해도 결과가 같아야 함"""
+        session_factory = async_sessionmaker(
+            test_engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+        sequential = await ReviewService(db_session).get_analytics(
+            analytics_user, analytics_shop.id, "month"
+        )
+        concurrent = await ReviewService(
+            db_session, session_factory=session_factory
+        ).get_analytics(analytics_user, analytics_shop.id, "month")
+
+        assert concurrent == sequential
+
+
+class TestReviewSearchFilter:
+    """리뷰 검색 조건 테스트"""
+
+    @staticmethod
+    def _compile(condition) -> str:
+        return str(condition.compile(dialect=postgresql.dialect()))
+
+    def test_should_skip_trigram_operators_for_two_character_query(self):
+        """trigram을 만들 수 없는 두 글자 검색어는 포함 여부로만 찾아야 함"""
+        condition = self._compile(review_search_filter("postgresql", "친절"))
+        rank = self._compile(review_search_rank("postgresql", "친절"))
+
+        assert "<%" not in condition
+        assert "ILIKE" in condition
+        assert "word_similarity" not in rank
+
+    def test_should_use_trigram_operators_for_longer_query(self):
+        """세 글자 이상 검색어는 trigram 유사도로도 찾아야 함"""
+        condition = self._compile(review_search_filter("postgresql", "친절해요"))
+        rank = self._compile(review_search_rank("postgresql", "친절해요"))
+
+        assert "<%" in condition
+        assert "word_similarity" in rank
@@ -0,0 +1,188 @@
+"""
+Unit tests for ShopCache
+대시보드 read-through 캐시 및 매장 버전 무효화 검증
+"""
+
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.security import hash_password
+from infrastructure.cache.redis_cache import RedisCache
+from infrastructure.cache.shop_cache import ShopCache
+from models.review import Review
+from models.shop import Shop
+from models.user import User
+from schemas.review import ReviewCreate
+from services.dashboard_service import DashboardService
+from services.review_service import ReviewService
+
+
+class UnavailableCache(RedisCache):
+    """Redis 서버에 연결할 수 없는 캐시"""
+
+    async def get(self, key: str) -> Any | None:
+        raise RedisConnectionError("connection refused")
+
+    async def set(
+        self, key: str, value: Any, ttl: int | None = None, nx: bool = False
+    ) -> bool:
+        raise RedisConnectionError("connection refused")
+
+    async def incr(self, key: str) -> int:
+        raise RedisConnectionError("connection refused")
+
+
+@pytest.fixture
+async def cache_user(db_session: AsyncSession) -> User:
+    """Create test user"""
+    user = User(
+        email="cache@example.com",
+        name="Cache Test User",
+        password_hash=hash_password("password123"),
+        auth_provider="email",
+    )
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    return user
+
+
+@pytest.fixture
+async def cache_shop(db_session: AsyncSession, cache_user: User) -> Shop:
+    """Create test shop with one pending review"""
+    shop = Shop(user_id=cache_user.id, name="Cache Salon", type="hair")
+    db_session.add(shop)
+    await db_session.commit()
+    await db_session.refresh(shop)
+
+    db_session.add(
+        Review(
+            shop_id=shop.id,
+            reviewer_name="Customer",
+            rating=4,
+            review_date=datetime.now(UTC),
+        )
+    )
+    await db_session.commit()
+    return shop
+
+
+async def _count_queries(db_session: AsyncSession, call) -> tuple[Any, int]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = await call()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return result, len(statements)
+
+
+class TestReadThrough:
+    """Dashboard reads should be served from cache until the shop changes"""
+
+    @pytest.mark.asyncio
+    async def test_should_serve_repeated_reads_from_cache(
+        self, db_session: AsyncSession, cache_shop: Shop, shop_cache: ShopCache
+    ):
+        service = DashboardService(db_session, shop_cache)
+
+        first, first_queries = await _count_queries(
+            db_session, lambda: service.get_review_stats(cache_shop.id)
+        )
+        second, second_queries = await _count_queries(
+            db_session, lambda: service.get_review_stats(cache_shop.id)
+        )
+
+        assert first_queries > 0
+        assert second_queries == 0
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_should_key_entries_by_parameters(
+        self, db_session: AsyncSession, cache_shop: Shop, shop_cache: ShopCache
+    ):
+        service = DashboardService(db_session, shop_cache)
+
+        week = await service.get_trend_data(cache_shop.id, "week")
+        year = await service.get_trend_data(cache_shop.id, "year")
+
+        assert week.period == "week"
+        assert year.period == "year"
+
+    @pytest.mark.asyncio
+    async def test_should_fall_back_to_database_when_redis_is_down(
+        self, db_session: AsyncSession, cache_shop: Shop
+    ):
+        service = DashboardService(db_session, ShopCache(UnavailableCache()))
+
+        stats = await service.get_review_stats(cache_shop.id)
+
+        assert stats.total_reviews == 1
+
+
+class TestInvalidation:
+    """Writes should bump the shop version and invalidate cached reads"""
+
+    @pytest.mark.asyncio
+    async def test_should_invalidate_on_publish_response(
+        self, db_session: AsyncSession, cache_shop: Shop, shop_cache: ShopCache
+    ):
+        service = DashboardService(db_session, shop_cache)
+        pending = await service.get_pending_reviews(cache_shop.id)
+        assert pending.total_pending == 1
+
+        await service.publish_response(
+            cache_shop.id, pending.reviews[0].id, "감사합니다!"
+        )
+
+        assert (await service.get_pending_reviews(cache_shop.id)).total_pending == 0
+        assert (await service.get_review_stats(cache_shop.id)).pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_should_invalidate_on_review_service_write(
+        self,
+        db_session: AsyncSession,
+        cache_user: User,
+        cache_shop: Shop,
+        shop_cache: ShopCache,
+    ):
+        dashboard = DashboardService(db_session, shop_cache)
+        assert (await dashboard.get_review_stats(cache_shop.id)).total_reviews == 1
+        version = await shop_cache.get_version(cache_shop.id)
+
+        await ReviewService(db_session, shop_cache).create_review(
+            cache_user,
+            cache_shop.id,
+            ReviewCreate(reviewerName="김고객", rating=5, reviewDate=datetime.now(UTC)),
+        )
+
+        assert version is not None
+        assert await shop_cache.get_version(cache_shop.id) == version + 1
+        assert (await dashboard.get_review_stats(cache_shop.id)).total_reviews == 2
+
+    @pytest.mark.asyncio
+    async def test_should_ignore_bump_failures(
+        self,
+        db_session: AsyncSession,
+        cache_user: User,
+        cache_shop: Shop,
+    ):
+        review = await ReviewService(
+            db_session, ShopCache(UnavailableCache())
+        ).create_review(
+            cache_user,
+            cache_shop.id,
+            ReviewCreate(reviewerName="김고객", rating=5, reviewDate=datetime.now(UTC)),
+        )
+
+        assert review.id is not None
@@ -0,0 +1,100 @@
+"""
+백그라운드 작업 큐
+요청 처리와 분리해 같은 프로세스의 이벤트 루프에서 작업 코루틴을 실행합니다.
+"""
+
+import asyncio
+import logging
+from collections.abc import Coroutine
+from functools import lru_cache
+from typing import Any
+
+from config.settings import get_settings
+from infrastructure.cache.job_store import JOB_HEARTBEAT_SECONDS, JobStore
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class JobQueue:
+    """프로세스 내 백그라운드 작업 큐
+
+    동시에 실행되는 작업 수를 max_concurrency로 제한하며, 나머지 작업은
+    슬롯이 빌 때까지 대기합니다. 실행 중인 태스크의 참조를 유지하므로
+    응답을 보낸 뒤에도 작업이 중간에 수거되지 않습니다. job_id와 함께 넣은
+    작업은 끝날 때까지 job_ids에 남아 heartbeat_jobs가 생존 신호를 갱신합니다.
+    """
+
+    def __init__(self, max_concurrency: int | None = None):
+        self._slots = asyncio.Semaphore(
+            max_concurrency or settings.background_job_concurrency
+        )
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._job_ids: set[str] = set()
+
+    @property
+    def job_ids(self) -> frozenset[str]:
+        """대기 중이거나 실행 중인 작업의 JobStore ID"""
+        return frozenset(self._job_ids)
+
+    def submit(self, job: Coroutine[Any, Any, None], job_id: str | None = None) -> None:
+        """작업을 큐에 넣습니다 (즉시 반환).
+
+        job_id는 작업 진행 상황을 기록하는 JobStore 레코드의 ID입니다.
+        """
+        task = asyncio.create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if job_id is not None:
+            self._job_ids.add(job_id)
+            task.add_done_callback(lambda _: self._job_ids.discard(job_id))
+
+    async def _run(self, job: Coroutine[Any, Any, None]) -> None:
+        try:
+            await self._slots.acquire()
+        except asyncio.CancelledError:
+            # 시작 전에 취소된 작업 (생존 신호가 끊기면 JobStore가 중단으로 처리)
+            job.close()
+            raise
+        try:
+            await job
+        except Exception:
+            logger.exception("Background job failed")
+        finally:
+            self._slots.release()
+
+    async def join(self) -> None:
+        """대기 중이거나 실행 중인 작업이 모두 끝날 때까지 기다립니다."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def shutdown(self) -> None:
+        """남은 작업을 취소하고 종료를 기다립니다.
+
+        실행 중인 작업은 취소될 때 작업 기록을 실패로 남깁니다. 큐는 프로세스
+        메모리에만 있으므로 재시작 후 다시 실행되지 않습니다.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await self.join()
+
+
+async def heartbeat_jobs(job_queue: JobQueue, job_store: JobStore) -> None:
+    """JOB_HEARTBEAT_SECONDS마다 큐에 남은 작업의 생존 신호를 갱신합니다.
+
+    슬롯을 기다리느라 오래 진행되지 않은 작업도 중단으로 처리되지 않습니다
+    (취소될 때까지 실행).
+    """
+    while True:
+        for job_id in job_queue.job_ids:
+            try:
+                await job_store.touch(job_id)
+            except Exception:
+                logger.exception("Job heartbeat failed", extra={"job_id": job_id})
+        await asyncio.sleep(JOB_HEARTBEAT_SECONDS)
+
+
+@lru_cache
+def get_job_queue() -> JobQueue:
+    """프로세스 전역 작업 큐를 반환합니다."""
+    return JobQueue()
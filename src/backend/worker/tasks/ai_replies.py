@@ -0,0 +1,57 @@
+"""
+AI 답변 일괄 생성 작업
+"""
+
+import asyncio
+import logging
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from infrastructure.cache.job_store import JOB_INTERRUPTED_ERROR, JobStore
+from infrastructure.cache.reply_cache import ReplyCache
+from infrastructure.cache.shop_cache import ShopCache
+from infrastructure.external.llm_client import get_llm_provider
+from services.ai_response_service import AIResponseService, ReplyOptions
+
+logger = logging.getLogger(__name__)
+
+JOB_KIND = "ai_replies"
+
+
+async def generate_ai_replies(
+    session_factory: async_sessionmaker[AsyncSession],
+    job_store: JobStore,
+    shop_cache: ShopCache | None,
+    reply_cache: ReplyCache | None,
+    job_id: str,
+    shop_id: UUID,
+    review_ids: list[UUID],
+    options: ReplyOptions,
+) -> None:
+    """리뷰 AI 답변을 일괄 생성하고 진행 상황을 작업 레코드에 기록합니다.
+
+    요청 세션과 별개로 풀에서 세션을 받아 사용합니다.
+    """
+    await job_store.update(job_id, status="running")
+
+    async def progress(succeeded: int, failed: int) -> None:
+        await job_store.advance(job_id, succeeded, failed)
+
+    try:
+        async with session_factory() as session:
+            service = AIResponseService(
+                session, shop_cache, get_llm_provider(), reply_cache
+            )
+            await service.generate_batch(shop_id, review_ids, options, progress)
+    except asyncio.CancelledError:
+        # 종료 시 취소된 작업은 실행 중 상태로 남지 않도록 실패로 기록
+        await job_store.finish(job_id, error=JOB_INTERRUPTED_ERROR)
+        raise
+    except Exception:
+        logger.exception(
+            "AI reply batch failed", extra={"job_id": job_id, "shop_id": str(shop_id)}
+        )
+        await job_store.finish(job_id, error="답변 생성 중 오류가 발생했습니다.")
+        return
+    await job_store.finish(job_id)
@@ -0,0 +1,174 @@
+"""
+스타일 이미지 분석 작업
+"""
+
+import asyncio
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from config.settings import get_settings
+from infrastructure.cache.job_store import JOB_INTERRUPTED_ERROR, JobStore
+from infrastructure.cache.shop_cache import ShopCache
+from infrastructure.external.http_clients import get_openai_http_client
+from services.vision_service import VisionService
+from worker.queue import JobQueue
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+JOB_KIND = "style_analysis"
+
+
+async def analyze_style_image(
+    session_factory: async_sessionmaker[AsyncSession],
+    shop_cache: ShopCache | None,
+    style_tag_id: UUID,
+) -> None:
+    """대기 중인 StyleTag의 이미지를 분석해 결과를 저장합니다.
+
+    Vision API 응답을 기다리는 동안에는 DB 세션을 잡지 않도록
+    상태 변경과 결과 저장에 각각 짧은 세션을 사용합니다.
+    """
+    client = get_openai_http_client()
+    async with session_factory() as session:
+        vision = VisionService(session, shop_cache, client)
+        style_tag = await vision.mark_analyzing(style_tag_id)
+        if style_tag is None:
+            return
+        image_url = style_tag.image_url
+
+    try:
+        # analyze는 DB를 쓰지 않으므로 세션을 반납한 뒤 호출
+        result: dict[str, Any] | None = await vision.analyze(image_url)
+    except Exception:
+        logger.warning(
+            "Style image analysis failed",
+            extra={"style_tag_id": str(style_tag_id)},
+            exc_info=True,
+        )
+        result = None
+
+    async with session_factory() as session:
+        await VisionService(session, shop_cache, client).save_analysis(
+            style_tag_id, result
+        )
+
+
+async def analyze_style_images(
+    session_factory: async_sessionmaker[AsyncSession],
+    job_store: JobStore,
+    shop_cache: ShopCache | None,
+    job_id: str,
+    shop_id: UUID,
+    style_tag_ids: list[UUID],
+) -> None:
+    """여러 StyleTag의 이미지를 일괄 분석하고 진행 상황을 작업 레코드에 기록합니다.
+
+    요청 세션과 별개로 풀에서 세션을 받아 사용합니다.
+    """
+    await job_store.update(job_id, status="running")
+
+    async def progress(succeeded: int, failed: int) -> None:
+        await job_store.advance(job_id, succeeded, failed)
+
+    try:
+        async with session_factory() as session:
+            vision = VisionService(session, shop_cache, get_openai_http_client())
+            await vision.analyze_batch(shop_id, style_tag_ids, progress)
+    except asyncio.CancelledError:
+        # 종료 시 취소된 작업은 실행 중 상태로 남지 않도록 실패로 기록
+        await job_store.finish(job_id, error=JOB_INTERRUPTED_ERROR)
+        raise
+    except Exception:
+        logger.exception(
+            "Style image batch failed",
+            extra={"job_id": job_id, "shop_id": str(shop_id)},
+        )
+        await job_store.finish(job_id, error="이미지 분석 중 오류가 발생했습니다.")
+        return
+    await job_store.finish(job_id)
+
+
+async def requeue_stale_style_tags(
+    session_factory: async_sessionmaker[AsyncSession],
+    job_store: JobStore,
+    shop_cache: ShopCache | None,
+    job_queue: JobQueue,
+) -> int:
+    """분석이 끊긴 StyleTag를 매장별 새 작업으로 큐에 다시 넣고 그 수를 반환합니다.
+
+    큐는 프로세스 메모리에만 있으므로 재시작이나 배포로 사라진 분석 작업을
+    이 함수가 복구합니다. 오래된 태그라도 맡은 작업이 아직 대기 중이거나
+    실행 중이면 (큰 일괄 분석은 settings.style_analysis_stale_seconds보다
+    오래 걸림) 그 작업이 처리하도록 두고, 작업이 끝났거나 사라진 태그와
+    작업 없이 만든 단건 분석 태그만 가져갑니다. 다시 넣은 분석도 작업
+    레코드로 진행 상황을 기록합니다.
+    """
+    stale_before = datetime.now(UTC) - timedelta(
+        seconds=settings.style_analysis_stale_seconds
+    )
+    count = 0
+    async with session_factory() as session:
+        vision = VisionService(session, shop_cache, get_openai_http_client())
+        stale = await vision.find_stale_style_tags(stale_before)
+
+        active: dict[str, bool] = {}
+        orphaned: dict[UUID, list[UUID]] = {}
+        for style_tag in stale:
+            job_id = style_tag.analysis_job_id
+            if job_id is not None:
+                if job_id not in active:
+                    active[job_id] = await job_store.is_active(job_id)
+                if active[job_id]:
+                    continue
+            orphaned.setdefault(style_tag.shop_id, []).append(style_tag.id)
+
+        for shop_id, style_tag_ids in orphaned.items():
+            job = await job_store.create(JOB_KIND, shop_id, len(style_tag_ids))
+            reassigned = await vision.reassign_style_tags(
+                shop_id, style_tag_ids, job["id"], stale_before
+            )
+            if len(reassigned) < len(style_tag_ids):
+                # 다른 프로세스가 먼저 가져간 태그는 제외
+                await job_store.update(job["id"], total=len(reassigned))
+            if not reassigned:
+                await job_store.finish(job["id"])
+                continue
+            job_queue.submit(
+                analyze_style_images(
+                    session_factory,
+                    job_store,
+                    shop_cache,
+                    job["id"],
+                    shop_id,
+                    reassigned,
+                ),
+                job_id=job["id"],
+            )
+            count += len(reassigned)
+
+    if count:
+        logger.info("Requeued stale style tags", extra={"count": count})
+    return count
+
+
+async def sweep_stale_style_tags(
+    session_factory: async_sessionmaker[AsyncSession],
+    job_store: JobStore,
+    shop_cache: ShopCache | None,
+    job_queue: JobQueue,
+) -> None:
+    """시작 시와 이후 settings.style_analysis_sweep_interval_seconds마다
+    분석이 끊긴 StyleTag를 다시 작업 큐에 넣습니다 (취소될 때까지 실행)."""
+    while True:
+        try:
+            await requeue_stale_style_tags(
+                session_factory, job_store, shop_cache, job_queue
+            )
+        except Exception:
+            logger.exception("Style tag sweep failed")
+        await asyncio.sleep(settings.style_analysis_sweep_interval_seconds)
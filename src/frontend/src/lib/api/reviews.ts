@@ -28,7 +28,8 @@ export interface Review {
 
 export interface ReviewListResponse {
   reviews: Review[];
-  total: number;
+  total: number | null;
+  nextCursor: string | null;
 }
 
 export interface ReviewListParams {
@@ -43,6 +44,8 @@ export interface ReviewListParams {
   order?: 'asc' | 'desc';
   limit?: number;
   offset?: number;
+  cursor?: string;
+  includeTotal?: boolean;
 }
 
 export interface MetricComparison {
@@ -162,6 +165,8 @@ export async function getReviews(
   if (params.order) searchParams.set('order', params.order);
   if (params.limit) searchParams.set('limit', params.limit.toString());
   if (params.offset) searchParams.set('offset', params.offset.toString());
+  if (params.cursor) searchParams.set('cursor', params.cursor);
+  if (params.includeTotal === false) searchParams.set('includeTotal', 'false');
 
   const queryString = searchParams.toString();
   return fetchWithAuth<ReviewListResponse>(